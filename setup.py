@@ -60,6 +60,8 @@ _TEST_REQUIRE = [
 
 _BENCHMARK_REQUIRE = ["pytest-benchmark==3.2.3"]
 
+_ORJSON_REQUIRE = ["orjson>=3.0.0"]
+
 _VERSION = "1.2.1"
 
 _PACKAGES = find_packages(exclude=["tests*"])
@@ -90,7 +92,11 @@ setup(
     packages=_PACKAGES,
     install_requires=["cffi>=1.0.0,<2.0.0", "lark-parser==0.10.0", "pytz"],
     tests_require=_TEST_REQUIRE,
-    extras_require={"test": _TEST_REQUIRE, "benchmark": _BENCHMARK_REQUIRE},
+    extras_require={
+        "test": _TEST_REQUIRE,
+        "benchmark": _BENCHMARK_REQUIRE,
+        "orjson": _ORJSON_REQUIRE,
+    },
     cmdclass={"build_ext": BuildExtCmd, "build_py": BuildPyCmd},
     include_package_data=True,
 )
@@ -3,6 +3,13 @@ from typing import Any, Callable, Dict, List, Optional, Union
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.directive.directive import Directive
 from tartiflette.engine import Engine
+from tartiflette.execution.complexity import ComplexityLimits
+from tartiflette.execution.document_cache import DocumentCache
+from tartiflette.execution.loader import BatchLoader
+from tartiflette.execution.persisted_queries import (
+    MemoryPersistedQueryStore,
+    PersistedQueryStore,
+)
 from tartiflette.resolver.resolver import Resolver
 from tartiflette.resolver.type_resolver import TypeResolver
 from tartiflette.scalar.scalar import Scalar
@@ -10,9 +17,14 @@ from tartiflette.subscription.subscription import Subscription
 from tartiflette.types.exceptions import TartifletteError
 
 __all__ = (
+    "BatchLoader",
+    "ComplexityLimits",
     "create_engine",
     "Directive",
+    "DocumentCache",
     "Engine",
+    "MemoryPersistedQueryStore",
+    "PersistedQueryStore",
     "Resolver",
     "TypeResolver",
     "Scalar",
@@ -31,8 +43,11 @@ async def create_engine(
     custom_default_type_resolver: Optional[Callable] = None,
     modules: Optional[Union[str, List[str], List[Dict[str, Any]]]] = None,
     query_cache_decorator: Optional[Callable] = UNDEFINED_VALUE,
-    json_loader: Optional[Callable[[str], Dict[str, Any]]] = None,
+    json_loader: Optional[
+        Callable[[Union[str, bytes]], Dict[str, Any]]
+    ] = None,
     custom_default_arguments_coercer: Optional[Callable] = None,
+    **options: Any,
 ) -> "Engine":
     """
     Create an engine by analyzing the SDL and connecting it with the imported
@@ -52,11 +67,14 @@ async def create_engine(
     the engine to import, usually this modules contains your Resolvers,
     Directives, Scalar or Subscription code
     :param query_cache_decorator: callable that will replace the tartiflette
-    default lru_cache decorator to cache query parsing
-    :param json_loader: A callable that will replace default python
-    json module.loads for ast_json loading
+    default DocumentCache decorator to cache query parsing
+    :param json_loader: A callable that will replace the default loader of
+    the AST JSON of the queries (`orjson.loads` if installed, python json
+    module.loads otherwise), it receives the raw bytes of the JSON
     :param custom_default_arguments_coercer: callable that will replace the
     tartiflette `default_arguments_coercer
+    :param options: options of the engine, see `Engine.cook` (e.g.
+    `persisted_query_store`, `complexity_limits` or `execution_timeout`)
     :type sdl: Union[str, List[str]]
     :type schema_name: str
     :type error_coercer: Callable[[Exception, Dict[str, Any]], Dict[str, Any]]
@@ -64,8 +82,9 @@ async def create_engine(
     :type custom_default_type_resolver: Optional[Callable]
     :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
     :type query_cache_decorator: Optional[Callable]
-    :type json_loader: Optional[Callable[[str], Dict[str, Any]]]
+    :type json_loader: Optional[Callable[[Union[str, bytes]], Dict[str, Any]]]
     :type custom_default_arguments_coercer: Optional[Callable]
+    :type options: Any
     :return: a Cooked Engine instance
     :rtype: Engine
 
@@ -78,6 +97,7 @@ async def create_engine(
     >>>   hello(name: String!): String!
     >>> }''')
     """
+    # pylint: disable=too-many-arguments
     e = Engine()
 
     await e.cook(
@@ -90,6 +110,7 @@ async def create_engine(
         query_cache_decorator=query_cache_decorator,
         json_loader=json_loader,
         custom_default_arguments_coercer=custom_default_arguments_coercer,
+        **options,
     )
 
     return e
@@ -1,4 +1,4 @@
-from typing import Any, Iterable, List, Optional, Union
+from typing import Any, Iterable, List, Optional, Tuple, Union
 
 from tartiflette.types.exceptions.tartiflette import CoercionError
 
@@ -7,10 +7,12 @@ __all__ = ("Path", "CoercionResult", "coercion_error")
 
 class Path:
     """
-    Representations of the path traveled during the coercion.
+    Representations of the path traveled during the coercion. The full path
+    is only materialized when it is needed (e.g. to locate an error) and
+    cached, the materialized path of the previous values being reused.
     """
 
-    __slots__ = ("prev", "key")
+    __slots__ = ("prev", "key", "_keys", "_str")
 
     def __init__(self, prev: Optional["Path"], key: Union[str, int]) -> None:
         """
@@ -21,6 +23,8 @@ class Path:
         """
         self.prev = prev
         self.key = key
+        self._keys: Optional[Tuple[Union[str, int], ...]] = None
+        self._str: Optional[str] = None
 
     def __repr__(self) -> str:
         """
@@ -36,29 +40,44 @@ class Path:
         :return: a human-readable representation of the full path
         :rtype: str
         """
-        path_str = ""
+        if self._str is None:
+            path_str = "".join(
+                f".{key}" if isinstance(key, str) else f"[{key}]"
+                for key in self._get_keys()
+            )
+            self._str = f"value{path_str}" if path_str else ""
+        return self._str
+
+    def _get_keys(self) -> Tuple[Union[str, int], ...]:
+        """
+        Computes, caches and returns the keys of the full path. Only the
+        values of the path which haven't been materialized yet are walked.
+        :return: the keys of the full path
+        :rtype: Tuple[Union[str, int], ...]
+        """
+        # pylint: disable=protected-access
+        if self._keys is not None:
+            return self._keys
+
+        uncached_paths = []
         current_path = self
-        while current_path:
-            path_str = (
-                f".{current_path.key}"
-                if isinstance(current_path.key, str)
-                else f"[{current_path.key}]"
-            ) + path_str
+        while current_path and current_path._keys is None:
+            uncached_paths.append(current_path)
             current_path = current_path.prev
-        return f"value{path_str}" if path_str else ""
 
-    def as_list(self) -> List[str]:
+        keys = current_path._keys if current_path else ()
+        for uncached_path in reversed(uncached_paths):
+            keys = keys + (uncached_path.key,)
+            uncached_path._keys = keys
+        return keys
+
+    def as_list(self) -> List[Union[str, int]]:
         """
         Computes and returns the path as a list.
         :return: the full path as a list
-        :rtype: List[str]
+        :rtype: List[Union[str, int]]
         """
-        path = []
-        current_path = self
-        while current_path:
-            path.append(current_path.key)
-            current_path = current_path.prev
-        return path[::-1]
+        return list(self._get_keys())
 
 
 class CoercionResult:
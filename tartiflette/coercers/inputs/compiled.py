@@ -0,0 +1,385 @@
+from difflib import get_close_matches
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Set
+
+from tartiflette.coercers.common import CoercionResult, Path, coercion_error
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.utils.errors import did_you_mean
+from tartiflette.utils.values import is_invalid_value
+
+__all__ = ("get_sync_input_coercer",)
+
+
+def _non_null_coercer(
+    node: "Node",
+    value: Any,
+    path: Optional["Path"],
+    graphql_type: "GraphQLType",
+    inner_coercer: Callable,
+) -> "CoercionResult":
+    """
+    Synchronous version of `non_null_coercer`.
+    :param node: the AST node to treat
+    :param value: the raw value to compute
+    :param path: the path traveled until this coercer
+    :param graphql_type: the schema type of the expected value
+    :param inner_coercer: the pre-computed coercer to use on the value
+    :type node: Node
+    :type value: Any
+    :type path: Optional[Path]
+    :type graphql_type: GraphQLType
+    :type inner_coercer: Callable
+    :return: the coercion result
+    :rtype: CoercionResult
+    """
+    if value is None:
+        return CoercionResult(
+            errors=[
+                coercion_error(
+                    f"Expected non-nullable type < {graphql_type} > not to be "
+                    "null",
+                    node,
+                    path,
+                )
+            ]
+        )
+    return inner_coercer(node, value, path)
+
+
+def _list_coercer(
+    node: "Node",
+    value: Any,
+    path: Optional["Path"],
+    inner_coercer: Callable,
+) -> "CoercionResult":
+    """
+    Synchronous version of `list_coercer`.
+    :param node: the AST node to treat
+    :param value: the raw value to compute
+    :param path: the path traveled until this coercer
+    :param inner_coercer: the pre-computed coercer to use on each value in
+    the list
+    :type node: Node
+    :type value: Any
+    :type path: Optional[Path]
+    :type inner_coercer: Callable
+    :return: the coercion result
+    :rtype: CoercionResult
+    """
+    if value is None:
+        return CoercionResult(value=None)
+
+    if not isinstance(value, list):
+        coerced_item_value, coerced_item_errors = inner_coercer(
+            node, value, path
+        )
+        return CoercionResult(
+            value=[coerced_item_value], errors=coerced_item_errors
+        )
+
+    errors = []
+    coerced_values = []
+    for index, item_value in enumerate(value):
+        coerced_value, coerced_errors = inner_coercer(
+            node, item_value, Path(path, index)
+        )
+        if coerced_errors:
+            errors.extend(coerced_errors)
+        elif not errors:
+            coerced_values.append(coerced_value)
+
+    return CoercionResult(value=coerced_values, errors=errors)
+
+
+def _scalar_coercer(
+    node: "Node",
+    value: Any,
+    path: Optional["Path"],
+    scalar_type: "GraphQLScalarType",
+) -> "CoercionResult":
+    """
+    Synchronous version of `scalar_coercer`.
+    :param node: the AST node to treat
+    :param value: the raw value to compute
+    :param path: the path traveled until this coercer
+    :param scalar_type: the GraphQLScalarType instance of the scalar
+    :type node: Node
+    :type value: Any
+    :type path: Optional[Path]
+    :type scalar_type: GraphQLScalarType
+    :return: the coercion result
+    :rtype: CoercionResult
+    """
+    if value is None:
+        return CoercionResult(value=None)
+
+    try:
+        coerced_value = scalar_type.coerce_input(value)
+        if is_invalid_value(coerced_value):
+            return CoercionResult(
+                errors=[
+                    coercion_error(
+                        f"Expected type < {scalar_type.name} >", node, path
+                    )
+                ]
+            )
+    except Exception as e:  # pylint: disable=broad-except
+        return CoercionResult(
+            errors=[
+                coercion_error(
+                    f"Expected type < {scalar_type.name} >",
+                    node,
+                    path,
+                    sub_message=str(e),
+                    original_error=e,
+                )
+            ]
+        )
+    return CoercionResult(value=coerced_value)
+
+
+def _enum_coercer(
+    node: "Node",
+    value: Any,
+    path: Optional["Path"],
+    enum_type: "GraphQLEnumType",
+) -> "CoercionResult":
+    """
+    Synchronous version of `enum_coercer`, for enums whose values have no
+    `on_post_input_coercion` directive.
+    :param node: the AST node to treat
+    :param value: the raw value to compute
+    :param path: the path traveled until this coercer
+    :param enum_type: the GraphQLEnumType instance of the enum
+    :type node: Node
+    :type value: Any
+    :type path: Optional[Path]
+    :type enum_type: GraphQLEnumType
+    :return: the coercion result
+    :rtype: CoercionResult
+    """
+    if value is None:
+        return CoercionResult(value=None)
+
+    try:
+        enum_type.get_value(value)
+    except Exception:  # pylint: disable=broad-except
+        return CoercionResult(
+            errors=[
+                coercion_error(
+                    f"Expected type < {enum_type.name} >",
+                    node,
+                    path,
+                    did_you_mean(
+                        get_close_matches(
+                            str(value),
+                            [enum.value for enum in enum_type.values],
+                            n=5,
+                        )
+                    ),
+                )
+            ]
+        )
+    return CoercionResult(value=value)
+
+
+def _input_object_coercer(
+    node: "Node",
+    value: Any,
+    path: Optional["Path"],
+    input_object_type: "GraphQLInputObjectType",
+    input_field_coercers: Dict[str, Callable],
+) -> "CoercionResult":
+    """
+    Synchronous version of `input_object_coercer`, for input objects whose
+    fields have no default value.
+    :param node: the AST node to treat
+    :param value: the raw value to compute
+    :param path: the path traveled until this coercer
+    :param input_object_type: the GraphQLInputObjectType instance of the
+    input object
+    :param input_field_coercers: the pre-computed coercers of the input
+    fields
+    :type node: Node
+    :type value: Any
+    :type path: Optional[Path]
+    :type input_object_type: GraphQLInputObjectType
+    :type input_field_coercers: Dict[str, Callable]
+    :return: the coercion result
+    :rtype: CoercionResult
+    """
+    if value is None:
+        return CoercionResult(value=None)
+
+    if not isinstance(value, dict):
+        return CoercionResult(
+            errors=[
+                coercion_error(
+                    f"Expected type < {input_object_type.name} > to be an object",
+                    node,
+                    path,
+                )
+            ]
+        )
+
+    input_fields = input_object_type.input_fields
+
+    errors = []
+    coerced_values = {}
+    for input_field_name, input_field in input_fields.items():
+        input_field_path = Path(path, input_field_name)
+        input_field_value = value.get(input_field_name, UNDEFINED_VALUE)
+        if is_invalid_value(input_field_value):
+            if input_field.graphql_type.is_non_null_type:
+                errors.append(
+                    coercion_error(
+                        f"Field < {input_field_path} > of required type "
+                        f"< {input_field.gql_type} > was not provided",
+                        node,
+                    )
+                )
+            continue
+
+        input_field_value, input_field_errors = input_field_coercers[
+            input_field_name
+        ](node, input_field_value, input_field_path)
+        if input_field_errors:
+            errors.extend(input_field_errors)
+        elif not errors:
+            coerced_values[input_field_name] = input_field_value
+
+    for input_field_name in value:
+        if input_field_name not in input_fields:
+            errors.append(
+                coercion_error(
+                    f"Field < {input_field_name} > is not defined by type "
+                    f"< {input_object_type.name} >",
+                    node,
+                    path,
+                    did_you_mean(
+                        get_close_matches(
+                            input_field_name, input_fields.keys(), n=5
+                        )
+                    ),
+                )
+            )
+
+    return CoercionResult(value=coerced_values, errors=errors)
+
+
+def _is_sync_coercible(
+    graphql_type: "GraphQLType", visited_type_names: Set[str]
+) -> bool:
+    """
+    Determines whether or not input values of the type can be coerced
+    synchronously, which is the case when no `on_post_input_coercion`
+    directive has to be awaited and no input field default value has to be
+    coerced.
+    :param graphql_type: the schema type to inspect
+    :param visited_type_names: the names of the types already inspected
+    :type graphql_type: GraphQLType
+    :type visited_type_names: Set[str]
+    :return: whether or not the type can be coerced synchronously
+    :rtype: bool
+    """
+    while graphql_type.is_wrapping_type:
+        graphql_type = graphql_type.wrapped_type
+
+    if graphql_type.name in visited_type_names:
+        return True
+    visited_type_names.add(graphql_type.name)
+
+    if getattr(graphql_type, "has_post_input_coercion_directives", True):
+        return False
+
+    if graphql_type.kind == "ENUM":
+        return not any(
+            enum_value.has_post_input_coercion_directives
+            for enum_value in graphql_type.values
+        )
+
+    if graphql_type.kind == "INPUT_OBJECT":
+        return all(
+            input_field.default_value is None
+            and not input_field.has_post_input_coercion_directives
+            and _is_sync_coercible(
+                input_field.graphql_type, visited_type_names
+            )
+            for input_field in (graphql_type.input_fields or {}).values()
+        )
+
+    return graphql_type.kind == "SCALAR"
+
+
+def _compile_input_coercer(
+    graphql_type: "GraphQLType", compiled_coercers: Dict[str, Callable]
+) -> Callable:
+    """
+    Computes the synchronous input coercer of a type.
+    :param graphql_type: the schema type for which compute the coercer
+    :param compiled_coercers: the coercers already computed by type name
+    :type graphql_type: GraphQLType
+    :type compiled_coercers: Dict[str, Callable]
+    :return: the synchronous input coercer of the type
+    :rtype: Callable
+    """
+    if graphql_type.is_non_null_type:
+        return partial(
+            _non_null_coercer,
+            graphql_type=graphql_type,
+            inner_coercer=_compile_input_coercer(
+                graphql_type.wrapped_type, compiled_coercers
+            ),
+        )
+
+    if graphql_type.is_list_type:
+        return partial(
+            _list_coercer,
+            inner_coercer=_compile_input_coercer(
+                graphql_type.wrapped_type, compiled_coercers
+            ),
+        )
+
+    coercer = compiled_coercers.get(graphql_type.name)
+    if coercer is not None:
+        return coercer
+
+    if graphql_type.kind == "ENUM":
+        coercer = partial(_enum_coercer, enum_type=graphql_type)
+    elif graphql_type.kind == "INPUT_OBJECT":
+        # Registered before its fields are compiled since they may refer
+        # to the input object itself
+        input_field_coercers = {}
+        coercer = compiled_coercers[graphql_type.name] = partial(
+            _input_object_coercer,
+            input_object_type=graphql_type,
+            input_field_coercers=input_field_coercers,
+        )
+        for input_field_name, input_field in (
+            graphql_type.input_fields or {}
+        ).items():
+            input_field_coercers[input_field_name] = _compile_input_coercer(
+                input_field.graphql_type, compiled_coercers
+            )
+    else:
+        coercer = partial(_scalar_coercer, scalar_type=graphql_type)
+
+    compiled_coercers[graphql_type.name] = coercer
+    return coercer
+
+
+def get_sync_input_coercer(graphql_type: "GraphQLType") -> Optional[Callable]:
+    """
+    Computes and returns a synchronous input coercer for the filled in
+    schema type, called with the AST node, the value & the path to coerce.
+    Types whose coercion awaits `on_post_input_coercion` directives or
+    coerces input field default values have no synchronous coercer.
+    :param graphql_type: the schema type for which compute the coercer
+    :type graphql_type: GraphQLType
+    :return: the synchronous input coercer or None if the type can't be
+    coerced synchronously
+    :rtype: Optional[Callable]
+    """
+    if not _is_sync_coercible(graphql_type, set()):
+        return None
+    return _compile_input_coercer(graphql_type, {})
@@ -1,7 +1,7 @@
 from typing import Any, Callable, Dict, List
 
-from tartiflette.execution.collect import collect_subfields
 from tartiflette.execution.execute import execute_fields
+from tartiflette.execution.plan import get_subfield_plans
 from tartiflette.utils.errors import located_error
 
 __all__ = ("complete_value_catching_error", "complete_object_value")
@@ -113,6 +113,6 @@ async def complete_object_value(
         return_type,
         result,
         path,
-        await collect_subfields(execution_context, return_type, field_nodes),
+        await get_subfield_plans(execution_context, return_type, field_nodes),
         info.is_introspection,
     )
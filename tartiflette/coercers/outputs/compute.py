@@ -1,5 +1,5 @@
 from functools import partial
-from typing import Callable
+from typing import Callable, Optional
 
 from tartiflette.coercers.outputs.list_coercer import list_coercer
 from tartiflette.coercers.outputs.non_null_coercer import non_null_coercer
@@ -7,12 +7,20 @@ from tartiflette.coercers.outputs.non_null_coercer import non_null_coercer
 __all__ = ("get_output_coercer",)
 
 
-def get_output_coercer(graphql_type: "GraphQLType") -> Callable:
+def get_output_coercer(
+    graphql_type: "GraphQLType",
+    concurrently: bool = False,
+    concurrency_limit: Optional[int] = None,
+) -> Callable:
     """
     Computes and returns the output coercer to use for the filled in schema
     type.
     :param graphql_type: the schema type for which compute the coercer
+    :param concurrently: whether list items should be coerced concurrently
+    :param concurrency_limit: maximum number of list items to coerce at once
     :type graphql_type: GraphQLType
+    :type concurrently: bool
+    :type concurrency_limit: Optional[int]
     :return: the computed coercer wrap with directives if defined
     :rtype: Callable
     """
@@ -22,7 +30,12 @@ def get_output_coercer(graphql_type: "GraphQLType") -> Callable:
         wrapped_type = inner_type.wrapped_type
         if inner_type.is_list_type:
             wrapper_coercers.append(
-                partial(list_coercer, item_type=wrapped_type)
+                partial(
+                    list_coercer,
+                    item_type=wrapped_type,
+                    is_concurrently=concurrently,
+                    concurrency_limit=concurrency_limit,
+                )
             )
         elif inner_type.is_non_null_type:
             wrapper_coercers.append(non_null_coercer)
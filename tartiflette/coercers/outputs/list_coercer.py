@@ -1,13 +1,199 @@
-from typing import Any, Callable, List
+import asyncio
+
+from typing import Any, Callable, List, Optional
 
 from tartiflette.coercers.common import Path
 from tartiflette.coercers.outputs.null_coercer import null_coercer_wrapper
 from tartiflette.resolver.factory import complete_value_catching_error
+from tartiflette.types.exceptions.tartiflette import ExecutionDeadlineExceeded
+from tartiflette.utils.coroutines import gather_eagerly
 from tartiflette.utils.errors import extract_exceptions_from_results
 
 __all__ = ("list_coercer",)
 
 
+async def complete_list_item(
+    item: Any,
+    index: int,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    inner_coercer: Callable,
+) -> Any:
+    """
+    Computes the value of a list item and returns the raised exception instead
+    of the value if the item couldn't be completed.
+    :param item: the list item to complete
+    :param index: the index of the item in the list
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param item_type: GraphQLType of list items
+    :param inner_coercer: the pre-computed coercer to use on the item
+    :type item: Any
+    :type index: int
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type inner_coercer: Callable
+    :return: the computed value or the raised exception
+    :rtype: Any
+    """
+    # pylint: disable=too-many-arguments
+    try:
+        return await complete_value_catching_error(
+            item,
+            info,
+            execution_context,
+            field_nodes,
+            Path(path, index),
+            item_type,
+            inner_coercer,
+        )
+    except Exception as e:  # pylint: disable=broad-except
+        return e
+
+
+async def complete_list_items_serially(
+    result: List[Any],
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    inner_coercer: Callable,
+) -> List[Any]:
+    """
+    Computes the value of each list items one after the other.
+    :param result: resolved list value
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param item_type: GraphQLType of list items
+    :param inner_coercer: the pre-computed coercer to use on the items
+    :type result: List[Any]
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type inner_coercer: Callable
+    :return: the computed values
+    :rtype: List[Any]
+    :raises ExecutionDeadlineExceeded: when the deadline of the request is
+    passed before all the items are completed
+    """
+    # pylint: disable=too-many-arguments
+    results = []
+    for index, item in enumerate(result):
+        if execution_context.is_deadline_exceeded():
+            raise ExecutionDeadlineExceeded()
+        results.append(
+            await complete_list_item(
+                item,
+                index,
+                info,
+                execution_context,
+                field_nodes,
+                path,
+                item_type,
+                inner_coercer,
+            )
+        )
+    return results
+
+
+async def complete_list_items_concurrently(
+    result: List[Any],
+    width: int,
+    gather: Callable,
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    item_type: "GraphQLOutputType",
+    inner_coercer: Callable,
+) -> List[Any]:
+    """
+    Computes the value of list items concurrently while never completing more
+    than `width` items at once. Values are returned in the list order.
+    :param result: resolved list value
+    :param width: maximum number of items to complete at once
+    :param gather: the function used to run the item coroutines concurrently
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param item_type: GraphQLType of list items
+    :param inner_coercer: the pre-computed coercer to use on the items
+    :type result: List[Any]
+    :type width: int
+    :type gather: Callable
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type item_type: GraphQLOutputType
+    :type inner_coercer: Callable
+    :return: the computed values
+    :rtype: List[Any]
+    :raises ExecutionDeadlineExceeded: when the deadline of the request is
+    passed before all the items are completed
+    """
+    # pylint: disable=too-many-arguments
+    if execution_context.is_deadline_exceeded():
+        raise ExecutionDeadlineExceeded()
+
+    if width >= len(result):
+        return await gather(
+            *[
+                complete_list_item(
+                    item,
+                    index,
+                    info,
+                    execution_context,
+                    field_nodes,
+                    path,
+                    item_type,
+                    inner_coercer,
+                )
+                for index, item in enumerate(result)
+            ]
+        )
+
+    results = [None] * len(result)
+    items = enumerate(result)
+    completed_count = 0
+
+    async def worker() -> None:
+        nonlocal completed_count
+        for index, item in items:
+            if execution_context.is_deadline_exceeded():
+                return
+            results[index] = await complete_list_item(
+                item,
+                index,
+                info,
+                execution_context,
+                field_nodes,
+                path,
+                item_type,
+                inner_coercer,
+            )
+            completed_count += 1
+
+    await gather(*[worker() for _ in range(width)])
+    if completed_count < len(result):
+        raise ExecutionDeadlineExceeded()
+    return results
+
+
 @null_coercer_wrapper
 async def list_coercer(
     result: Any,
@@ -17,6 +203,8 @@ async def list_coercer(
     path: "Path",
     item_type: "GraphQLOutputType",
     inner_coercer: Callable,
+    is_concurrently: bool = False,
+    concurrency_limit: Optional[int] = None,
 ) -> List[Any]:
     """
     Computes the value of a list.
@@ -27,6 +215,10 @@ async def list_coercer(
     :param path: the path traveled until this resolver
     :param item_type: GraphQLType of list items
     :param inner_coercer: the pre-computed coercer to use on the result
+    :param is_concurrently: whether list items should be completed
+    concurrently
+    :param concurrency_limit: maximum number of list items to complete at
+    once when completed concurrently
     :type result: Any
     :type info: ResolveInfo
     :type execution_context: ExecutionContext
@@ -34,31 +226,46 @@ async def list_coercer(
     :type path: Path
     :type item_type: GraphQLOutputType
     :type inner_coercer: Callable
+    :type is_concurrently: bool
+    :type concurrency_limit: Optional[int]
     :return: the computed value
     :rtype: List[Any]
     """
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-locals,too-many-arguments
     if not isinstance(result, list):
         raise TypeError(
             "Expected Iterable, but did not find one for field "
             f"{info.parent_type.name}.{info.field_name}."
         )
 
-    results = []
-    for index, item in enumerate(result):
+    item_args = (
+        info,
+        execution_context,
+        field_nodes,
+        path,
+        item_type,
+        inner_coercer,
+    )
+    width = min(len(result), concurrency_limit or len(result))
+    if not is_concurrently or width < 2:
+        results = await complete_list_items_serially(result, *item_args)
+    else:
+        extra_slots = execution_context.acquire_list_slots(width - 1)
         try:
-            value = await complete_value_catching_error(
-                item,
-                info,
-                execution_context,
-                field_nodes,
-                Path(path, index),
-                item_type,
-                inner_coercer,
+            results = (
+                await complete_list_items_concurrently(
+                    result,
+                    extra_slots + 1,
+                    gather_eagerly
+                    if execution_context.schema.eager_execution
+                    else asyncio.gather,
+                    *item_args,
+                )
+                if extra_slots
+                else await complete_list_items_serially(result, *item_args)
             )
-        except Exception as e:  # pylint: disable=broad-except
-            value = e
-        results.append(value)
+        finally:
+            execution_context.release_list_slots(extra_slots)
 
     exceptions = extract_exceptions_from_results(results)
     if exceptions:
@@ -8,7 +8,69 @@ from tartiflette.types.exceptions.tartiflette import CoercionError
 from tartiflette.utils.errors import graphql_error_from_nodes
 from tartiflette.utils.values import is_invalid_value
 
-__all__ = ("variable_coercer", "coerce_variables")
+__all__ = (
+    "variable_coercer",
+    "sync_variable_coercer",
+    "coerce_variables",
+    "compile_variables_coercer",
+)
+
+
+def _missing_variable_error(
+    executable_variable_definition: "ExecutableVariableDefinition",
+    has_value: bool,
+) -> "TartifletteError":
+    """
+    Returns the error of a variable of non-null type whose value is null or
+    wasn't provided.
+    :param executable_variable_definition: the variable definition to treat
+    :param has_value: whether or not a value was provided for the variable
+    :type executable_variable_definition: ExecutableVariableDefinition
+    :type has_value: bool
+    :return: the error of the variable
+    :rtype: TartifletteError
+    """
+    var_name = executable_variable_definition.name
+    var_type = executable_variable_definition.graphql_type
+    return graphql_error_from_nodes(
+        (
+            f"Variable < ${var_name} > of non-null type "
+            f"< {var_type} > must not be null."
+        )
+        if has_value
+        else (
+            f"Variable < ${var_name} > of required type "
+            f"< {var_type} > was not provided."
+        ),
+        nodes=executable_variable_definition.definition,
+    )
+
+
+def _variable_coercion_result(
+    var_name: str, value: Any, coercion_result: "CoercionResult"
+) -> "CoercionResult":
+    """
+    Returns the coercion result of the value of a variable, prefixing the
+    coercion errors with the name & the value of the variable.
+    :param var_name: the name of the variable
+    :param value: the raw value of the variable
+    :param coercion_result: the result of the coercion of the value
+    :type var_name: str
+    :type value: Any
+    :type coercion_result: CoercionResult
+    :return: the coercion result of the variable
+    :rtype: CoercionResult
+    """
+    coerced_value, coerce_errors = coercion_result
+    if coerce_errors:
+        for coerce_error in coerce_errors:
+            if isinstance(coerce_error, CoercionError):
+                coerce_error.message = (
+                    f"Variable < ${var_name} > got invalid value "
+                    f"< {value} >; {coerce_error.message}"
+                )
+        return CoercionResult(errors=coerce_errors)
+    return CoercionResult(value=coerced_value)
 
 
 async def variable_coercer(
@@ -63,34 +125,64 @@ async def variable_coercer(
     if (not has_value or value is None) and var_type.is_non_null_type:
         return CoercionResult(
             errors=[
-                graphql_error_from_nodes(
-                    (
-                        f"Variable < ${var_name} > of non-null type "
-                        f"< {var_type} > must not be null."
-                    )
-                    if has_value
-                    else (
-                        f"Variable < ${var_name} > of required type "
-                        f"< {var_type} > was not provided."
-                    ),
-                    nodes=variable_definition_node,
+                _missing_variable_error(
+                    executable_variable_definition, has_value
                 )
             ]
         )
 
     if has_value:
-        coerced_value, coerce_errors = await input_coercer(
-            variable_definition_node, value, ctx
+        return _variable_coercion_result(
+            var_name,
+            value,
+            await input_coercer(variable_definition_node, value, ctx),
+        )
+
+    return UNDEFINED_VALUE
+
+
+def sync_variable_coercer(
+    executable_variable_definition: "ExecutableVariableDefinition",
+    raw_variable_values: Dict[str, Any],
+    input_coercer: Callable,
+) -> Union["CoercionResult", "UNDEFINED_VALUE"]:
+    """
+    Computes the value of a variable whose type can be coerced
+    synchronously. Variables using their default value have to go through
+    `variable_coercer`.
+    :param executable_variable_definition: the variable definition to treat
+    :param raw_variable_values: the raw variables values to coerce
+    :param input_coercer: synchronous callable to use to compute the
+    variable value
+    :type executable_variable_definition: ExecutableVariableDefinition
+    :type raw_variable_values: Dict[str, Any]
+    :type input_coercer: Callable
+    :return: the computed value of the variable definition
+    :rtype: Union[CoercionResult, UNDEFINED_VALUE]
+    """
+    var_name = executable_variable_definition.name
+    has_value = var_name in raw_variable_values
+    value = raw_variable_values.get(var_name, UNDEFINED_VALUE)
+
+    if (
+        not has_value or value is None
+    ) and executable_variable_definition.graphql_type.is_non_null_type:
+        return CoercionResult(
+            errors=[
+                _missing_variable_error(
+                    executable_variable_definition, has_value
+                )
+            ]
+        )
+
+    if has_value:
+        return _variable_coercion_result(
+            var_name,
+            value,
+            input_coercer(
+                executable_variable_definition.definition, value, None
+            ),
         )
-        if coerce_errors:
-            for coerce_error in coerce_errors:
-                if isinstance(coerce_error, CoercionError):
-                    coerce_error.message = (
-                        f"Variable < ${var_name} > got invalid value "
-                        f"< {value} >; {coerce_error.message}"
-                    )
-            return CoercionResult(errors=coerce_errors)
-        return CoercionResult(value=coerced_value)
 
     return UNDEFINED_VALUE
 
@@ -136,3 +228,78 @@ async def coerce_variables(
             coerced_values[executable_variable_definition.name] = value
 
     return coerced_values, coercion_errors
+
+
+def compile_variables_coercer(
+    executable_variable_definitions: List["ExecutableVariableDefinition"],
+) -> Callable:
+    """
+    Computes the function coercing the variables of an operation. Variables
+    whose type can be coerced synchronously are coerced inline, only the
+    ones awaiting `on_post_input_coercion` directives or using their
+    default value go through the asynchronous coercers.
+    :param executable_variable_definitions: the variable definitions of the
+    operation
+    :type executable_variable_definitions: List[ExecutableVariableDefinition]
+    :return: the coroutine function computing the values of the variables
+    from the raw variables values & the context
+    :rtype: Callable
+    """
+
+    async def variables_coercer(
+        raw_variable_values: Dict[str, Any], ctx: Optional[Any]
+    ) -> Tuple[Dict[str, Any], List["TartifletteError"]]:
+        results = []
+        pending_indexes = []
+        pending_coroutines = []
+        for index, executable_variable_definition in enumerate(
+            executable_variable_definitions
+        ):
+            if executable_variable_definition.sync_coercer is None or (
+                executable_variable_definition.name not in raw_variable_values
+                and not is_invalid_value(
+                    executable_variable_definition.default_value
+                )
+            ):
+                results.append(UNDEFINED_VALUE)
+                pending_indexes.append(index)
+                pending_coroutines.append(
+                    executable_variable_definition.coercer(
+                        raw_variable_values, ctx
+                    )
+                )
+                continue
+
+            results.append(
+                executable_variable_definition.sync_coercer(
+                    raw_variable_values
+                )
+            )
+
+        if pending_coroutines:
+            for index, result in zip(
+                pending_indexes,
+                await asyncio.gather(
+                    *pending_coroutines, return_exceptions=True
+                ),
+            ):
+                results[index] = result
+
+        coercion_errors: List["TartifletteError"] = []
+        coerced_values: Dict[str, Any] = {}
+
+        for executable_variable_definition, result in zip(
+            executable_variable_definitions, results
+        ):
+            if is_invalid_value(result):
+                continue
+
+            value, errors = result
+            if errors:
+                coercion_errors.extend(errors)
+            else:
+                coerced_values[executable_variable_definition.name] = value
+
+        return coerced_values, coercion_errors
+
+    return variables_coercer
@@ -0,0 +1,50 @@
+from typing import Any, Callable, Dict, Optional
+
+from tartiflette import Directive
+
+
+class CostDirective:
+    """
+    Built-in directive to declare the cost of a field for the complexity
+    analysis of the operations.
+    """
+
+    async def on_post_bake(
+        self,
+        directive_args: Dict[str, Any],
+        next_directive: Callable,
+        element: "GraphQLField",
+    ) -> "GraphQLField":
+        """
+        Sets the cost of the baked field.
+        :param directive_args: arguments passed to the directive
+        :param next_directive: next directive to call
+        :param element: current baked field
+        :type directive_args: Dict[str, Any]
+        :type next_directive: Callable
+        :type element: GraphQLField
+        :return: the baked field
+        :rtype: GraphQLField
+        """
+        element = await next_directive(element)
+        setattr(element, "cost", directive_args["value"])
+        return element
+
+
+def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Links the directive to the appropriate schema and returns the SDL related
+    to the directive.
+    :param schema_name: schema name to link with
+    :param config: configuration of the directive
+    :type schema_name: str
+    :type config: Optional[Dict[str, Any]]
+    :return: the SDL related to the directive
+    :rtype: str
+    """
+    # pylint: disable=unused-argument
+    Directive("cost", schema_name=schema_name)(CostDirective())
+    return '''
+    """Declares the cost of the field for the complexity analysis of the operations."""
+    directive @cost(value: Int!) on FIELD_DEFINITION
+    '''
@@ -124,7 +124,9 @@ def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
     :rtype: str
     """
     # pylint: disable=unused-argument
-    Directive("include", schema_name=schema_name)(IncludeDirective())
+    Directive("include", schema_name=schema_name, collection_scope="document")(
+        IncludeDirective()
+    )
     return '''
     """Directs the executor to include this field or fragment only when the `if` argument is true."""
     directive @include(
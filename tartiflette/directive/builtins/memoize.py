@@ -0,0 +1,51 @@
+from typing import Any, Callable, Dict, Optional
+
+from tartiflette import Directive
+
+
+class MemoizeDirective:
+    """
+    Built-in directive to memoize the results of a field resolver for the
+    duration of a request.
+    """
+
+    async def on_post_bake(
+        self,
+        directive_args: Dict[str, Any],
+        next_directive: Callable,
+        element: "GraphQLField",
+    ) -> "GraphQLField":
+        """
+        Marks the baked field as memoized.
+        :param directive_args: arguments passed to the directive
+        :param next_directive: next directive to call
+        :param element: current baked field
+        :type directive_args: Dict[str, Any]
+        :type next_directive: Callable
+        :type element: GraphQLField
+        :return: the memoized baked field
+        :rtype: GraphQLField
+        """
+        # pylint: disable=unused-argument
+        element = await next_directive(element)
+        setattr(element, "memoize", True)
+        return element
+
+
+def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Links the directive to the appropriate schema and returns the SDL related
+    to the directive.
+    :param schema_name: schema name to link with
+    :param config: configuration of the directive
+    :type schema_name: str
+    :type config: Optional[Dict[str, Any]]
+    :return: the SDL related to the directive
+    :rtype: str
+    """
+    # pylint: disable=unused-argument
+    Directive("memoize", schema_name=schema_name)(MemoizeDirective())
+    return '''
+    """Directs the executor to resolve the field only once per parent and arguments during a request."""
+    directive @memoize on FIELD_DEFINITION
+    '''
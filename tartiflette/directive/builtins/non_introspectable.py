@@ -49,9 +49,11 @@ def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
     :rtype: str
     """
     # pylint: disable=unused-argument
-    Directive("nonIntrospectable", schema_name=schema_name)(
-        NonIntrospectableDirective()
-    )
+    Directive(
+        "nonIntrospectable",
+        schema_name=schema_name,
+        context_independent_introspection=True,
+    )(NonIntrospectableDirective())
     return '''
     """Directs the executor to hide the element on introspection queries."""
     directive @nonIntrospectable on FIELD_DEFINITION
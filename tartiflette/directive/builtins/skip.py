@@ -124,7 +124,9 @@ def bake(schema_name: str, config: Optional[Dict[str, Any]] = None) -> str:
     :rtype: str
     """
     # pylint: disable=unused-argument
-    Directive("skip", schema_name=schema_name)(SkipDirective())
+    Directive("skip", schema_name=schema_name, collection_scope="document")(
+        SkipDirective()
+    )
     return '''
     """Directs the executor to skip this field or fragment when the `if` argument is true."""
     directive @skip(
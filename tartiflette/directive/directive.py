@@ -32,19 +32,34 @@ class Directive:
         name: str,
         schema_name: str = "default",
         arguments_coercer: Optional[Callable] = None,
+        collection_scope: str = "request",
+        context_independent_introspection: bool = False,
     ) -> None:
         """
         :param name: name of the directive
         :param schema_name: name of the schema to which link the directive
         :param arguments_coercer: callable to use to coerce directive arguments
+        :param collection_scope: determines how long the decision taken by
+        the `on_*_collection` hooks can be reused ("document", "request" or
+        "dynamic")
+        :param context_independent_introspection: whether or not the
+        `on_introspection` hook only depends on the introspected element &
+        the directive arguments, which allows the responses of introspection
+        queries to be cached
         :type name: str
         :type schema_name: str
         :type arguments_coercer: Optional[Callable]
+        :type collection_scope: str
+        :type context_independent_introspection: bool
         """
         self.name = name
         self._implementation = None
         self._schema_name = schema_name
         self._arguments_coercer = arguments_coercer
+        self._collection_scope = collection_scope
+        self._context_independent_introspection = (
+            context_independent_introspection
+        )
 
     def bake(self, schema: "GraphQLSchema") -> None:
         """
@@ -63,6 +78,10 @@ class Directive:
             directive.arguments_coercer = (
                 self._arguments_coercer or schema.default_arguments_coercer
             )
+            directive.collection_scope = self._collection_scope
+            directive.context_independent_introspection = (
+                self._context_independent_introspection
+            )
         except KeyError:
             raise UnknownDirectiveDefinition(
                 f"Unknown Directive Definition {self.name}"
@@ -1,7 +1,7 @@
-import json as default_json_module
+import asyncio
 import logging
 
-from functools import lru_cache, partial
+from functools import partial
 from importlib import import_module, invalidate_caches
 from inspect import isawaitable
 from typing import (
@@ -10,27 +10,47 @@ from typing import (
     Callable,
     Dict,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     Union,
 )
 
 from tartiflette.constants import UNDEFINED_VALUE
-from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.execution.batch import BatchCaches, current_batch_caches
+from tartiflette.execution.collect import (
+    DocumentParsingInfo,
+    parse_and_validate_query,
+)
+from tartiflette.execution.complexity import ComplexityLimits
+from tartiflette.execution.document_cache import DocumentCache
 from tartiflette.execution.execute import create_source_event_stream, execute
+from tartiflette.execution.introspection import INTROSPECTION_QUERY
+from tartiflette.execution.memoization import ResolverMemoizationInfo
+from tartiflette.execution.persisted_queries import PersistedQueries
 from tartiflette.execution.response import build_response
+from tartiflette.execution.stream import (
+    chunk_fragments,
+    encode_response,
+    execute_stream,
+)
 from tartiflette.schema.bakery import SchemaBakery
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.types.exceptions.tartiflette import (
     ImproperlyConfigured,
     NonCallable,
     NonCoroutine,
+    TartifletteError,
 )
 from tartiflette.utils.callables import is_valid_coroutine
 from tartiflette.utils.errors import (
     default_error_coercer,
     error_coercer_factory,
 )
+from tartiflette.utils.json_codecs import (
+    default_json_encoder,
+    default_json_loader,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +70,10 @@ _BUILTINS_MODULES = (
     "tartiflette.schema.builtins.introspection",
 )
 
+# Built-ins only imported when the complexity analysis is enabled, so that
+# schemas declaring their own `@cost` directive can still be used otherwise
+_COMPLEXITY_BUILTINS_MODULES = ("tartiflette.directive.builtins.cost",)
+
 
 async def _bake_module(
     module: object, schema_name: str, config: Optional[Dict[str, Any]] = None
@@ -72,7 +96,10 @@ async def _bake_module(
 
 
 async def _import_builtins(
-    imported_modules: List[object], sdl: str, schema_name: str
+    imported_modules: List[object],
+    sdl: str,
+    schema_name: str,
+    builtins_modules: Tuple[str, ...] = _BUILTINS_MODULES,
 ) -> Tuple[List[object], str]:
     """
     Imports and bakes built-ins directives and scalars if not already
@@ -80,13 +107,15 @@ async def _import_builtins(
     :param imported_modules: list of already imported modules
     :param sdl: SDL with complementary content from already baked modules
     :param schema_name: schema name to link with
+    :param builtins_modules: names of the built-ins modules to import
     :type imported_modules: List[object]
     :type sdl: str
     :type schema_name: str
+    :type builtins_modules: Tuple[str, ...]
     :return: couple list of imported modules instance/final SDL
     :rtype: Tuple[List[object], str]
     """
-    for module in _BUILTINS_MODULES:
+    for module in builtins_modules:
         try:
             module = import_module(module)
             sdl = "{sdl}\n{msdl}".format(
@@ -100,15 +129,19 @@ async def _import_builtins(
 
 
 async def _import_modules(
-    module_definitions: List[Union[str, Dict[str, Any]]], schema_name: str
+    module_definitions: List[Union[str, Dict[str, Any]]],
+    schema_name: str,
+    builtins_modules: Tuple[str, ...] = _BUILTINS_MODULES,
 ) -> Tuple[List[object], str]:
     """
     Imports and bakes the list of modules filled at engine initialisation
     before importing & baking built-ins modules.
     :param module_definitions: list of modules filled at engine initialisation
     :param schema_name: schema name to link with
+    :param builtins_modules: names of the built-ins modules to import
     :type module_definitions: List[Union[str, Dict[str, Any]]]
     :type schema_name: str
+    :type builtins_modules: Tuple[str, ...]
     :return: couple list of imported modules instance/final SDL
     :rtype: Tuple[List[object], str]
     """
@@ -131,7 +164,134 @@ async def _import_modules(
             )
         imported_modules.append(module)
 
-    return await _import_builtins(imported_modules, sdl, schema_name)
+    return await _import_builtins(
+        imported_modules, sdl, schema_name, builtins_modules
+    )
+
+
+class _EngineOptions(NamedTuple):
+    """
+    Options of an engine which can either be given at its initialisation or
+    when cooking it, the ones given when cooking it taking precedence.
+    """
+
+    query_cache_decorator: Optional[Callable] = UNDEFINED_VALUE
+    json_loader: Optional[Callable[[Union[str, bytes]], Dict[str, Any]]] = None
+    json_encoder: Optional[Callable[[Any], Union[str, bytes]]] = None
+    coerce_list_concurrently: Optional[bool] = None
+    list_concurrency_limit: Optional[int] = None
+    request_list_concurrency_limit: Optional[int] = None
+    schema_snapshot_path: Optional[str] = None
+    eager_execution: Optional[bool] = None
+    complexity_limits: Optional["ComplexityLimits"] = None
+    execution_timeout: Optional[float] = None
+    introspection_cache: Optional[bool] = None
+    prerender_introspection: Optional[bool] = None
+    persisted_query_store: Optional["PersistedQueryStore"] = None
+    persisted_queries_manifest: Optional[Union[str, Dict[str, str]]] = None
+    trusted_documents: Optional[bool] = None
+    trusted_document_verifier: Optional[Callable] = None
+
+    def override(self, **options: Any) -> "_EngineOptions":
+        """
+        Returns the options overridden by the given ones which are set, i.e.
+        which aren't left to their default value (`None`, or
+        `UNDEFINED_VALUE` for `query_cache_decorator` which is disabled with
+        `None`).
+        :param options: the options overriding the current ones
+        :type options: Any
+        :return: the overridden options
+        :rtype: _EngineOptions
+        """
+        return _EngineOptions(
+            *(
+                override if override is not default else value
+                for value, override, default in zip(
+                    self, _EngineOptions(**options), _EngineOptions()
+                )
+            )
+        )
+
+    def validate(self) -> None:
+        """
+        Ensures that the options have valid values.
+        :raises ImproperlyConfigured: if an option has an invalid value
+        :raises NonCallable: if the `trusted_document_verifier` isn't callable
+        """
+        for limit_name, limit in (
+            ("list_concurrency_limit", self.list_concurrency_limit),
+            (
+                "request_list_concurrency_limit",
+                self.request_list_concurrency_limit,
+            ),
+        ):
+            if limit is not None and (not isinstance(limit, int) or limit < 1):
+                raise ImproperlyConfigured(
+                    f"Given < {limit_name} > should be a positive integer."
+                )
+
+        if self.complexity_limits is not None and not isinstance(
+            self.complexity_limits, ComplexityLimits
+        ):
+            raise ImproperlyConfigured(
+                "Given < complexity_limits > should be a ComplexityLimits "
+                "instance."
+            )
+
+        if self.execution_timeout is not None and (
+            isinstance(self.execution_timeout, bool)
+            or not isinstance(self.execution_timeout, (int, float))
+            or self.execution_timeout <= 0
+        ):
+            raise ImproperlyConfigured(
+                "Given < execution_timeout > should be a positive number."
+            )
+
+        if self.trusted_document_verifier and not callable(
+            self.trusted_document_verifier
+        ):
+            raise NonCallable(
+                "Given < trusted_document_verifier > is not callable."
+            )
+
+    @property
+    def builtins_modules(self) -> Tuple[str, ...]:
+        """
+        Returns the names of the built-ins modules to import.
+        :return: the names of the built-ins modules to import
+        :rtype: Tuple[str, ...]
+        """
+        if self.complexity_limits is None:
+            return _BUILTINS_MODULES
+        return _BUILTINS_MODULES + _COMPLEXITY_BUILTINS_MODULES
+
+    @property
+    def query_cache_accepts_buffers(self) -> bool:
+        """
+        Returns whether or not mutable buffers can be given to the query
+        cache. Custom caches may hash & retain the queries, which can't be
+        done with mutable buffers.
+        :return: whether or not mutable buffers can be given to the cache
+        :rtype: bool
+        """
+        return not callable(self.query_cache_decorator) or isinstance(
+            self.query_cache_decorator, DocumentCache
+        )
+
+    def configure_schema(self, schema: "GraphQLSchema") -> None:
+        """
+        Sets the options used to execute the requests on a baked schema.
+        :param schema: the baked GraphQLSchema instance
+        :type schema: GraphQLSchema
+        """
+        schema.json_loader = self.json_loader
+        schema.json_encoder = self.json_encoder
+        schema.complexity_limits = self.complexity_limits
+        schema.execution_timeout = self.execution_timeout
+        schema.introspection_cache = bool(
+            self.introspection_cache or self.prerender_introspection
+        )
+        schema.eager_execution = bool(self.eager_execution)
 
 
 class Engine:
@@ -150,6 +310,7 @@ class Engine:
         query_cache_decorator=UNDEFINED_VALUE,
         json_loader=None,
         custom_default_arguments_coercer=None,
+        **options,
     ) -> None:
         """
         Creates an uncooked Engine instance.
@@ -164,18 +325,28 @@ class Engine:
             custom_default_arguments_coercer
         )
         self._modules = modules
-        self._query_cache_decorator = (
-            query_cache_decorator
-            if query_cache_decorator is not UNDEFINED_VALUE
-            else lru_cache(maxsize=512)
-        )
         self._sdl = sdl
         self._cooked = False
         self._build_response = None
         self._query_executor = None
         self._subscription_executor = None
         self._cached_parse_and_validate_query = None
-        self._json_loader = json_loader or default_json_module.loads
+        self._persisted_queries = None
+
+        options = _EngineOptions(
+            query_cache_decorator=query_cache_decorator,
+            json_loader=json_loader,
+            **options,
+        )
+        self._options = options._replace(
+            query_cache_decorator=(
+                options.query_cache_decorator
+                if options.query_cache_decorator is not UNDEFINED_VALUE
+                else DocumentCache()
+            ),
+            json_loader=options.json_loader or default_json_loader,
+            json_encoder=options.json_encoder or default_json_encoder,
+        )
 
     async def cook(
         self,
@@ -187,9 +358,12 @@ class Engine:
         custom_default_type_resolver: Optional[Callable] = None,
         modules: Optional[Union[str, List[str], List[Dict[str, Any]]]] = None,
         query_cache_decorator: Optional[Callable] = UNDEFINED_VALUE,
-        json_loader: Optional[Callable[[str], Dict[str, Any]]] = None,
+        json_loader: Optional[
+            Callable[[Union[str, bytes]], Dict[str, Any]]
+        ] = None,
         custom_default_arguments_coercer: Optional[Callable] = None,
         schema_name: Optional[str] = None,
+        **options: Any,
     ) -> None:
         """
         Cook the tartiflette, basically prepare the engine by binding it to
@@ -208,21 +382,70 @@ class Engine:
         want the engine to import, usually this modules contains your
         Resolvers, Directives, Scalar or Subscription code
         :param query_cache_decorator: callable that will replace the
-        tartiflette default lru_cache decorator to cache query parsing
-        :param json_loader: A callable that will replace default python
-        json module.loads for ast_json loading
+        tartiflette default DocumentCache decorator to cache query parsing
+        :param json_loader: A callable that will replace the default loader
+        of the AST JSON of the queries (`orjson.loads` if installed, python
+        json module.loads otherwise), it receives the raw bytes of the JSON
         :param custom_default_arguments_coercer: callable that will replace the
         tartiflette `default_arguments_coercer`
         :param schema_name: name of the SDL
+        :param options: options of the engine overriding the ones given at
+        its initialisation:
+        - `coerce_list_concurrently` (Optional[bool]): whether or not output
+        list items should be coerced concurrently (defaults to `False`)
+        - `list_concurrency_limit` (Optional[int]): maximum number of items of
+        a single output list to coerce at once
+        - `request_list_concurrency_limit` (Optional[int]): maximum number of
+        additional list items to coerce at once across a whole request
+        - `persisted_query_store` (Optional[PersistedQueryStore]): store of
+        the queries which can be persisted by clients & executed through
+        their hash (automatic persisted queries are disabled if `None`,
+        default)
+        - `persisted_queries_manifest` (Optional[Union[str, Dict[str, str]]]):
+        mapping of hashes to queries (or path to a JSON file containing it) to
+        register as persisted queries
+        - `schema_snapshot_path` (Optional[str]): directory where snapshots of
+        the parsed & validated SDL are stored to skip its parsing & validation
+        when it hasn't changed
+        - `eager_execution` (Optional[bool]): whether or not the coroutines
+        resolving the fields of a selection set (or the items of a list)
+        should be run in eager tasks, only scheduling the ones which suspend
+        (Python 3.12+, defaults to `False`)
+        - `json_encoder` (Optional[Callable[[Any], Union[str, bytes]]]): a
+        callable encoding the responses of `execute_stream` into JSON
+        documents as str or bytes (defaults to a compact python json module
+        encoder)
+        - `complexity_limits` (Optional[ComplexityLimits]): limits of the
+        depth, field count & cost of the operations, operations exceeding them
+        being rejected before their execution
+        - `execution_timeout` (Optional[float]): maximum duration of the
+        execution of a request in seconds, the fields which couldn't be
+        completed in time being resolved with an error
+        - `introspection_cache` (Optional[bool]): whether or not the responses
+        of the introspection queries should be cached along with their
+        document (defaults to `False`)
+        - `prerender_introspection` (Optional[bool]): whether or not the
+        response of the standard introspection query should be computed &
+        JSON encoded once the engine is cooked, which enables the
+        introspection cache (defaults to `False`)
+        - `trusted_documents` (Optional[bool]): whether or not the queries of
+        the persisted queries manifest should be executed without being
+        validated (defaults to `False`)
+        - `trusted_document_verifier` (Optional[Callable]): callable called
+        with the hash, the query & the context of the queries sent along with
+        their hash which aren't persisted yet, returning whether or not the
+        query comes from a trusted source (e.g. a valid signature) and can be
+        persisted without being validated
         :type sdl: Union[str, List[str]]
         :type error_coercer: Callable[[Exception, Dict[str, Any]], Dict[str, Any]]
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
         :type modules: Optional[Union[str, List[str], List[Dict[str, Any]]]]
         :type query_cache_decorator: Optional[Callable]
-        :type json_loader: Optional[Callable[[str], Dict[str, Any]]]
+        :type json_loader: Optional[Callable[[Union[str, bytes]], Dict[str, Any]]]
         :type custom_default_arguments_coercer: Optional[Callable]
         :type schema_name: Optional[str]
+        :type options: Any
         """
         # pylint: disable=too-many-arguments,too-many-locals
         if self._cooked:
@@ -251,11 +474,9 @@ class Engine:
         custom_default_resolver = (
             custom_default_resolver or self._custom_default_resolver
         )
-        if custom_default_resolver and not is_valid_coroutine(
-            custom_default_resolver
-        ):
-            raise NonCoroutine(
-                "Given < custom_default_resolver > is not a coroutine callable."
+        if custom_default_resolver and not callable(custom_default_resolver):
+            raise NonCallable(
+                "Given < custom_default_resolver > is not callable."
             )
 
         custom_default_type_resolver = (
@@ -280,12 +501,19 @@ class Engine:
                 "coroutine callable."
             )
 
+        options = self._options.override(
+            query_cache_decorator=query_cache_decorator,
+            json_loader=json_loader,
+            **options,
+        )
+        options.validate()
+
         self._error_coercer = error_coercer_factory(
             custom_error_coercer or default_error_coercer
         )
 
         self._modules, modules_sdl = await _import_modules(
-            modules, schema_name
+            modules, schema_name, options.builtins_modules
         )
 
         SchemaRegistry.register_sdl(schema_name, sdl, modules_sdl)
@@ -294,6 +522,10 @@ class Engine:
             custom_default_resolver,
             custom_default_type_resolver,
             custom_default_arguments_coercer,
+            options.coerce_list_concurrently,
+            options.list_concurrency_limit,
+            options.request_list_concurrency_limit,
+            options.schema_snapshot_path,
         )
         self._build_response = partial(
             build_response, error_coercer=self._error_coercer
@@ -306,18 +538,140 @@ class Engine:
             self._perform_query, self._perform_subscription
         )
 
-        if query_cache_decorator is UNDEFINED_VALUE:
-            query_cache_decorator = self._query_cache_decorator
-
         self._cached_parse_and_validate_query = (
-            query_cache_decorator(parse_and_validate_query)
-            if callable(query_cache_decorator)
+            options.query_cache_decorator(parse_and_validate_query)
+            if callable(options.query_cache_decorator)
             else parse_and_validate_query
         )
 
-        self._schema.json_loader = json_loader or self._json_loader
+        options.configure_schema(self._schema)
+        self._options = options
+        await self._prepare_documents()
+
         self._cooked = True
 
+    async def _prepare_documents(self) -> None:
+        """
+        Prepares the documents known once the engine is cooked: warms the
+        document cache, registers the queries of the persisted queries
+        manifest & pre-renders the introspection query.
+        """
+        options = self._options
+        if isinstance(options.query_cache_decorator, DocumentCache):
+            options.query_cache_decorator.warm(self._schema)
+
+        self._persisted_queries = PersistedQueries(
+            options.persisted_query_store,
+            bool(options.trusted_documents),
+            options.trusted_document_verifier,
+        )
+        if options.persisted_queries_manifest:
+            await self.register_persisted_queries(
+                options.persisted_queries_manifest
+            )
+
+        if options.prerender_introspection:
+            await self._prerender_introspection_query()
+
+    def resolver_memoization_info(self) -> "ResolverMemoizationInfo":
+        """
+        Returns the statistics of the memoized resolvers: `hits` is the
+        number of saved resolver calls and `misses` the number of memoized
+        resolver calls actually performed.
+        :return: the statistics of the memoized resolvers
+        :rtype: ResolverMemoizationInfo
+        """
+        return ResolverMemoizationInfo(
+            hits=self._schema.memoization_hits,
+            misses=self._schema.memoization_misses,
+        )
+
+    def document_parsing_info(self) -> "DocumentParsingInfo":
+        """
+        Returns the statistics of the parsed queries: `trusted` is the number
+        of queries parsed without being validated since they come from a
+        trusted source and `validated` the number of queries parsed &
+        validated.
+        :return: the statistics of the parsed queries
+        :rtype: DocumentParsingInfo
+        """
+        return DocumentParsingInfo(
+            trusted=self._schema.trusted_parses,
+            validated=self._schema.validated_parses,
+        )
+
+    async def _prerender_introspection_query(self) -> None:
+        """
+        Executes the standard introspection query and JSON encodes its
+        response. The query is parsed through the query cache, so that the
+        requests sending it (whether as `str` or `bytes`) get the cached
+        document along with its cached response.
+        """
+        if self._schema.has_context_dependent_introspection_directives:
+            raise ImproperlyConfigured(
+                "The introspection query can't be pre-rendered since the "
+                "schema uses introspection directives which aren't "
+                "context independent."
+            )
+
+        document, errors = self._cached_parse_and_validate_query(
+            INTROSPECTION_QUERY, self._schema
+        )
+        await self._query_executor(
+            self._schema,
+            document,
+            errors,
+            "IntrospectionQuery",
+            None,
+            None,
+            None,
+            context_coercer=None,
+        )
+
+    async def register_persisted_queries(
+        self, manifest: Union[str, Dict[str, str]]
+    ) -> None:
+        """
+        Registers a manifest of queries as persisted queries. Each query is
+        parsed & validated once and for all (only parsed if the engine trusts
+        the persisted documents) and its document is kept for the lifetime of
+        the engine. Queries are also persisted in the `persisted_query_store`
+        if any.
+        :param manifest: mapping of hashes to queries or path to a JSON file
+        containing it
+        :type manifest: Union[str, Dict[str, str]]
+        """
+        await self._persisted_queries.register(manifest, self._schema)
+
+    async def _parse_and_validate_request(
+        self,
+        query: Optional[Union[str, bytes, bytearray, memoryview]],
+        query_hash: Optional[str],
+        context: Optional[Any] = None,
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Returns the DocumentNode of a request, either from its query or from
+        its persisted query hash.
+        :param query: the GraphQL request / query
+        :param query_hash: the SHA-256 hash of the persisted query
+        :param context: the context of the request
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
+        :type query_hash: Optional[str]
+        :type context: Optional[Any]
+        :return: the DocumentNode or the errors of the query
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        if query_hash is None:
+            if (
+                isinstance(query, (bytearray, memoryview))
+                and not self._options.query_cache_accepts_buffers
+            ):
+                query = bytes(query)
+            return self._cached_parse_and_validate_query(query, self._schema)
+        return await self._persisted_queries.parse_and_validate(
+            query, query_hash, self._schema, context
+        )
+
     async def _perform_subscription(
         self,
         schema: "GraphQLSchema",
@@ -383,11 +737,12 @@ class Engine:
 
     async def execute(
         self,
-        query: Union[str, bytes],
+        query: Optional[Union[str, bytes, bytearray, memoryview]] = None,
         operation_name: Optional[str] = None,
         context: Optional[Any] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        query_hash: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Parses and executes a GraphQL query/mutation request.
@@ -398,16 +753,19 @@ class Engine:
         :param variables: the variables provided in the GraphQL request
         :param initial_value: an initial value corresponding to the root type
         being executed
-        :type query: Union[str, bytes]
+        :param query_hash: the SHA-256 hash of a persisted query, the query
+        is persisted when provided along with its hash
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
         :type operation_name: Optional[str]
         :type context: Optional[Any]
         :type variables: Optional[Dict[str, Any]]
         :type initial_value: Optional[Any]
+        :type query_hash: Optional[str]
         :return: computed response corresponding to the request
         :rtype: Dict[str, Any]
         """
-        document, errors = self._cached_parse_and_validate_query(
-            query, self._schema
+        document, errors = await self._parse_and_validate_request(
+            query, query_hash, context
         )
 
         # Goes through potential schema directives and finish in self._perform_query
@@ -422,13 +780,211 @@ class Engine:
             context_coercer=context,
         )
 
+    async def _execute_batched_operation(
+        self,
+        document: Optional["DocumentNode"],
+        errors: Optional[List["TartifletteError"]],
+        operation_name: Optional[str],
+        context: Optional[Any],
+        variables: Optional[Dict[str, Any]],
+        initial_value: Optional[Any],
+        batch_caches: Optional["BatchCaches"],
+    ) -> Dict[str, Any]:
+        """
+        Executes an operation of a batch from its already parsed document.
+        :param document: the DocumentNode of the query of the operation
+        :param errors: the parsing & validation errors of the query
+        :param operation_name: the operation name to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :param variables: the variables provided in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param batch_caches: the resolver caches shared by the operations of
+        the batch, if any
+        :type document: Optional[DocumentNode]
+        :type errors: Optional[List[TartifletteError]]
+        :type operation_name: Optional[str]
+        :type context: Optional[Any]
+        :type variables: Optional[Dict[str, Any]]
+        :type initial_value: Optional[Any]
+        :type batch_caches: Optional[BatchCaches]
+        :return: computed response corresponding to the operation
+        :rtype: Dict[str, Any]
+        """
+        # pylint: disable=too-many-arguments
+        if batch_caches is not None:
+            # Each operation runs in its own task, the caches are thus only
+            # set for the current operation
+            current_batch_caches.set(batch_caches)
+
+        return await self._query_executor(
+            self._schema,
+            document,
+            errors,
+            operation_name,
+            context,
+            variables,
+            initial_value,
+            context_coercer=context,
+        )
+
+    async def execute_many(
+        self,
+        requests: List[
+            Tuple[
+                Union[str, bytes, bytearray, memoryview],
+                Optional[Dict[str, Any]],
+                Optional[str],
+            ]
+        ],
+        context: Optional[Any] = None,
+        initial_value: Optional[Any] = None,
+        share_caches: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Parses and executes a batch of GraphQL query/mutation requests
+        concurrently. Each distinct query of the batch is only parsed &
+        validated once.
+        :param requests: the `(query, variables, operation_name)` tuples of
+        the operations to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers of all the operations
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param share_caches: whether or not the BatchLoaders & the values of
+        the memoized resolvers should be shared by the operations of the
+        batch instead of being scoped to each operation
+        :type requests: List[Tuple[Union[str, bytes, bytearray, memoryview], Optional[Dict[str, Any]], Optional[str]]]
+        :type context: Optional[Any]
+        :type initial_value: Optional[Any]
+        :type share_caches: bool
+        :return: computed responses corresponding to the requests, in the
+        same order
+        :rtype: List[Dict[str, Any]]
+        """
+        parsed_queries: Dict[
+            Union[str, bytes],
+            Tuple[
+                Optional["DocumentNode"], Optional[List["TartifletteError"]]
+            ],
+        ] = {}
+        operations = []
+        for query, variables, operation_name in requests:
+            # Mutable buffers can't be hashed
+            query_key = (
+                bytes(query)
+                if isinstance(query, (bytearray, memoryview))
+                else query
+            )
+            parsed_query = parsed_queries.get(query_key)
+            if parsed_query is None:
+                parsed_query = await self._parse_and_validate_request(
+                    query, None, context
+                )
+                parsed_queries[query_key] = parsed_query
+            operations.append((parsed_query, variables, operation_name))
+
+        batch_caches = BatchCaches() if share_caches else None
+        return await asyncio.gather(
+            *[
+                self._execute_batched_operation(
+                    document,
+                    errors,
+                    operation_name,
+                    context,
+                    variables,
+                    initial_value,
+                    batch_caches,
+                )
+                for (document, errors), variables, operation_name in (
+                    operations
+                )
+            ]
+        )
+
+    async def execute_stream(
+        self,
+        query: Optional[Union[str, bytes, bytearray, memoryview]] = None,
+        operation_name: Optional[str] = None,
+        context: Optional[Any] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        initial_value: Optional[Any] = None,
+        query_hash: Optional[str] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterable[bytes]:
+        """
+        Parses and executes a GraphQL query/mutation request and yields its
+        JSON encoded response by chunks, in document order. Streaming happens
+        at the granularity of the root fields: each root field of a query is
+        encoded as soon as it and the root fields preceding it are completed
+        (the whole value of a root field being awaited before any part of it
+        is encoded), while the response of mutations is encoded once all
+        their root fields are executed.
+        :param query: the GraphQL request / query as UTF8-encoded string
+        :param operation_name: the operation name to execute
+        :param context: value that can contain everything you need and that
+        will be accessible from the resolvers
+        :param variables: the variables provided in the GraphQL request
+        :param initial_value: an initial value corresponding to the root type
+        being executed
+        :param query_hash: the SHA-256 hash of a persisted query, the query
+        is persisted when provided along with its hash
+        :param chunk_size: minimum size (in bytes) of the yielded chunks
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
+        :type operation_name: Optional[str]
+        :type context: Optional[Any]
+        :type variables: Optional[Dict[str, Any]]
+        :type initial_value: Optional[Any]
+        :type query_hash: Optional[str]
+        :type chunk_size: int
+        :return: the chunks of the JSON encoded response
+        :rtype: AsyncIterable[bytes]
+        """
+        # pylint: disable=too-many-arguments
+        document, errors = await self._parse_and_validate_request(
+            query, query_hash, context
+        )
+
+        # Schema execution directives expect the whole response, so it has
+        # to be computed before being encoded
+        fragments = (
+            encode_response(
+                await self._query_executor(
+                    self._schema,
+                    document,
+                    errors,
+                    operation_name,
+                    context,
+                    variables,
+                    initial_value,
+                    context_coercer=context,
+                ),
+                self._schema.json_encoder,
+            )
+            if errors or self._schema.has_execution_directives
+            else execute_stream(
+                self._schema,
+                document,
+                self._build_response,
+                initial_value,
+                context,
+                variables,
+                operation_name,
+            )
+        )
+
+        async for chunk in chunk_fragments(fragments, chunk_size):
+            yield chunk
+
     async def subscribe(
         self,
-        query: Union[str, bytes],
+        query: Optional[Union[str, bytes, bytearray, memoryview]] = None,
         operation_name: Optional[str] = None,
         context: Optional[Any] = None,
         variables: Optional[Dict[str, Any]] = None,
         initial_value: Optional[Any] = None,
+        query_hash: Optional[str] = None,
     ) -> AsyncIterable[Dict[str, Any]]:
         """
         Parses and executes a GraphQL subscription request.
@@ -439,16 +995,19 @@ class Engine:
         :param variables: the variables provided in the GraphQL request
         :param initial_value: an initial value corresponding to the root type
         being executed
-        :type query: Union[str, bytes]
+        :param query_hash: the SHA-256 hash of a persisted query, the query
+        is persisted when provided along with its hash
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
         :type operation_name: Optional[str]
         :type context: Optional[Any]
         :type variables: Optional[Dict[str, Any]]
         :type initial_value: Optional[Any]
+        :type query_hash: Optional[str]
         :return: computed response corresponding to the request
         :rtype: AsyncIterable[Dict[str, Any]]
         """
-        document, errors = self._cached_parse_and_validate_query(
-            query, self._schema
+        document, errors = await self._parse_and_validate_request(
+            query, query_hash, context
         )
 
         # Goes through potential schema directives and finish in self._perform_subscription
@@ -0,0 +1,28 @@
+import asyncio
+
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+__all__ = ("BatchCaches", "current_batch_caches")
+
+
+class BatchCaches:
+    """
+    Caches of the resolvers shared by the operations of a batch: the
+    BatchLoaders retrieved through `info.get_loader` & the values of the
+    memoized resolvers.
+    """
+
+    __slots__ = ("loaders", "resolver_memo")
+
+    def __init__(self) -> None:
+        self.loaders: Dict[Hashable, "BatchLoader"] = {}
+        self.resolver_memo: Dict[Hashable, Tuple[Any, "asyncio.Future"]] = {}
+
+
+# Caches of the batch the current operation belongs to, set in the task
+# executing each operation of a batch since schema execution directives
+# can't forward extra parameters to the executor
+current_batch_caches: ContextVar[Optional["BatchCaches"]] = ContextVar(
+    "current_batch_caches", default=None
+)
@@ -1,4 +1,6 @@
-from typing import Dict, List, Optional, Set, Tuple, Union
+import asyncio
+
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 from tartiflette.execution.nodes.variable_definition import (
     variable_definition_node_to_executable,
@@ -7,8 +9,12 @@ from tartiflette.language.ast import (
     FieldNode,
     FragmentSpreadNode,
     InlineFragmentNode,
+    ListValueNode,
+    ObjectValueNode,
+    VariableNode,
 )
 from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.validators import validate_document
 from tartiflette.types.exceptions.tartiflette import (
     SkipCollection,
     TartifletteError,
@@ -21,22 +27,53 @@ from tartiflette.utils.errors import to_graphql_error
 from tartiflette.utils.type_from_ast import schema_type_from_ast
 
 __all__ = (
+    "DocumentParsingInfo",
     "parse_and_validate_query",
     "collect_executable_variable_definitions",
     "collect_fields",
     "collect_subfields",
+    "get_node_collection_scope",
+    "DOCUMENT_COLLECTION_SCOPE",
+    "REQUEST_COLLECTION_SCOPE",
+    "DYNAMIC_COLLECTION_SCOPE",
 )
 
+DOCUMENT_COLLECTION_SCOPE = "document"
+REQUEST_COLLECTION_SCOPE = "request"
+DYNAMIC_COLLECTION_SCOPE = "dynamic"
+
+_COLLECTION_SCOPE_PRIORITIES = {
+    DOCUMENT_COLLECTION_SCOPE: 0,
+    REQUEST_COLLECTION_SCOPE: 1,
+    DYNAMIC_COLLECTION_SCOPE: 2,
+}
+
+
+class DocumentParsingInfo(NamedTuple):
+    """
+    Statistics of the queries parsed by an engine.
+    """
+
+    trusted: int
+    validated: int
+
 
 def parse_and_validate_query(
-    query: Union[str, bytes], schema: "GraphQLSchema"
+    query: Union[str, bytes, bytearray, memoryview],
+    schema: "GraphQLSchema",
+    trusted: bool = False,
 ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
     """
-    Analyzes & validates a query by converting it to a DocumentNode.
+    Analyzes & validates a query by converting it to a DocumentNode which is
+    then validated against the schema. Documents coming from a trusted
+    source are only parsed.
     :param query: the GraphQL request / query as UTF8-encoded string
-    :type query: Union[str, bytes]
+    :type query: Union[str, bytes, bytearray, memoryview]
     :param schema: the GraphQLSchema instance linked to the engine
     :type schema: GraphQLSchema
+    :param trusted: whether or not the query comes from a trusted source and
+    can be executed without being validated
+    :type trusted: bool
     :return: a DocumentNode representing the query
     :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
     """
@@ -50,8 +87,20 @@ def parse_and_validate_query(
             [to_graphql_error(e, message="Server encountered an error.")],
         )
 
-    if document.validators.errors:
-        return None, document.validators.errors
+    if trusted:
+        schema.trusted_parses += 1
+        return document, None
+
+    schema.validated_parses += 1
+    try:
+        errors = validate_document(schema, document)
+    except Exception as e:  # pylint: disable=broad-except
+        return (
+            None,
+            [to_graphql_error(e, message="Server encountered an error.")],
+        )
+    if errors:
+        return None, errors
 
     return document, None
 
@@ -81,13 +130,98 @@ def collect_executable_variable_definitions(
     ]
 
 
-async def should_include_node(
+def get_collection_hook_name(
+    node: Union["FragmentSpreadNode", "FieldNode", "InlineFragmentNode"]
+) -> str:
+    """
+    Returns the name of the directive hook to call to collect the node.
+    :param node: the selection node to collect or skip
+    :type node: Union[FragmentSpreadNode, FieldNode, InlineFragmentNode]
+    :return: the name of the directive hook to call
+    :rtype: str
+    """
+    if isinstance(node, FieldNode):
+        return "on_field_collection"
+    if isinstance(node, FragmentSpreadNode):
+        return "on_fragment_spread_collection"
+    return "on_inline_fragment_collection"
+
+
+def has_variables(value_node: "ValueNode") -> bool:
+    """
+    Determines whether or not the value node refers to a variable.
+    :param value_node: the value node to inspect
+    :type value_node: ValueNode
+    :return: whether or not the value node refers to a variable
+    :rtype: bool
+    """
+    if isinstance(value_node, VariableNode):
+        return True
+    if isinstance(value_node, ListValueNode):
+        return any(has_variables(node) for node in value_node.values)
+    if isinstance(value_node, ObjectValueNode):
+        return any(has_variables(node.value) for node in value_node.fields)
+    return False
+
+
+def get_node_collection_scope(
+    execution_context: "ExecutionContext",
+    node: Union["FragmentSpreadNode", "FieldNode", "InlineFragmentNode"],
+) -> str:
+    """
+    Determines how long the collection decision of the node can be reused:
+    - "document": the decision only depends on literal directive arguments
+    and is reused by all the requests of the document
+    - "request": the decision is reused until the end of the request
+    - "dynamic": the decision is computed each time the node is collected
+    Directives which don't implement the collection hook don't affect the
+    decision.
+    :param execution_context: instance of the query execution context
+    :param node: the selection node to collect or skip
+    :type execution_context: ExecutionContext
+    :type node: Union[FragmentSpreadNode, FieldNode, InlineFragmentNode]
+    :return: the collection scope of the node
+    :rtype: str
+    """
+    hook_name = get_collection_hook_name(node)
+
+    scope = DOCUMENT_COLLECTION_SCOPE
+    for directive_node in node.directives or []:
+        try:
+            directive = execution_context.schema.find_directive(
+                directive_node.name.value
+            )
+        except KeyError:
+            continue
+
+        if not hasattr(directive.implementation, hook_name):
+            continue
+
+        directive_scope = directive.collection_scope
+        if directive_scope not in _COLLECTION_SCOPE_PRIORITIES:
+            return DYNAMIC_COLLECTION_SCOPE
+
+        if directive_scope == DOCUMENT_COLLECTION_SCOPE and any(
+            has_variables(argument.value)
+            for argument in directive_node.arguments or []
+        ):
+            directive_scope = REQUEST_COLLECTION_SCOPE
+
+        if (
+            _COLLECTION_SCOPE_PRIORITIES[directive_scope]
+            > _COLLECTION_SCOPE_PRIORITIES[scope]
+        ):
+            scope = directive_scope
+    return scope
+
+
+async def compute_should_include_node(
     execution_context: "ExecutionContext",
     node: Union["FragmentSpreadNode", "FieldNode", "InlineFragmentNode"],
 ) -> bool:
     """
-    Determines if a field should be included based on the @include and @skip
-    directives, where @skip has higher precedence than @include.
+    Calls the collection hooks of the directives of the node in order to
+    determine whether or not it should be collected.
     :param execution_context: instance of the query execution context
     :param node: the selection node to collect or skip
     :type execution_context: ExecutionContext
@@ -95,19 +229,6 @@ async def should_include_node(
     :return: whether or not the node should be collected or skipped
     :rtype: bool
     """
-    if not node.directives:
-        return True
-
-    hook_name = (
-        "on_field_collection"
-        if isinstance(node, FieldNode)
-        else (
-            "on_fragment_spread_collection"
-            if isinstance(node, FragmentSpreadNode)
-            else "on_inline_fragment_collection"
-        )
-    )
-
     try:
         await wraps_with_directives(
             directives_definition=compute_directive_nodes(
@@ -115,7 +236,7 @@ async def should_include_node(
                 node.directives,
                 execution_context.variable_values,
             ),
-            directive_hook=hook_name,
+            directive_hook=get_collection_hook_name(node),
             with_default=True,
         )(
             node,
@@ -132,6 +253,59 @@ async def should_include_node(
     return True
 
 
+async def should_include_node(
+    execution_context: "ExecutionContext",
+    node: Union["FragmentSpreadNode", "FieldNode", "InlineFragmentNode"],
+) -> bool:
+    """
+    Determines if a field should be included based on the @include and @skip
+    directives, where @skip has higher precedence than @include.
+    Decisions are reused for the whole document or request depending on the
+    collection scope of the node.
+    :param execution_context: instance of the query execution context
+    :param node: the selection node to collect or skip
+    :type execution_context: ExecutionContext
+    :type node: Union[FragmentSpreadNode, FieldNode, InlineFragmentNode]
+    :return: whether or not the node should be collected or skipped
+    :rtype: bool
+    """
+    if not node.directives:
+        return True
+
+    node_id = id(node)
+    try:
+        return execution_context.collection_decisions[node_id]
+    except KeyError:
+        pass
+
+    decision = execution_context.request_collection_decisions.get(node_id)
+    if decision is not None:
+        return decision if isinstance(decision, bool) else await decision
+
+    scope = get_node_collection_scope(execution_context, node)
+    if scope == DYNAMIC_COLLECTION_SCOPE:
+        return await compute_should_include_node(execution_context, node)
+
+    # Concurrent collections of the same node wait for the pending decision
+    # instead of calling the directive hooks again.
+    pending_decision = asyncio.get_event_loop().create_future()
+    execution_context.request_collection_decisions[node_id] = pending_decision
+    try:
+        decision = await compute_should_include_node(execution_context, node)
+    except BaseException:
+        del execution_context.request_collection_decisions[node_id]
+        pending_decision.cancel()
+        raise
+
+    pending_decision.set_result(decision)
+    if scope == DOCUMENT_COLLECTION_SCOPE:
+        execution_context.collection_decisions[node_id] = decision
+        del execution_context.request_collection_decisions[node_id]
+    else:
+        execution_context.request_collection_decisions[node_id] = decision
+    return decision
+
+
 def get_field_entry_key(node: "FieldNode") -> str:
     """
     Implements the logic to compute the key of a given field's entry.
@@ -0,0 +1,443 @@
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from tartiflette.execution.collect import (
+    DOCUMENT_COLLECTION_SCOPE,
+    get_field_entry_key,
+    get_node_collection_scope,
+    should_include_node,
+)
+from tartiflette.language.ast import (
+    FieldNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    IntValueNode,
+    VariableNode,
+)
+from tartiflette.types.exceptions.tartiflette import TartifletteError
+from tartiflette.utils.type_from_ast import schema_type_from_ast
+
+__all__ = (
+    "ComplexityLimits",
+    "QueryComplexity",
+    "get_operation_complexity",
+    "validate_operation_complexity",
+)
+
+# Arguments whose value is used as multiplier of the cost of the selection
+# set of the field
+_MULTIPLIER_ARGUMENTS = ("first", "last", "limit")
+
+
+class QueryComplexity(NamedTuple):
+    """
+    Complexity of an operation.
+    """
+
+    depth: int
+    field_count: int
+    cost: int
+
+
+class ComplexityLimits:
+    """
+    Limits of the complexity of the operations executed by an engine, which
+    can be used as `complexity_limits` of an engine. Operations exceeding one
+    of the limits are rejected before being executed.
+
+    The cost of a field is declared through the `@cost` directive (`1` by
+    default) and the cost of its selection set is multiplied by the value of
+    its `first`, `last` or `limit` argument (or by `default_list_multiplier`
+    for list fields without such an argument).
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        max_field_count: Optional[int] = None,
+        max_cost: Optional[int] = None,
+        default_list_multiplier: int = 1,
+    ) -> None:
+        """
+        :param max_depth: maximum depth of the selection sets of an operation
+        :param max_field_count: maximum number of fields of an operation, once
+        its fragments are expanded
+        :param max_cost: maximum weighted cost of an operation
+        :param default_list_multiplier: multiplier of the cost of the
+        selection set of list fields without `first`, `last` or `limit`
+        argument
+        :type max_depth: Optional[int]
+        :type max_field_count: Optional[int]
+        :type max_cost: Optional[int]
+        :type default_list_multiplier: int
+        """
+        for limit_name, limit in (
+            ("max_depth", max_depth),
+            ("max_field_count", max_field_count),
+            ("max_cost", max_cost),
+            ("default_list_multiplier", default_list_multiplier),
+        ):
+            if limit is not None and (not isinstance(limit, int) or limit < 1):
+                raise ValueError(
+                    f"Given < {limit_name} > should be a positive integer."
+                )
+
+        self.max_depth = max_depth
+        self.max_field_count = max_field_count
+        self.max_cost = max_cost
+        self.default_list_multiplier = default_list_multiplier
+
+    def get_errors(
+        self, complexity: "QueryComplexity"
+    ) -> List["TartifletteError"]:
+        """
+        Returns the errors of the limits exceeded by the complexity.
+        :param complexity: the complexity of the operation
+        :type complexity: QueryComplexity
+        :return: the errors of the exceeded limits
+        :rtype: List[TartifletteError]
+        """
+        return [
+            TartifletteError(
+                f"Query {name} < {value} > exceeds the maximum {name} "
+                f"< {limit} >.",
+                extensions={"code": "QUERY_TOO_COMPLEX"},
+            )
+            for name, value, limit in (
+                ("depth", complexity.depth, self.max_depth),
+                ("field count", complexity.field_count, self.max_field_count),
+                ("cost", complexity.cost, self.max_cost),
+            )
+            if limit is not None and value > limit
+        ]
+
+
+class _ComplexityAnalysis:
+    """
+    State of the complexity analysis of an operation.
+    """
+
+    __slots__ = (
+        "execution_context",
+        "limits",
+        "depth",
+        "field_count",
+        "is_cacheable",
+        "selection_set_complexities",
+    )
+
+    def __init__(
+        self, execution_context: "ExecutionContext", limits: "ComplexityLimits"
+    ) -> None:
+        """
+        :param execution_context: instance of the query execution context
+        :param limits: the limits of the complexity of the operation
+        :type execution_context: ExecutionContext
+        :type limits: ComplexityLimits
+        """
+        self.execution_context = execution_context
+        self.limits = limits
+        self.depth = 0
+        self.field_count = 0
+        # Whether or not the complexity only depends on the document
+        self.is_cacheable = True
+        # Cost, depth offset & field count of the merged selection sets
+        # already analyzed, by collected field nodes, so that fragments
+        # spread in several places are only walked once
+        self.selection_set_complexities: Dict[
+            Tuple[Tuple[Tuple[str, str], Tuple[int, ...]], ...],
+            Tuple[int, int, int],
+        ] = {}
+
+    def is_exceeded(self) -> bool:
+        """
+        Determines whether or not the depth or field count limits are
+        already exceeded, in which case the analysis can be stopped.
+        :return: whether or not the analysis can be stopped
+        :rtype: bool
+        """
+        return (
+            self.limits.max_depth is not None
+            and self.depth > self.limits.max_depth
+        ) or (
+            self.limits.max_field_count is not None
+            and self.field_count > self.limits.max_field_count
+        )
+
+    async def should_include_node(
+        self,
+        node: Union["FieldNode", "FragmentSpreadNode", "InlineFragmentNode"],
+    ) -> bool:
+        """
+        Determines whether or not the node would be collected during the
+        execution.
+        :param node: the selection node to collect or skip
+        :type node: Union[FieldNode, FragmentSpreadNode, InlineFragmentNode]
+        :return: whether or not the node should be collected
+        :rtype: bool
+        """
+        if (
+            node.directives
+            and self.is_cacheable
+            and get_node_collection_scope(self.execution_context, node)
+            != DOCUMENT_COLLECTION_SCOPE
+        ):
+            self.is_cacheable = False
+        return await should_include_node(self.execution_context, node)
+
+    async def collect_fields(
+        self,
+        parent_type: "GraphQLType",
+        selection_set: "SelectionSetNode",
+        fields: Dict[Tuple[str, str], Tuple["GraphQLType", List["FieldNode"]]],
+        visited_fragment_names: Set[str],
+    ) -> None:
+        """
+        Collects the fields of a selection set by parent type & response key,
+        fragments being expanded.
+        :param parent_type: the type of the selection set
+        :param selection_set: the selection set node to collect
+        :param fields: the collected fields
+        :param visited_fragment_names: the fragments already expanded
+        :type parent_type: GraphQLType
+        :type selection_set: SelectionSetNode
+        :type fields: Dict[Tuple[str, str], Tuple[GraphQLType, List[FieldNode]]]
+        :type visited_fragment_names: Set[str]
+        """
+        schema = self.execution_context.schema
+        for selection in selection_set.selections:
+            if not await self.should_include_node(selection):
+                continue
+
+            if isinstance(selection, FieldNode):
+                fields.setdefault(
+                    (parent_type.name, get_field_entry_key(selection)),
+                    (parent_type, []),
+                )[1].append(selection)
+                continue
+
+            if isinstance(selection, InlineFragmentNode):
+                fragment = selection
+            else:
+                fragment_name = selection.name.value
+                if fragment_name in visited_fragment_names:
+                    continue
+                visited_fragment_names.add(fragment_name)
+                fragment = self.execution_context.fragments[fragment_name]
+
+            await self.collect_fields(
+                schema_type_from_ast(schema, fragment.type_condition)
+                if fragment.type_condition
+                else parent_type,
+                fragment.selection_set,
+                fields,
+                visited_fragment_names,
+            )
+
+    def get_multiplier(
+        self, field_definition: "GraphQLField", field_node: "FieldNode"
+    ) -> int:
+        """
+        Returns the multiplier of the cost of the selection set of a field.
+        :param field_definition: the definition of the field
+        :param field_node: the AST node of the field
+        :type field_definition: GraphQLField
+        :type field_node: FieldNode
+        :return: the multiplier of the cost of the selection set
+        :rtype: int
+        """
+        argument_nodes = {
+            argument_node.name.value: argument_node.value
+            for argument_node in field_node.arguments or []
+        }
+        for argument_name in _MULTIPLIER_ARGUMENTS:
+            argument_definition = field_definition.arguments.get(argument_name)
+            if argument_definition is None:
+                continue
+
+            value_node = argument_nodes.get(
+                argument_name, argument_definition.default_value
+            )
+            value = None
+            if isinstance(value_node, IntValueNode):
+                value = int(value_node.value)
+            elif isinstance(value_node, VariableNode):
+                self.is_cacheable = False
+                value = self.execution_context.variable_values.get(
+                    value_node.name.value
+                )
+
+            if isinstance(value, int) and value >= 0:
+                return value
+
+        graphql_type = field_definition.graphql_type
+        if graphql_type.is_non_null_type:
+            graphql_type = graphql_type.wrapped_type
+        return (
+            self.limits.default_list_multiplier
+            if graphql_type.is_list_type
+            else 1
+        )
+
+    async def analyze_selection_set(
+        self,
+        parent_type: "GraphQLType",
+        selection_sets: List["SelectionSetNode"],
+        depth: int,
+    ) -> int:
+        """
+        Computes the cost of the merged selection sets of a field while
+        updating the depth & field count of the operation.
+        :param parent_type: the type of the selection sets
+        :param selection_sets: the selection sets to analyze
+        :param depth: the depth of the fields of the selection sets
+        :type parent_type: GraphQLType
+        :type selection_sets: List[SelectionSetNode]
+        :type depth: int
+        :return: the cost of the selection sets
+        :rtype: int
+        """
+        fields = {}
+        visited_fragment_names = set()
+        for selection_set in selection_sets:
+            await self.collect_fields(
+                parent_type, selection_set, fields, visited_fragment_names
+            )
+
+        key = tuple(
+            (field_key, tuple(id(field_node) for field_node in field_nodes))
+            for field_key, (_, field_nodes) in fields.items()
+        )
+        try:
+            cost, depth_offset, field_count = self.selection_set_complexities[
+                key
+            ]
+        except KeyError:
+            pass
+        else:
+            self.depth = max(self.depth, depth + depth_offset)
+            self.field_count += field_count
+            return cost
+
+        previous_depth, previous_field_count = self.depth, self.field_count
+        self.depth = 0
+        cost = await self.analyze_fields(fields, depth)
+        self.selection_set_complexities[key] = (
+            cost,
+            self.depth - depth,
+            self.field_count - previous_field_count,
+        )
+        self.depth = max(previous_depth, self.depth)
+        return cost
+
+    async def analyze_fields(
+        self,
+        fields: Dict[Tuple[str, str], Tuple["GraphQLType", List["FieldNode"]]],
+        depth: int,
+    ) -> int:
+        """
+        Computes the cost of collected fields while updating the depth &
+        field count of the operation.
+        :param fields: the collected fields
+        :param depth: the depth of the fields
+        :type fields: Dict[Tuple[str, str], Tuple[GraphQLType, List[FieldNode]]]
+        :type depth: int
+        :return: the cost of the fields
+        :rtype: int
+        """
+        cost = 0
+        for field_parent_type, field_nodes in fields.values():
+            field_name = field_nodes[0].name.value
+            if field_name == "__typename":
+                continue
+
+            field_definition = (
+                self.execution_context.schema.find_field_definition(
+                    field_parent_type, field_name
+                )
+            )
+            if field_definition is None:
+                continue
+
+            self.field_count += 1
+            self.depth = max(self.depth, depth)
+            if self.is_exceeded():
+                break
+
+            cost += field_definition.cost
+            child_selection_sets = [
+                field_node.selection_set
+                for field_node in field_nodes
+                if field_node.selection_set
+            ]
+            if not child_selection_sets:
+                continue
+
+            field_type = field_definition.graphql_type
+            while field_type.is_wrapping_type:
+                field_type = field_type.wrapped_type
+
+            cost += self.get_multiplier(
+                field_definition, field_nodes[0]
+            ) * await self.analyze_selection_set(
+                field_type, child_selection_sets, depth + 1
+            )
+        return cost
+
+
+async def get_operation_complexity(
+    execution_context: "ExecutionContext",
+    limits: "ComplexityLimits",
+    complexities: Dict[int, "QueryComplexity"],
+) -> "QueryComplexity":
+    """
+    Computes the complexity of the operation of the execution context. The
+    complexity is cached in `complexities` unless it depends on the variables
+    of the request. The analysis is stopped as soon as the depth or field
+    count limits are exceeded.
+    :param execution_context: instance of the query execution context
+    :param limits: the limits of the complexity of the operation
+    :param complexities: the complexities of the operations of the document
+    :type execution_context: ExecutionContext
+    :type limits: ComplexityLimits
+    :type complexities: Dict[int, QueryComplexity]
+    :return: the complexity of the operation
+    :rtype: QueryComplexity
+    """
+    operation = execution_context.operation
+    try:
+        return complexities[id(operation)]
+    except KeyError:
+        pass
+
+    analysis = _ComplexityAnalysis(execution_context, limits)
+    cost = await analysis.analyze_selection_set(
+        execution_context.schema.get_operation_root_type(operation),
+        [operation.selection_set],
+        1,
+    )
+    complexity = QueryComplexity(analysis.depth, analysis.field_count, cost)
+    if analysis.is_cacheable:
+        complexities[id(operation)] = complexity
+    return complexity
+
+
+async def validate_operation_complexity(
+    execution_context: "ExecutionContext",
+    limits: "ComplexityLimits",
+    complexities: Dict[int, "QueryComplexity"],
+) -> List["TartifletteError"]:
+    """
+    Returns the errors of the complexity limits exceeded by the operation of
+    the execution context.
+    :param execution_context: instance of the query execution context
+    :param limits: the limits of the complexity of the operation
+    :param complexities: the complexities of the operations of the document
+    :type execution_context: ExecutionContext
+    :type limits: ComplexityLimits
+    :type complexities: Dict[int, QueryComplexity]
+    :return: the errors of the exceeded limits
+    :rtype: List[TartifletteError]
+    """
+    return limits.get_errors(
+        await get_operation_complexity(execution_context, limits, complexities)
+    )
@@ -1,9 +1,15 @@
-from typing import Any, Dict, List, Optional, Tuple, Union
+import asyncio
 
-from tartiflette.coercers.variables import coerce_variables
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+from tartiflette.coercers.variables import compile_variables_coercer
+from tartiflette.execution.batch import BatchCaches, current_batch_caches
 from tartiflette.execution.collect import (
     collect_executable_variable_definitions,
 )
+from tartiflette.execution.complexity import validate_operation_complexity
+from tartiflette.execution.deadline import ExecutionDeadline
+from tartiflette.execution.loader import BatchLoader
 from tartiflette.language.ast import OperationDefinitionNode
 from tartiflette.types.exceptions.tartiflette import (
     MultipleException,
@@ -14,6 +20,37 @@ from tartiflette.utils.errors import is_coercible_exception
 __all__ = ("build_execution_context",)
 
 
+class RequestState:
+    """
+    Per-request state shared by the resolvers of a GraphQL request: the
+    BatchLoaders & memoized resolver values (shared by the operations of a
+    batch sharing their caches), the slots left to coerce list items
+    concurrently & the deadline of the execution.
+    """
+
+    __slots__ = ("loaders", "resolver_memo", "list_slots", "deadline")
+
+    def __init__(self, schema: "GraphQLSchema") -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type schema: GraphQLSchema
+        """
+        # Operations of a batch sharing their caches use the ones of the batch
+        batch_caches = current_batch_caches.get()
+        if batch_caches is None:
+            batch_caches = BatchCaches()
+        self.loaders: Dict[Hashable, "BatchLoader"] = batch_caches.loaders
+        self.resolver_memo: Dict[
+            Hashable, Tuple[Any, "asyncio.Future"]
+        ] = batch_caches.resolver_memo
+        self.list_slots: Optional[int] = schema.request_list_concurrency_limit
+        self.deadline: Optional["ExecutionDeadline"] = (
+            ExecutionDeadline(schema.execution_timeout)
+            if schema.execution_timeout is not None
+            else None
+        )
+
+
 class ExecutionContext:
     """
     Utility class containing all the information needed to run an end-to-end
@@ -28,6 +65,11 @@ class ExecutionContext:
         "root_value",
         "variable_values",
         "errors",
+        "execution_plans",
+        "collection_decisions",
+        "request_execution_plans",
+        "request_collection_decisions",
+        "request_state",
     )
 
     def __init__(
@@ -38,6 +80,8 @@ class ExecutionContext:
         context: Optional[Any],
         root_value: Optional[Any],
         variable_values: Optional[Dict[str, Any]],
+        execution_plans: Optional[Dict[Tuple[Union[str, int], ...], Any]],
+        collection_decisions: Optional[Dict[int, bool]] = None,
     ) -> None:
         """
         :param schema: the GraphQLSchema instance linked to the engine
@@ -49,14 +93,20 @@ class ExecutionContext:
         :param root_value: an initial value corresponding to the root type
         being executed
         :param variable_values: the variables provided in the GraphQL request
+        :param execution_plans: cache of the field plans computed for the
+        document
+        :param collection_decisions: cache of the collection decisions
+        computed for the document
         :type schema: GraphQLSchema
         :type fragments: Dict[str, FragmentDefinitionNode]
         :type operation: OperationDefinitionNode
         :type context: Optional[Any]
         :type root_value: Optional[Any]
         :type variable_values: Optional[Dict[str, Any]]
+        :type execution_plans: Optional[Dict[Tuple[Union[str, int], ...], Any]]
+        :type collection_decisions: Optional[Dict[int, bool]]
         """
-        # pylint: disable=too-many-arguments,too-many-locals
+        # pylint: disable=too-many-arguments
         self.schema = schema
         self.fragments = fragments
         self.operation = operation
@@ -64,6 +114,81 @@ class ExecutionContext:
         self.root_value = root_value
         self.variable_values = variable_values
         self.errors: List["TartifletteError"] = []
+        self.execution_plans: Dict[Tuple[Union[str, int], ...], Any] = (
+            execution_plans if execution_plans is not None else {}
+        )
+        self.collection_decisions: Dict[int, bool] = (
+            collection_decisions if collection_decisions is not None else {}
+        )
+        self.request_execution_plans: Dict[
+            Tuple[Union[str, int], ...], Any
+        ] = {}
+        self.request_collection_decisions: Dict[int, bool] = {}
+        self.request_state = RequestState(schema)
+
+    def is_deadline_exceeded(self) -> bool:
+        """
+        Determines whether or not the deadline of the request is passed.
+        :return: whether or not the deadline of the request is passed
+        :rtype: bool
+        """
+        deadline = self.request_state.deadline
+        return deadline is not None and deadline.is_exceeded()
+
+    def acquire_list_slots(self, count: int) -> int:
+        """
+        Reserves up to `count` slots to coerce additional list items
+        concurrently and returns the number of granted slots. When no
+        request limit is configured, all the requested slots are granted.
+        :param count: the number of slots wanted
+        :type count: int
+        :return: the number of granted slots
+        :rtype: int
+        """
+        request_state = self.request_state
+        if request_state.list_slots is None:
+            return count
+
+        granted = min(count, request_state.list_slots)
+        request_state.list_slots -= granted
+        return granted
+
+    def release_list_slots(self, count: int) -> None:
+        """
+        Gives back slots previously granted by `acquire_list_slots`.
+        :param count: the number of slots to give back
+        :type count: int
+        """
+        if self.request_state.list_slots is not None:
+            self.request_state.list_slots += count
+
+    def get_loader(
+        self,
+        batch_load_fn: Callable,
+        key: Optional[Hashable] = None,
+        **options,
+    ) -> "BatchLoader":
+        """
+        Returns the BatchLoader of the request linked to the key, creating
+        it on first use.
+        :param batch_load_fn: callable receiving a list of keys and returning
+        the list of values in the same order
+        :param key: key identifying the loader (defaults to `batch_load_fn`)
+        :param options: extra parameters of the BatchLoader to create
+        :type batch_load_fn: Callable
+        :type key: Optional[Hashable]
+        :type options: Dict[str, Any]
+        :return: the BatchLoader of the request linked to the key
+        :rtype: BatchLoader
+        """
+        if key is None:
+            key = batch_load_fn
+
+        loaders = self.request_state.loaders
+        loader = loaders.get(key)
+        if loader is None:
+            loader = loaders[key] = BatchLoader(batch_load_fn, **options)
+        return loader
 
     def add_error(
         self,
@@ -100,35 +225,28 @@ class ExecutionContext:
             self.errors.append(graphql_error)
 
 
-async def build_execution_context(
-    schema: "GraphQLSchema",
-    document: "DocumentNode",
-    root_value: Optional[Any],
-    context: Optional[Any],
-    raw_variable_values: Optional[Dict[str, Any]],
-    operation_name: str,
-) -> Tuple[Optional["ExecutionContext"], Optional[List["TartifletteError"]]]:
+def _get_operation(
+    document: "DocumentNode", operation_name: str
+) -> Tuple[
+    Optional["OperationDefinitionNode"],
+    Dict[str, "FragmentDefinitionNode"],
+    Optional["TartifletteError"],
+]:
     """
-    Factory function to build and return an ExecutionContext instance.
-    :param schema: the GraphQLSchema instance linked to the engine
+    Extracts the operation to execute & the fragment definitions from the
+    document.
     :param document: the DocumentNode instance linked to the GraphQL request
-    :param root_value: an initial value corresponding to the root type being
-    executed
-    :param context: value that can contain everything you need and that will be
-    accessible from the resolvers
-    :param raw_variable_values: the variables provided in the GraphQL request
     :param operation_name: the operation name to execute
-    :type schema: GraphQLSchema
     :type document: DocumentNode
-    :type root_value: Optional[Any]
-    :type context: Optional[Any]
-    :type raw_variable_values: Optional[Dict[str, Any]]
     :type operation_name: str
-    :return: an ExecutionContext instance
-    :rtype: Tuple[Optional[ExecutionContext], Optional[List[TartifletteError]]]
+    :return: the operation to execute, the fragment definitions & the error
+    raised when the operation couldn't be determined
+    :rtype: Tuple[
+        Optional[OperationDefinitionNode],
+        Dict[str, FragmentDefinitionNode],
+        Optional[TartifletteError],
+    ]
     """
-    # pylint: disable=too-many-arguments,too-many-locals,too-complex
-    errors: List["TartifletteError"] = []
     operation: Optional["OperationDefinitionNode"] = None
     fragments: Dict[str, "FragmentDefinitionNode"] = {}
     operations: Dict[Optional[str], "OperationDefinitionNode"] = {}
@@ -146,39 +264,112 @@ async def build_execution_context(
     elif len(operations) == 1:
         _, operation = operations.popitem()
 
-    if not operation:
-        errors.append(
-            TartifletteError(
-                f"Unknown operation named < {operation_name} >."
-                if operation_name
-                else "Must provide operation name if query contains multiple operations."
-            )
-        )
-
-    variable_values: Dict[str, Any] = {}
     if operation:
-        executable_variable_definitions = (
+        return operation, fragments, None
+
+    return (
+        None,
+        fragments,
+        TartifletteError(
+            f"Unknown operation named < {operation_name} >."
+            if operation_name
+            else "Must provide operation name if query contains multiple operations."
+        ),
+    )
+
+
+async def _coerce_variable_values(
+    schema: "GraphQLSchema",
+    document: "DocumentNode",
+    operation: "OperationDefinitionNode",
+    context: Optional[Any],
+    raw_variable_values: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], List["TartifletteError"]]:
+    """
+    Coerces the variables provided in the GraphQL request with the variables
+    coercer of the operation, compiled once per operation of the document.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param document: the DocumentNode instance linked to the GraphQL request
+    :param operation: the AST operation definition node to execute
+    :param context: value that can contain everything you need and that will be
+    accessible from the resolvers
+    :param raw_variable_values: the variables provided in the GraphQL request
+    :type schema: GraphQLSchema
+    :type document: DocumentNode
+    :type operation: OperationDefinitionNode
+    :type context: Optional[Any]
+    :type raw_variable_values: Optional[Dict[str, Any]]
+    :return: the coerced variables & the coercion errors
+    :rtype: Tuple[Dict[str, Any], List[TartifletteError]]
+    """
+    variables_coercer = document.variables_coercers.get(id(operation))
+    if variables_coercer is None:
+        variables_coercer = compile_variables_coercer(
             collect_executable_variable_definitions(schema, operation)
         )
+        document.variables_coercers[id(operation)] = variables_coercer
+
+    return await variables_coercer(raw_variable_values or {}, context)
 
-        variable_values, variable_errors = await coerce_variables(
-            executable_variable_definitions, raw_variable_values or {}, context
-        )
 
-        if variable_errors:
-            errors.extend(variable_errors)
+async def build_execution_context(
+    schema: "GraphQLSchema",
+    document: "DocumentNode",
+    root_value: Optional[Any],
+    context: Optional[Any],
+    raw_variable_values: Optional[Dict[str, Any]],
+    operation_name: str,
+) -> Tuple[Optional["ExecutionContext"], Optional[List["TartifletteError"]]]:
+    """
+    Factory function to build and return an ExecutionContext instance.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param document: the DocumentNode instance linked to the GraphQL request
+    :param root_value: an initial value corresponding to the root type being
+    executed
+    :param context: value that can contain everything you need and that will be
+    accessible from the resolvers
+    :param raw_variable_values: the variables provided in the GraphQL request
+    :param operation_name: the operation name to execute
+    :type schema: GraphQLSchema
+    :type document: DocumentNode
+    :type root_value: Optional[Any]
+    :type context: Optional[Any]
+    :type raw_variable_values: Optional[Dict[str, Any]]
+    :type operation_name: str
+    :return: an ExecutionContext instance
+    :rtype: Tuple[Optional[ExecutionContext], Optional[List[TartifletteError]]]
+    """
+    # pylint: disable=too-many-arguments
+    operation, fragments, operation_error = _get_operation(
+        document, operation_name
+    )
+    if operation_error:
+        return None, [operation_error]
 
+    variable_values, errors = await _coerce_variable_values(
+        schema, document, operation, context, raw_variable_values
+    )
     if errors:
         return None, errors
 
-    return (
-        ExecutionContext(
-            schema=schema,
-            fragments=fragments,
-            operation=operation,
-            context=context,
-            root_value=root_value,
-            variable_values=variable_values,
-        ),
-        None,
+    execution_context = ExecutionContext(
+        schema=schema,
+        fragments=fragments,
+        operation=operation,
+        context=context,
+        root_value=root_value,
+        variable_values=variable_values,
+        execution_plans=document.execution_plans,
+        collection_decisions=document.collection_decisions,
     )
+
+    if schema.complexity_limits is not None:
+        errors = await validate_operation_complexity(
+            execution_context,
+            schema.complexity_limits,
+            document.complexities,
+        )
+        if errors:
+            return None, errors
+
+    return execution_context, None
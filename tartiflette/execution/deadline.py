@@ -0,0 +1,98 @@
+import asyncio
+
+from typing import Any, Awaitable, Optional, Set
+
+from tartiflette.types.exceptions.tartiflette import ExecutionDeadlineExceeded
+
+__all__ = ("ExecutionDeadline",)
+
+
+class ExecutionDeadline:
+    """
+    Deadline of the execution of a request. A single timer is armed for the
+    whole request, once a resolver suspends: when it fires, the tasks still
+    awaiting a resolver are cancelled (as `asyncio.timeout` does with its
+    task) and the resolvers called afterwards aren't called at all.
+    """
+
+    __slots__ = ("time", "_loop", "_timer", "_waiting_tasks", "_expired_tasks")
+
+    def __init__(self, timeout: float) -> None:
+        """
+        :param timeout: maximum duration of the execution in seconds
+        :type timeout: float
+        """
+        self._loop = asyncio.get_event_loop()
+        self.time = self._loop.time() + timeout
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._waiting_tasks: Set["asyncio.Task"] = set()
+        self._expired_tasks: Set["asyncio.Task"] = set()
+
+    def is_exceeded(self) -> bool:
+        """
+        Determines whether or not the deadline is passed.
+        :return: whether or not the deadline is passed
+        :rtype: bool
+        """
+        return self._loop.time() >= self.time
+
+    def _expire(self) -> None:
+        """
+        Cancels the tasks awaiting a resolver once the deadline is reached.
+        """
+        self._timer = None
+        for task in self._waiting_tasks:
+            task.cancel()
+        self._expired_tasks.update(self._waiting_tasks)
+
+    def _release(self, task: "asyncio.Task") -> bool:
+        """
+        Withdraws a task which stopped awaiting its resolver, along with the
+        cancellation requested by the deadline if any.
+        :param task: the task which stopped awaiting its resolver
+        :type task: asyncio.Task
+        :return: whether or not the task was cancelled by the deadline only
+        :rtype: bool
+        """
+        self._waiting_tasks.discard(task)
+        if task not in self._expired_tasks:
+            return False
+
+        self._expired_tasks.discard(task)
+        uncancel = getattr(task, "uncancel", None)  # Python 3.11+
+        return uncancel is None or uncancel() == 0
+
+    async def run(self, awaitable: Awaitable) -> Any:
+        """
+        Awaits the awaitable of a resolver, within the current task, until
+        the deadline at most.
+        :param awaitable: the awaitable of the resolver
+        :type awaitable: Awaitable
+        :return: the result of the awaitable
+        :rtype: Any
+        :raises ExecutionDeadlineExceeded: when the awaitable didn't complete
+        before the deadline
+        """
+        task = asyncio.current_task()
+        if self._timer is None:
+            self._timer = self._loop.call_at(self.time, self._expire)
+
+        self._waiting_tasks.add(task)
+        try:
+            return await awaitable
+        except asyncio.CancelledError:
+            # Cancellations which weren't requested by the deadline (or
+            # requested along with it) are propagated
+            if self._release(task):
+                raise ExecutionDeadlineExceeded() from None
+            raise
+        finally:
+            self._release(task)
+
+    def disarm(self) -> None:
+        """
+        Disarms the timer once the execution is over.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
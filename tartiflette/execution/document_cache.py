@@ -0,0 +1,489 @@
+import asyncio
+import logging
+import os
+import sys
+
+from collections import OrderedDict
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from tartiflette.execution.persisted_queries import get_query_hash
+from tartiflette.language.ast.base import Node
+from tartiflette.language.ast.location import Location
+
+__all__ = ("DocumentCache", "DocumentCacheInfo", "estimate_document_size")
+
+logger = logging.getLogger(__name__)
+
+_DISK_ENTRY_EXTENSION = ".graphql"
+
+
+class DocumentCacheInfo(NamedTuple):
+    """
+    Statistics of a DocumentCache instance.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_entries: Optional[int]
+    max_size: Optional[int]
+
+
+def _get_slots(cls: type) -> Tuple[str, ...]:
+    """
+    Returns all the slots defined by a class and its parents.
+    :param cls: class to inspect
+    :type cls: type
+    :return: the slots of the class
+    :rtype: Tuple[str, ...]
+    """
+    slots = []
+    for klass in cls.__mro__:
+        klass_slots = klass.__dict__.get("__slots__", ())
+        if isinstance(klass_slots, str):
+            klass_slots = (klass_slots,)
+        slots.extend(klass_slots)
+    return tuple(slots)
+
+
+def estimate_document_size(document: "DocumentNode") -> int:
+    """
+    Estimates the memory footprint in bytes of the AST of a document. Only
+    the parsed definitions are taken into account: validation & execution
+    caches attached to the DocumentNode are left out.
+    :param document: the DocumentNode to measure
+    :type document: DocumentNode
+    :return: the estimated size of the document in bytes
+    :rtype: int
+    """
+    size = sys.getsizeof(document)
+    slots_by_class = {}
+    seen = set()
+    stack = [document.definitions, document.location]
+    while stack:
+        value = stack.pop()
+        if value is None or id(value) in seen:
+            continue
+
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+        if isinstance(value, (Node, Location)):
+            cls = value.__class__
+            slots = slots_by_class.get(cls)
+            if slots is None:
+                slots = slots_by_class[cls] = _get_slots(cls)
+            stack.extend(getattr(value, slot, None) for slot in slots)
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return size
+
+
+def _estimate_errors_size(errors: List["TartifletteError"]) -> int:
+    """
+    Estimates the memory footprint in bytes of a list of errors.
+    :param errors: the list of errors to measure
+    :type errors: List[TartifletteError]
+    :return: the estimated size of the errors in bytes
+    :rtype: int
+    """
+    return sys.getsizeof(errors) + sum(
+        sys.getsizeof(error) + sys.getsizeof(str(error)) for error in errors
+    )
+
+
+def _remove_disk_entry(path: str) -> None:
+    """
+    Removes a query persisted in the on-disk tier of the cache.
+    :param path: the path of the persisted query
+    :type path: str
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        logger.exception("Unable to remove persisted query < %s >.", path)
+
+
+def _list_disk_entries(
+    directory: str, max_entries: Optional[int]
+) -> Optional[List[str]]:
+    """
+    Lists the queries persisted in a directory of the on-disk tier of the
+    cache, from the least to the most recently persisted. The oldest queries
+    exceeding `max_entries` are removed.
+    :param directory: the directory of the persisted queries of a schema
+    :param max_entries: maximum number of queries to keep
+    :type directory: str
+    :type max_entries: Optional[int]
+    :return: the paths of the persisted queries or None if the directory
+    can't be listed
+    :rtype: Optional[List[str]]
+    """
+    try:
+        paths = [
+            os.path.join(directory, filename)
+            for filename in os.listdir(directory)
+            if filename.endswith(_DISK_ENTRY_EXTENSION)
+        ]
+        paths.sort(key=os.path.getmtime)
+    except OSError:
+        return None
+
+    if max_entries is not None and len(paths) > max_entries:
+        for path in paths[:-max_entries]:
+            _remove_disk_entry(path)
+        paths = paths[-max_entries:]
+    return paths
+
+
+def _write_disk_entry(
+    directory: str, digest: str, query: bytes, evicted_digests: List[str]
+) -> None:
+    """
+    Writes a query to the on-disk tier of the cache and removes the evicted
+    ones.
+    :param directory: the directory of the schema the query was parsed for
+    :param digest: the digest of the query
+    :param query: the UTF-8 encoded GraphQL query
+    :param evicted_digests: the digests of the queries to remove
+    :type directory: str
+    :type digest: str
+    :type query: bytes
+    :type evicted_digests: List[str]
+    """
+    path = os.path.join(directory, digest + _DISK_ENTRY_EXTENSION)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(query)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.exception("Unable to persist query < %s >.", digest)
+
+    for evicted_digest in evicted_digests:
+        _remove_disk_entry(
+            os.path.join(directory, evicted_digest + _DISK_ENTRY_EXTENSION)
+        )
+
+
+class DocumentCache:
+    """
+    Bounded cache of parsed & validated query documents which can be used as
+    `query_cache_decorator` of an engine.
+
+    Entries are keyed by the schema, the SHA-256 hash of its SDL & the
+    SHA-256 digest of the query so that query strings aren't retained by the
+    cache, and evicted in least recently used order once `max_entries`
+    entries or `max_size` estimated bytes of AST are exceeded. When a
+    `disk_path` directory is provided, successfully parsed queries are also
+    persisted there, outside of the event loop, and re-parsed by `warm`
+    (called when the engine is cooked) so that a fresh process starts with a
+    warm cache. Only the `max_entries` most recently persisted queries of a
+    schema are kept on disk.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = 512,
+        max_size: Optional[int] = None,
+        disk_path: Optional[str] = None,
+    ) -> None:
+        """
+        :param max_entries: maximum number of documents to keep in memory
+        (unbounded if `None`)
+        :param max_size: maximum estimated size in bytes of the documents to
+        keep in memory (unbounded if `None`)
+        :param disk_path: directory where parsed queries should be persisted
+        :type max_entries: Optional[int]
+        :type max_size: Optional[int]
+        :type disk_path: Optional[str]
+        """
+        for limit_name, limit in (
+            ("max_entries", max_entries),
+            ("max_size", max_size),
+        ):
+            if limit is not None and (not isinstance(limit, int) or limit < 1):
+                raise ValueError(
+                    f"Given < {limit_name} > should be a positive integer."
+                )
+
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.disk_path = disk_path
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[Any, int]]" = (
+            OrderedDict()
+        )
+        # Digests of the queries persisted in each directory of the on-disk
+        # tier, in least recently persisted order
+        self._disk_entries: Dict[str, "OrderedDict[str, None]"] = {}
+        self._pending_writes: Set["asyncio.Future"] = set()
+        self._func: Optional[Callable] = None
+
+    def __call__(self, func: Callable) -> Callable:
+        """
+        Decorates the function parsing & validating queries so that its
+        results are cached.
+        :param func: the function parsing & validating queries
+        :type func: Callable
+        :return: the decorated function
+        :rtype: Callable
+        """
+        self._func = func
+
+        @wraps(func)
+        def wrapper(
+            query: Union[str, bytes, bytearray, memoryview],
+            schema: "GraphQLSchema",
+        ) -> Tuple[Optional["DocumentNode"], Optional[List[Any]]]:
+            return self.get(query, schema)
+
+        wrapper.cache_info = self.cache_info
+        wrapper.cache_clear = self.cache_clear
+        return wrapper
+
+    @staticmethod
+    def get_digest(query: Union[str, bytes, bytearray, memoryview]) -> str:
+        """
+        Computes the digest identifying a query.
+        :param query: the GraphQL request / query
+        :type query: Union[str, bytes, bytearray, memoryview]
+        :return: the SHA-256 hexadecimal digest of the query
+        :rtype: str
+        """
+        return get_query_hash(query)
+
+    def get(
+        self,
+        query: Union[str, bytes, bytearray, memoryview],
+        schema: "GraphQLSchema",
+    ) -> Tuple[Optional["DocumentNode"], Optional[List[Any]]]:
+        """
+        Returns the cached parsing & validation result of the query or
+        computes, caches & persists it.
+        :param query: the GraphQL request / query
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type query: Union[str, bytes, bytearray, memoryview]
+        :type schema: GraphQLSchema
+        :return: the DocumentNode or the errors of the query
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        digest = self.get_digest(query)
+        key = (schema.name, schema.sdl_hash, digest)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+        self.misses += 1
+        result = self._func(query, schema)
+        if self._store(key, result) and result[0] is not None:
+            self._persist(schema, digest, query)
+        return result
+
+    def _store(
+        self,
+        key: Tuple[str, str, str],
+        result: Tuple[Optional["DocumentNode"], Optional[List[Any]]],
+    ) -> bool:
+        """
+        Adds a result to the cache and evicts the least recently used entries
+        exceeding the limits of the cache.
+        :param key: the key of the entry
+        :param result: the parsing & validation result to cache
+        :type key: Tuple[str, str, str]
+        :type result: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        :return: whether or not the result has been cached
+        :rtype: bool
+        """
+        document, errors = result
+        size = (
+            estimate_document_size(document)
+            if document is not None
+            else _estimate_errors_size(errors or [])
+        )
+        if self.max_size is not None and size > self.max_size:
+            return False
+
+        self._entries[key] = (result, size)
+        self.size += size
+        while (
+            self.max_entries is not None
+            and len(self._entries) > self.max_entries
+        ) or (self.max_size is not None and self.size > self.max_size):
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+        return True
+
+    def _get_schema_directory(self, schema: "GraphQLSchema") -> str:
+        """
+        Returns the directory where the queries of a schema are persisted,
+        which depends on the SDL of the schema so that queries validated
+        against a previous version of the schema aren't reused.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type schema: GraphQLSchema
+        :return: the directory of the schema
+        :rtype: str
+        """
+        return os.path.join(self.disk_path, schema.name, schema.sdl_hash)
+
+    def _persist(
+        self,
+        schema: "GraphQLSchema",
+        digest: str,
+        query: Union[str, bytes, bytearray, memoryview],
+    ) -> None:
+        """
+        Writes a query to the on-disk tier of the cache, if any, and removes
+        the least recently persisted queries exceeding `max_entries`. Files
+        are written & removed in the default executor of the running event
+        loop, if any.
+        :param schema: the GraphQLSchema instance the query was parsed for
+        :param digest: the digest of the query
+        :param query: the GraphQL request / query
+        :type schema: GraphQLSchema
+        :type digest: str
+        :type query: Union[str, bytes, bytearray, memoryview]
+        """
+        if self.disk_path is None:
+            return
+
+        directory = self._get_schema_directory(schema)
+        disk_entries = self._disk_entries.setdefault(directory, OrderedDict())
+        if digest in disk_entries:
+            return
+
+        disk_entries[digest] = None
+        evicted_digests = []
+        while (
+            self.max_entries is not None
+            and len(disk_entries) > self.max_entries
+        ):
+            evicted_digests.append(disk_entries.popitem(last=False)[0])
+
+        # The query is copied since buffers may be reused by the caller
+        query = (
+            query.encode("utf-8") if isinstance(query, str) else bytes(query)
+        )
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _write_disk_entry(directory, digest, query, evicted_digests)
+            return
+
+        future = loop.run_in_executor(
+            None,
+            _write_disk_entry,
+            directory,
+            digest,
+            query,
+            evicted_digests,
+        )
+        self._pending_writes.add(future)
+        future.add_done_callback(self._pending_writes.discard)
+
+    def warm(self, schema: "GraphQLSchema") -> int:
+        """
+        Fills the cache with the queries persisted in the on-disk tier for the
+        schema. The most recently persisted queries are kept when they don't
+        all fit in the cache.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type schema: GraphQLSchema
+        :return: the number of warmed documents
+        :rtype: int
+        """
+        if self.disk_path is None or self._func is None:
+            return 0
+
+        directory = self._get_schema_directory(schema)
+        paths = _list_disk_entries(directory, self.max_entries)
+        if paths is None:
+            return 0
+
+        disk_entries = self._disk_entries[directory] = OrderedDict()
+        return sum(
+            self._warm_entry(schema, path, disk_entries) for path in paths
+        )
+
+    def _warm_entry(
+        self,
+        schema: "GraphQLSchema",
+        path: str,
+        disk_entries: "OrderedDict[str, None]",
+    ) -> bool:
+        """
+        Loads a query persisted in the on-disk tier and caches its document
+        unless it's already cached or invalid.
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param path: the path of the persisted query
+        :param disk_entries: the digests of the persisted queries of the
+        schema
+        :type schema: GraphQLSchema
+        :type path: str
+        :type disk_entries: OrderedDict[str, None]
+        :return: whether or not the document of the query has been cached
+        :rtype: bool
+        """
+        try:
+            with open(path, "rb") as query_file:
+                query = query_file.read()
+        except OSError:
+            return False
+
+        digest = self.get_digest(query)
+        disk_entries[digest] = None
+        key = (schema.name, schema.sdl_hash, digest)
+        if key in self._entries:
+            return False
+
+        result = self._func(query, schema)
+        return result[0] is not None and self._store(key, result)
+
+    def cache_info(self) -> "DocumentCacheInfo":
+        """
+        Returns the statistics of the cache.
+        :return: the statistics of the cache
+        :rtype: DocumentCacheInfo
+        """
+        return DocumentCacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            len(self._entries),
+            self.size,
+            self.max_entries,
+            self.max_size,
+        )
+
+    def cache_clear(self) -> None:
+        """
+        Clears the in-memory entries & statistics of the cache. Persisted
+        queries are kept.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
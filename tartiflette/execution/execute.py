@@ -1,79 +1,36 @@
 import asyncio
 
+from inspect import isawaitable
 from typing import Any, AsyncIterable, Callable, Dict, List, Optional, Union
 
 from tartiflette.coercers.arguments import coerce_arguments
 from tartiflette.coercers.common import Path
-from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.execution.collect import collect_fields
 from tartiflette.execution.context import build_execution_context
 from tartiflette.execution.helpers import get_field_definition
+from tartiflette.execution.introspection import (
+    get_cached_introspection_response,
+)
+from tartiflette.execution.plan import get_operation_field_plans
 from tartiflette.execution.types import build_resolve_info
+from tartiflette.utils.coroutines import gather_eagerly
 from tartiflette.utils.errors import extract_exceptions_from_results
 from tartiflette.utils.values import is_invalid_value
 
 __all__ = (
-    "resolve_field",
+    "start_fields",
     "execute_fields",
     "execute",
     "create_source_event_stream",
 )
 
 
-async def resolve_field(
-    execution_context: "ExecutionContext",
-    parent_type: "GraphQLObjectType",
-    source: Any,
-    field_nodes: List["FieldNode"],
-    path: "Path",
-    is_introspection_context: bool = False,
-) -> Any:
-    """
-    Resolves the field on the given source object. In particular, this
-    figures out the value that the field returns by calling its resolve
-    function, then calls completeValue to complete promises, serialize scalars,
-    or execute the sub-selection-set for objects.
-    :param execution_context: instance of the query execution context
-    :param parent_type: GraphQLObjectType of the field's parent
-    :param source: default root value or field parent value
-    :param field_nodes: AST nodes related to the resolved field
-    :param path: the path traveled until this resolver
-    :param is_introspection_context: determines whether or not the resolved
-    field is in a context of an introspection query
-    :type execution_context: ExecutionContext
-    :type parent_type: GraphQLObjectType
-    :type source: Any
-    :type field_nodes: List[FieldNode]
-    :type path: Path
-    :type is_introspection_context: bool
-    :return: the computed field value
-    :rtype: Any
-    """
-    field_node = field_nodes[0]
-    field_name = field_node.name.value
-
-    field_definition = get_field_definition(
-        execution_context.schema, parent_type, field_name
-    )
-    if field_definition is None:
-        return UNDEFINED_VALUE
-
-    return await field_definition.resolver(
-        execution_context,
-        parent_type,
-        source,
-        field_nodes,
-        path,
-        is_introspection_context,
-    )
-
-
 async def execute_fields_serially(
     execution_context: "ExecutionContext",
     parent_type: "GraphQLObjectType",
     source_value: Any,
     path: Optional["Path"],
-    fields: Dict[str, List["FieldNode"]],
+    field_plans: List["FieldPlan"],
 ) -> Dict[str, Any]:
     """
     Implements the "Evaluating selection sets" section of the spec for "write"
@@ -82,26 +39,86 @@ async def execute_fields_serially(
     :param parent_type: GraphQLObjectType of the field's parent
     :param source_value: default root value or field parent value
     :param path: the path traveled until this resolver
-    :param fields: dictionary of collected fields
+    :param field_plans: pre-computed plans of the fields to execute
     :type execution_context: ExecutionContext
     :type parent_type: GraphQLObjectType
     :type source_value: Any
     :type path: Optional[Path]
-    :type fields: Dict[str, List[FieldNode]]
+    :type field_plans: List[FieldPlan]
     :return: the computed fields value
     :rtype: Dict[str, Any]
     """
     results = {}
-    for entry_key, field_nodes in fields.items():
-        result = await resolve_field(
+    for field_plan in field_plans:
+        result = await field_plan.field_definition.resolver(
             execution_context,
             parent_type,
             source_value,
-            field_nodes,
-            Path(path, entry_key),
+            field_plan.field_nodes,
+            Path(path, field_plan.response_key),
+            False,
         )
         if not is_invalid_value(result):
-            results[entry_key] = result
+            results[field_plan.response_key] = result
+    return results
+
+
+def start_fields(
+    execution_context: "ExecutionContext",
+    parent_type: "GraphQLObjectType",
+    source_value: Any,
+    path: Optional["Path"],
+    field_plans: List["FieldPlan"],
+    is_introspection_context: bool = False,
+) -> List[Any]:
+    """
+    Starts the execution of the fields of a selection set. The fields with a
+    synchronous resolution path are resolved inline while the others are
+    returned as awaitables, which have to be awaited by the caller.
+    :param execution_context: instance of the query execution context
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param source_value: default root value or field parent value
+    :param path: the path traveled until this resolver
+    :param field_plans: pre-computed plans of the fields to execute
+    :param is_introspection_context: determines whether or not the resolved
+    field is in a context of an introspection query
+    :type execution_context: ExecutionContext
+    :type parent_type: GraphQLObjectType
+    :type source_value: Any
+    :type path: Optional[Path]
+    :type field_plans: List[FieldPlan]
+    :type is_introspection_context: bool
+    :return: the values of the fields or the awaitables computing them, in
+    the order of the field plans
+    :rtype: List[Any]
+    """
+    results = []
+    for field_plan in field_plans:
+        if (
+            field_plan.sync_resolver is not None
+            and not is_introspection_context
+        ):
+            results.append(
+                field_plan.sync_resolver(
+                    execution_context,
+                    parent_type,
+                    source_value,
+                    field_plan.field_nodes,
+                    path,
+                    field_plan.response_key,
+                )
+            )
+        else:
+            results.append(
+                field_plan.field_definition.resolver(
+                    execution_context,
+                    parent_type,
+                    source_value,
+                    field_plan.field_nodes,
+                    Path(path, field_plan.response_key),
+                    is_introspection_context,
+                )
+            )
     return results
 
 
@@ -110,7 +127,7 @@ async def execute_fields(
     parent_type: "GraphQLObjectType",
     source_value: Any,
     path: Optional["Path"],
-    fields: Dict[str, List["FieldNode"]],
+    field_plans: List["FieldPlan"],
     is_introspection_context: bool = False,
 ) -> Dict[str, Any]:
     """
@@ -120,40 +137,52 @@ async def execute_fields(
     :param parent_type: GraphQLObjectType of the field's parent
     :param source_value: default root value or field parent value
     :param path: the path traveled until this resolver
-    :param fields: dictionary of collected fields
+    :param field_plans: pre-computed plans of the fields to execute
     :param is_introspection_context: determines whether or not the resolved
     field is in a context of an introspection query
     :type execution_context: ExecutionContext
     :type parent_type: GraphQLObjectType
     :type source_value: Any
     :type path: Optional[Path]
-    :type fields: Dict[str, List[FieldNode]]
+    :type field_plans: List[FieldPlan]
     :type is_introspection_context: bool
     :return: the computed fields value
     :rtype: Dict[str, Any]
     """
-    results = await asyncio.gather(
-        *[
-            resolve_field(
-                execution_context,
-                parent_type,
-                source_value,
-                field_nodes,
-                Path(path, entry_key),
-                is_introspection_context,
-            )
-            for entry_key, field_nodes in fields.items()
-        ],
-        return_exceptions=True,
+    # Fields with a synchronous resolution path are resolved inline, only
+    # the fields which actually return awaitables are gathered
+    results = start_fields(
+        execution_context,
+        parent_type,
+        source_value,
+        path,
+        field_plans,
+        is_introspection_context,
     )
+    pending_indexes = [
+        index for index, result in enumerate(results) if isawaitable(result)
+    ]
+
+    if pending_indexes:
+        pending_awaitables = [results[index] for index in pending_indexes]
+        pending_results = (
+            await gather_eagerly(*pending_awaitables)
+            if execution_context.schema.eager_execution
+            else await asyncio.gather(
+                *pending_awaitables, return_exceptions=True
+            )
+        )
 
-    exceptions = extract_exceptions_from_results(results)
-    if exceptions:
-        raise exceptions
+        exceptions = extract_exceptions_from_results(pending_results)
+        if exceptions:
+            raise exceptions
+
+        for index, result in zip(pending_indexes, pending_results):
+            results[index] = result
 
     return {
-        entry_key: result
-        for entry_key, result in zip(fields, results)
+        field_plan.response_key: result
+        for field_plan, result in zip(field_plans, results)
         if not is_invalid_value(result)
     }
 
@@ -178,8 +207,8 @@ async def execute_operation(
         operation
     )
 
-    fields = await collect_fields(
-        execution_context, operation_root_type, operation.selection_set
+    field_plans = await get_operation_field_plans(
+        execution_context, operation_root_type, operation
     )
 
     try:
@@ -189,7 +218,7 @@ async def execute_operation(
                 operation_root_type,
                 root_value,
                 None,
-                fields,
+                field_plans,
             )
             if operation.operation_type == "mutation"
             else execute_fields(
@@ -197,12 +226,16 @@ async def execute_operation(
                 operation_root_type,
                 root_value,
                 None,
-                fields,
+                field_plans,
             )
         )
     except Exception as e:  # pylint: disable=broad-except
         execution_context.add_error(e)
         return None
+    finally:
+        deadline = execution_context.request_state.deadline
+        if deadline is not None:
+            deadline.disarm()
 
 
 async def execute(
@@ -215,7 +248,9 @@ async def execute(
     operation_name: Optional[str],
 ) -> Dict[str, Any]:
     """
-    Runs the execution of the executable operation.
+    Runs the execution of the executable operation. When the introspection
+    cache is enabled, the responses of introspection queries are cached
+    along with their document.
     :param schema: the GraphQLSchema instance linked to the engine
     :param document: the DocumentNode instance linked to the GraphQL request
     :param response_builder: callable in charge of returning the formatted
@@ -243,10 +278,25 @@ async def execute(
     if errors:
         return await response_builder(errors=errors)
 
+    cached_response = (
+        get_cached_introspection_response(
+            execution_context, document.introspection_responses
+        )
+        if schema.introspection_cache
+        else None
+    )
+    if cached_response is not None and cached_response.encoded is not None:
+        return cached_response.get_response()
+
     data = await execute_operation(
         execution_context, execution_context.operation, root_value
     )
-    return await response_builder(data=data, errors=execution_context.errors)
+    response = await response_builder(
+        data=data, errors=execution_context.errors
+    )
+    if cached_response is not None and not execution_context.errors:
+        cached_response.set_response(response, schema.json_encoder)
+    return response
 
 
 async def create_source_event_stream(
@@ -1,9 +1,11 @@
+from typing import Optional
+
 __all__ = ("get_field_definition",)
 
 
 def get_field_definition(
     schema: "GraphQLSchema", parent_type: "GraphQLObjectType", field_name: str
-) -> "GraphQLField":
+) -> Optional["GraphQLField"]:
     """
     Returns the field corresponding to the parent type and field name.
     :param schema: the GraphQLSchema instance linked to the engine
@@ -12,11 +14,8 @@ def get_field_definition(
     :type schema: GraphQLSchema
     :type parent_type: GraphQLObjectType
     :type field_name: str
-    :return: the GraphQLField instance
-    :rtype: GraphQLField
+    :return: the GraphQLField instance or None if the parent type doesn't
+    define the field
+    :rtype: Optional[GraphQLField]
     """
-    try:
-        return schema.get_field_by_name(f"{parent_type}.{field_name}")
-    except Exception:  # pylint: disable=broad-except
-        pass
-    return None
+    return schema.find_field_definition(parent_type, field_name)
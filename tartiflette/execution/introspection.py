@@ -0,0 +1,339 @@
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Union
+
+from tartiflette.execution.collect import DOCUMENT_COLLECTION_SCOPE
+from tartiflette.language.ast import FieldNode, FragmentSpreadNode
+from tartiflette.utils.json_codecs import default_json_loader
+
+__all__ = (
+    "INTROSPECTION_QUERY",
+    "CachedIntrospectionResponse",
+    "get_cached_introspection_response",
+)
+
+# Introspection query sent by most GraphQL tools (`getIntrospectionQuery`
+# from `graphql-js`), whose response can be pre-rendered by the engine
+INTROSPECTION_QUERY = """
+    query IntrospectionQuery {
+      __schema {
+        queryType { name }
+        mutationType { name }
+        subscriptionType { name }
+        types {
+          ...FullType
+        }
+        directives {
+          name
+          description
+          locations
+          args {
+            ...InputValue
+          }
+        }
+      }
+    }
+
+    fragment FullType on __Type {
+      kind
+      name
+      description
+      fields(includeDeprecated: true) {
+        name
+        description
+        args {
+          ...InputValue
+        }
+        type {
+          ...TypeRef
+        }
+        isDeprecated
+        deprecationReason
+      }
+      inputFields {
+        ...InputValue
+      }
+      interfaces {
+        ...TypeRef
+      }
+      enumValues(includeDeprecated: true) {
+        name
+        description
+        isDeprecated
+        deprecationReason
+      }
+      possibleTypes {
+        ...TypeRef
+      }
+    }
+
+    fragment InputValue on __InputValue {
+      name
+      description
+      type { ...TypeRef }
+      defaultValue
+    }
+
+    fragment TypeRef on __Type {
+      kind
+      name
+      ofType {
+        kind
+        name
+        ofType {
+          kind
+          name
+          ofType {
+            kind
+            name
+            ofType {
+              kind
+              name
+              ofType {
+                kind
+                name
+                ofType {
+                  kind
+                  name
+                  ofType {
+                    kind
+                    name
+                  }
+                }
+              }
+            }
+          }
+        }
+      }
+    }
+"""
+
+# Maximum number of responses cached per operation for distinct variables
+_MAX_CACHED_RESPONSES_PER_OPERATION = 64
+
+# Directive hooks which may make the response depend on the request context
+_EXECUTION_DIRECTIVE_HOOKS = (
+    "on_argument_execution",
+    "on_field_execution",
+    "on_post_input_coercion",
+    "on_pre_output_coercion",
+)
+
+
+class CachedIntrospectionResponse:
+    """
+    Cached response of an introspection operation. The response is kept JSON
+    encoded, so that each request decodes its own copy of it and can't alter
+    the responses of the other ones.
+    """
+
+    __slots__ = ("encoded",)
+
+    def __init__(self) -> None:
+        self.encoded: Optional[bytes] = None
+
+    def set_response(
+        self,
+        response: Dict[str, Any],
+        json_encoder: Callable[[Any], Union[str, bytes]],
+    ) -> bytes:
+        """
+        Caches the UTF-8 encoded JSON document of the response.
+        :param response: the response to cache
+        :param json_encoder: callable encoding a value into a JSON document
+        :type response: Dict[str, Any]
+        :type json_encoder: Callable[[Any], Union[str, bytes]]
+        :return: the UTF-8 encoded JSON document of the response
+        :rtype: bytes
+        """
+        encoded = json_encoder(response)
+        self.encoded = (
+            encoded.encode("utf-8") if isinstance(encoded, str) else encoded
+        )
+        return self.encoded
+
+    def get_response(self) -> Dict[str, Any]:
+        """
+        Returns a copy of the cached response, decoded from its JSON document.
+        :return: a copy of the cached response
+        :rtype: Dict[str, Any]
+        """
+        return default_json_loader(self.encoded)
+
+
+def _is_context_independent_directive(
+    schema: "GraphQLSchema", directive_node: "DirectiveNode"
+) -> bool:
+    """
+    Determines whether or not a directive used in a query only depends on
+    the document & the variables of the request.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param directive_node: the directive node to inspect
+    :type schema: GraphQLSchema
+    :type directive_node: DirectiveNode
+    :return: whether or not the directive is context independent
+    :rtype: bool
+    """
+    try:
+        directive = schema.find_directive(directive_node.name.value)
+    except KeyError:
+        return False
+
+    return directive.collection_scope == DOCUMENT_COLLECTION_SCOPE and not any(
+        hasattr(directive.implementation, hook_name)
+        for hook_name in _EXECUTION_DIRECTIVE_HOOKS
+    )
+
+
+def _has_context_independent_directives(
+    execution_context: "ExecutionContext",
+    selection_set: "SelectionSetNode",
+    visited_fragment_names: Set[str],
+) -> bool:
+    """
+    Determines whether or not all the directives used in a selection set,
+    and in the fragments it spreads, are context independent.
+    :param execution_context: instance of the query execution context
+    :param selection_set: the selection set to inspect
+    :param visited_fragment_names: the fragments already inspected
+    :type execution_context: ExecutionContext
+    :type selection_set: SelectionSetNode
+    :type visited_fragment_names: Set[str]
+    :return: whether or not all the directives are context independent
+    :rtype: bool
+    """
+    schema = execution_context.schema
+    for selection in selection_set.selections:
+        if any(
+            not _is_context_independent_directive(schema, directive_node)
+            for directive_node in selection.directives or []
+        ):
+            return False
+
+        if isinstance(selection, FragmentSpreadNode):
+            fragment_name = selection.name.value
+            if fragment_name in visited_fragment_names:
+                continue
+            visited_fragment_names.add(fragment_name)
+            selection = execution_context.fragments[fragment_name]
+            if any(
+                not _is_context_independent_directive(schema, directive_node)
+                for directive_node in selection.directives or []
+            ):
+                return False
+
+        if (
+            selection.selection_set
+            and not _has_context_independent_directives(
+                execution_context,
+                selection.selection_set,
+                visited_fragment_names,
+            )
+        ):
+            return False
+    return True
+
+
+def _selects_introspection_fields_only(
+    execution_context: "ExecutionContext", selection_set: "SelectionSetNode"
+) -> bool:
+    """
+    Determines whether or not a root selection set only selects the
+    `__schema`, `__type` & `__typename` fields.
+    :param execution_context: instance of the query execution context
+    :param selection_set: the root selection set to inspect
+    :type execution_context: ExecutionContext
+    :type selection_set: SelectionSetNode
+    :return: whether or not only introspection fields are selected
+    :rtype: bool
+    """
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            if not selection.name.value.startswith("__"):
+                return False
+        elif not _selects_introspection_fields_only(
+            execution_context,
+            execution_context.fragments[selection.name.value].selection_set
+            if isinstance(selection, FragmentSpreadNode)
+            else selection.selection_set,
+        ):
+            return False
+    return True
+
+
+def _is_cacheable_introspection_operation(
+    execution_context: "ExecutionContext",
+) -> bool:
+    """
+    Determines whether or not the response of the operation only depends on
+    the schema, the document & the variables of the request.
+    :param execution_context: instance of the query execution context
+    :type execution_context: ExecutionContext
+    :return: whether or not the response of the operation can be cached
+    :rtype: bool
+    """
+    schema = execution_context.schema
+    operation = execution_context.operation
+    return (
+        operation.operation_type == "query"
+        and not schema.has_context_dependent_introspection_directives
+        and _selects_introspection_fields_only(
+            execution_context, operation.selection_set
+        )
+        and all(
+            _is_context_independent_directive(schema, directive_node)
+            for directive_node in operation.directives or []
+        )
+        and _has_context_independent_directives(
+            execution_context, operation.selection_set, set()
+        )
+    )
+
+
+def get_cached_introspection_response(
+    execution_context: "ExecutionContext",
+    introspection_responses: Dict[
+        int, Optional[Dict[Hashable, "CachedIntrospectionResponse"]]
+    ],
+) -> Optional["CachedIntrospectionResponse"]:
+    """
+    Returns the cache entry of the response of the operation for the
+    variables of the request, which holds no response yet if it has never
+    been computed. Operations whose response may depend on the request
+    context (non-introspection fields, context dependent directives...) or
+    on unhashable variables aren't cached, and only a bounded number of
+    variable sets is cached per operation.
+    :param execution_context: instance of the query execution context
+    :param introspection_responses: cached responses of the introspection
+    operations of the document
+    :type execution_context: ExecutionContext
+    :type introspection_responses: Dict[int, Optional[Dict[Hashable, CachedIntrospectionResponse]]]
+    :return: the cache entry of the response or None if it can't be cached
+    :rtype: Optional[CachedIntrospectionResponse]
+    """
+    operation_id = id(execution_context.operation)
+    try:
+        responses = introspection_responses[operation_id]
+    except KeyError:
+        responses = (
+            {}
+            if _is_cacheable_introspection_operation(execution_context)
+            else None
+        )
+        introspection_responses[operation_id] = responses
+
+    if responses is None:
+        return None
+
+    variables_key = tuple(sorted(execution_context.variable_values.items()))
+    try:
+        return responses[variables_key]
+    except KeyError:
+        pass
+    except TypeError:
+        return None
+
+    if len(responses) >= _MAX_CACHED_RESPONSES_PER_OPERATION:
+        return None
+
+    cached_response = CachedIntrospectionResponse()
+    responses[variables_key] = cached_response
+    return cached_response
@@ -0,0 +1,216 @@
+import asyncio
+
+from inspect import isawaitable
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+__all__ = ("BatchLoader",)
+
+
+class BatchLoader:
+    """
+    Collects the keys loaded during consecutive event loop iterations and
+    dispatches them at once to a batch load function as soon as an iteration
+    doesn't load any new key. Loaded values are cached by key for the
+    lifetime of the loader.
+
+    Loaders are usually retrieved per request with `info.get_loader(...)`
+    so that their cache doesn't outlive the request:
+
+        async def load_users(ids):
+            users = await fetch_users(ids)
+            return [users.get(user_id) for user_id in ids]
+
+        @Resolver("Post.author")
+        async def resolve_post_author(parent, args, ctx, info):
+            return await info.get_loader(load_users).load(parent["author_id"])
+    """
+
+    __slots__ = (
+        "_batch_load_fn",
+        "_cache",
+        "_max_batch_size",
+        "_cache_key_fn",
+        "_futures",
+        "_queue",
+        "_dispatched_queue_size",
+        "_dispatch_tasks",
+    )
+
+    def __init__(
+        self,
+        batch_load_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        cache: bool = True,
+        max_batch_size: Optional[int] = None,
+        cache_key_fn: Optional[Callable[[Any], Hashable]] = None,
+    ) -> None:
+        """
+        :param batch_load_fn: callable receiving a list of keys and returning
+        the list of values (or exceptions) in the same order
+        :param cache: whether or not loaded values should be cached by key
+        :param max_batch_size: maximum number of keys dispatched at once
+        :param cache_key_fn: callable computing the cache key of a key
+        :type batch_load_fn: Callable[[List[Any]], Awaitable[List[Any]]]
+        :type cache: bool
+        :type max_batch_size: Optional[int]
+        :type cache_key_fn: Optional[Callable[[Any], Hashable]]
+        """
+        self._batch_load_fn = batch_load_fn
+        self._cache = cache
+        self._max_batch_size = max_batch_size
+        self._cache_key_fn = cache_key_fn
+        self._futures: Dict[Hashable, "asyncio.Future"] = {}
+        self._queue: List[Tuple[Any, "asyncio.Future"]] = []
+        self._dispatched_queue_size = 0
+        # Strong references to the running batches, which would otherwise
+        # only be weakly referenced by the event loop
+        self._dispatch_tasks: Set["asyncio.Task"] = set()
+
+    def _get_cache_key(self, key: Any) -> Hashable:
+        """
+        Returns the cache key of a key.
+        :param key: the loaded key
+        :type key: Any
+        :return: the cache key
+        :rtype: Hashable
+        """
+        return self._cache_key_fn(key) if self._cache_key_fn else key
+
+    def load(self, key: Any) -> "asyncio.Future":
+        """
+        Schedules the load of a key and returns a future resolved with its
+        value once its batch has been dispatched.
+        :param key: the key to load
+        :type key: Any
+        :return: a future resolved with the value of the key
+        :rtype: asyncio.Future
+        """
+        if self._cache:
+            future = self._futures.get(self._get_cache_key(key))
+            if future is not None:
+                return future
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        if self._cache:
+            self._futures[self._get_cache_key(key)] = future
+
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append((key, future))
+        return future
+
+    async def load_many(self, keys: List[Any]) -> List[Any]:
+        """
+        Loads several keys at once.
+        :param keys: the keys to load
+        :type keys: List[Any]
+        :return: the values of the keys
+        :rtype: List[Any]
+        """
+        return await asyncio.gather(*[self.load(key) for key in keys])
+
+    def prime(self, key: Any, value: Any) -> None:
+        """
+        Caches the value of a key if it isn't already cached.
+        :param key: the key to cache
+        :param value: the value of the key
+        :type key: Any
+        :type value: Any
+        """
+        cache_key = self._get_cache_key(key)
+        if self._cache and cache_key not in self._futures:
+            future = asyncio.get_event_loop().create_future()
+            future.set_result(value)
+            self._futures[cache_key] = future
+
+    def clear(self, key: Any) -> None:
+        """
+        Removes a key from the cache.
+        :param key: the key to remove
+        :type key: Any
+        """
+        self._futures.pop(self._get_cache_key(key), None)
+
+    def clear_all(self) -> None:
+        """
+        Empties the cache.
+        """
+        self._futures.clear()
+
+    def _dispatch(self) -> None:
+        """
+        Dispatches the collected keys, unless new keys were loaded during the
+        last event loop iteration. Sibling values completed a few iterations
+        apart (e.g. items of nested lists) thus end up in the same batch.
+        """
+        if len(self._queue) != self._dispatched_queue_size:
+            self._dispatched_queue_size = len(self._queue)
+            asyncio.get_event_loop().call_soon(self._dispatch)
+            return
+
+        queue, self._queue = self._queue, []
+        self._dispatched_queue_size = 0
+        batch_size = self._max_batch_size or len(queue)
+        for index in range(0, len(queue), batch_size):
+            task = asyncio.ensure_future(
+                self._dispatch_batch(queue[index : index + batch_size])
+            )
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(self._dispatch_tasks.discard)
+
+    def _reject(
+        self, batch: List[Tuple[Any, "asyncio.Future"]], exception: Exception
+    ) -> None:
+        """
+        Rejects the futures of a batch and removes their keys from the cache
+        so that they can be loaded again.
+        :param batch: the keys & futures to reject
+        :param exception: the exception to reject the futures with
+        :type batch: List[Tuple[Any, asyncio.Future]]
+        :type exception: Exception
+        """
+        for key, future in batch:
+            self.clear(key)
+            if not future.done():
+                future.set_exception(exception)
+
+    async def _dispatch_batch(
+        self, batch: List[Tuple[Any, "asyncio.Future"]]
+    ) -> None:
+        """
+        Calls the batch load function with the keys of the batch and
+        resolves their futures.
+        :param batch: the keys & futures to resolve
+        :type batch: List[Tuple[Any, asyncio.Future]]
+        """
+        try:
+            values = self._batch_load_fn([key for key, _ in batch])
+            if isawaitable(values):
+                values = await values
+
+            values = list(values)
+            if len(values) != len(batch):
+                raise TypeError(
+                    "Batch load function should return as many values as "
+                    f"given keys: got {len(values)} values for "
+                    f"{len(batch)} keys."
+                )
+        except Exception as e:  # pylint: disable=broad-except
+            self._reject(batch, e)
+            return
+
+        for (key, future), value in zip(batch, values):
+            if isinstance(value, Exception):
+                self._reject([(key, future)], value)
+            elif not future.done():
+                future.set_result(value)
@@ -0,0 +1,65 @@
+from typing import Any, Dict, Hashable, NamedTuple
+
+__all__ = (
+    "ResolverMemoizationInfo",
+    "freeze_arguments",
+    "get_memoization_key",
+)
+
+
+class ResolverMemoizationInfo(NamedTuple):
+    """
+    Statistics of the memoized resolvers of an engine.
+    """
+
+    hits: int
+    misses: int
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Converts the coerced value of an argument into a hashable value.
+    :param value: the coerced value to convert
+    :type value: Any
+    :return: a hashable version of the value
+    :rtype: Hashable
+    """
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item)) for key, item in value.items())
+        )
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def freeze_arguments(arguments: Dict[str, Any]) -> Hashable:
+    """
+    Converts the coerced arguments of a field into a hashable value.
+    :param arguments: the coerced arguments of the field
+    :type arguments: Dict[str, Any]
+    :return: a hashable version of the arguments
+    :rtype: Hashable
+    :raises TypeError: when an argument value isn't hashable
+    """
+    frozen_arguments = _freeze(arguments)
+    hash(frozen_arguments)
+    return frozen_arguments
+
+
+def get_memoization_key(
+    source: Any, field_definition: "GraphQLField", arguments: Dict[str, Any]
+) -> Hashable:
+    """
+    Computes the key identifying a resolver call during a request.
+    :param source: the parent value of the resolved field
+    :param field_definition: GraphQLField instance of the resolved field
+    :param arguments: the coerced arguments of the field
+    :type source: Any
+    :type field_definition: GraphQLField
+    :type arguments: Dict[str, Any]
+    :return: the key identifying the resolver call
+    :rtype: Hashable
+    :raises TypeError: when an argument value isn't hashable
+    """
+    return (id(source), id(field_definition), freeze_arguments(arguments))
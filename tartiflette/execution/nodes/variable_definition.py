@@ -1,9 +1,13 @@
 from functools import partial
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
+from tartiflette.coercers.inputs.compiled import get_sync_input_coercer
 from tartiflette.coercers.inputs.compute import get_input_coercer
 from tartiflette.coercers.literals.compute import get_literal_coercer
-from tartiflette.coercers.variables import variable_coercer
+from tartiflette.coercers.variables import (
+    sync_variable_coercer,
+    variable_coercer,
+)
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.utils.type_from_ast import schema_type_from_ast
 
@@ -20,6 +24,7 @@ class ExecutableVariableDefinition:
         "graphql_type",
         "default_value",
         "coercer",
+        "sync_coercer",
         "definition",
     )
 
@@ -30,6 +35,7 @@ class ExecutableVariableDefinition:
         default_value: Any,
         coercer: Callable,
         definition: "VariableDefinitionNode",
+        sync_coercer: Optional[Callable] = None,
     ) -> None:
         """
         :param name: the name of the variable
@@ -37,16 +43,23 @@ class ExecutableVariableDefinition:
         :param default_value: the default value of the variable
         :param coercer: callable to use when coercing the user input value
         :param definition: the variable definition AST node
+        :param sync_coercer: synchronous callable to use when coercing the
+        user input value, if its type can be coerced synchronously
         :type name: str
         :type graphql_type: GraphQLType
         :type default_value: Any
         :type coercer: Callable
         :type definition: VariableDefinitionNode
+        :type sync_coercer: Optional[Callable]
         """
+        # pylint: disable=too-many-arguments
         self.name = name
         self.graphql_type = graphql_type
         self.default_value = default_value
         self.coercer = partial(coercer, self)
+        self.sync_coercer = (
+            partial(sync_coercer, self) if sync_coercer is not None else None
+        )
         self.definition = definition
 
 
@@ -64,6 +77,7 @@ def variable_definition_node_to_executable(
     :rtype: ExecutableVariableDefinition
     """
     graphql_type = schema_type_from_ast(schema, variable_definition_node.type)
+    sync_input_coercer = get_sync_input_coercer(graphql_type)
     return ExecutableVariableDefinition(
         name=variable_definition_node.variable.name.value,
         graphql_type=graphql_type,
@@ -77,4 +91,9 @@ def variable_definition_node_to_executable(
             literal_coercer=get_literal_coercer(graphql_type),
         ),
         definition=variable_definition_node,
+        sync_coercer=(
+            partial(sync_variable_coercer, input_coercer=sync_input_coercer)
+            if sync_input_coercer is not None
+            else None
+        ),
     )
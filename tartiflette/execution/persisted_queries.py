@@ -0,0 +1,357 @@
+import hashlib
+import json
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.types.exceptions.tartiflette import (
+    ImproperlyConfigured,
+    TartifletteError,
+)
+
+__all__ = (
+    "PersistedQueries",
+    "PersistedQueryStore",
+    "MemoryPersistedQueryStore",
+    "get_query_hash",
+)
+
+# Maximum number of documents of the queries persisted through the
+# `persisted_query_store` kept by an engine
+_PERSISTED_DOCUMENTS_MAX_ENTRIES = 512
+
+
+def get_query_hash(query: Union[str, bytes, bytearray, memoryview]) -> str:
+    """
+    Computes the hash identifying a persisted query.
+    :param query: the GraphQL request / query
+    :type query: Union[str, bytes, bytearray, memoryview]
+    :return: the SHA-256 hexadecimal digest of the query
+    :rtype: str
+    """
+    if isinstance(query, str):
+        query = query.encode("utf-8")
+    return hashlib.sha256(query).hexdigest()
+
+
+class PersistedQueryStore(ABC):
+    """
+    Abstract base class of the stores holding the persisted queries of an
+    engine. Implementations can define both methods either as regular
+    methods or as coroutines.
+    """
+
+    @abstractmethod
+    def get(
+        self, query_hash: str
+    ) -> Union[Optional[str], Awaitable[Optional[str]]]:
+        """
+        Returns the query persisted under the hash.
+        :param query_hash: the hash of the query
+        :type query_hash: str
+        :return: the persisted query or None if unknown
+        :rtype: Union[Optional[str], Awaitable[Optional[str]]]
+        """
+
+    @abstractmethod
+    def set(
+        self, query_hash: str, query: Union[str, bytes]
+    ) -> Optional[Awaitable[None]]:
+        """
+        Persists a query under its hash.
+        :param query_hash: the hash of the query
+        :param query: the GraphQL request / query to persist
+        :type query_hash: str
+        :type query: Union[str, bytes]
+        :rtype: Optional[Awaitable[None]]
+        """
+
+
+class MemoryPersistedQueryStore(PersistedQueryStore):
+    """
+    In-memory store of persisted queries. Queries are evicted in least
+    recently used order once `max_entries` queries are persisted.
+    """
+
+    def __init__(self, max_entries: Optional[int] = 1024) -> None:
+        """
+        :param max_entries: maximum number of queries to keep (unbounded if
+        `None`)
+        :type max_entries: Optional[int]
+        """
+        if max_entries is not None and (
+            not isinstance(max_entries, int) or max_entries < 1
+        ):
+            raise ValueError(
+                "Given < max_entries > should be a positive integer."
+            )
+
+        self.max_entries = max_entries
+        self._queries: "OrderedDict[str, Union[str, bytes]]" = OrderedDict()
+
+    def get(self, query_hash: str) -> Optional[Union[str, bytes]]:
+        """
+        Returns the query persisted under the hash.
+        :param query_hash: the hash of the query
+        :type query_hash: str
+        :return: the persisted query or None if unknown
+        :rtype: Optional[Union[str, bytes]]
+        """
+        query = self._queries.get(query_hash)
+        if query is not None:
+            self._queries.move_to_end(query_hash)
+        return query
+
+    def set(self, query_hash: str, query: Union[str, bytes]) -> None:
+        """
+        Persists a query under its hash and evicts the least recently used
+        queries exceeding `max_entries`.
+        :param query_hash: the hash of the query
+        :param query: the GraphQL request / query to persist
+        :type query_hash: str
+        :type query: Union[str, bytes]
+        """
+        self._queries[query_hash] = query
+        self._queries.move_to_end(query_hash)
+        while (
+            self.max_entries is not None
+            and len(self._queries) > self.max_entries
+        ):
+            self._queries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of persisted queries.
+        :return: the number of persisted queries
+        :rtype: int
+        """
+        return len(self._queries)
+
+
+def _persisted_query_error(message: str, code: str) -> List[TartifletteError]:
+    """
+    Returns the errors of a request whose persisted query can't be executed.
+    :param message: message of the error
+    :param code: code of the error, added to its extensions
+    :type message: str
+    :type code: str
+    :return: the errors of the request
+    :rtype: List[TartifletteError]
+    """
+    return [TartifletteError(message, extensions={"code": code})]
+
+
+class PersistedQueries:
+    """
+    Documents of the persisted queries of an engine: the queries of its
+    manifest, kept for the lifetime of the engine, and the most recently
+    used queries of its `persisted_query_store`.
+    """
+
+    def __init__(
+        self,
+        store: Optional[PersistedQueryStore] = None,
+        trusted_documents: bool = False,
+        trusted_document_verifier: Optional[Callable] = None,
+    ) -> None:
+        """
+        :param store: store of the queries which can be persisted by clients
+        (automatic persisted queries are disabled if `None`)
+        :param trusted_documents: whether or not the queries of the manifest
+        should be executed without being validated
+        :param trusted_document_verifier: callable returning whether or not a
+        new query comes from a trusted source
+        :type store: Optional[PersistedQueryStore]
+        :type trusted_documents: bool
+        :type trusted_document_verifier: Optional[Callable]
+        """
+        self.store = store
+        self.trusted_documents = trusted_documents
+        self.trusted_document_verifier = trusted_document_verifier
+        self._manifest_documents: Dict[str, "DocumentNode"] = {}
+        self._documents: "OrderedDict[str, DocumentNode]" = OrderedDict()
+
+    async def register(
+        self, manifest: Union[str, Dict[str, str]], schema: "GraphQLSchema"
+    ) -> None:
+        """
+        Registers a manifest of queries. Each query is parsed & validated
+        once and for all (only parsed if the documents are trusted) and its
+        document is kept for the lifetime of the engine. Queries are also
+        persisted in the store if any.
+        :param manifest: mapping of hashes to queries or path to a JSON file
+        containing it
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type manifest: Union[str, Dict[str, str]]
+        :type schema: GraphQLSchema
+        """
+        if isinstance(manifest, str):
+            with open(manifest, encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+
+        for query_hash, query in manifest.items():
+            document, errors = parse_and_validate_query(
+                query, schema, trusted=self.trusted_documents
+            )
+            if errors:
+                raise ImproperlyConfigured(
+                    f"Persisted query < {query_hash} > is invalid: "
+                    + ", ".join(error.message for error in errors)
+                )
+
+            if self.store is not None:
+                await self._store(query_hash, query)
+            self._manifest_documents[query_hash] = document
+
+    async def parse_and_validate(
+        self,
+        query: Optional[Union[str, bytes, bytearray, memoryview]],
+        query_hash: str,
+        schema: "GraphQLSchema",
+        context: Optional[Any] = None,
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Returns the DocumentNode linked to a persisted query hash. When the
+        query is provided along with its hash, it's persisted for the next
+        requests.
+        :param query: the GraphQL request / query, if provided
+        :param query_hash: the SHA-256 hash of the query
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param context: the context of the request
+        :type query: Optional[Union[str, bytes, bytearray, memoryview]]
+        :type query_hash: str
+        :type schema: GraphQLSchema
+        :type context: Optional[Any]
+        :return: the DocumentNode or the errors of the query
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        if query is not None and get_query_hash(query) != query_hash:
+            return None, _persisted_query_error(
+                "Provided hash does not match query",
+                "PERSISTED_QUERY_HASH_MISMATCH",
+            )
+
+        document = self._manifest_documents.get(query_hash)
+        if document is not None:
+            return document, None
+
+        if self.store is None:
+            return None, _persisted_query_error(
+                "PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED"
+            )
+
+        document = self._documents.get(query_hash)
+        if document is not None:
+            self._documents.move_to_end(query_hash)
+            return document, None
+
+        if query is None:
+            return await self._parse_and_validate_stored(query_hash, schema)
+        return await self._parse_and_validate_new(
+            query, query_hash, schema, context
+        )
+
+    async def _parse_and_validate_stored(
+        self, query_hash: str, schema: "GraphQLSchema"
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates the query persisted in the store under a hash.
+        Queries of the store may have been registered by any client (and
+        validated against another schema), so they are never trusted.
+        :param query_hash: the SHA-256 hash of the query
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type query_hash: str
+        :type schema: GraphQLSchema
+        :return: the DocumentNode or the errors of the query
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        query = self.store.get(query_hash)
+        if isawaitable(query):
+            query = await query
+
+        if query is None:
+            return None, _persisted_query_error(
+                "PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"
+            )
+
+        document, errors = parse_and_validate_query(query, schema)
+        if errors:
+            return None, errors
+
+        self._keep_document(query_hash, document)
+        return document, None
+
+    async def _parse_and_validate_new(
+        self,
+        query: Union[str, bytes, bytearray, memoryview],
+        query_hash: str,
+        schema: "GraphQLSchema",
+        context: Optional[Any],
+    ) -> Tuple[Optional["DocumentNode"], Optional[List["TartifletteError"]]]:
+        """
+        Parses & validates a query sent along with its hash and persists it
+        in the store once valid. Only the queries vouched for by the
+        `trusted_document_verifier` are trusted.
+        :param query: the GraphQL request / query
+        :param query_hash: the SHA-256 hash of the query
+        :param schema: the GraphQLSchema instance linked to the engine
+        :param context: the context of the request
+        :type query: Union[str, bytes, bytearray, memoryview]
+        :type query_hash: str
+        :type schema: GraphQLSchema
+        :type context: Optional[Any]
+        :return: the DocumentNode or the errors of the query
+        :rtype: Tuple[Optional[DocumentNode], Optional[List[TartifletteError]]]
+        """
+        trusted = False
+        if self.trusted_document_verifier is not None:
+            trusted = self.trusted_document_verifier(
+                query_hash, query, context
+            )
+            if isawaitable(trusted):
+                trusted = await trusted
+
+        document, errors = parse_and_validate_query(
+            query, schema, trusted=bool(trusted)
+        )
+        if errors:
+            return None, errors
+
+        if isinstance(query, (bytearray, memoryview)):
+            # The buffer may be reused by the caller once executed
+            query = bytes(query)
+        await self._store(query_hash, query)
+
+        self._keep_document(query_hash, document)
+        return document, None
+
+    async def _store(self, query_hash: str, query: Union[str, bytes]) -> None:
+        """
+        Persists a query in the store.
+        :param query_hash: the SHA-256 hash of the query
+        :param query: the GraphQL request / query
+        :type query_hash: str
+        :type query: Union[str, bytes]
+        """
+        stored = self.store.set(query_hash, query)
+        if isawaitable(stored):
+            await stored
+
+    def _keep_document(
+        self, query_hash: str, document: "DocumentNode"
+    ) -> None:
+        """
+        Keeps the document of a query of the store, evicting the least
+        recently used documents once `_PERSISTED_DOCUMENTS_MAX_ENTRIES` are
+        kept.
+        :param query_hash: the SHA-256 hash of the query
+        :param document: the DocumentNode of the query
+        :type query_hash: str
+        :type document: DocumentNode
+        """
+        self._documents[query_hash] = document
+        if len(self._documents) > _PERSISTED_DOCUMENTS_MAX_ENTRIES:
+            self._documents.popitem(last=False)
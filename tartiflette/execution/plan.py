@@ -0,0 +1,318 @@
+import asyncio
+
+from functools import partial
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from tartiflette.execution.collect import (
+    DOCUMENT_COLLECTION_SCOPE,
+    DYNAMIC_COLLECTION_SCOPE,
+    REQUEST_COLLECTION_SCOPE,
+    collect_fields,
+    collect_subfields,
+    get_node_collection_scope,
+)
+from tartiflette.execution.helpers import get_field_definition
+from tartiflette.language.ast import FragmentSpreadNode, InlineFragmentNode
+
+__all__ = (
+    "FieldPlan",
+    "get_operation_field_plans",
+    "get_subfield_plans",
+)
+
+
+class FieldPlan:
+    """
+    Pre-computed information needed to execute a field of a selection set
+    for a given runtime type.
+    """
+
+    __slots__ = (
+        "response_key",
+        "field_nodes",
+        "field_definition",
+        "sync_resolver",
+    )
+
+    def __init__(
+        self,
+        response_key: str,
+        field_nodes: List["FieldNode"],
+        field_definition: "GraphQLField",
+    ) -> None:
+        """
+        :param response_key: the key of the field in the response
+        :param field_nodes: merged AST nodes related to the field
+        :param field_definition: GraphQLField instance of the field
+        :type response_key: str
+        :type field_nodes: List[FieldNode]
+        :type field_definition: GraphQLField
+        """
+        self.response_key = response_key
+        self.field_nodes = field_nodes
+        self.field_definition = field_definition
+
+        # Query directives have to be applied through `resolve_field`
+        self.sync_resolver: Optional[Callable] = (
+            field_definition.sync_resolver
+            if not any(field_node.directives for field_node in field_nodes)
+            else None
+        )
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of a FieldPlan instance.
+        :return: the representation of a FieldPlan instance
+        :rtype: str
+        """
+        return (
+            f"FieldPlan(response_key={self.response_key!r}, "
+            f"field_nodes={self.field_nodes!r})"
+        )
+
+
+def get_selection_set_collection_scope(
+    execution_context: "ExecutionContext",
+    selection_set: Optional["SelectionSetNode"],
+    visited_fragment_names: Set[str],
+) -> str:
+    """
+    Determines how long the fields collected from the selection set can be
+    reused, according to the most volatile collection scope of the selections
+    collected along with it.
+    :param execution_context: instance of the query execution context
+    :param selection_set: selection set node to inspect
+    :param visited_fragment_names: the set of fragment names already visited
+    :type execution_context: ExecutionContext
+    :type selection_set: Optional[SelectionSetNode]
+    :type visited_fragment_names: Set[str]
+    :return: the collection scope of the selection set
+    :rtype: str
+    """
+    scope = DOCUMENT_COLLECTION_SCOPE
+    if not selection_set:
+        return scope
+
+    for selection in selection_set.selections:
+        scopes = [get_node_collection_scope(execution_context, selection)]
+
+        if isinstance(selection, InlineFragmentNode):
+            scopes.append(
+                get_selection_set_collection_scope(
+                    execution_context,
+                    selection.selection_set,
+                    visited_fragment_names,
+                )
+            )
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment_name = selection.name.value
+            if fragment_name not in visited_fragment_names:
+                visited_fragment_names.add(fragment_name)
+                fragment_definition = execution_context.fragments.get(
+                    fragment_name
+                )
+                if fragment_definition:
+                    scopes.append(
+                        get_selection_set_collection_scope(
+                            execution_context,
+                            fragment_definition.selection_set,
+                            visited_fragment_names,
+                        )
+                    )
+
+        for selection_scope in scopes:
+            if selection_scope == DYNAMIC_COLLECTION_SCOPE:
+                return selection_scope
+            if selection_scope == REQUEST_COLLECTION_SCOPE:
+                scope = selection_scope
+    return scope
+
+
+def build_field_plans(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    fields: Dict[str, List["FieldNode"]],
+) -> List["FieldPlan"]:
+    """
+    Converts collected fields into a list of field plans. Fields unknown to the
+    runtime type are left out since they can't produce a value.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: current runtime type of the selection set
+    :param fields: dictionary of collected fields
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type fields: Dict[str, List[FieldNode]]
+    :return: the list of field plans
+    :rtype: List[FieldPlan]
+    """
+    field_plans = []
+    for response_key, field_nodes in fields.items():
+        field_definition = get_field_definition(
+            execution_context.schema,
+            runtime_type,
+            field_nodes[0].name.value,
+        )
+        if field_definition is not None:
+            field_plans.append(
+                FieldPlan(response_key, field_nodes, field_definition)
+            )
+    return field_plans
+
+
+async def get_field_plans(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    cache_key: Tuple[Union[str, int], ...],
+    collector: Callable[[], Awaitable[Dict[str, List["FieldNode"]]]],
+    get_scope: Callable[[], str],
+) -> List["FieldPlan"]:
+    """
+    Returns the field plans identified by the cache key. Field plans are
+    computed once per document or once per request depending on the
+    collection scope of the selection, dynamic selections are computed each
+    time.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: current runtime type of the selection set
+    :param cache_key: key identifying the selection and its runtime type
+    :param collector: callable returning the collected fields
+    :param get_scope: callable returning the collection scope of the
+    selection
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type cache_key: Tuple[Union[str, int], ...]
+    :type collector: Callable[[], Awaitable[Dict[str, List[FieldNode]]]]
+    :type get_scope: Callable[[], str]
+    :return: the list of field plans
+    :rtype: List[FieldPlan]
+    """
+    field_plans = execution_context.execution_plans.get(cache_key)
+    if field_plans is not None:
+        return field_plans
+
+    field_plans = execution_context.request_execution_plans.get(cache_key)
+    if field_plans is not None:
+        return (
+            field_plans if isinstance(field_plans, list) else await field_plans
+        )
+
+    scope = get_scope()
+    if scope == DYNAMIC_COLLECTION_SCOPE:
+        return build_field_plans(
+            execution_context, runtime_type, await collector()
+        )
+
+    # Concurrent completions of the same selection wait for the pending
+    # field plans instead of collecting the fields again.
+    pending_field_plans = asyncio.get_event_loop().create_future()
+    execution_context.request_execution_plans[cache_key] = pending_field_plans
+    try:
+        field_plans = build_field_plans(
+            execution_context, runtime_type, await collector()
+        )
+    except BaseException:
+        del execution_context.request_execution_plans[cache_key]
+        pending_field_plans.cancel()
+        raise
+
+    pending_field_plans.set_result(field_plans)
+    if scope == DOCUMENT_COLLECTION_SCOPE:
+        execution_context.execution_plans[cache_key] = field_plans
+        del execution_context.request_execution_plans[cache_key]
+    else:
+        execution_context.request_execution_plans[cache_key] = field_plans
+    return field_plans
+
+
+def get_field_nodes_collection_scope(
+    execution_context: "ExecutionContext", field_nodes: List["FieldNode"]
+) -> str:
+    """
+    Determines the collection scope of the merged selection sets of the
+    field nodes.
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the parent field
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :return: the collection scope of the merged selection sets
+    :rtype: str
+    """
+    scope = DOCUMENT_COLLECTION_SCOPE
+    visited_fragment_names: Set[str] = set()
+    for field_node in field_nodes:
+        field_node_scope = get_selection_set_collection_scope(
+            execution_context, field_node.selection_set, visited_fragment_names
+        )
+        if field_node_scope == DYNAMIC_COLLECTION_SCOPE:
+            return field_node_scope
+        if field_node_scope == REQUEST_COLLECTION_SCOPE:
+            scope = field_node_scope
+    return scope
+
+
+async def get_operation_field_plans(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    operation: "OperationDefinitionNode",
+) -> List["FieldPlan"]:
+    """
+    Returns the field plans of the root selection set of an operation.
+    Selection sets are planned once per document, or once per request when
+    their directives depend on the request.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: root type of the operation
+    :param operation: AST operation definition node to execute
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type operation: OperationDefinitionNode
+    :return: the list of field plans
+    :rtype: List[FieldPlan]
+    """
+    return await get_field_plans(
+        execution_context,
+        runtime_type,
+        (runtime_type.name, id(operation)),
+        partial(
+            collect_fields,
+            execution_context,
+            runtime_type,
+            operation.selection_set,
+        ),
+        partial(
+            get_selection_set_collection_scope,
+            execution_context,
+            operation.selection_set,
+            set(),
+        ),
+    )
+
+
+async def get_subfield_plans(
+    execution_context: "ExecutionContext",
+    runtime_type: "GraphQLObjectType",
+    field_nodes: List["FieldNode"],
+) -> List["FieldPlan"]:
+    """
+    Returns the field plans of the merged selection sets of the field nodes
+    for the runtime type. Selection sets are planned once per document, or
+    once per request when their directives depend on the request, instead of
+    once per object.
+    :param execution_context: instance of the query execution context
+    :param runtime_type: runtime type of the object to complete
+    :param field_nodes: AST nodes related to the parent field
+    :type execution_context: ExecutionContext
+    :type runtime_type: GraphQLObjectType
+    :type field_nodes: List[FieldNode]
+    :return: the list of field plans
+    :rtype: List[FieldPlan]
+    """
+    return await get_field_plans(
+        execution_context,
+        runtime_type,
+        (runtime_type.name, *[id(node) for node in field_nodes]),
+        partial(
+            collect_subfields, execution_context, runtime_type, field_nodes
+        ),
+        partial(
+            get_field_nodes_collection_scope, execution_context, field_nodes
+        ),
+    )
@@ -0,0 +1,360 @@
+import asyncio
+
+from inspect import isawaitable
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from tartiflette.execution.context import build_execution_context
+from tartiflette.execution.execute import execute_operation, start_fields
+from tartiflette.execution.introspection import (
+    get_cached_introspection_response,
+)
+from tartiflette.execution.plan import get_operation_field_plans
+from tartiflette.utils.errors import extract_exceptions_from_results
+from tartiflette.utils.values import is_invalid_value
+
+__all__ = (
+    "iterencode_json",
+    "encode_response",
+    "execute_stream",
+    "chunk_fragments",
+)
+
+# Number of list items encoded at once
+_LIST_BATCH_SIZE = 100
+
+
+def _encode(
+    json_encoder: Callable[[Any], Union[str, bytes]], value: Any
+) -> bytes:
+    """
+    Encodes a value into a UTF-8 encoded JSON document.
+    :param json_encoder: callable encoding a value into a JSON document
+    :param value: the value to encode
+    :type json_encoder: Callable[[Any], Union[str, bytes]]
+    :type value: Any
+    :return: the UTF-8 encoded JSON document
+    :rtype: bytes
+    """
+    encoded = json_encoder(value)
+    return encoded.encode("utf-8") if isinstance(encoded, str) else encoded
+
+
+def iterencode_json(
+    value: Any, json_encoder: Callable[[Any], Union[str, bytes]]
+) -> Iterator[bytes]:
+    """
+    Encodes a value into UTF-8 encoded JSON fragments. Lists are encoded by
+    batches of items and objects holding lists or objects are encoded key by
+    key, so that no fragment holds the whole encoding of a large value.
+    :param value: the value to encode
+    :param json_encoder: callable encoding a value into a JSON document
+    :type value: Any
+    :type json_encoder: Callable[[Any], Union[str, bytes]]
+    :return: the JSON fragments of the value
+    :rtype: Iterator[bytes]
+    """
+    if isinstance(value, list) and value:
+        yield b"["
+        for index in range(0, len(value), _LIST_BATCH_SIZE):
+            batch = _encode(
+                json_encoder, value[index : index + _LIST_BATCH_SIZE]
+            ).strip()[1:-1]
+            yield batch if not index else b"," + batch
+        yield b"]"
+    elif isinstance(value, dict) and any(
+        isinstance(item, (dict, list)) for item in value.values()
+    ):
+        separator = b"{"
+        for key, item in value.items():
+            yield separator + _encode(json_encoder, key) + b":"
+            yield from iterencode_json(item, json_encoder)
+            separator = b","
+        yield b"}"
+    else:
+        yield _encode(json_encoder, value)
+
+
+async def encode_response(
+    response: Dict[str, Any], json_encoder: Callable[[Any], Union[str, bytes]]
+) -> AsyncIterator[bytes]:
+    """
+    Encodes an already computed GraphQL response into JSON fragments.
+    :param response: the GraphQL response to encode
+    :param json_encoder: callable encoding a value into a JSON document
+    :type response: Dict[str, Any]
+    :type json_encoder: Callable[[Any], Union[str, bytes]]
+    :return: the JSON fragments of the response
+    :rtype: AsyncIterator[bytes]
+    """
+    for fragment in iterencode_json(response, json_encoder):
+        yield fragment
+
+
+async def _complete_non_null_fields(
+    execution_context: "ExecutionContext",
+    field_plans: List["FieldPlan"],
+    results: List[Any],
+) -> bool:
+    """
+    Waits for the non-null root fields to be completed. Since an error on a
+    non-null root field nulls the whole data, all the root fields are then
+    awaited and their errors collected.
+    :param execution_context: instance of the query execution context
+    :param field_plans: plans of the root fields
+    :param results: the values of the root fields or the futures computing
+    them
+    :type execution_context: ExecutionContext
+    :type field_plans: List[FieldPlan]
+    :type results: List[Any]
+    :return: whether or not a non-null root field failed
+    :rtype: bool
+    """
+    non_null_futures = [
+        result
+        for result, field_plan in zip(results, field_plans)
+        if asyncio.isfuture(result)
+        and field_plan.field_definition.graphql_type.is_non_null_type
+    ]
+    if not non_null_futures:
+        return False
+
+    await asyncio.wait(non_null_futures)
+    if not any(future.exception() for future in non_null_futures):
+        return False
+
+    await asyncio.gather(
+        *[result for result in results if asyncio.isfuture(result)],
+        return_exceptions=True,
+    )
+    execution_context.add_error(
+        extract_exceptions_from_results(
+            [
+                (result.exception() or result.result())
+                if asyncio.isfuture(result)
+                else result
+                for result in results
+            ]
+        )
+    )
+    return True
+
+
+async def _encode_data(
+    field_plans: List["FieldPlan"],
+    results: List[Any],
+    json_encoder: Callable[[Any], Union[str, bytes]],
+) -> AsyncIterator[bytes]:
+    """
+    Encodes the `data` of a response, each root field being encoded as soon
+    as it and the fields preceding it are completed.
+    :param field_plans: plans of the root fields
+    :param results: the values of the root fields or the futures computing
+    them, released once encoded
+    :param json_encoder: callable encoding a value into a JSON document
+    :type field_plans: List[FieldPlan]
+    :type results: List[Any]
+    :type json_encoder: Callable[[Any], Union[str, bytes]]
+    :return: the JSON fragments of the `data` of the response
+    :rtype: AsyncIterator[bytes]
+    """
+    separator = b'{"data":{'
+    for index, field_plan in enumerate(field_plans):
+        result = results[index]
+        if asyncio.isfuture(result):
+            result = await result
+        # Releases the value as soon as it has been encoded
+        results[index] = None
+
+        if is_invalid_value(result):
+            continue
+
+        yield separator + _encode(json_encoder, field_plan.response_key) + b":"
+        for fragment in iterencode_json(result, json_encoder):
+            yield fragment
+        separator = b","
+
+    yield b'{"data":{}' if separator != b"," else b"}"
+
+
+async def _encode_query_response(
+    execution_context: "ExecutionContext",
+    response_builder: Callable,
+    root_value: Optional[Any],
+) -> AsyncIterator[bytes]:
+    """
+    Executes the root fields of a query concurrently and encodes each of
+    them as soon as it and the fields preceding it are completed. Since an
+    error on a non-null root field nulls the whole data, nothing is encoded
+    before the non-null root fields are completed.
+    :param execution_context: instance of the query execution context
+    :param response_builder: callable in charge of returning the formatted
+    GraphQL response
+    :param root_value: an initial value corresponding to the root type
+    being executed
+    :type execution_context: ExecutionContext
+    :type response_builder: Callable
+    :type root_value: Optional[Any]
+    :return: the JSON fragments of the response
+    :rtype: AsyncIterator[bytes]
+    """
+    json_encoder = execution_context.schema.json_encoder
+    operation_root_type = execution_context.schema.get_operation_root_type(
+        execution_context.operation
+    )
+    field_plans = await get_operation_field_plans(
+        execution_context, operation_root_type, execution_context.operation
+    )
+
+    results = [
+        asyncio.ensure_future(result) if isawaitable(result) else result
+        for result in start_fields(
+            execution_context,
+            operation_root_type,
+            root_value,
+            None,
+            field_plans,
+        )
+    ]
+
+    try:
+        if await _complete_non_null_fields(
+            execution_context, field_plans, results
+        ):
+            response = await response_builder(
+                data=None, errors=execution_context.errors
+            )
+            for fragment in iterencode_json(response, json_encoder):
+                yield fragment
+            return
+
+        async for fragment in _encode_data(field_plans, results, json_encoder):
+            yield fragment
+    finally:
+        for result in results:
+            if asyncio.isfuture(result) and not result.done():
+                result.cancel()
+        deadline = execution_context.request_state.deadline
+        if deadline is not None:
+            deadline.disarm()
+
+    response = await response_builder(errors=execution_context.errors)
+    if "errors" in response:
+        yield b',"errors":'
+        for fragment in iterencode_json(response["errors"], json_encoder):
+            yield fragment
+    yield b"}"
+
+
+async def execute_stream(
+    schema: "GraphQLSchema",
+    document: "DocumentNode",
+    response_builder: Callable,
+    root_value: Optional[Any],
+    context: Optional[Any],
+    variables: Optional[Dict[str, Any]],
+    operation_name: Optional[str],
+) -> AsyncIterator[bytes]:
+    """
+    Runs the execution of the executable operation and encodes the GraphQL
+    response into JSON fragments, in document order. The root fields of
+    queries are encoded as soon as they're completed while the response of
+    mutations is encoded once their root fields are serially executed. The
+    JSON encoding of the cached introspection responses is reused.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param document: the DocumentNode instance linked to the GraphQL request
+    :param response_builder: callable in charge of returning the formatted
+    GraphQL response
+    :param root_value: an initial value corresponding to the root type being
+    executed
+    :param context: value that can contain everything you need and that will be
+    accessible from the resolvers
+    :param variables: the variables provided in the GraphQL request
+    :param operation_name: the operation name to execute
+    :type schema: GraphQLSchema
+    :type document: DocumentNode
+    :type response_builder: Callable
+    :type root_value: Optional[Any]
+    :type context: Optional[Any]
+    :type variables: Optional[Dict[str, Any]]
+    :type operation_name: str
+    :return: the JSON fragments of the GraphQL response
+    :rtype: AsyncIterator[bytes]
+    """
+    # pylint: disable=too-many-arguments
+    execution_context, errors = await build_execution_context(
+        schema, document, root_value, context, variables, operation_name
+    )
+
+    cached_response = (
+        get_cached_introspection_response(
+            execution_context, document.introspection_responses
+        )
+        if not errors and schema.introspection_cache
+        else None
+    )
+
+    if errors:
+        response = await response_builder(errors=errors)
+    elif (
+        cached_response is not None
+        or execution_context.operation.operation_type == "mutation"
+    ):
+        if cached_response is not None and cached_response.encoded is not None:
+            yield cached_response.encoded
+            return
+
+        data = await execute_operation(
+            execution_context, execution_context.operation, root_value
+        )
+        response = await response_builder(
+            data=data, errors=execution_context.errors
+        )
+        if cached_response is not None and not execution_context.errors:
+            yield cached_response.set_response(response, schema.json_encoder)
+            return
+    else:
+        async for fragment in _encode_query_response(
+            execution_context, response_builder, root_value
+        ):
+            yield fragment
+        return
+
+    for fragment in iterencode_json(response, schema.json_encoder):
+        yield fragment
+
+
+async def chunk_fragments(
+    fragments: AsyncIterable[bytes], chunk_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Groups JSON fragments into chunks of at least `chunk_size` bytes (except
+    for the last one).
+    :param fragments: the JSON fragments to group
+    :param chunk_size: the minimum size of the chunks
+    :type fragments: AsyncIterable[bytes]
+    :type chunk_size: int
+    :return: the chunks
+    :rtype: AsyncIterator[bytes]
+    """
+    buffer: List[bytes] = []
+    buffer_size = 0
+    async for fragment in fragments:
+        buffer.append(fragment)
+        buffer_size += len(fragment)
+        if buffer_size >= chunk_size:
+            yield b"".join(buffer)
+            buffer = []
+            buffer_size = 0
+
+    if buffer:
+        yield b"".join(buffer)
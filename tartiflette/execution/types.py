@@ -1,80 +1,166 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from tartiflette.coercers.common import Path
 
 __all__ = ("build_resolve_info",)
 
 
 class ResolveInfo:
     """
-    Class containing the information related to a resolved field.
+    Class containing the information related to a resolved field. Only the
+    information specific to the resolved field is stored, the information
+    related to the request is read from the execution context on access.
+    When only the path of the field's parent is provided, the path of the
+    field is created on first access.
     """
 
     __slots__ = (
-        "field_name",
+        "execution_context",
+        "field_definition",
         "field_nodes",
-        "return_type",
         "parent_type",
-        "path",
-        "schema",
-        "fragments",
-        "root_value",
-        "operation",
-        "variable_values",
         "is_introspection",
+        "_path",
+        "_parent_path",
+        "_response_key",
     )
 
     def __init__(
         self,
-        field_name: str,
-        field_nodes: List["FieldNodes"],
-        return_type: "GraphQLOutputType",
+        execution_context: "ExecutionContext",
+        field_definition: "GraphQLField",
+        field_nodes: List["FieldNode"],
         parent_type: "GraphQLObjectType",
-        path: "Path",
-        schema: "GraphQLSchema",
-        fragments: Dict[str, "FragmentDefinitionNode"],
-        root_value: Optional[Any],
-        operation: "OperationDefinitionNode",
-        variable_values: Optional[Dict[str, Any]],
-        is_introspection_context: bool,
-    ):
-        """
-        :param field_name: name of the resolved field
+        path: Optional["Path"],
+        is_introspection_context: bool = False,
+        parent_path: Optional["Path"] = None,
+        response_key: Optional[str] = None,
+    ) -> None:
+        """
+        :param execution_context: instance of the query execution context
+        :param field_definition: GraphQLField instance of the resolved field
         :param field_nodes: AST nodes related to the resolved field
-        :param return_type: GraphQLOutputType instance of the resolved field
         :param parent_type: GraphQLObjectType of the field's parent
-        :param path: the path traveled until this field
-        :param schema: the GraphQLSchema instance linked to the engine
-        :param fragments: a dictionary of fragment definition AST nodes
-        contained in the request
-        :param root_value: the initial value corresponding to the root type
-        being executed
-        :param operation: the AST operation definition node to execute
-        :param variable_values: the variables provided in the GraphQL request
+        :param path: the path traveled until this field (or None to create it
+        from `parent_path` & `response_key` on first access)
         :param is_introspection_context: determines whether or not the resolved
         field is in a context of an introspection query
-        :type field_name: str
-        :type field_nodes: List[FieldNodes]
-        :type return_type: GraphQLOutputType
+        :param parent_path: the path traveled until the field's parent
+        :param response_key: the key of the field in the response
+        :type execution_context: ExecutionContext
+        :type field_definition: GraphQLField
+        :type field_nodes: List[FieldNode]
         :type parent_type: GraphQLObjectType
-        :type path: Path
-        :type schema: GraphQLSchema
-        :type fragments: Dict[str, FragmentDefinitionNode]
-        :type root_value: Optional[Any]
-        :type operation: OperationDefinitionNode
-        :type variable_values: Optional[Dict[str, Any]]
+        :type path: Optional[Path]
         :type is_introspection_context: bool
+        :type parent_path: Optional[Path]
+        :type response_key: Optional[str]
         """
-        # pylint: disable=too-many-arguments,too-many-locals
-        self.field_name = field_name
+        # pylint: disable=too-many-arguments
+        self.execution_context = execution_context
+        self.field_definition = field_definition
         self.field_nodes = field_nodes
-        self.return_type = return_type
         self.parent_type = parent_type
-        self.path = path
-        self.schema = schema
-        self.fragments = fragments
-        self.root_value = root_value
-        self.operation = operation
-        self.variable_values = variable_values
         self.is_introspection: bool = is_introspection_context
+        self._path = path
+        self._parent_path = parent_path
+        self._response_key = response_key
+
+    @property
+    def path(self) -> "Path":
+        """
+        Returns the path traveled until this field.
+        :return: the path traveled until this field
+        :rtype: Path
+        """
+        if self._path is None:
+            self._path = Path(self._parent_path, self._response_key)
+        return self._path
+
+    @property
+    def field_name(self) -> str:
+        """
+        Returns the name of the resolved field.
+        :return: the name of the resolved field
+        :rtype: str
+        """
+        return self.field_definition.name
+
+    @property
+    def return_type(self) -> "GraphQLOutputType":
+        """
+        Returns the GraphQLOutputType instance of the resolved field.
+        :return: the GraphQLOutputType instance of the resolved field
+        :rtype: GraphQLOutputType
+        """
+        return self.field_definition.graphql_type
+
+    @property
+    def schema(self) -> "GraphQLSchema":
+        """
+        Returns the GraphQLSchema instance linked to the engine.
+        :return: the GraphQLSchema instance linked to the engine
+        :rtype: GraphQLSchema
+        """
+        return self.execution_context.schema
+
+    @property
+    def fragments(self) -> Dict[str, "FragmentDefinitionNode"]:
+        """
+        Returns the fragment definition AST nodes contained in the request.
+        :return: the fragment definition AST nodes contained in the request
+        :rtype: Dict[str, FragmentDefinitionNode]
+        """
+        return self.execution_context.fragments
+
+    @property
+    def root_value(self) -> Optional[Any]:
+        """
+        Returns the initial value corresponding to the root type being
+        executed.
+        :return: the initial value corresponding to the root type
+        :rtype: Optional[Any]
+        """
+        return self.execution_context.root_value
+
+    @property
+    def operation(self) -> "OperationDefinitionNode":
+        """
+        Returns the AST operation definition node being executed.
+        :return: the AST operation definition node being executed
+        :rtype: OperationDefinitionNode
+        """
+        return self.execution_context.operation
+
+    @property
+    def variable_values(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the variables provided in the GraphQL request.
+        :return: the variables provided in the GraphQL request
+        :rtype: Optional[Dict[str, Any]]
+        """
+        return self.execution_context.variable_values
+
+    def get_loader(
+        self,
+        batch_load_fn: Callable,
+        key: Optional[Hashable] = None,
+        **options,
+    ) -> "BatchLoader":
+        """
+        Returns the BatchLoader of the request linked to the key, creating
+        it on first use. Loaders are shared by all the resolvers of a request.
+        :param batch_load_fn: callable receiving a list of keys and returning
+        the list of values in the same order
+        :param key: key identifying the loader (defaults to `batch_load_fn`)
+        :param options: extra parameters of the BatchLoader to create
+        :type batch_load_fn: Callable
+        :type key: Optional[Hashable]
+        :type options: Dict[str, Any]
+        :return: the BatchLoader of the request linked to the key
+        :rtype: BatchLoader
+        """
+        return self.execution_context.get_loader(batch_load_fn, key, **options)
 
 
 def build_resolve_info(
@@ -82,8 +168,10 @@ def build_resolve_info(
     field_definition: "GraphQLField",
     field_nodes: List["FieldNode"],
     parent_type: "GraphQLObjectType",
-    path: "Path",
+    path: Optional["Path"],
     is_introspection_context: bool = False,
+    parent_path: Optional["Path"] = None,
+    response_key: Optional[str] = None,
 ) -> "ResolveInfo":
     """
     Builds & returns a ResolveInfo instance.
@@ -91,28 +179,30 @@ def build_resolve_info(
     :param field_definition: GraphQLField instance of the resolved field
     :param field_nodes: AST nodes related to the resolved field
     :param parent_type: GraphQLObjectType of the field's parent
-    :param path: the path traveled until this resolver
+    :param path: the path traveled until this resolver (or None to create
+    it from `parent_path` & `response_key` on first access)
     :param is_introspection_context: determines whether or not the resolved
     field is in a context of an introspection query
+    :param parent_path: the path traveled until the field's parent
+    :param response_key: the key of the field in the response
     :type execution_context: ExecutionContext
     :type field_definition: GraphQLField
     :type field_nodes: List[FieldNode]
     :type parent_type: GraphQLObjectType
-    :type path: Path
+    :type path: Optional[Path]
     :type is_introspection_context: bool
+    :type parent_path: Optional[Path]
+    :type response_key: Optional[str]
     :return: a ResolveInfo instance
     :rtype: ResolveInfo
     """
     return ResolveInfo(
-        field_definition.name,
+        execution_context,
+        field_definition,
         field_nodes,
-        field_definition.graphql_type,
         parent_type,
         path,
-        execution_context.schema,
-        execution_context.fragments,
-        execution_context.root_value,
-        execution_context.operation,
-        execution_context.variable_values,
         is_introspection_context,
+        parent_path,
+        response_key,
     )
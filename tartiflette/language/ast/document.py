@@ -1,4 +1,6 @@
-from typing import Any, List, Optional
+import warnings
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 from tartiflette.language.ast.base import Node
 
@@ -10,7 +12,16 @@ class DocumentNode(Node):
     AST node representing a GraphQL document.
     """
 
-    __slots__ = ("definitions", "location", "_hash_id", "validators")
+    __slots__ = (
+        "definitions",
+        "location",
+        "_hash_id",
+        "execution_plans",
+        "collection_decisions",
+        "complexities",
+        "introspection_responses",
+        "variables_coercers",
+    )
 
     def __init__(
         self,
@@ -21,18 +32,33 @@ class DocumentNode(Node):
     ) -> None:
         """
         :param definitions: definitions of the document
+        :param validators: deprecated & ignored, documents are validated
+        once parsed by `parse_and_validate_query`
         :param location: location of the document in the query/SDL
         :param hash_id: hash of the DocumentNode
-        :param validators: a validators object that will be used to validate the document
         :type definitions: List[DefinitionNode]
+        :type validators: Optional["Validators"]
         :type location: Optional[Location]
         :type hash_id: Optional[int]
-        :type validators: Optional["Validators"]
         """
+        if validators is not None:
+            warnings.warn(
+                "The < validators > parameter of DocumentNode is deprecated "
+                "and ignored.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+
         self.definitions = definitions
         self.location = location
         self._hash_id = hash_id
-        self.validators = validators
+        self.execution_plans: Dict[Tuple[Union[str, int], ...], Any] = {}
+        self.collection_decisions: Dict[int, bool] = {}
+        self.complexities: Dict[int, "QueryComplexity"] = {}
+        self.introspection_responses: Dict[
+            int, Optional[Dict[Hashable, "CachedIntrospectionResponse"]]
+        ] = {}
+        self.variables_coercers: Dict[int, Callable] = {}
 
     def __eq__(self, other: Any) -> bool:
         """
@@ -1,4 +1,5 @@
 import os
+import sys
 
 from types import TracebackType
 from typing import Optional, Type, Union
@@ -34,6 +35,10 @@ try:
 except OSError:
     _LIB = _FFI.dlopen(f"{_LIBGRAPHQLPARSER_DIR}/libgraphqlparser.dylib")
 
+# CPython always stores a trailing NUL byte after the content of `bytes` &
+# `bytearray` objects, their buffer can thus directly be used as C string
+_NUL_TERMINATED_BUFFERS = sys.implementation.name == "cpython"
+
 
 class ParsedData:
     """
@@ -79,24 +84,58 @@ class ParsedData:
         self._destroy_cb(self._c_parsed)
 
 
-def _parse_context_manager(query: Union[str, bytes]) -> ParsedData:
+def _to_c_string(query: Union[str, bytes, bytearray, memoryview]) -> "CData":
+    """
+    Returns a NUL terminated C string of the query. The buffer of `bytes` &
+    `bytearray` queries (or of memoryviews spanning a whole `bytes` or
+    `bytearray` object) is used as is, other queries are copied once.
+    :param query: query to convert
+    :type query: Union[str, bytes, bytearray, memoryview]
+    :return: char[]
+    :rtype: CData
+    """
+    if isinstance(query, str):
+        query = query.encode("UTF-8")
+    elif (
+        isinstance(query, memoryview)
+        and query.c_contiguous
+        and isinstance(query.obj, (bytes, bytearray))
+        and query.nbytes == len(query.obj)
+    ):
+        query = query.obj
+
+    if _NUL_TERMINATED_BUFFERS and isinstance(query, (bytes, bytearray)):
+        return _FFI.from_buffer(query)
+
+    if isinstance(query, bytes):
+        return _FFI.new("char[]", query)
+
+    query = memoryview(query)
+    if not query.c_contiguous:
+        return _FFI.new("char[]", query.tobytes())
+
+    c_string = _FFI.new("char[]", query.nbytes + 1)
+    _FFI.memmove(c_string, query, query.nbytes)
+    return c_string
+
+
+def _parse_context_manager(
+    query: Union[str, bytes, bytearray, memoryview]
+) -> ParsedData:
     """
     Parses the query with the libgraphqlparser library and returns a ParsedData
     instance.
     :param query: query to parse with libgraphqlparser
-    :type query: Union[str, bytes]
+    :type query: Union[str, bytes, bytearray, memoryview]
     :return: a ParsedData instance which is a context manager
     :rtype: ParsedData
     :raises GraphQLSyntaxError: raised when the libgraphqlparser library
     couldn't parse the query due to a syntax error.
     """
-    if isinstance(query, str):
-        query = query.encode("UTF-8")
-
     errors = _FFI.new("char **")
 
     parsed_data = ParsedData(
-        _LIB.graphql_parse_string(_FFI.new("char[]", query), errors),
+        _LIB.graphql_parse_string(_to_c_string(query), errors),
         _LIB.graphql_node_free,
     )
 
@@ -111,11 +150,13 @@ def _parse_context_manager(query: Union[str, bytes]) -> ParsedData:
     return parsed_data
 
 
-def _parse_to_json_ast(query: Union[str, bytes]) -> bytes:
+def _parse_to_json_ast(
+    query: Union[str, bytes, bytearray, memoryview]
+) -> bytes:
     """
     Parses the query and returns its AST JSON representation as bytes.
     :param query: query to parse
-    :type query: Union[str, bytes]
+    :type query: Union[str, bytes, bytearray, memoryview]
     :return: bytes AST JSON representation of the query
     :rtype: bytes
     """
@@ -124,13 +165,14 @@ def _parse_to_json_ast(query: Union[str, bytes]) -> bytes:
 
 
 def parse_to_document(
-    query: Union[str, bytes], schema: "GraphQLSchema"
+    query: Union[str, bytes, bytearray, memoryview], schema: "GraphQLSchema"
 ) -> "DocumentNode":
     """
     Returns a DocumentNode instance which represents the query after being
-    parsed.
+    parsed. The document isn't validated against the schema (see
+    `tartiflette.language.validators.validate_document`).
     :param query: query to parse and transform into a DocumentNode
-    :type query: Union[str, bytes]
+    :type query: Union[str, bytes, bytearray, memoryview]
     :param schema: the GraphQLSchema instance linked to the engine
     :type schema: GraphQLSchema
     :return: a DocumentNode representing the query
@@ -151,5 +193,5 @@ def parse_to_document(
     >>> }''')
     """
     return document_from_ast_json(
-        schema.json_loader(_parse_to_json_ast(query)), query, schema
+        schema.json_loader(_parse_to_json_ast(query)), query
     )
@@ -0,0 +1,394 @@
+from typing import Dict, List, NamedTuple, Optional
+
+from tartiflette.coercers.common import Path
+from tartiflette.language.ast import VariableNode
+from tartiflette.language.validators.query.utils import (
+    get_schema_field_type_name,
+)
+
+__all__ = (
+    "ArgumentUsage",
+    "SpreadUsage",
+    "DefinitionUsages",
+    "TypeInfo",
+    "ValidationContext",
+)
+
+
+class ArgumentUsage(NamedTuple):
+    """
+    Argument whose value is a variable, along with the field or directive
+    it's provided to.
+    """
+
+    argument: "ArgumentNode"
+    # Fully qualified field name (Type.field) or directive name
+    node_location: str
+    is_directive: bool
+    path: Optional["Path"]
+
+
+class SpreadUsage(NamedTuple):
+    """
+    Fragment spread along with the path where it's spread.
+    """
+
+    spread: "FragmentSpreadNode"
+    path: Optional["Path"]
+
+
+class DefinitionUsages:
+    """
+    Variables, fragment spreads & arguments using a variable found in an
+    operation or fragment definition.
+    """
+
+    __slots__ = ("used_vars", "spreads", "args_using_var")
+
+    def __init__(self) -> None:
+        self.used_vars: List["VariableNode"] = []
+        self.spreads: List["FragmentSpreadNode"] = []
+        self.args_using_var: List["ArgumentUsage"] = []
+
+
+class TypeInfo:
+    """
+    Stacks of the types & fields traversed while a document is visited.
+    """
+
+    __slots__ = ("_type_names", "_parent_type_names", "_field_names")
+
+    def __init__(self) -> None:
+        self._type_names: List[Optional[str]] = []
+        self._parent_type_names: List[Optional[str]] = []
+        self._field_names: List[str] = []
+
+    @property
+    def type_name(self) -> Optional[str]:
+        """
+        Returns the name of the type of the current field, fragment or
+        operation.
+        :return: the name of the type of the current node
+        :rtype: Optional[str]
+        """
+        return self._type_names[-1] if self._type_names else None
+
+    @property
+    def parent_type_name(self) -> Optional[str]:
+        """
+        Returns the name of the type of the current selection set.
+        :return: the name of the type of the current selection set
+        :rtype: Optional[str]
+        """
+        return self._parent_type_names[-1] if self._parent_type_names else None
+
+    @property
+    def field_name(self) -> Optional[str]:
+        """
+        Returns the fully qualified name (Type.field) of the current field.
+        :return: the fully qualified name of the current field
+        :rtype: Optional[str]
+        """
+        return self._field_names[-1] if self._field_names else None
+
+    def push_type(self, type_name: Optional[str]) -> None:
+        """
+        Enters a node (operation, fragment or inline fragment) of the given
+        type.
+        :param type_name: the name of the type of the node entered
+        :type type_name: Optional[str]
+        """
+        self._type_names.append(type_name)
+
+    def pop_type(self) -> Optional[str]:
+        """
+        Leaves the current operation, fragment or inline fragment.
+        :return: the name of the type of the node left
+        :rtype: Optional[str]
+        """
+        return self._type_names.pop()
+
+    def enter_selection_set(self) -> None:
+        """
+        Enters a selection set on the current type.
+        """
+        self._parent_type_names.append(self.type_name)
+
+    def leave_selection_set(self) -> None:
+        """
+        Leaves the current selection set.
+        """
+        self._parent_type_names.pop()
+
+    def enter_field(self, field_name: str, schema: "GraphQLSchema") -> None:
+        """
+        Enters a field selected on the current selection set.
+        :param field_name: the name of the field entered
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type field_name: str
+        :type schema: GraphQLSchema
+        """
+        parent_type_name = self.parent_type_name
+        self._field_names.append(f"{parent_type_name}.{field_name}")
+        self._type_names.append(
+            get_schema_field_type_name(parent_type_name, field_name, schema)
+        )
+
+    def leave_field(self) -> None:
+        """
+        Leaves the current field.
+        """
+        self._type_names.pop()
+        self._field_names.pop()
+
+
+class ValidationContext:
+    """
+    State of the validation of a document, shared by the validation rules.
+
+    The state is updated by the `enter_*` & `leave_*` methods while the
+    document is visited: the ones of a node are called before the rules
+    enter it & after the rules leave it. When a rule leaves a field, the
+    `parent_type_name` is thus the name of the type the field is selected
+    on while `type_name` is the name of the type of the field.
+    """
+
+    __slots__ = (
+        "schema",
+        "errors",
+        "aborted",
+        "path",
+        "operations",
+        "fragments",
+        "fragment_spreads",
+        "spreaded_in",
+        "inlined_in",
+        "operation_usages",
+        "fragment_usages",
+        "usages",
+        "directive_name",
+        "in_variable_definition",
+        "type_info",
+    )
+
+    def __init__(self, schema: "GraphQLSchema") -> None:
+        """
+        :param schema: the GraphQLSchema instance linked to the engine
+        :type schema: GraphQLSchema
+        """
+        self.schema = schema
+        self.errors: List["TartifletteError"] = []
+        # Set when a rule aborts the validation, no other rule is then run
+        self.aborted = False
+        self.path: Optional["Path"] = None
+        self.operations: List["OperationDefinitionNode"] = []
+        self.fragments: List["FragmentDefinitionNode"] = []
+        self.fragment_spreads: List["FragmentSpreadNode"] = []
+        self.spreaded_in: Dict[Optional[str], List["SpreadUsage"]] = {}
+        self.inlined_in: Dict[Optional[str], List["InlineFragmentNode"]] = {}
+        self.operation_usages: Dict[str, "DefinitionUsages"] = {}
+        self.fragment_usages: Dict[str, "DefinitionUsages"] = {}
+        self.usages: Optional["DefinitionUsages"] = None
+        self.directive_name: Optional[str] = None
+        self.in_variable_definition = False
+        self.type_info = TypeInfo()
+
+    @property
+    def type_name(self) -> Optional[str]:
+        """
+        Returns the name of the type of the current field, fragment or
+        operation.
+        :return: the name of the type of the current node
+        :rtype: Optional[str]
+        """
+        return self.type_info.type_name
+
+    @property
+    def parent_type_name(self) -> Optional[str]:
+        """
+        Returns the name of the type of the current selection set.
+        :return: the name of the type of the current selection set
+        :rtype: Optional[str]
+        """
+        return self.type_info.parent_type_name
+
+    @property
+    def field_name(self) -> Optional[str]:
+        """
+        Returns the fully qualified name (Type.field) of the current field.
+        :return: the fully qualified name of the current field
+        :rtype: Optional[str]
+        """
+        return self.type_info.field_name
+
+    def enter_operation_definition(
+        self, node: "OperationDefinitionNode"
+    ) -> None:
+        """
+        :param node: the operation definition node entered
+        :type node: OperationDefinitionNode
+        """
+        self.type_info.push_type(
+            getattr(
+                self.schema, f"{node.operation_type.lower()}_operation_name"
+            )
+        )
+        self.usages = self.operation_usages.setdefault(
+            node.name.value if node.name else "None", DefinitionUsages()
+        )
+
+    def leave_operation_definition(
+        self, node: "OperationDefinitionNode"
+    ) -> None:
+        """
+        :param node: the operation definition node left
+        :type node: OperationDefinitionNode
+        """
+        self.type_info.pop_type()
+        self.operations.append(node)
+
+    def enter_fragment_definition(
+        self, node: "FragmentDefinitionNode"
+    ) -> None:
+        """
+        :param node: the fragment definition node entered
+        :type node: FragmentDefinitionNode
+        """
+        self.type_info.push_type(node.type_condition.name.value)
+        self.usages = self.fragment_usages.setdefault(
+            node.name.value, DefinitionUsages()
+        )
+
+    def leave_fragment_definition(
+        self, node: "FragmentDefinitionNode"
+    ) -> None:
+        """
+        :param node: the fragment definition node left
+        :type node: FragmentDefinitionNode
+        """
+        self.type_info.pop_type()
+        self.fragments.append(node)
+
+    def enter_variable_definition(
+        self, node: "VariableDefinitionNode"
+    ) -> None:
+        """
+        :param node: the variable definition node entered
+        :type node: VariableDefinitionNode
+        """
+        # pylint: disable=unused-argument
+        self.in_variable_definition = True
+
+    def leave_variable_definition(
+        self, node: "VariableDefinitionNode"
+    ) -> None:
+        """
+        :param node: the variable definition node left
+        :type node: VariableDefinitionNode
+        """
+        # pylint: disable=unused-argument
+        self.in_variable_definition = False
+
+    def enter_selection_set(self, node: "SelectionSetNode") -> None:
+        """
+        :param node: the selection set node entered
+        :type node: SelectionSetNode
+        """
+        # pylint: disable=unused-argument
+        self.type_info.enter_selection_set()
+
+    def leave_selection_set(self, node: "SelectionSetNode") -> None:
+        """
+        :param node: the selection set node left
+        :type node: SelectionSetNode
+        """
+        # pylint: disable=unused-argument
+        self.type_info.leave_selection_set()
+
+    def enter_field(self, node: "FieldNode") -> None:
+        """
+        :param node: the field node entered
+        :type node: FieldNode
+        """
+        field_name = node.name.value
+        self.path = Path(prev=self.path, key=field_name)
+        self.type_info.enter_field(field_name, self.schema)
+
+    def leave_field(self, node: "FieldNode") -> None:
+        """
+        :param node: the field node left
+        :type node: FieldNode
+        """
+        # pylint: disable=unused-argument
+        self.type_info.leave_field()
+        self.path = self.path.prev
+
+    def enter_fragment_spread(self, node: "FragmentSpreadNode") -> None:
+        """
+        :param node: the fragment spread node entered
+        :type node: FragmentSpreadNode
+        """
+        self.fragment_spreads.append(node)
+        self.spreaded_in.setdefault(self.parent_type_name, []).append(
+            SpreadUsage(node, self.path)
+        )
+        self.usages.spreads.append(node)
+
+    def enter_inline_fragment(self, node: "InlineFragmentNode") -> None:
+        """
+        :param node: the inline fragment node entered
+        :type node: InlineFragmentNode
+        """
+        self.type_info.push_type(
+            node.type_condition.name.value
+            if node.type_condition
+            else self.parent_type_name
+        )
+
+    def leave_inline_fragment(self, node: "InlineFragmentNode") -> None:
+        """
+        :param node: the inline fragment node left
+        :type node: InlineFragmentNode
+        """
+        self.inlined_in.setdefault(self.type_info.pop_type(), []).append(node)
+
+    def enter_directive(self, node: "DirectiveNode") -> None:
+        """
+        :param node: the directive node entered
+        :type node: DirectiveNode
+        """
+        self.directive_name = node.name.value
+
+    def leave_directive(self, node: "DirectiveNode") -> None:
+        """
+        :param node: the directive node left
+        :type node: DirectiveNode
+        """
+        # pylint: disable=unused-argument
+        self.directive_name = None
+
+    def leave_argument(self, node: "ArgumentNode") -> None:
+        """
+        :param node: the argument node left
+        :type node: ArgumentNode
+        """
+        if not isinstance(node.value, VariableNode):
+            return
+
+        is_directive = self.directive_name is not None
+        self.usages.args_using_var.append(
+            ArgumentUsage(
+                node,
+                self.directive_name if is_directive else self.field_name,
+                is_directive,
+                self.path,
+            )
+        )
+
+    def enter_variable(self, node: "VariableNode") -> None:
+        """
+        :param node: the variable node entered
+        :type node: VariableNode
+        """
+        if not self.in_variable_definition:
+            self.usages.used_vars.append(node)
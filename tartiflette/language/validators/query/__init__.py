@@ -29,35 +29,35 @@ from .values_of_correct_type import ValuesOfCorrectType
 from .variable_uniqueness import VariableUniqueness
 from .variables_are_input_types import VariablesAreInputTypes
 
-# TODO make this automatically via reflection
-
+# Rules subscribed to a same event are run in this order, which is thus the
+# order of their errors
 RULE_SET = {
-    AllVariableUsagesAreAllowed.RULE_NAME: AllVariableUsagesAreAllowed(),
-    AllVariablesUsed.RULE_NAME: AllVariablesUsed(),
-    AllVariableUsesDefined.RULE_NAME: AllVariableUsesDefined(),
-    ArgumentNames.RULE_NAME: ArgumentNames(),
-    ArgumentUniqueness.RULE_NAME: ArgumentUniqueness(),
-    DirectivesAreDefined.RULE_NAME: DirectivesAreDefined(),
     DirectivesAreInValidLocations.RULE_NAME: DirectivesAreInValidLocations(),
-    DirectivesAreUniquePerLocation.RULE_NAME: DirectivesAreUniquePerLocation(),
-    ExecutableDefinition.RULE_NAME: ExecutableDefinition(),
     FieldSelectionsOnObjectsInterfacesAndUnionsTypes.RULE_NAME: FieldSelectionsOnObjectsInterfacesAndUnionsTypes(),
-    FragmentMustBeUsed.RULE_NAME: FragmentMustBeUsed(),
-    FragmentNameUniqueness.RULE_NAME: FragmentNameUniqueness(),
+    LeafFieldSelections.RULE_NAME: LeafFieldSelections(),
+    ValuesOfCorrectType.RULE_NAME: ValuesOfCorrectType(),
+    ArgumentNames.RULE_NAME: ArgumentNames(),
+    RequiredArguments.RULE_NAME: RequiredArguments(),
+    DirectivesAreDefined.RULE_NAME: DirectivesAreDefined(),
+    FragmentSpreadTypeExistence.RULE_NAME: FragmentSpreadTypeExistence(),
     FragmentsOnCompositeTypes.RULE_NAME: FragmentsOnCompositeTypes(),
-    FragmentSpreadIsPossible.RULE_NAME: FragmentSpreadIsPossible(),
     FragmentSpreadsMustNotFormCycles.RULE_NAME: FragmentSpreadsMustNotFormCycles(
         True
     ),
-    FragmentSpreadTargetDefined.RULE_NAME: FragmentSpreadTargetDefined(),
-    FragmentSpreadTypeExistence.RULE_NAME: FragmentSpreadTypeExistence(),
-    InputObjectFieldUniqueness.RULE_NAME: InputObjectFieldUniqueness(),
-    LeafFieldSelections.RULE_NAME: LeafFieldSelections(),
+    OperationNameUniqueness.RULE_NAME: OperationNameUniqueness(),
     LoneAnonymousOperation.RULE_NAME: LoneAnonymousOperation(),
-    RequiredArguments.RULE_NAME: RequiredArguments(),
     SingleRootField.RULE_NAME: SingleRootField(),
-    OperationNameUniqueness.RULE_NAME: OperationNameUniqueness(),
-    ValuesOfCorrectType.RULE_NAME: ValuesOfCorrectType(),
-    VariablesAreInputTypes.RULE_NAME: VariablesAreInputTypes(),
+    FragmentNameUniqueness.RULE_NAME: FragmentNameUniqueness(),
+    FragmentSpreadTargetDefined.RULE_NAME: FragmentSpreadTargetDefined(),
+    FragmentMustBeUsed.RULE_NAME: FragmentMustBeUsed(),
+    FragmentSpreadIsPossible.RULE_NAME: FragmentSpreadIsPossible(),
+    AllVariableUsesDefined.RULE_NAME: AllVariableUsesDefined(),
+    AllVariablesUsed.RULE_NAME: AllVariablesUsed(),
+    AllVariableUsagesAreAllowed.RULE_NAME: AllVariableUsagesAreAllowed(),
+    ExecutableDefinition.RULE_NAME: ExecutableDefinition(),
+    ArgumentUniqueness.RULE_NAME: ArgumentUniqueness(),
+    DirectivesAreUniquePerLocation.RULE_NAME: DirectivesAreUniquePerLocation(),
+    InputObjectFieldUniqueness.RULE_NAME: InputObjectFieldUniqueness(),
     VariableUniqueness.RULE_NAME: VariableUniqueness(),
+    VariablesAreInputTypes.RULE_NAME: VariablesAreInputTypes(),
 }
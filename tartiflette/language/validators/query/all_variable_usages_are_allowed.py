@@ -12,45 +12,50 @@ from tartiflette.types.non_null import GraphQLNonNull
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
-def _find_args_using_var_in_spread(spreads, per_fragment, args_using_var=None):
+def _find_args_using_var_in_spread(
+    spreads, fragment_usages, args_using_var=None, visited=None
+):
     if not args_using_var:
         args_using_var = []
+    if visited is None:
+        visited = set()
 
     for spread in spreads:
+        # Each fragment is only followed once, which also prevents fragment
+        # cycles from recursing forever
+        if spread.name.value in visited:
+            continue
+        visited.add(spread.name.value)
+
+        usages = fragment_usages.get(spread.name.value)
+        if usages is None:
+            continue
         args_using_var = _find_args_using_var_in_spread(
-            per_fragment.get(spread.name.value, {}).get("spreads", []),
-            per_fragment,
-            args_using_var,
-        )
-        args_using_var.extend(
-            per_fragment.get(spread.name.value, {}).get("args_using_var", [])
+            usages.spreads, fragment_usages, args_using_var, visited
         )
+        args_using_var.extend(usages.args_using_var)
 
     return args_using_var
 
 
-def _get_args_using_var(operation, per_operation, per_fragment):
-    operation_key = operation.name.value if operation.name else "None"
-
-    args_using_var = per_operation.get(operation_key, {}).get(
-        "args_using_var", []
+def _get_args_using_var(operation, operation_usages, fragment_usages):
+    usages = operation_usages.get(
+        operation.name.value if operation.name else "None"
     )
+    if usages is None:
+        return []
 
-    args_using_var.extend(
-        _find_args_using_var_in_spread(
-            per_operation.get(operation_key, {}).get("spreads", []),
-            per_fragment,
-        )
+    return usages.args_using_var + _find_args_using_var_in_spread(
+        usages.spreads, fragment_usages
     )
-    return args_using_var
 
 
 def _find_schema_object(arg_info, schema):
-    if arg_info["is_directive"]:
-        if not schema.has_directive(arg_info["node_location"]):
+    if arg_info.is_directive:
+        if not schema.has_directive(arg_info.node_location):
             return None
-        return schema.find_directive(arg_info["node_location"])
-    return find_field_by_name(arg_info["node_location"], schema)
+        return schema.find_directive(arg_info.node_location)
+    return find_field_by_name(arg_info.node_location, schema)
 
 
 def _find_schema_argument(used_arg, schema):
@@ -59,7 +64,7 @@ def _find_schema_argument(used_arg, schema):
         return None
 
     for arg_name, arg in schema_object.arguments.items():
-        if used_arg["arg"].name.value == arg_name:
+        if used_arg.argument.name.value == arg_name:
             return arg
     return None
 
@@ -127,16 +132,16 @@ class AllVariableUsagesAreAllowed(June2018ReleaseValidationRule):
     RULE_NUMBER = "5.8.5"
 
     def _validate_operation(
-        self, operation, per_operation, per_fragment, schema
+        self, operation, operation_usages, fragment_usages, schema
     ):
         errors = []
         for used_arg in _get_args_using_var(
-            operation, per_operation, per_fragment
+            operation, operation_usages, fragment_usages
         ):
             schema_argument = _find_schema_argument(used_arg, schema)
             variable_used = _find_variable_by_name(
                 operation.variable_definitions,
-                used_arg["arg"].value.name.value,
+                used_arg.argument.value.name.value,
             )
 
             if not schema_argument or not variable_used:
@@ -146,38 +151,24 @@ class AllVariableUsagesAreAllowed(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't use < ${variable_used.variable.name.value} / {variable_used.type} > for type < {schema_argument.gql_type} >.",
-                        nodes=[variable_used, used_arg["arg"].value],
-                        path=used_arg["path"],
+                        nodes=[variable_used, used_arg.argument.value],
+                        path=used_arg.path,
                         extensions=self._extensions,
                     )
                 )
 
         return errors
 
-    def validate(
-        self,
-        schema,
-        operations=None,
-        per_operation=None,
-        per_fragment=None,
-        **_,
-    ):
-
+    def leave_document(self, _, context):
         errors = []
 
-        if not operations:
-            return []  # No operation
-
-        if not per_operation:
-            per_operation = {}
-
-        if not per_fragment:
-            per_fragment = {}
-
-        for operation in operations:
+        for operation in context.operations:
             errors.extend(
                 self._validate_operation(
-                    operation, per_operation, per_fragment, schema
+                    operation,
+                    context.operation_usages,
+                    context.fragment_usages,
+                    context.schema,
                 )
             )
 
@@ -9,11 +9,11 @@ from tartiflette.language.validators.query.utils import (
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
-def _validate_operation(operation, per_operation, per_fragment):
+def _validate_operation(operation, operation_usages, fragment_usages):
     error_per_var = {}
     defined_vars = get_defined_vars(operation)
 
-    for a_var in get_used_vars(operation, per_operation, per_fragment):
+    for a_var in get_used_vars(operation, operation_usages, fragment_usages):
         if not find_nodes_by_name(defined_vars, a_var.name.value):
             error_per_var.setdefault(a_var.name.value, []).append(a_var)
 
@@ -41,22 +41,10 @@ class AllVariableUsesDefined(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-All-Variable-Uses-Defined"
     RULE_NUMBER = "5.8.3"
 
-    def validate(
-        self, operations=None, per_operation=None, per_fragment=None, **_
-    ):
-
+    def leave_document(self, _, context):
         errors = []
 
-        if not operations:
-            return []  # No operation
-
-        if not per_operation:
-            per_operation = {}
-
-        if not per_fragment:
-            per_fragment = {}
-
-        for operation in operations:
+        for operation in context.operations:
             errors.extend(
                 [
                     graphql_error_from_nodes(
@@ -66,7 +54,9 @@ class AllVariableUsesDefined(June2018ReleaseValidationRule):
                         extensions=self._extensions,
                     )
                     for k, v in _validate_operation(
-                        operation, per_operation, per_fragment
+                        operation,
+                        context.operation_usages,
+                        context.fragment_usages,
                     ).items()
                 ]
             )
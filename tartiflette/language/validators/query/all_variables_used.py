@@ -18,9 +18,9 @@ def _get_message(operation, varname):
     return f"Unused Varibable < {varname} > in {operation_message}."
 
 
-def _validate_operation(operation, per_operation, per_fragment):
+def _validate_operation(operation, operation_usages, fragment_usages):
     error_per_var = {}
-    used_vars = get_used_vars(operation, per_operation, per_fragment)
+    used_vars = get_used_vars(operation, operation_usages, fragment_usages)
 
     for a_var in get_defined_vars(operation):
         if not find_nodes_by_name(used_vars, a_var.name.value):
@@ -41,22 +41,10 @@ class AllVariablesUsed(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-All-Variables-Used"
     RULE_NUMBER = "5.8.4"
 
-    def validate(
-        self, operations=None, per_operation=None, per_fragment=None, **_
-    ):
-
+    def leave_document(self, _, context):
         errors = []
 
-        if not operations:
-            return []  # No operation
-
-        if not per_operation:
-            per_operation = {}
-
-        if not per_fragment:
-            per_fragment = {}
-
-        for operation in operations:
+        for operation in context.operations:
             errors.extend(
                 [
                     graphql_error_from_nodes(
@@ -66,7 +54,9 @@ class AllVariablesUsed(June2018ReleaseValidationRule):
                         extensions=self._extensions,
                     )
                     for k, v in _validate_operation(
-                        operation, per_operation, per_fragment
+                        operation,
+                        context.operation_usages,
+                        context.fragment_usages,
                     ).items()
                 ]
             )
@@ -1,4 +1,3 @@
-from tartiflette.language.ast import DirectiveNode
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
@@ -65,9 +64,12 @@ class ArgumentNames(June2018ReleaseValidationRule):
 
         return errors
 
-    def validate(self, node, path, schema, parent_type_name=None, **__):
-        if isinstance(node, DirectiveNode):
-            return self._validate_directive_arguments(node, path, schema)
+    def leave_directive(self, node, context):
+        return self._validate_directive_arguments(
+            node, context.path, context.schema
+        )
+
+    def leave_field(self, node, context):
         return self._validate_field_arguments(
-            node, path, schema, parent_type_name
+            node, context.path, context.schema, context.parent_type_name
         )
@@ -17,7 +17,8 @@ class ArgumentUniqueness(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Argument-Uniqueness"
     RULE_NUMBER = "5.4.2"
 
-    def validate(self, arguments, path, **__):
+    def leave_arguments(self, node, context):
+        arguments = node.arguments
         errors = []
         already_tested = []
 
@@ -31,7 +32,7 @@ class ArgumentUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple arguments named < {argument.name.value} >.",
-                        path=path,
+                        path=context.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
@@ -15,13 +15,13 @@ class DirectivesAreDefined(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Directives-Are-Defined"
     RULE_NUMBER = "5.7.1"
 
-    def validate(self, directive, schema, path, **_):
-        if not schema.has_directive(directive.name.value):
+    def leave_directive(self, directive, context):
+        if not context.schema.has_directive(directive.name.value):
             return [
                 graphql_error_from_nodes(
                     message=f"Unknow Directive < @{directive.name.value} >.",
                     nodes=directive,
-                    path=path,
+                    path=context.path,
                     extensions=self._extensions,
                 )
             ]
@@ -33,7 +33,7 @@ class DirectivesAreInValidLocations(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Directives-Are-In-Valid-Locations"
     RULE_NUMBER = "5.7.2"
 
-    def validate(self, node, path, schema, **_):
+    def _validate(self, node, path, schema):
         errors = []
 
         node_type = type(node)
@@ -59,3 +59,18 @@ class DirectivesAreInValidLocations(June2018ReleaseValidationRule):
                 )
 
         return errors
+
+    def leave_operation_definition(self, node, context):
+        return self._validate(node, context.path, context.schema)
+
+    def leave_fragment_definition(self, node, context):
+        return self._validate(node, context.path, context.schema)
+
+    def leave_field(self, node, context):
+        return self._validate(node, context.path, context.schema)
+
+    def leave_fragment_spread(self, node, context):
+        return self._validate(node, context.path, context.schema)
+
+    def leave_inline_fragment(self, node, context):
+        return self._validate(node, context.path, context.schema)
@@ -16,7 +16,8 @@ class DirectivesAreUniquePerLocation(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Directives-Are-Unique-Per-Location"
     RULE_NUMBER = "5.7.3"
 
-    def validate(self, directives, path, **_):
+    def leave_directives(self, node, context):
+        directives = node.directives
         errors = []
         already_tested = []
 
@@ -32,7 +33,7 @@ class DirectivesAreUniquePerLocation(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple directives named < {directive.name.value} > in the same location.",
-                        path=path,
+                        path=context.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
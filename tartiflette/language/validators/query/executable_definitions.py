@@ -18,17 +18,17 @@ class ExecutableDefinition(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Executable-Definitions"
     RULE_NUMBER = "5.1.1"
 
-    def validate(self, definitions, path, **__):
+    def leave_document(self, node, context):
         bad_nodes = [
             x
-            for x in definitions
+            for x in node.definitions
             if not isinstance(x, ExecutableDefinitionNode)
         ]
         if bad_nodes:
             return [
                 graphql_error_from_nodes(
                     message="Theses definitions are not executable.",
-                    path=path,
+                    path=context.path,
                     nodes=bad_nodes,
                     extensions=self._extensions,
                 )
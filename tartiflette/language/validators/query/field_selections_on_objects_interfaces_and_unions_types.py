@@ -19,7 +19,10 @@ class FieldSelectionsOnObjectsInterfacesAndUnionsTypes(
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Field-Selections-on-Objects-Interfaces-and-Unions-Types"
     RULE_NUMBER = "5.3.1"
 
-    def validate(self, path, schema, field, parent_type_name, **__):
+    def leave_field(self, field, context):
+        path = context.path
+        schema = context.schema
+        parent_type_name = context.parent_type_name
         graphql_type = find_field_reduced_type(
             parent_type_name, field.name.value, schema
         )
@@ -16,19 +16,18 @@ class FragmentMustBeUsed(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragments-Must-Be-Used"
     RULE_NUMBER = "5.5.1.4"
 
-    def validate(self, path, fragments, fragment_spreads=None, **__):
+    def leave_document(self, _, context):
         errors = []
 
-        if not fragment_spreads:
-            fragment_spreads = []
-
-        for fragment in fragments:
-            if not find_nodes_by_name(fragment_spreads, fragment.name.value):
+        for fragment in context.fragments:
+            if not find_nodes_by_name(
+                context.fragment_spreads, fragment.name.value
+            ):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Fragment < {fragment.name.value} > is never used.",
                         nodes=fragment,
-                        path=path,
+                        path=context.path,
                         extensions=self._extensions,
                     )
                 )
@@ -17,7 +17,8 @@ class FragmentNameUniqueness(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-Name-Uniqueness"
     RULE_NUMBER = "5.5.1.1"
 
-    def validate(self, path, fragments, **__):
+    def leave_document(self, _, context):
+        fragments = context.fragments
         errors = []
         already_tested = []
 
@@ -31,7 +32,7 @@ class FragmentNameUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple fragments named < {fragment.name.value} >.",
-                        path=path,
+                        path=context.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
@@ -9,7 +9,7 @@ from tartiflette.utils.errors import graphql_error_from_nodes
 def _get_spreaded_fragment(fragments, spreads):
     spreaded_fragments = []
     for spread in spreads:
-        nodes = find_nodes_by_name(fragments, spread["spread"].name.value)
+        nodes = find_nodes_by_name(fragments, spread.spread.name.value)
         if nodes:
             spreaded_fragments.append(nodes[0])
     return spreaded_fragments
@@ -65,8 +65,8 @@ class FragmentSpreadIsPossible(June2018ReleaseValidationRule):
                 details = ""
                 if message == "spread":
                     details = f" via < {node.name.value} > Fragment "
-                    location = locations[index]["spread"]
-                    path = locations[index]["path"]
+                    location = locations[index].spread
+                    path = locations[index].path
 
                 errors.append(
                     graphql_error_from_nodes(
@@ -112,15 +112,12 @@ class FragmentSpreadIsPossible(June2018ReleaseValidationRule):
 
         return errors
 
-    def validate(
-        self, path, schema, fragments, inlined_in=None, spreaded_in=None, **__
-    ):
-        if not inlined_in:
-            inlined_in = {}
-
-        if not spreaded_in:
-            spreaded_in = {}
-
+    def leave_document(self, _, context):
         return self._validate_inlines(
-            inlined_in, path, schema
-        ) + self._validate_spreads(fragments, spreaded_in, path, schema)
+            context.inlined_in, context.path, context.schema
+        ) + self._validate_spreads(
+            context.fragments,
+            context.spreaded_in,
+            context.path,
+            context.schema,
+        )
@@ -31,16 +31,13 @@ class FragmentSpreadTargetDefined(June2018ReleaseValidationRule):
             )
         return errors
 
-    def validate(self, path, fragments, fragment_spreads=None, **__):
+    def leave_document(self, _, context):
         erronous_speads = {}
 
-        if not fragment_spreads:
-            fragment_spreads = []
-
-        for spread in fragment_spreads:
-            if not find_nodes_by_name(fragments, spread.name.value):
+        for spread in context.fragment_spreads:
+            if not find_nodes_by_name(context.fragments, spread.name.value):
                 erronous_speads.setdefault(spread.name.value, []).append(
                     spread
                 )
 
-        return self._to_errors(erronous_speads, path)
+        return self._to_errors(erronous_speads, context.path)
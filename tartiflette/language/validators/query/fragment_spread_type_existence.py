@@ -16,7 +16,7 @@ class FragmentSpreadTypeExistence(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-Spread-Type-Existence"
     RULE_NUMBER = "5.5.1.2"
 
-    def validate(self, path, schema, fragment, **__):
+    def _validate(self, path, schema, fragment):
         errors = []
 
         if fragment.type_condition and not schema.has_type(
@@ -32,3 +32,9 @@ class FragmentSpreadTypeExistence(June2018ReleaseValidationRule):
             )
 
         return errors
+
+    def leave_fragment_definition(self, node, context):
+        return self._validate(context.path, context.schema, node)
+
+    def leave_inline_fragment(self, node, context):
+        return self._validate(context.path, context.schema, node)
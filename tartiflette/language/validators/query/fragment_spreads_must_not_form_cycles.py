@@ -1,8 +1,6 @@
-from tartiflette.language.ast import FragmentSpreadNode
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
-from tartiflette.language.validators.query.utils import find_nodes_by_name
 from tartiflette.utils.errors import graphql_error_from_nodes
 
 
@@ -33,28 +31,42 @@ class FragmentSpreadsMustNotFormCycles(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-spreads-must-not-form-cycles"
     RULE_NUMBER = "5.5.2.2"
 
-    def _validate_fragment(self, fragments, fragment, spreaded):
-        for selected in fragment.selection_set.selections:
-            if isinstance(selected, FragmentSpreadNode):
-                if selected.name.value not in spreaded:
-                    spreaded.append(selected.name.value)
-
-                    fragment = find_nodes_by_name(
-                        fragments, selected.name.value
-                    )
-                    if not fragment:
-                        continue  # Handled by another validator
-                    fragment = fragment[0]
-
-                    self._validate_fragment(fragments, fragment, spreaded)
-                else:
-                    raise CycleException(fragments, self._extensions)
-        return
-
-    def validate(self, fragments, **_):
+    def _validate_fragment(
+        self, fragments, fragment_usages, fragment_name, spreading, visited
+    ):
+        # pylint: disable=too-many-arguments
+        visited.add(fragment_name)
+        usages = fragment_usages.get(fragment_name)
+        if usages is None:
+            return  # Handled by another validator
+
+        # Spreads are followed at any depth of the selection set, through
+        # fields & inline fragments
+        spreading.add(fragment_name)
+        for spread in usages.spreads:
+            spread_name = spread.name.value
+            if spread_name in spreading:
+                raise CycleException(fragments, self._extensions)
+            if spread_name not in visited:
+                self._validate_fragment(
+                    fragments, fragment_usages, spread_name, spreading, visited
+                )
+        spreading.remove(fragment_name)
+
+    def leave_document(self, _, context):
+        fragments = context.fragments
+        visited = set()
         for fragment in fragments:
+            if fragment.name.value in visited:
+                continue
             try:
-                self._validate_fragment(fragments, fragment, [])
+                self._validate_fragment(
+                    fragments,
+                    context.fragment_usages,
+                    fragment.name.value,
+                    set(),
+                    visited,
+                )
             except CycleException as e:
                 return e.tartiflette_errors
 
@@ -18,7 +18,7 @@ class FragmentsOnCompositeTypes(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Fragments-On-Composite-Types"
     RULE_NUMBER = "5.5.1.3"
 
-    def validate(self, path, schema, fragment, **__):
+    def _validate(self, path, schema, fragment):
         errors = []
         if (
             fragment.type_condition
@@ -43,3 +43,9 @@ class FragmentsOnCompositeTypes(June2018ReleaseValidationRule):
             )
 
         return errors
+
+    def leave_fragment_definition(self, node, context):
+        return self._validate(context.path, context.schema, node)
+
+    def leave_inline_fragment(self, node, context):
+        return self._validate(context.path, context.schema, node)
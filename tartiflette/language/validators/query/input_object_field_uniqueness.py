@@ -18,7 +18,8 @@ class InputObjectFieldUniqueness(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Input-Object-Field-Uniqueness"
     RULE_NUMBER = "5.6.3"
 
-    def validate(self, path, input_fields, **__):
+    def leave_object_value(self, node, context):
+        input_fields = node.fields
         errors = []
         already_tested = []
 
@@ -34,7 +35,7 @@ class InputObjectFieldUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple Input Field named < {ifield.name.value} >.",
-                        path=path,
+                        path=context.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
@@ -18,7 +18,10 @@ class LeafFieldSelections(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Leaf-Field-Selections"
     RULE_NUMBER = "5.3.3"
 
-    def validate(self, path, schema, field, parent_type_name, **__):
+    def leave_field(self, field, context):
+        path = context.path
+        schema = context.schema
+        parent_type_name = context.parent_type_name
         rtype = find_field_reduced_type(
             parent_type_name, field.name.value, schema
         )
@@ -16,7 +16,8 @@ class LoneAnonymousOperation(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Lone-Anonymous-Operation"
     RULE_NUMBER = "5.2.2.1"
 
-    def validate(self, path, operations, **__):
+    def leave_document(self, _, context):
+        operations = context.operations
         bad_nodes = []
         errors = []
 
@@ -29,7 +30,7 @@ class LoneAnonymousOperation(June2018ReleaseValidationRule):
             errors.append(
                 graphql_error_from_nodes(
                     message="Anonymous operation must be the only defined operation.",
-                    path=path,
+                    path=context.path,
                     nodes=bad_nodes,
                     extensions=self._extensions,
                 )
@@ -16,7 +16,8 @@ class OperationNameUniqueness(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Operation-Name-Uniqueness"
     RULE_NUMBER = "5.2.1.1"
 
-    def validate(self, path, operations, **__):
+    def leave_document(self, _, context):
+        operations = context.operations
         errors = []
         already_tested = []
 
@@ -32,7 +33,7 @@ class OperationNameUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple operations named < {operation.name.value} >.",
-                        path=path,
+                        path=context.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
@@ -1,4 +1,3 @@
-from tartiflette.language.ast import DirectiveNode
 from tartiflette.language.validators.query.rule import (
     June2018ReleaseValidationRule,
 )
@@ -69,7 +68,10 @@ class RequiredArguments(June2018ReleaseValidationRule):
             f"in field < {parent_type_name}.{field.name.value} >.",
         )
 
-    def validate(self, path, schema, node, parent_type_name=None, **__):
-        if isinstance(node, DirectiveNode):
-            return self._validate_directive(path, schema, node)
-        return self._validate_field(path, schema, node, parent_type_name)
+    def leave_directive(self, node, context):
+        return self._validate_directive(context.path, context.schema, node)
+
+    def leave_field(self, node, context):
+        return self._validate_field(
+            context.path, context.schema, node, context.parent_type_name
+        )
@@ -4,6 +4,11 @@ from typing import Optional
 class ValidationRule:
     """
     Base class for a Validation Rule.
+
+    A rule subscribes to the events of the validation of a document by
+    implementing `enter_<kind>` / `leave_<kind>` methods (e.g. `leave_field`
+    or `leave_document`). They're called with the visited node & the
+    ValidationContext of the document and return the list of errors found.
     """
 
     RULE_NAME: Optional[str] = None
@@ -58,14 +58,14 @@ class SingleRootField(June2018ReleaseValidationRule):
 
         return []
 
-    def validate(self, path, definitions, **__):
-        for operation in definitions["OperationDefinition"]:
+    def leave_document(self, _, context):
+        for operation in context.operations:
             if operation.operation_type == "subscription":
                 return self._validate_selection_set(
                     operation,
                     operation.selection_set,
-                    definitions["FragmentDefinition"],
-                    path,
+                    context.fragments,
+                    context.path,
                 )
 
         return []
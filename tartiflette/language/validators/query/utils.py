@@ -117,64 +117,64 @@ def find_nodes_by_name(nodes: List["Node"], name: str) -> List["Node"]:
     return [x for x in nodes if x.name and x.name.value == name]
 
 
-def _find_var_usage_in_spread(spreads, per_fragment, used_vars=None):
+def _find_var_usage_in_spread(
+    spreads, fragment_usages, used_vars=None, visited=None
+):
     if not used_vars:
         used_vars = []
+    if visited is None:
+        visited = set()
 
     for spread in spreads:
+        # Each fragment is only followed once, which also prevents fragment
+        # cycles from recursing forever
+        if spread.name.value in visited:
+            continue
+        visited.add(spread.name.value)
+
+        usages = fragment_usages.get(spread.name.value)
+        if usages is None:
+            continue
         used_vars = _find_var_usage_in_spread(
-            per_fragment.get(spread.name.value, {}).get("spreads", []),
-            per_fragment,
-            used_vars,
-        )
-        used_vars.extend(
-            per_fragment.get(spread.name.value, {}).get("used_vars", [])
+            usages.spreads, fragment_usages, used_vars, visited
         )
+        used_vars.extend(usages.used_vars)
 
     return used_vars
 
 
 def get_used_vars(
     operation: "OperationDefinitionNode",
-    per_operation: Dict[
-        str,
-        Dict[str, Union[List["VaribalbeNode"], List["FragmentSpreadNode"]]],
-    ],
-    per_fragment: Dict[
-        str,
-        Dict[str, Union[List["VaribalbeNode"], List["FragmentSpreadNode"]]],
-    ],
+    operation_usages: Dict[str, "DefinitionUsages"],
+    fragment_usages: Dict[str, "DefinitionUsages"],
 ) -> List["VariableNode"]:
     """
     Retrive which varibles are use in the context of an operation.
 
-    Per_operation : { "operation_name" : { "used_vars": [VariableNode], "spreads": [FragmentSpreadNode] }}
-    Per_fragment : { "fragment_name": { "used_vars": [VariableNode], "spreads": [FragmentSpreadNode] }}
-
-    This method will walk these two dicts and collect the the variable nodes that are used in a given "operation_name"
+    This method will walk the usages of the operation and of the fragments
+    it spreads and collect the the variable nodes that are used in a given
+    "operation_name"
 
     :param operation: The operation to look through
     :type operation: OperationDefinitionNode
-    :param per_operation: A dict with var and spread used sorted by operation name
-    :type per_operation: Dict[str, Dict[str, Union[List["VaribalbeNode"], List["FragmentSpreadNode"]]]]
-    :param per_fragment: A dict with var and spread used sorted by fragment name
-    :type per_fragment: Dict[str, Dict[str, Union[List["VaribalbeNode"], List["FragmentSpreadNode"]]]]
+    :param operation_usages: The usages of the operations by operation name
+    :type operation_usages: Dict[str, DefinitionUsages]
+    :param fragment_usages: The usages of the fragments by fragment name
+    :type fragment_usages: Dict[str, DefinitionUsages]
 
     :return: a list of Variable Node used in a operation context.
     :rtype: List["VariableNode"]
     """
 
-    operation_key = operation.name.value if operation.name else "None"
-
-    used_vars = per_operation.get(operation_key, {}).get("used_vars", [])
+    usages = operation_usages.get(
+        operation.name.value if operation.name else "None"
+    )
+    if usages is None:
+        return []
 
-    used_vars.extend(
-        _find_var_usage_in_spread(
-            per_operation.get(operation_key, {}).get("spreads", []),
-            per_fragment,
-        )
+    return usages.used_vars + _find_var_usage_in_spread(
+        usages.spreads, fragment_usages
     )
-    return used_vars
 
 
 def get_defined_vars(
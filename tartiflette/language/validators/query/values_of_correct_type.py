@@ -1,6 +1,5 @@
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import (
-    DirectiveNode,
     ListValueNode,
     NullValueNode,
     ObjectValueNode,
@@ -283,9 +282,12 @@ class ValuesOfCorrectType(June2018ReleaseValidationRule):
             directive_schema_definition, directive, [], path, schema
         )
 
-    def validate(self, path, schema, node, parent_type_name=None, **__):
-        if isinstance(node, DirectiveNode):
-            return self._validate_directive_arguments(path, schema, node)
+    def leave_directive(self, node, context):
+        return self._validate_directive_arguments(
+            context.path, context.schema, node
+        )
+
+    def leave_field(self, node, context):
         return self._validate_field_arguments(
-            path, schema, node, parent_type_name
+            context.path, context.schema, node, context.parent_type_name
         )
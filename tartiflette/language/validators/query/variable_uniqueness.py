@@ -18,11 +18,11 @@ class VariableUniqueness(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Variable-Uniqueness"
     RULE_NUMBER = "5.8.1"
 
-    def validate(self, path, variable_definitions, **__):
+    def leave_variable_definitions(self, node, context):
         errors = []
         already_tested = []
 
-        variables = [x.variable for x in variable_definitions]
+        variables = [x.variable for x in node.variable_definitions]
 
         for variable in variables:
             if variable.name.value in already_tested:
@@ -34,7 +34,7 @@ class VariableUniqueness(June2018ReleaseValidationRule):
                 errors.append(
                     graphql_error_from_nodes(
                         message=f"Can't have multiple variables named < {variable.name.value} >.",
-                        path=path,
+                        path=context.path,
                         nodes=with_same_name,
                         extensions=self._extensions,
                     )
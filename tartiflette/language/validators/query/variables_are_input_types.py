@@ -17,7 +17,8 @@ class VariablesAreInputTypes(June2018ReleaseValidationRule):
     RULE_LINK = "https://graphql.github.io/graphql-spec/June2018/#sec-Variables-Are-Input-Types"
     RULE_NUMBER = "5.8.2"
 
-    def validate(self, variable, path, schema, **__):
+    def leave_variable_definition(self, variable, context):
+        schema = context.schema
         var_type = get_wrapped_named_type(variable.type)
 
         if schema.has_type(var_type.name.value) and not isinstance(
@@ -26,7 +27,7 @@ class VariablesAreInputTypes(June2018ReleaseValidationRule):
             return [
                 graphql_error_from_nodes(
                     message=f"Variable {variable.variable.name.value} cannot be non-input type {var_type.name.value}.",
-                    path=path,
+                    path=context.path,
                     nodes=variable,
                     extensions=self._extensions,
                 )
@@ -0,0 +1,194 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from tartiflette.language.ast import (
+    ArgumentNode,
+    DirectiveNode,
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    ListValueNode,
+    ObjectFieldNode,
+    ObjectValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    VariableDefinitionNode,
+    VariableNode,
+)
+from tartiflette.language.validators.context import ValidationContext
+from tartiflette.language.validators.query import RULE_SET
+
+__all__ = ("validate_document",)
+
+# Name of the events of each kind of node visited during the validation and
+# attributes holding its children, in the order in which they're visited.
+# Other nodes (names, types, scalar values...) aren't visited.
+_VISITED_NODES = {
+    DocumentNode: ("document", ("definitions",)),
+    OperationDefinitionNode: (
+        "operation_definition",
+        ("variable_definitions", "directives", "selection_set"),
+    ),
+    VariableDefinitionNode: (
+        "variable_definition",
+        ("variable", "default_value"),
+    ),
+    FragmentDefinitionNode: (
+        "fragment_definition",
+        ("directives", "selection_set"),
+    ),
+    SelectionSetNode: ("selection_set", ("selections",)),
+    FieldNode: ("field", ("arguments", "directives", "selection_set")),
+    FragmentSpreadNode: ("fragment_spread", ("directives",)),
+    InlineFragmentNode: (
+        "inline_fragment",
+        ("directives", "selection_set"),
+    ),
+    DirectiveNode: ("directive", ("arguments",)),
+    ArgumentNode: ("argument", ("value",)),
+    ListValueNode: ("list_value", ("values",)),
+    ObjectValueNode: ("object_value", ("fields",)),
+    ObjectFieldNode: ("object_field", ("value",)),
+    VariableNode: ("variable", ()),
+}
+
+# Events which can be subscribed by a rule: `enter_<kind>` & `leave_<kind>`
+# for each visited node, plus `leave_<attribute>` emitted with the parent
+# node once a non-empty list of children has been visited
+_EVENT_NAMES = tuple(
+    f"{prefix}_{kind}"
+    for kind, _ in _VISITED_NODES.values()
+    for prefix in ("enter", "leave")
+) + tuple(
+    f"leave_{attribute}"
+    for attribute in ("arguments", "directives", "variable_definitions")
+)
+
+_Handlers = Dict[str, List[Tuple["ValidationRule", Callable]]]
+
+
+def _subscribe(rules: Iterable["ValidationRule"]) -> "_Handlers":
+    """
+    Returns the handlers of the rules for each event they subscribe to, in
+    the order of the rules.
+    :param rules: the validation rules to subscribe
+    :type rules: Iterable[ValidationRule]
+    :return: the handlers of the rules by event name
+    :rtype: Dict[str, List[Tuple[ValidationRule, Callable]]]
+    """
+    handlers = {}
+    for rule in rules:
+        for event_name in _EVENT_NAMES:
+            handler = getattr(rule, event_name, None)
+            if handler is not None:
+                handlers.setdefault(event_name, []).append((rule, handler))
+    return handlers
+
+
+_RULE_SET_HANDLERS = _subscribe(RULE_SET.values())
+
+
+def _emit(
+    handlers: "_Handlers",
+    event_name: str,
+    node: "Node",
+    context: "ValidationContext",
+) -> None:
+    """
+    Calls the handlers of the rules subscribed to an event and collects the
+    errors they return. Once a rule aborts the validation, no other handler
+    is called.
+    :param handlers: the handlers of the rules by event name
+    :param event_name: name of the emitted event
+    :param node: the node concerned by the event
+    :param context: the validation context of the document
+    :type handlers: Dict[str, List[Tuple[ValidationRule, Callable]]]
+    :type event_name: str
+    :type node: Node
+    :type context: ValidationContext
+    """
+    for rule, handler in handlers.get(event_name, ()):
+        if context.aborted:
+            return
+
+        errors = handler(node, context)
+        if errors:
+            context.errors.extend(errors)
+            if rule.abort:
+                context.aborted = True
+
+
+def _visit(
+    node: "Node", handlers: "_Handlers", context: "ValidationContext"
+) -> None:
+    """
+    Visits a node and its children depth-first, emitting the events
+    subscribed by the rules & updating the validation context.
+    :param node: the node to visit
+    :param handlers: the handlers of the rules by event name
+    :param context: the validation context of the document
+    :type node: Node
+    :type handlers: Dict[str, List[Tuple[ValidationRule, Callable]]]
+    :type context: ValidationContext
+    """
+    try:
+        kind, attributes = _VISITED_NODES[node.__class__]
+    except KeyError:
+        return
+
+    enter_event_name = f"enter_{kind}"
+    context_handler = getattr(context, enter_event_name, None)
+    if context_handler is not None:
+        context_handler(node)
+    _emit(handlers, enter_event_name, node, context)
+
+    for attribute in attributes:
+        child = getattr(node, attribute)
+        if child is None:
+            continue
+
+        if not isinstance(child, list):
+            _visit(child, handlers, context)
+            continue
+
+        for item in child:
+            _visit(item, handlers, context)
+        if child:
+            _emit(handlers, f"leave_{attribute}", node, context)
+
+    leave_event_name = f"leave_{kind}"
+    _emit(handlers, leave_event_name, node, context)
+    context_handler = getattr(context, leave_event_name, None)
+    if context_handler is not None:
+        context_handler(node)
+
+
+def validate_document(
+    schema: "GraphQLSchema",
+    document: "DocumentNode",
+    rules: Optional[Iterable["ValidationRule"]] = None,
+) -> List["TartifletteError"]:
+    """
+    Validates a document against the schema. All the rules are run in a
+    single traversal of the document: each rule subscribes to the events
+    it needs by implementing `enter_<kind>` / `leave_<kind>` methods (e.g.
+    `leave_field`), which are called with the node & the validation context
+    and return the errors found.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param document: the document to validate
+    :param rules: the validation rules to run (the ones of the
+    specification by default)
+    :type schema: GraphQLSchema
+    :type document: DocumentNode
+    :type rules: Optional[Iterable[ValidationRule]]
+    :return: the validation errors of the document
+    :rtype: List[TartifletteError]
+    """
+    context = ValidationContext(schema)
+    _visit(
+        document,
+        _RULE_SET_HANDLERS if rules is None else _subscribe(rules),
+        context,
+    )
+    return context.errors
@@ -1,8 +1,15 @@
-from typing import Any, Callable, List, Union
+import asyncio
+
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from tartiflette.coercers.arguments import coerce_arguments
+from tartiflette.coercers.common import Path
 from tartiflette.coercers.outputs.common import complete_value_catching_error
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.execution.memoization import get_memoization_key
 from tartiflette.execution.types import build_resolve_info
+from tartiflette.types.exceptions.tartiflette import ExecutionDeadlineExceeded
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
 )
@@ -11,7 +18,131 @@ from tartiflette.utils.directives import (
     wraps_with_directives,
 )
 
-__all__ = ("resolve_field",)
+__all__ = ("resolve_field", "resolve_trivial_field", "resolve_sync_field")
+
+
+async def resolve_field_value(
+    execution_context: "ExecutionContext",
+    resolver: Callable,
+    source: Any,
+    arguments: Dict[str, Any],
+    info: "ResolveInfo",
+) -> Any:
+    """
+    Calls the resolver of the field and applies the introspection directives
+    on its result. When the request has a deadline, the resolver isn't
+    called once it's passed and is cancelled when it's reached.
+    :param execution_context: instance of the query execution context
+    :param resolver: callable to use to resolve the field
+    :param source: default root value or field parent value
+    :param arguments: the coerced arguments of the field
+    :param info: information related to the execution and the resolved field
+    :type execution_context: ExecutionContext
+    :type resolver: Callable
+    :type source: Any
+    :type arguments: Dict[str, Any]
+    :type info: ResolveInfo
+    :return: the resolved field value
+    :rtype: Any
+    """
+    deadline = execution_context.request_state.deadline
+    if deadline is None:
+        result = await resolver(
+            source,
+            arguments,
+            execution_context.context,
+            info,
+            context_coercer=execution_context.context,
+        )
+    else:
+        if deadline.is_exceeded():
+            raise ExecutionDeadlineExceeded()
+
+        result = await deadline.run(
+            resolver(
+                source,
+                arguments,
+                execution_context.context,
+                info,
+                context_coercer=execution_context.context,
+            )
+        )
+
+    if info.is_introspection:
+        return await introspection_directives_executor(
+            result,
+            execution_context.context,
+            info,
+            context_coercer=execution_context.context,
+        )
+    return result
+
+
+async def resolve_memoized_field_value(
+    execution_context: "ExecutionContext",
+    field_definition: "GraphQLField",
+    resolver: Callable,
+    source: Any,
+    arguments: Dict[str, Any],
+    info: "ResolveInfo",
+) -> Any:
+    """
+    Resolves the field only once per parent & arguments during the request.
+    Concurrent identical calls wait for the pending one. Failed calls aren't
+    memoized so that each of them produces its own error.
+    :param execution_context: instance of the query execution context
+    :param field_definition: GraphQLField instance of the resolved field
+    :param resolver: callable to use to resolve the field
+    :param source: default root value or field parent value
+    :param arguments: the coerced arguments of the field
+    :param info: information related to the execution and the resolved field
+    :type execution_context: ExecutionContext
+    :type field_definition: GraphQLField
+    :type resolver: Callable
+    :type source: Any
+    :type arguments: Dict[str, Any]
+    :type info: ResolveInfo
+    :return: the resolved field value
+    :rtype: Any
+    """
+    # pylint: disable=too-many-arguments
+    try:
+        key = get_memoization_key(source, field_definition, arguments)
+    except TypeError:
+        return await resolve_field_value(
+            execution_context, resolver, source, arguments, info
+        )
+
+    resolver_memo = execution_context.request_state.resolver_memo
+    entry = resolver_memo.get(key)
+    if entry is not None:
+        _, future = entry
+        if not future.done():
+            await asyncio.wait((future,))
+        if not future.cancelled():
+            execution_context.schema.memoization_hits += 1
+            return future.result()
+
+        return await resolve_field_value(
+            execution_context, resolver, source, arguments, info
+        )
+
+    execution_context.schema.memoization_misses += 1
+
+    # The source is kept alive so that its identity can't be reused
+    future = asyncio.get_event_loop().create_future()
+    resolver_memo[key] = (source, future)
+    try:
+        result = await resolve_field_value(
+            execution_context, resolver, source, arguments, info
+        )
+    except BaseException:
+        del resolver_memo[key]
+        future.cancel()
+        raise
+
+    future.set_result(result)
+    return result
 
 
 async def resolve_field_value_or_error(
@@ -23,7 +154,9 @@ async def resolve_field_value_or_error(
     info: "ResolveInfo",
 ) -> Union[Exception, Any]:
     """
-    Coerce the field's arguments and then try to resolve the field.
+    Coerce the field's arguments and then try to resolve the field. The
+    resolver of fields flagged as memoized is called only once per parent &
+    arguments during the request.
     :param execution_context: instance of the query execution context
     :param field_definition: GraphQLField instance of the resolved field
     :param field_nodes: AST nodes related to the resolved field
@@ -60,27 +193,27 @@ async def resolve_field_value_or_error(
                 with_default=True,
             )
 
-        result = await resolver(
-            source,
-            await coerce_arguments(
-                field_definition.arguments,
-                field_nodes[0],
-                execution_context.variable_values,
-                execution_context.context,
-                coercer=field_definition.arguments_coercer,
-            ),
+        arguments = await coerce_arguments(
+            field_definition.arguments,
+            field_nodes[0],
+            execution_context.variable_values,
             execution_context.context,
-            info,
-            context_coercer=execution_context.context,
+            coercer=field_definition.arguments_coercer,
         )
-        if info.is_introspection:
-            return await introspection_directives_executor(
-                result,
-                execution_context.context,
+
+        # Query directives may alter the result of a specific selection
+        if field_definition.memoize and not computed_directives:
+            return await resolve_memoized_field_value(
+                execution_context,
+                field_definition,
+                resolver,
+                source,
+                arguments,
                 info,
-                context_coercer=execution_context.context,
             )
-        return result
+        return await resolve_field_value(
+            execution_context, resolver, source, arguments, info
+        )
     except Exception as e:  # pylint: disable=broad-except
         return e
 
@@ -146,3 +279,223 @@ async def resolve_field(
         field_definition.graphql_type,
         output_coercer,
     )
+
+
+def coerce_scalar_value(
+    result: Any, scalar_type: "GraphQLScalarType", is_non_null: bool
+) -> Any:
+    """
+    Synchronously coerces the resolved value of a scalar field.
+    :param result: resolved field value
+    :param scalar_type: GraphQLScalarType instance of the resolved field
+    :param is_non_null: whether or not the field is non-nullable
+    :type result: Any
+    :type scalar_type: GraphQLScalarType
+    :type is_non_null: bool
+    :return: the coerced value or UNDEFINED_VALUE if the value can't be
+    coerced without reporting an error
+    :rtype: Any
+    """
+    if result is None:
+        return UNDEFINED_VALUE if is_non_null else None
+
+    try:
+        return scalar_type.coerce_output(result)
+    except Exception:  # pylint: disable=broad-except
+        return UNDEFINED_VALUE
+
+
+def resolve_trivial_field(
+    execution_context: "ExecutionContext",
+    parent_type: "GraphQLObjectType",
+    source: Any,
+    field_nodes: List["FieldNode"],
+    parent_path: Optional["Path"],
+    response_key: str,
+    field_definition: "GraphQLField",
+    scalar_type: "GraphQLScalarType",
+    is_non_null: bool,
+) -> Union[Any, Awaitable[Any]]:
+    """
+    Synchronously resolves and coerces a field without arguments nor
+    directives, resolved with the default resolver and whose type is a
+    scalar type. The behaviour is the one of `default_field_resolver`
+    followed by the scalar output coercion, without any coroutine involved.
+    :param execution_context: instance of the query execution context
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param source: field parent value
+    :param field_nodes: AST nodes related to the resolved field
+    :param parent_path: the path traveled until the field's parent
+    :param response_key: the key of the field in the response
+    :param field_definition: GraphQLField instance of the resolved field
+    :param scalar_type: GraphQLScalarType instance of the resolved field
+    :param is_non_null: whether or not the field is non-nullable
+    :type execution_context: ExecutionContext
+    :type parent_type: GraphQLObjectType
+    :type source: Any
+    :type field_nodes: List[FieldNode]
+    :type parent_path: Optional[Path]
+    :type response_key: str
+    :type field_definition: GraphQLField
+    :type scalar_type: GraphQLScalarType
+    :type is_non_null: bool
+    :return: the coerced resolved field value or an awaitable resolving it
+    through `resolve_field` in order to report an error
+    :rtype: Union[Any, Awaitable[Any]]
+    """
+    # pylint: disable=too-many-arguments
+    try:
+        try:
+            result = getattr(source, field_definition.name)
+        except AttributeError:
+            try:
+                result = source[field_definition.name]
+            except (KeyError, TypeError):
+                result = None
+    except Exception:  # pylint: disable=broad-except
+        result = UNDEFINED_VALUE
+    else:
+        result = coerce_scalar_value(result, scalar_type, is_non_null)
+
+    if result is UNDEFINED_VALUE:
+        return field_definition.resolver(
+            execution_context,
+            parent_type,
+            source,
+            field_nodes,
+            Path(parent_path, response_key),
+            False,
+        )
+    return result
+
+
+async def complete_awaitable_value(
+    awaitable: Awaitable[Any],
+    info: "ResolveInfo",
+    execution_context: "ExecutionContext",
+    field_nodes: List["FieldNode"],
+    path: "Path",
+    return_type: "GraphQLOutputType",
+    output_coercer: Callable,
+) -> Any:
+    """
+    Awaits the value returned by a synchronous resolver and coerces it.
+    :param awaitable: the awaitable returned by the resolver
+    :param info: information related to the execution and the resolved field
+    :param execution_context: instance of the query execution context
+    :param field_nodes: AST nodes related to the resolved field
+    :param path: the path traveled until this resolver
+    :param return_type: GraphQLOutputType instance of the resolved field
+    :param output_coercer: pre-computed callable to coerce the result value
+    :type awaitable: Awaitable[Any]
+    :type info: ResolveInfo
+    :type execution_context: ExecutionContext
+    :type field_nodes: List[FieldNode]
+    :type path: Path
+    :type return_type: GraphQLOutputType
+    :type output_coercer: Callable
+    :return: the coerced resolved field value
+    :rtype: Any
+    """
+    # pylint: disable=too-many-arguments
+    try:
+        result = await awaitable
+    except Exception as e:  # pylint: disable=broad-except
+        result = e
+
+    return await complete_value_catching_error(
+        result,
+        info,
+        execution_context,
+        field_nodes,
+        path,
+        return_type,
+        output_coercer,
+    )
+
+
+def resolve_sync_field(
+    execution_context: "ExecutionContext",
+    parent_type: "GraphQLObjectType",
+    source: Any,
+    field_nodes: List["FieldNode"],
+    parent_path: Optional["Path"],
+    response_key: str,
+    field_definition: "GraphQLField",
+    resolver: Callable,
+    output_coercer: Callable,
+    scalar_type: Optional["GraphQLScalarType"],
+) -> Union[Any, Awaitable[Any]]:
+    """
+    Calls the synchronous resolver of a field without arguments nor
+    directives inline. Scalar values are coerced synchronously while other
+    values (and errors) are completed through the regular output coercers.
+    :param execution_context: instance of the query execution context
+    :param parent_type: GraphQLObjectType of the field's parent
+    :param source: field parent value
+    :param field_nodes: AST nodes related to the resolved field
+    :param parent_path: the path traveled until the field's parent
+    :param response_key: the key of the field in the response
+    :param field_definition: GraphQLField instance of the resolved field
+    :param resolver: the synchronous resolver of the field
+    :param output_coercer: pre-computed callable to coerce the result value
+    :param scalar_type: GraphQLScalarType instance of the resolved field if
+    its values can be coerced synchronously
+    :type execution_context: ExecutionContext
+    :type parent_type: GraphQLObjectType
+    :type source: Any
+    :type field_nodes: List[FieldNode]
+    :type parent_path: Optional[Path]
+    :type response_key: str
+    :type field_definition: GraphQLField
+    :type resolver: Callable
+    :type output_coercer: Callable
+    :type scalar_type: Optional[GraphQLScalarType]
+    :return: the coerced resolved field value or an awaitable completing it
+    :rtype: Union[Any, Awaitable[Any]]
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    # The path of the field is only created if the resolver accesses it or
+    # if the value can't be coerced synchronously
+    info = build_resolve_info(
+        execution_context,
+        field_definition,
+        field_nodes,
+        parent_type,
+        None,
+        parent_path=parent_path,
+        response_key=response_key,
+    )
+
+    try:
+        result = resolver(source, {}, execution_context.context, info)
+    except Exception as e:  # pylint: disable=broad-except
+        result = e
+
+    if isawaitable(result):
+        return complete_awaitable_value(
+            result,
+            info,
+            execution_context,
+            field_nodes,
+            info.path,
+            field_definition.graphql_type,
+            output_coercer,
+        )
+
+    if scalar_type is not None and not isinstance(result, Exception):
+        coerced_result = coerce_scalar_value(
+            result, scalar_type, field_definition.graphql_type.is_non_null_type
+        )
+        if coerced_result is not UNDEFINED_VALUE:
+            return coerced_result
+
+    return complete_value_catching_error(
+        result,
+        info,
+        execution_context,
+        field_nodes,
+        info.path,
+        field_definition.graphql_type,
+        output_coercer,
+    )
@@ -1,19 +1,57 @@
-from typing import Callable, Optional
+from functools import wraps
+from inspect import isawaitable
+from typing import Any, Callable, Dict, Optional
 
+from tartiflette.execution.memoization import freeze_arguments
 from tartiflette.schema.registry import SchemaRegistry
 from tartiflette.types.exceptions.tartiflette import (
+    ImproperlyConfigured,
     MissingImplementation,
-    NonAwaitableResolver,
     NonCallable,
     UnknownFieldDefinition,
 )
 from tartiflette.types.helpers.definition import get_wrapped_type
 from tartiflette.types.helpers.type import get_graphql_type
-from tartiflette.utils.callables import is_valid_coroutine
 
 __all__ = ("Resolver",)
 
 
+def batch_resolver_factory(implementation: Callable) -> Callable:
+    """
+    Wraps a batch resolver implementation, which receives the list of
+    parents and returns the list of their values, into a regular resolver.
+    The parents of a field node collected during the same event loop
+    iteration with the same arguments (operations of a batch sharing their
+    caches may use different variables) are resolved with a single call to
+    the implementation.
+    :param implementation: the batch resolver implementation
+    :type implementation: Callable
+    :return: a regular resolver
+    :rtype: Callable
+    """
+
+    @wraps(implementation)
+    async def batch_resolver(
+        parent: Any, args: Dict[str, Any], ctx: Any, info: "ResolveInfo"
+    ) -> Any:
+        try:
+            arguments_key = freeze_arguments(args)
+        except TypeError:
+            # Unhashable arguments can't identify the loader to use
+            values = implementation([parent], args, ctx, info)
+            if isawaitable(values):
+                values = await values
+            return list(values)[0]
+
+        return await info.get_loader(
+            lambda parents: implementation(parents, args, ctx, info),
+            key=(implementation, id(info.field_nodes[0]), arguments_key),
+            cache=False,
+        ).load(parent)
+
+    return batch_resolver
+
+
 class Resolver:
     """
     This decorator allows you to link a GraphQL Schema field to a resolver.
@@ -30,6 +68,17 @@ class Resolver:
         async def field_resolver(parent, args, ctx, info):
             # do your stuff
             return 42
+
+    With `batch=True`, the resolver receives the list of parents and returns
+    the list of their values in the same order:
+
+        @Resolver("SomeObject.field", batch=True)
+        async def field_resolver(parents, args, ctx, info):
+            return [42 for _ in parents]
+
+    With `memoize=True`, the resolver is called only once per parent &
+    arguments during a request, even if the field is selected several times
+    (e.g. through aliases or overlapping fragments).
     """
 
     def __init__(
@@ -38,6 +87,10 @@ class Resolver:
         schema_name: str = "default",
         type_resolver: Optional[Callable] = None,
         arguments_coercer: Optional[Callable] = None,
+        concurrently: Optional[bool] = None,
+        list_concurrency_limit: Optional[int] = None,
+        batch: bool = False,
+        memoize: bool = False,
     ) -> None:
         """
         :param name: name of the field to wrap
@@ -45,16 +98,45 @@ class Resolver:
         :param type_resolver: callable to use to resolve the type of an
         abstract type
         :param arguments_coercer: the callable to use to coerce field arguments
+        :param concurrently: whether or not list items of the field should be
+        coerced concurrently (overrides the engine setting)
+        :param list_concurrency_limit: maximum number of list items of the
+        field to coerce at once (overrides the engine setting)
+        :param batch: whether or not the resolver should receive the list of
+        parents collected during the same event loop iteration at once
+        :param memoize: whether or not the resolver should be called only once
+        per parent & arguments during a request
         :type name: str
         :type schema_name: str
         :type type_resolver: Optional[Callable]
         :type arguments_coercer: Optional[Callable]
+        :type concurrently: Optional[bool]
+        :type list_concurrency_limit: Optional[int]
+        :type batch: bool
+        :type memoize: bool
+        :raises ImproperlyConfigured: if `list_concurrency_limit` isn't a
+        positive integer
         """
+        # pylint: disable=too-many-arguments
+        if list_concurrency_limit is not None and (
+            isinstance(list_concurrency_limit, bool)
+            or not isinstance(list_concurrency_limit, int)
+            or list_concurrency_limit < 1
+        ):
+            raise ImproperlyConfigured(
+                "Given < list_concurrency_limit > should be a positive "
+                "integer."
+            )
+
         self.name = name
         self._type_resolver = type_resolver
         self._implementation = None
         self._schema_name = schema_name
         self._arguments_coercer = arguments_coercer
+        self._concurrently = concurrently
+        self._list_concurrency_limit = list_concurrency_limit
+        self._batch = batch
+        self._memoize = memoize
 
     def bake(self, schema: "GraphQLSchema") -> None:
         """
@@ -69,8 +151,16 @@ class Resolver:
 
         try:
             field = schema.get_field_by_name(self.name)
-            field.raw_resolver = self._implementation
+            field.raw_resolver = (
+                batch_resolver_factory(self._implementation)
+                if self._batch
+                else self._implementation
+            )
             field.query_arguments_coercer = self._arguments_coercer
+            field.coerce_list_concurrently = self._concurrently
+            field.list_concurrency_limit = self._list_concurrency_limit
+            if self._memoize:
+                field.memoize = True
 
             field_wrapped_type = get_wrapped_type(
                 get_graphql_type(schema, field.gql_type)
@@ -92,9 +182,9 @@ class Resolver:
         :return: the implementation of the resolver
         :rtype: Callable
         """
-        if not is_valid_coroutine(implementation):
-            raise NonAwaitableResolver(
-                f"The resolver `{repr(implementation)}` given is not awaitable."
+        if not callable(implementation):
+            raise NonCallable(
+                f"The resolver `{repr(implementation)}` given is not callable."
             )
 
         if self._type_resolver is not None and not callable(
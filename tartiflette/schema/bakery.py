@@ -1,6 +1,14 @@
-from typing import Callable, Optional
+import hashlib
+
+from typing import Callable, Optional, Tuple
 
 from tartiflette.schema.registry import SchemaRegistry
+from tartiflette.schema.snapshot import (
+    dump_schema_snapshot,
+    get_schema_snapshot_file,
+    load_schema_snapshot,
+    write_schema_snapshot,
+)
 from tartiflette.schema.transformer import schema_from_sdl
 
 __all__ = ("SchemaBakery",)
@@ -27,12 +35,42 @@ class SchemaBakery:
         schema_info["inst"] = schema
         return schema
 
+    @staticmethod
+    def _preheat_from_snapshot(
+        schema_name: str, sdl: str, schema_snapshot_file: str
+    ) -> Tuple["GraphQLSchema", Optional[bytes]]:
+        """
+        Loads the GraphQLSchema instance from its snapshot file when it
+        exists. Otherwise, the SDL is converted to a GraphQLSchema instance
+        which is serialized so that it can be written once successfully baked.
+        :param schema_name: name of the schema to treat
+        :param sdl: the full SDL of the schema
+        :param schema_snapshot_file: path of the snapshot file of the schema
+        :type schema_name: str
+        :type sdl: str
+        :type schema_snapshot_file: str
+        :return: a pre-baked GraphQLSchema instance and its serialization if
+        it has to be written to the snapshot file
+        :rtype: Tuple[GraphQLSchema, Optional[bytes]]
+        """
+        schema = load_schema_snapshot(schema_snapshot_file, sdl)
+        if schema is not None:
+            SchemaRegistry.find_schema_info(schema_name)["inst"] = schema
+            return schema, None
+
+        schema = SchemaBakery._preheat(schema_name)
+        return schema, dump_schema_snapshot(schema, sdl)
+
     @staticmethod
     async def bake(
         schema_name: str,
         custom_default_resolver: Optional[Callable] = None,
         custom_default_type_resolver: Optional[Callable] = None,
         custom_default_arguments_coercer: Optional[Callable] = None,
+        coerce_list_concurrently: Optional[bool] = None,
+        list_concurrency_limit: Optional[int] = None,
+        request_list_concurrency_limit: Optional[int] = None,
+        schema_snapshot_path: Optional[str] = None,
     ) -> "GraphQLSchema":
         """
         Bakes and returns a GraphQLSchema instance.
@@ -44,17 +82,50 @@ class SchemaBakery:
         to deduct the type of a result)
         :param custom_default_arguments_coercer: callable that will replace the
         tartiflette `default_arguments_coercer`
+        :param coerce_list_concurrently: whether or not output list items
+        should be coerced concurrently
+        :param list_concurrency_limit: maximum number of items of a single
+        output list to coerce at once
+        :param request_list_concurrency_limit: maximum number of additional
+        list items to coerce at once across a whole request
+        :param schema_snapshot_path: directory where snapshots of the parsed
+        & validated SDL are stored, keyed by the hash of the SDL
         :type schema_name: str
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
         :type custom_default_arguments_coercer: Optional[Callable]
+        :type coerce_list_concurrently: Optional[bool]
+        :type list_concurrency_limit: Optional[int]
+        :type request_list_concurrency_limit: Optional[int]
+        :type schema_snapshot_path: Optional[str]
         :return: a baked GraphQLSchema instance
         :rtype: GraphQLSchema
         """
-        schema = SchemaBakery._preheat(schema_name)
+        # pylint: disable=too-many-arguments
+        sdl = SchemaRegistry.find_schema_info(schema_name)["sdl"]
+        schema_snapshot_file = snapshot = None
+        if schema_snapshot_path:
+            schema_snapshot_file = get_schema_snapshot_file(
+                schema_snapshot_path, schema_name, sdl
+            )
+            schema, snapshot = SchemaBakery._preheat_from_snapshot(
+                schema_name, sdl, schema_snapshot_file
+            )
+        else:
+            schema = SchemaBakery._preheat(schema_name)
+
+        schema.sdl_hash = hashlib.sha256(sdl.encode("utf-8")).hexdigest()
+
         await schema.bake(
             custom_default_resolver,
             custom_default_type_resolver,
             custom_default_arguments_coercer,
+            coerce_list_concurrently,
+            list_concurrency_limit,
+            request_list_concurrency_limit,
         )
+
+        # Snapshots are only written once the schema is known to be valid
+        if snapshot is not None:
+            write_schema_snapshot(schema_snapshot_file, snapshot)
         return schema
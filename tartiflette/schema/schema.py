@@ -41,10 +41,7 @@ from tartiflette.types.scalar import (
 )
 from tartiflette.types.schema_extension import GraphQLSchemaExtension
 from tartiflette.types.union import GraphQLUnionType, GraphQLUnionTypeExtension
-from tartiflette.utils.callables import (
-    is_valid_async_generator,
-    is_valid_coroutine,
-)
+from tartiflette.utils.callables import is_valid_async_generator
 from tartiflette.utils.directives import wraps_with_directives
 from tartiflette.utils.errors import graphql_error_from_nodes
 
@@ -54,6 +51,8 @@ _DEFAULT_QUERY_OPERATION_NAME = "Query"
 _DEFAULT_MUTATION_OPERATION_NAME = "Mutation"
 _DEFAULT_SUBSCRIPTION_OPERATION_NAME = "Subscription"
 
+_EMPTY_FIELD_TABLE: Dict[str, "GraphQLField"] = {}
+
 
 _IMPLEMENTABLE_DIRECTIVE_FUNCTION_HOOKS = (
     "on_post_bake",
@@ -179,6 +178,17 @@ class GraphQLSchema:
         self.name = name
         self.default_type_resolver: Optional[Callable] = None
         self.default_arguments_coercer: Optional[Callable] = None
+        self.coerce_list_concurrently: bool = False
+        self.list_concurrency_limit: Optional[int] = None
+        self.request_list_concurrency_limit: Optional[int] = None
+
+        # Memoized resolvers statistics
+        self.memoization_hits: int = 0
+        self.memoization_misses: int = 0
+
+        # Parsed queries statistics
+        self.trusted_parses: int = 0
+        self.validated_parses: int = 0
 
         # Operation type names
         self.query_operation_name: str = _DEFAULT_QUERY_OPERATION_NAME
@@ -200,6 +210,7 @@ class GraphQLSchema:
             ]
         ] = []
         self._operation_types: Dict[str, "GraphQLObjectType"] = {}
+        self._field_tables: Dict[str, Dict[str, "GraphQLField"]] = {}
 
         # Introspection attributes
         self.types: List["GraphQLType"] = []
@@ -219,6 +230,20 @@ class GraphQLSchema:
         self.extensions: List["GraphQLExtension"] = []
         self._schema_directives: List["DirectiveNode"] = []
         self._json_loader = None
+        self.json_encoder: Optional[Callable[[Any], Union[str, bytes]]] = None
+        self.eager_execution: bool = False
+        self.has_execution_directives: bool = False
+        self.complexity_limits: Optional["ComplexityLimits"] = None
+        self.execution_timeout: Optional[float] = None
+        self.introspection_cache: bool = False
+        self.has_context_dependent_introspection_directives: bool = False
+
+        # Whether or not the SDL has already been validated in a previous
+        # process which produced the snapshot this schema was loaded from
+        self.is_snapshot: bool = False
+
+        # SHA-256 hash of the full SDL of the schema, filled in when baked
+        self.sdl_hash: Optional[str] = None
 
     @property
     def json_loader(self):
@@ -436,6 +461,37 @@ class GraphQLSchema:
                 f"field `{name}` was not found in GraphQL schema."
             )
 
+    def find_field_definition(
+        self, parent_type: "GraphQLObjectType", field_name: str
+    ) -> Optional["GraphQLField"]:
+        """
+        Returns the field of the parent type corresponding to the field name
+        or None if the parent type doesn't define such a field. Uses the field
+        tables computed at bake time, including the introspection fields.
+        :param parent_type: GraphQLObjectType of the field's parent
+        :param field_name: name of the field to retrieve
+        :type parent_type: GraphQLObjectType
+        :type field_name: str
+        :return: the field corresponding to the parent type and field name
+        :rtype: Optional[GraphQLField]
+        """
+        return self._field_tables.get(
+            parent_type.name, _EMPTY_FIELD_TABLE
+        ).get(field_name)
+
+    def _bake_field_tables(self) -> None:
+        """
+        Computes, for each type with fields, the table of its fields indexed
+        by name.
+        """
+        self._field_tables = {
+            type_name: dict(type_definition.implemented_fields)
+            for type_name, type_definition in self.type_definitions.items()
+            if isinstance(
+                getattr(type_definition, "implemented_fields", None), dict
+            )
+        }
+
     def _inject_introspection_fields(self) -> None:
         """
         Injects introspection fields to the query type and to defined object
@@ -755,10 +811,10 @@ class GraphQLSchema:
         for directive in self._directive_definitions.values():
             for expected in _IMPLEMENTABLE_DIRECTIVE_FUNCTION_HOOKS:
                 attr = getattr(directive.implementation, expected, None)
-                if attr and not is_valid_coroutine(attr):
+                if attr and not callable(attr):
                     errors.append(
                         f"Directive {directive.name} Method "
-                        f"{expected} is not awaitable."
+                        f"{expected} is not callable."
                     )
 
             for expected in _IMPLEMENTABLE_DIRECTIVE_GENERATOR_HOOKS:
@@ -1009,6 +1065,15 @@ class GraphQLSchema:
             # TODO: Validate Field: default value must be of given type
             # TODO: Check all objects have resolvers (at least in parent)
         ]
+
+        if self.is_snapshot:
+            # The SDL has already been validated, only implementations
+            # aren't part of snapshots
+            validators = [
+                self._validate_all_scalars_have_implementations,
+                self._validate_directive_implementation,
+            ]
+
         errors = []
         for validator in validators:
             errors.extend(validator())
@@ -1097,6 +1162,10 @@ class GraphQLSchema:
 
     def bake_execute(self, func_query, func_subscription):
         directives = compute_directive_nodes(self, self._schema_directives)
+        self.has_execution_directives = any(
+            "on_schema_execution" in directive["callables"]
+            for directive in directives
+        )
         func_query = wraps_with_directives(
             directives, "on_schema_execution", func_query, is_resolver=True
         )
@@ -1115,6 +1184,9 @@ class GraphQLSchema:
         custom_default_resolver: Optional[Callable] = None,
         custom_default_type_resolver: Optional[Callable] = None,
         custom_default_arguments_coercer: Optional[Callable] = None,
+        coerce_list_concurrently: Optional[bool] = None,
+        list_concurrency_limit: Optional[int] = None,
+        request_list_concurrency_limit: Optional[int] = None,
     ) -> None:
         """
         Bake the final schema (it should not change after this) used for
@@ -1126,19 +1198,42 @@ class GraphQLSchema:
         to deduct the type of a result)
         :param custom_default_arguments_coercer: callable that will replace the
         tartiflette `default_arguments_coercer`
+        :param coerce_list_concurrently: whether or not output list items
+        should be coerced concurrently
+        :param list_concurrency_limit: maximum number of items of a single
+        output list to coerce at once
+        :param request_list_concurrency_limit: maximum number of additional
+        list items to coerce at once across a whole request
         :type custom_default_resolver: Optional[Callable]
         :type custom_default_type_resolver: Optional[Callable]
         :type custom_default_arguments_coercer: Optional[Callable]
+        :type coerce_list_concurrently: Optional[bool]
+        :type list_concurrency_limit: Optional[int]
+        :type request_list_concurrency_limit: Optional[int]
         """
+        # pylint: disable=too-many-arguments
         self.default_type_resolver = (
             custom_default_type_resolver or default_type_resolver
         )
         self.default_arguments_coercer = (
             custom_default_arguments_coercer or gather_arguments_coercer
         )
+        self.coerce_list_concurrently = (
+            coerce_list_concurrently
+            if coerce_list_concurrently is not None
+            else self.coerce_list_concurrently
+        )
+        self.list_concurrency_limit = (
+            list_concurrency_limit or self.list_concurrency_limit
+        )
+        self.request_list_concurrency_limit = (
+            request_list_concurrency_limit
+            or self.request_list_concurrency_limit
+        )
         self._inject_introspection_fields()
 
-        self._validate_extensions()  # Validate this before bake
+        if not self.is_snapshot:
+            self._validate_extensions()  # Validate this before bake
         # TODO maybe a pre_bake/post_bake thing
 
         try:
@@ -1171,6 +1266,12 @@ class GraphQLSchema:
         self.mutationType = self._operation_types["mutation"]
         self.subscriptionType = self._operation_types["subscription"]
         self.directives = list(self._directive_definitions.values())
+        self.has_context_dependent_introspection_directives = any(
+            hasattr(directive.implementation, "on_introspection")
+            and not directive.context_independent_introspection
+            for directive in self.directives
+        )
+        self._bake_field_tables()
 
         for type_name, type_definition in self.type_definitions.items():
             if not type_name.startswith("__"):
@@ -0,0 +1,193 @@
+import hashlib
+import hmac
+import logging
+import os
+import pickle
+
+from typing import Optional
+
+try:
+    from importlib.metadata import version
+except ImportError:  # pragma: no cover (Python < 3.8)
+    from pkg_resources import get_distribution
+
+    def version(distribution_name: str) -> str:
+        return get_distribution(distribution_name).version
+
+
+__all__ = (
+    "get_schema_snapshot_file",
+    "load_schema_snapshot",
+    "dump_schema_snapshot",
+    "write_schema_snapshot",
+)
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_EXTENSION = ".snapshot"
+_SNAPSHOT_FILE_MODE = 0o644
+
+
+def _get_tartiflette_version() -> str:
+    """
+    Returns the installed version of tartiflette.
+    :return: the installed version of tartiflette
+    :rtype: str
+    """
+    try:
+        return version("tartiflette")
+    except Exception:  # pylint: disable=broad-except
+        return "unknown"
+
+
+def _get_snapshot_key(sdl: str) -> bytes:
+    """
+    Returns the key of the snapshots of a SDL: the SHA-256 hash of the SDL
+    and the version of tartiflette which produces the snapshots.
+    :param sdl: the full SDL of the schema
+    :type sdl: str
+    :return: the key of the snapshots of the SDL
+    :rtype: bytes
+    """
+    return hashlib.sha256(
+        f"{_get_tartiflette_version()}\n{sdl}".encode("utf-8")
+    ).digest()
+
+
+def _sign_snapshot(sdl: str, payload: bytes) -> bytes:
+    """
+    Computes the HMAC of a serialized schema, keyed by the key of the SDL it
+    was produced from.
+    :param sdl: the full SDL of the schema
+    :param payload: the serialized schema
+    :type sdl: str
+    :type payload: bytes
+    :return: the HMAC of the serialized schema
+    :rtype: bytes
+    """
+    return hmac.new(_get_snapshot_key(sdl), payload, hashlib.sha256).digest()
+
+
+def _is_trusted_snapshot_file(snapshot_file: "os.stat_result") -> bool:
+    """
+    Determines whether or not a snapshot file can be trusted: it has to be
+    owned by the current user (or root) and not be writable by other users.
+    :param snapshot_file: the status of the snapshot file
+    :type snapshot_file: os.stat_result
+    :return: whether or not the snapshot file can be trusted
+    :rtype: bool
+    """
+    if not hasattr(os, "getuid"):  # pragma: no cover (Windows)
+        return True
+    return snapshot_file.st_uid in (0, os.getuid()) and not (
+        snapshot_file.st_mode & 0o022
+    )
+
+
+def get_schema_snapshot_file(
+    directory: str, schema_name: str, sdl: str
+) -> str:
+    """
+    Returns the path of the snapshot file of a schema. Snapshots are keyed by
+    the SHA-256 hash of the SDL and the version of tartiflette which produced
+    them.
+    :param directory: directory containing the snapshots
+    :param schema_name: name of the schema
+    :param sdl: the full SDL of the schema
+    :type directory: str
+    :type schema_name: str
+    :type sdl: str
+    :return: the path of the snapshot file
+    :rtype: str
+    """
+    sdl_hash = _get_snapshot_key(sdl).hex()
+    return os.path.join(
+        directory, f"{schema_name}-{sdl_hash}{_SNAPSHOT_EXTENSION}"
+    )
+
+
+def load_schema_snapshot(
+    snapshot_file: str, sdl: str
+) -> Optional["GraphQLSchema"]:
+    """
+    Loads the pre-baked GraphQLSchema instance stored in a snapshot file.
+    Since snapshots are unpickled, the snapshot directory must be trusted:
+    snapshot files owned by another user or writable by other users are
+    ignored, as well as the ones whose HMAC doesn't match the SDL (e.g.
+    produced from another SDL or truncated).
+    :param snapshot_file: path of the snapshot file
+    :param sdl: the full SDL of the schema
+    :type snapshot_file: str
+    :type sdl: str
+    :return: the pre-baked GraphQLSchema instance or None if the snapshot
+    doesn't exist or can't be loaded
+    :rtype: Optional[GraphQLSchema]
+    """
+    try:
+        with open(snapshot_file, "rb") as snapshot:
+            if not _is_trusted_snapshot_file(os.fstat(snapshot.fileno())):
+                logger.warning(
+                    "Ignoring schema snapshot < %s > which is owned or "
+                    "writable by another user.",
+                    snapshot_file,
+                )
+                return None
+            signature = snapshot.read(hashlib.sha256().digest_size)
+            payload = snapshot.read()
+        if not hmac.compare_digest(signature, _sign_snapshot(sdl, payload)):
+            logger.warning(
+                "Ignoring schema snapshot < %s > which doesn't match the SDL.",
+                snapshot_file,
+            )
+            return None
+        schema = pickle.loads(payload)
+    except FileNotFoundError:
+        return None
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Unable to load schema snapshot < %s >.",
+            snapshot_file,
+            exc_info=True,
+        )
+        return None
+
+    schema.is_snapshot = True
+    return schema
+
+
+def dump_schema_snapshot(schema: "GraphQLSchema", sdl: str) -> bytes:
+    """
+    Serializes a pre-baked GraphQLSchema instance, prefixed by its HMAC. The
+    schema has to be serialized before being baked so that no callable is
+    attached to it.
+    :param schema: the pre-baked GraphQLSchema instance
+    :param sdl: the full SDL of the schema
+    :type schema: GraphQLSchema
+    :type sdl: str
+    :return: the signed serialized schema
+    :rtype: bytes
+    """
+    payload = pickle.dumps(schema, protocol=pickle.HIGHEST_PROTOCOL)
+    return _sign_snapshot(sdl, payload) + payload
+
+
+def write_schema_snapshot(snapshot_file: str, snapshot: bytes) -> None:
+    """
+    Atomically writes a serialized schema to its snapshot file, which is
+    only writable by the current user.
+    :param snapshot_file: path of the snapshot file
+    :param snapshot: the serialized schema
+    :type snapshot_file: str
+    :type snapshot: bytes
+    """
+    tmp_file = f"{snapshot_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(snapshot_file), exist_ok=True)
+        with open(tmp_file, "wb") as snapshot_tmp_file:
+            snapshot_tmp_file.write(snapshot)
+        os.chmod(tmp_file, _SNAPSHOT_FILE_MODE)
+        os.replace(tmp_file, snapshot_file)
+    except OSError:
+        logger.exception(
+            "Unable to write schema snapshot < %s >.", snapshot_file
+        )
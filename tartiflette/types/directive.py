@@ -31,6 +31,8 @@ class GraphQLDirective:
         self.description = description
         self.implementation: Optional[Callable] = None
         self.arguments_coercer: Optional[Callable] = None
+        self.collection_scope: str = "request"
+        self.context_independent_introspection: bool = False
 
         # Introspection attributes
         self.args: List["GraphQLArgument"] = []
@@ -59,6 +59,7 @@ class GraphQLEnumValue:
 
         # Coercers
         self.input_coercer: Optional[Callable] = None
+        self.has_post_input_coercion_directives: bool = False
         self.literal_coercer: Optional[Callable] = None
         self.output_coercer: Optional[Callable] = None
 
@@ -140,6 +141,10 @@ class GraphQLEnumValue:
             directive_hook="on_post_input_coercion",
             with_default=True,
         )
+        self.has_post_input_coercion_directives = any(
+            "on_post_input_coercion" in directive["callables"]
+            for directive in directives_definition
+        )
 
         # Coercers
         self.input_coercer = post_input_coercion_directives
@@ -187,6 +192,7 @@ class GraphQLEnumType(GraphQLInputType, GraphQLType):
 
         # Coercers
         self.input_coercer: Optional[Callable] = None
+        self.has_post_input_coercion_directives: bool = False
         self.literal_coercer: Optional[Callable] = None
         self.output_coercer: Optional[Callable] = None
 
@@ -269,6 +275,10 @@ class GraphQLEnumType(GraphQLInputType, GraphQLType):
             directives_definition=directives_definition,
             directive_hook="on_post_input_coercion",
         )
+        self.has_post_input_coercion_directives = any(
+            "on_post_input_coercion" in directive["callables"]
+            for directive in directives_definition
+        )
 
         # Coercers
         self.input_coercer = partial(
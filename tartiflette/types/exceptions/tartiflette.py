@@ -194,3 +194,17 @@ class RedefinedImplementation(TartifletteError):
 
 class CoercionError(TartifletteError):
     pass
+
+
+class ExecutionDeadlineExceeded(TartifletteError):
+    """
+    Error of the fields which couldn't be completed before the deadline of
+    the request.
+    """
+
+    def __init__(self, message: str = "Execution deadline exceeded.") -> None:
+        """
+        :param message: message explaining the error which occurred
+        :type message: str
+        """
+        super().__init__(message, extensions={"code": "DEADLINE_EXCEEDED"})
@@ -3,16 +3,52 @@ from typing import Any, Callable, Dict, List, Optional, Union
 
 from tartiflette.coercers.outputs.compute import get_output_coercer
 from tartiflette.resolver.default import default_field_resolver
-from tartiflette.resolver.factory import resolve_field
+from tartiflette.resolver.factory import (
+    resolve_field,
+    resolve_sync_field,
+    resolve_trivial_field,
+)
 from tartiflette.types.helpers.get_directive_instances import (
     compute_directive_nodes,
 )
 from tartiflette.types.helpers.type import get_graphql_type
+from tartiflette.types.scalar import GraphQLScalarType
+from tartiflette.utils.callables import is_valid_coroutine
 from tartiflette.utils.directives import wraps_with_directives
 
 __all__ = ("GraphQLField",)
 
 
+def get_sync_coercible_scalar_type(
+    schema: "GraphQLSchema", graphql_type: "GraphQLType"
+) -> Optional["GraphQLScalarType"]:
+    """
+    Returns the scalar type of a field if its values can be coerced
+    synchronously, which is the case of (non-null) scalar types whose output
+    coercion isn't wrapped by any directive.
+    :param schema: the GraphQLSchema instance linked to the engine
+    :param graphql_type: GraphQL type of the field
+    :type schema: GraphQLSchema
+    :type graphql_type: GraphQLType
+    :return: the scalar type of the field if its values can be coerced
+    synchronously
+    :rtype: Optional[GraphQLScalarType]
+    """
+    scalar_type = (
+        graphql_type.wrapped_type
+        if graphql_type.is_non_null_type
+        else graphql_type
+    )
+    if not isinstance(scalar_type, GraphQLScalarType) or any(
+        "on_pre_output_coercion" in directive["callables"]
+        for directive in compute_directive_nodes(
+            schema, scalar_type.directives
+        )
+    ):
+        return None
+    return scalar_type
+
+
 class GraphQLField:
     """
     Definition of a GraphQL field.
@@ -58,12 +94,21 @@ class GraphQLField:
         self.raw_resolver = resolver
         self.resolver: Optional[Callable] = None
         self.subscribe: Optional[Callable] = None
+        self.sync_resolver: Optional[Callable] = None
+        self.memoize: bool = False
+
+        # Complexity analysis
+        self.cost: int = 1
 
         # Arguments coercer
         self.arguments_coercer: Optional[Callable] = None
         self.query_arguments_coercer: Optional[Callable] = None
         self.subscription_arguments_coercer: Optional[Callable] = None
 
+        # Output list coercion
+        self.coerce_list_concurrently: Optional[bool] = None
+        self.list_concurrency_limit: Optional[int] = None
+
         # Introspection attributes
         self.isDeprecated: bool = False  # pylint: disable=invalid-name
         self.args: List["GraphQLArgument"] = []
@@ -178,23 +223,63 @@ class GraphQLField:
         )
 
         # Resolvers
+        resolver = (
+            self.raw_resolver
+            or custom_default_resolver
+            or default_field_resolver
+        )
+        output_coercer = get_output_coercer(
+            self.graphql_type,
+            concurrently=(
+                self.coerce_list_concurrently
+                if self.coerce_list_concurrently is not None
+                else schema.coerce_list_concurrently
+            ),
+            concurrency_limit=(
+                self.list_concurrency_limit or schema.list_concurrency_limit
+            ),
+        )
         self.resolver = partial(
             resolve_field,
             field_definition=self,
             resolver=wraps_with_directives(
                 directives_definition=directives_definition,
                 directive_hook="on_field_execution",
-                func=(
-                    self.raw_resolver
-                    or custom_default_resolver
-                    or default_field_resolver
-                ),
+                func=resolver,
                 is_resolver=True,
                 with_default=True,
             ),
-            output_coercer=get_output_coercer(self.graphql_type),
+            output_coercer=output_coercer,
         )
 
+        # Fields without arguments nor directives can be resolved without
+        # going through `resolve_field` when their resolver is synchronous
+        self.sync_resolver = None
+        if (
+            not self.arguments
+            and not directives_definition
+            and not self.memoize
+        ):
+            scalar_type = get_sync_coercible_scalar_type(
+                schema, self.graphql_type
+            )
+            if resolver is default_field_resolver:
+                if scalar_type is not None:
+                    self.sync_resolver = partial(
+                        resolve_trivial_field,
+                        field_definition=self,
+                        scalar_type=scalar_type,
+                        is_non_null=self.graphql_type.is_non_null_type,
+                    )
+            elif not is_valid_coroutine(resolver):
+                self.sync_resolver = partial(
+                    resolve_sync_field,
+                    field_definition=self,
+                    resolver=resolver,
+                    output_coercer=output_coercer,
+                    scalar_type=scalar_type,
+                )
+
         for argument in self.arguments.values():
             argument.bake(schema)
             self.args.append(argument)
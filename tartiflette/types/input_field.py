@@ -56,6 +56,7 @@ class GraphQLInputField:
 
         # Coercers
         self.input_coercer: Optional[Callable] = None
+        self.has_post_input_coercion_directives: bool = False
         self.literal_coercer: Optional[Callable] = None
 
         # Introspection attributes
@@ -135,6 +136,10 @@ class GraphQLInputField:
             directives_definition=directives_definition,
             directive_hook="on_post_input_coercion",
         )
+        self.has_post_input_coercion_directives = any(
+            "on_post_input_coercion" in directive["callables"]
+            for directive in directives_definition
+        )
 
         # Coercers
         self.input_coercer = partial(
@@ -61,6 +61,7 @@ class GraphQLInputObjectType(GraphQLInputType, GraphQLType):
 
         # Coercers
         self.input_coercer: Optional[Callable] = None
+        self.has_post_input_coercion_directives: bool = False
         self.literal_coercer: Optional[Callable] = None
 
         # Introspection attributes
@@ -123,6 +124,10 @@ class GraphQLInputObjectType(GraphQLInputType, GraphQLType):
             directives_definition=directives_definition,
             directive_hook="on_post_input_coercion",
         )
+        self.has_post_input_coercion_directives = any(
+            "on_post_input_coercion" in directive["callables"]
+            for directive in directives_definition
+        )
 
         # Coercers
         self.input_coercer = partial(
@@ -64,6 +64,7 @@ class GraphQLScalarType(GraphQLInputType, GraphQLType):
         self.coerce_input: Optional[Callable] = None
         self.parse_literal: Optional[Callable] = None
         self.input_coercer: Optional[Callable] = None
+        self.has_post_input_coercion_directives: bool = False
         self.literal_coercer: Optional[Callable] = None
         self.output_coercer: Optional[Callable] = None
 
@@ -122,6 +123,10 @@ class GraphQLScalarType(GraphQLInputType, GraphQLType):
             directives_definition=directives_definition,
             directive_hook="on_post_input_coercion",
         )
+        self.has_post_input_coercion_directives = any(
+            "on_post_input_coercion" in directive["callables"]
+            for directive in directives_definition
+        )
 
         # Coercers
         self.input_coercer = partial(
@@ -0,0 +1,66 @@
+import asyncio
+import sys
+
+from inspect import iscoroutine
+from typing import Any, Awaitable, List
+
+__all__ = ("gather_eagerly",)
+
+# Eager tasks (Python 3.12+) start running their coroutine as soon as they're
+# created, within their own task, and are only scheduled on the event loop
+# once they suspend
+_HAS_EAGER_TASKS = sys.version_info >= (3, 12)
+
+
+def _create_task(awaitable: Awaitable) -> "asyncio.Future":
+    """
+    Wraps the awaitable into a task, which is started eagerly when possible.
+    :param awaitable: the awaitable to wrap
+    :type awaitable: Awaitable
+    :return: the task running the awaitable
+    :rtype: asyncio.Future
+    """
+    if _HAS_EAGER_TASKS and iscoroutine(awaitable):
+        # pylint: disable=unexpected-keyword-arg
+        return asyncio.Task(
+            awaitable, loop=asyncio.get_event_loop(), eager_start=True
+        )
+    return asyncio.ensure_future(awaitable)
+
+
+def _task_outcome(task: "asyncio.Future") -> Any:
+    """
+    Returns the result of a done task or, as `asyncio.gather` called with
+    `return_exceptions=True` does, the exception it raised.
+    :param task: the done task
+    :type task: asyncio.Future
+    :return: the result or the exception of the task
+    :rtype: Any
+    """
+    if task.cancelled():
+        return asyncio.CancelledError()
+    exception = task.exception()
+    return exception if exception is not None else task.result()
+
+
+async def gather_eagerly(*awaitables: Awaitable) -> List[Any]:
+    """
+    Runs the awaitables concurrently in eager tasks, so that the ones which
+    complete synchronously are never scheduled on the event loop, and only
+    gathers the suspended ones. Without eager tasks (Python < 3.12), it's
+    equivalent to `asyncio.gather`. As with `asyncio.gather` called with
+    `return_exceptions=True`, exceptions are returned instead of being
+    raised. Results are returned in the order of the awaitables.
+    :param awaitables: the awaitables to run
+    :type awaitables: Awaitable
+    :return: the results of the awaitables
+    :rtype: List[Any]
+    """
+    if not _HAS_EAGER_TASKS:
+        return await asyncio.gather(*awaitables, return_exceptions=True)
+
+    tasks = [_create_task(awaitable) for awaitable in awaitables]
+    pending_tasks = [task for task in tasks if not task.done()]
+    if pending_tasks:
+        await asyncio.gather(*pending_tasks, return_exceptions=True)
+    return [_task_outcome(task) for task in tasks]
@@ -1,6 +1,7 @@
 import asyncio
 
 from functools import partial
+from inspect import isawaitable
 from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Union
 
 from tartiflette.constants import UNDEFINED_VALUE
@@ -170,12 +171,15 @@ async def directive_executor(
     :return: the computed value
     :rtype: Any
     """
-    return await directive_func(
+    result = directive_func(
         await directive_arguments_coercer(ctx=context_coercer),
         partial(wrapped_func, context_coercer=context_coercer),
         *args,
         **kwargs,
     )
+    if isawaitable(result):
+        return await result
+    return result
 
 
 async def directive_generator(
@@ -205,7 +209,10 @@ async def resolver_executor(resolver: Callable, *args, **kwargs) -> Any:
     :rtype: Any
     """
     kwargs.pop("context_coercer", None)
-    return await resolver(*args, **kwargs)
+    result = resolver(*args, **kwargs)
+    if isawaitable(result):
+        return await result
+    return result
 
 
 async def subscription_generator(generator: AsyncGenerator, *args, **kwargs):
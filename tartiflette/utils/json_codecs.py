@@ -0,0 +1,29 @@
+import json
+
+from typing import Any, Callable, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+__all__ = ("default_json_loader", "default_json_encoder")
+
+# Both libraries directly decode the raw `bytes` of the JSON AST produced by
+# libgraphqlparser, `orjson` being used when installed
+default_json_loader: Callable[[Union[str, bytes]], Any] = (
+    orjson.loads if orjson is not None else json.loads
+)
+
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def default_json_encoder(value: Any) -> str:
+    """
+    Encodes a value into a compact JSON document.
+    :param value: the value to encode
+    :type value: Any
+    :return: the JSON document
+    :rtype: str
+    """
+    return _JSON_ENCODER.encode(value)
@@ -0,0 +1,299 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+from tartiflette.execution.introspection import INTROSPECTION_QUERY
+
+pytest.importorskip("pytest_benchmark")
+
+_SDL = """
+type Item {
+  id: Int
+  name: String
+  price: Float
+  available: Boolean
+  code: String
+}
+
+type Query {
+  items: [Item]
+}
+"""
+
+_FIELDS = ("id", "name", "price", "available", "code")
+
+_QUERY = "{ items { %s } }" % " ".join(_FIELDS)
+
+_ITEMS = [
+    {
+        "id": index,
+        "name": f"Item #{index}",
+        "price": index / 10,
+        "available": bool(index % 2),
+        "code": f"I{index}",
+    }
+    for index in range(500)
+]
+
+
+def _sync_resolver(field_name):
+    def resolver(parent, args, ctx, info):
+        return parent[field_name]
+
+    return resolver
+
+
+def _async_resolver(field_name):
+    async def resolver(parent, args, ctx, info):
+        return parent[field_name]
+
+    return resolver
+
+
+@pytest.fixture(scope="module")
+def engines():
+    loop = asyncio.new_event_loop()
+    engines = {}
+    try:
+        for mode, resolver_factory in (
+            ("sync", _sync_resolver),
+            ("async", _async_resolver),
+        ):
+            schema_name = f"benchmark_execution_{mode}"
+
+            @Resolver("Query.items", schema_name=schema_name)
+            async def resolve_query_items(parent, args, ctx, info):
+                return _ITEMS
+
+            for field_name in _FIELDS:
+                Resolver(f"Item.{field_name}", schema_name=schema_name)(
+                    resolver_factory(field_name)
+                )
+
+            engines[mode] = loop.run_until_complete(
+                create_engine(_SDL, schema_name=schema_name)
+            )
+        yield loop, engines
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_execution_wide_query_resolvers(benchmark, engines, mode):
+    loop, engines = engines
+    engine = engines[mode]
+
+    result = benchmark(lambda: loop.run_until_complete(engine.execute(_QUERY)))
+    assert len(result["data"]["items"]) == len(_ITEMS)
+
+
+_GRAPH_SDL = """
+type Node {
+  id: Int
+  name: String
+  children: [Node]
+}
+
+type Query {
+  root: Node
+}
+"""
+
+_GRAPH_QUERIES = {
+    # 3^6 nodes deep
+    "deep": "{ root { %s } }"
+    % ("id name children { " * 6 + "id name" + " }" * 6),
+    # 2000 nodes wide
+    "wide": "{ root { children { id name } } }",
+}
+
+
+def _build_graph(width, depth, identifier=0):
+    return {
+        "id": identifier,
+        "name": f"Node #{identifier}",
+        "children": [
+            _build_graph(width, depth - 1, identifier * width + index + 1)
+            for index in range(width)
+        ]
+        if depth
+        else [],
+    }
+
+
+_GRAPHS = {"deep": _build_graph(3, 6), "wide": _build_graph(2000, 1)}
+
+
+@pytest.fixture(scope="module")
+def graph_engines():
+    loop = asyncio.new_event_loop()
+    engines = {}
+    try:
+        for strategy in ("default", "eager"):
+            schema_name = f"benchmark_execution_graph_{strategy}"
+
+            @Resolver("Query.root", schema_name=schema_name)
+            async def resolve_query_root(parent, args, ctx, info):
+                return _GRAPHS[ctx["graph"]]
+
+            for field_name in ("id", "name", "children"):
+                Resolver(f"Node.{field_name}", schema_name=schema_name)(
+                    _async_resolver(field_name)
+                )
+
+            engines[strategy] = loop.run_until_complete(
+                create_engine(
+                    _GRAPH_SDL,
+                    schema_name=schema_name,
+                    eager_execution=strategy == "eager",
+                )
+            )
+        yield loop, engines
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("graph", ["deep", "wide"])
+@pytest.mark.parametrize("strategy", ["default", "eager"])
+def test_execution_object_graph(benchmark, graph_engines, graph, strategy):
+    loop, engines = graph_engines
+    engine = engines[strategy]
+
+    result = benchmark(
+        lambda: loop.run_until_complete(
+            engine.execute(_GRAPH_QUERIES[graph], context={"graph": graph})
+        )
+    )
+    assert "errors" not in result
+
+
+_INTROSPECTION_SDL = "\n".join(
+    [
+        "type Type%d { %s }"
+        % (
+            index,
+            " ".join(f"field{field}(arg: Int): String" for field in range(10)),
+        )
+        for index in range(50)
+    ]
+    + ["type Query { %s }" % " ".join(f"t{i}: Type{i}" for i in range(50))]
+)
+
+
+@pytest.fixture(scope="module")
+def introspection_engines():
+    loop = asyncio.new_event_loop()
+    engines = {}
+    try:
+        for cache in ("none", "cache", "prerender"):
+            engines[cache] = loop.run_until_complete(
+                create_engine(
+                    _INTROSPECTION_SDL,
+                    schema_name=f"benchmark_execution_introspection_{cache}",
+                    introspection_cache=cache == "cache",
+                    prerender_introspection=cache == "prerender",
+                )
+            )
+        yield loop, engines
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("cache", ["none", "cache", "prerender"])
+def test_execution_introspection_query(
+    benchmark, introspection_engines, cache
+):
+    loop, engines = introspection_engines
+    engine = engines[cache]
+
+    result = benchmark(
+        lambda: loop.run_until_complete(engine.execute(INTROSPECTION_QUERY))
+    )
+    assert "errors" not in result
+
+
+_INPUT_SDL = """
+directive @trim on INPUT_FIELD_DEFINITION
+
+input ItemInput {
+  id: Int!
+  name: String!
+  price: Float
+  tags: [String!]
+}
+
+input TrimmedItemInput {
+  id: Int!
+  name: String! @trim
+  price: Float
+  tags: [String!]
+}
+
+type Mutation {
+  addItems(items: [ItemInput!]!): Int
+  addTrimmedItems(items: [TrimmedItemInput!]!): Int
+}
+
+type Query {
+  hello: String
+}
+"""
+
+_INPUT_QUERIES = {
+    "sync": "mutation ($items: [ItemInput!]!) { addItems(items: $items) }",
+    "directives": (
+        "mutation ($items: [TrimmedItemInput!]!) "
+        "{ addTrimmedItems(items: $items) }"
+    ),
+}
+
+_INPUT_ITEMS = [
+    {
+        "id": index,
+        "name": f" Item #{index} ",
+        "price": index / 10,
+        "tags": ["a", "b"],
+    }
+    for index in range(1000)
+]
+
+
+@pytest.fixture(scope="module")
+def input_engine():
+    loop = asyncio.new_event_loop()
+    schema_name = "benchmark_execution_input_coercion"
+    try:
+
+        @Directive("trim", schema_name=schema_name)
+        class TrimDirective:
+            @staticmethod
+            async def on_post_input_coercion(
+                directive_args, next_directive, parent_node, value, ctx
+            ):
+                return (await next_directive(parent_node, value, ctx)).strip()
+
+        @Resolver("Mutation.addItems", schema_name=schema_name)
+        @Resolver("Mutation.addTrimmedItems", schema_name=schema_name)
+        async def resolve_mutation_add_items(parent, args, ctx, info):
+            return len(args["items"])
+
+        yield loop, loop.run_until_complete(
+            create_engine(_INPUT_SDL, schema_name=schema_name)
+        )
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("coercion", ["sync", "directives"])
+def test_execution_input_coercion(benchmark, input_engine, coercion):
+    loop, engine = input_engine
+
+    result = benchmark(
+        lambda: loop.run_until_complete(
+            engine.execute(
+                _INPUT_QUERIES[coercion], variables={"items": _INPUT_ITEMS}
+            )
+        )
+    )
+    assert list(result["data"].values()) == [len(_INPUT_ITEMS)]
@@ -0,0 +1,116 @@
+import asyncio
+import json
+
+import pytest
+
+from tartiflette import create_engine
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.parsers.libgraphqlparser.parser import (
+    _parse_context_manager,
+    _parse_to_json_ast,
+)
+from tartiflette.language.validators import validate_document
+
+pytest.importorskip("pytest_benchmark")
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_SDL = """
+type Item {
+  id: Int
+  name(locale: String): String
+  children(first: Int): [Item]
+}
+
+type Query {
+  item(id: Int!): Item
+}
+"""
+
+_QUERY = "query Items($locale: String) {\n%s\n}" % "\n".join(
+    f"""
+    item{index}: item(id: {index}) @include(if: true) {{
+      id
+      name(locale: $locale)
+      children(first: 10) {{ id name children(first: 5) {{ id }} }}
+    }}
+    """
+    for index in range(50)
+)
+
+_LARGE_QUERY = "query Items($locale: String) {\n%s\n}" % "\n".join(
+    f"""
+    item{index}: item(id: {index}) @include(if: true) {{
+      id
+      name(locale: $locale)
+      children(first: 10) {{ id name children(first: 5) {{ id }} }}
+    }}
+    """
+    for index in range(500)
+)
+
+
+@pytest.fixture(scope="module")
+def schema():
+    loop = asyncio.new_event_loop()
+    try:
+        engine = loop.run_until_complete(
+            create_engine(_SDL, schema_name="benchmark_parser")
+        )
+    finally:
+        loop.close()
+    return engine._schema  # pylint: disable=protected-access
+
+
+def test_parser_json_ast(benchmark):
+    benchmark(lambda: json.loads(_parse_to_json_ast(_QUERY)))
+
+
+def test_parser_parse_to_document(benchmark, schema):
+    benchmark(parse_to_document, _QUERY, schema)
+
+
+@pytest.mark.parametrize("query", [_QUERY, _LARGE_QUERY], ids=["50", "500"])
+@pytest.mark.parametrize("json_loader", ["json", "orjson"])
+def test_parser_parse_to_document_json_loader(
+    benchmark, schema, json_loader, query
+):
+    if json_loader == "orjson" and orjson is None:
+        pytest.skip("orjson isn't installed")
+
+    previous_json_loader = schema.json_loader
+    schema.json_loader = json.loads if json_loader == "json" else orjson.loads
+    try:
+        benchmark(parse_to_document, query, schema)
+    finally:
+        schema.json_loader = previous_json_loader
+
+
+@pytest.mark.parametrize("query", [_QUERY, _LARGE_QUERY], ids=["50", "500"])
+def test_parser_validate_document(benchmark, schema, query):
+    document = parse_to_document(query, schema)
+    benchmark(validate_document, schema, document)
+
+
+_LARGE_MUTATION = "mutation {\n%s\n}" % "\n".join(
+    f'add{index}: item(id: {index}) {{ name(locale: "{"x" * 1000}") }}'
+    for index in range(1000)
+)
+
+
+@pytest.mark.parametrize("query_type", ["str", "bytes", "bytearray"])
+def test_parser_query_input(benchmark, query_type):
+    query = {
+        "str": _LARGE_MUTATION,
+        "bytes": _LARGE_MUTATION.encode("utf-8"),
+        "bytearray": bytearray(_LARGE_MUTATION.encode("utf-8")),
+    }[query_type]
+
+    def parse():
+        with _parse_context_manager(query):
+            pass
+
+    benchmark(parse)
@@ -66,9 +66,7 @@ async def test_issue228_3():
 
     @Directive("tartifyMe", schema_name="issue228_3")
     class TartifyYourself:
-        @staticmethod
-        def on_pre_output_coercion(*_, **_kwargs):
-            pass
+        on_pre_output_coercion = "not a callable"
 
         @staticmethod
         def on_post_input_coercion(*_, **_kwargs):
@@ -82,9 +80,7 @@ async def test_issue228_3():
         def on_argument_execution(*_, **_kwargs):
             pass
 
-        @staticmethod
-        def on_introspection(*_, **_kwargs):
-            pass
+        on_introspection = "not a callable"
 
         def on_schema_subscription(self, *_, **_kwargs):
             pass
@@ -97,12 +93,8 @@ async def test_issue228_3():
         match="""
 
 0: Missing Query Type < Query >.
-1: Directive tartifyMe Method on_pre_output_coercion is not awaitable.
-2: Directive tartifyMe Method on_introspection is not awaitable.
-3: Directive tartifyMe Method on_post_input_coercion is not awaitable.
-4: Directive tartifyMe Method on_argument_execution is not awaitable.
-5: Directive tartifyMe Method on_field_execution is not awaitable.
-6: Directive tartifyMe Method on_schema_execution is not awaitable.
-7: Directive tartifyMe Method on_schema_subscription is not an Async Generator.""",
+1: Directive tartifyMe Method on_pre_output_coercion is not callable.
+2: Directive tartifyMe Method on_introspection is not callable.
+3: Directive tartifyMe Method on_schema_subscription is not an Async Generator.""",
     ):
         await create_engine(sdl=sdl, schema_name="issue228_3")
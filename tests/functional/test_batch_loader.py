@@ -0,0 +1,270 @@
+import asyncio
+
+import pytest
+
+from tartiflette import BatchLoader, Resolver, create_engine
+
+_SDL = """
+type User {
+  id: Int!
+  name: String
+  friends: [User]
+}
+
+type Post {
+  id: Int!
+  author: User
+  batchAuthor: User
+  title(prefix: String): String
+}
+
+type Query {
+  posts: [Post]
+}
+"""
+
+_USERS = {
+    1: {"id": 1, "name": "Alice", "friend_ids": [2, 3]},
+    2: {"id": 2, "name": "Bob", "friend_ids": [1]},
+    3: {"id": 3, "name": "Carol", "friend_ids": [1, 2]},
+}
+
+_POSTS = [
+    {"id": 1, "author_id": 1},
+    {"id": 2, "author_id": 2},
+    {"id": 3, "author_id": 1},
+    {"id": 4, "author_id": 3},
+]
+
+
+async def _engine(schema_name, batch_calls, **kwargs):
+    async def load_users(ids):
+        batch_calls.append(("users", ids))
+        return [_USERS.get(user_id) for user_id in ids]
+
+    @Resolver("Query.posts", schema_name=schema_name)
+    async def resolve_query_posts(parent, args, ctx, info):
+        return _POSTS
+
+    @Resolver("Post.author", schema_name=schema_name)
+    async def resolve_post_author(parent, args, ctx, info):
+        return await info.get_loader(load_users).load(parent["author_id"])
+
+    @Resolver("Post.batchAuthor", schema_name=schema_name, batch=True)
+    async def resolve_post_batch_author(parents, args, ctx, info):
+        batch_calls.append(("batchAuthor", [post["id"] for post in parents]))
+        return [_USERS[post["author_id"]] for post in parents]
+
+    @Resolver("Post.title", schema_name=schema_name, batch=True)
+    async def resolve_post_title(parents, args, ctx, info):
+        batch_calls.append(("title", [post["id"] for post in parents]))
+        return [
+            ValueError("Boom")
+            if post["id"] == 3
+            else f"{args.get('prefix', '')}Post#{post['id']}"
+            for post in parents
+        ]
+
+    @Resolver("User.friends", schema_name=schema_name, batch=True)
+    async def resolve_user_friends(parents, args, ctx, info):
+        batch_calls.append(("friends", [user["id"] for user in parents]))
+        return [
+            [_USERS[friend_id] for friend_id in user["friend_ids"]]
+            for user in parents
+        ]
+
+    # Parents are only batched while list items are coerced concurrently
+    kwargs.setdefault("coerce_list_concurrently", True)
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_get_loader():
+    batch_calls = []
+    engine = await _engine("test_batch_loader_get_loader", batch_calls)
+
+    assert await engine.execute("{ posts { id author { name } } }") == {
+        "data": {
+            "posts": [
+                {"id": 1, "author": {"name": "Alice"}},
+                {"id": 2, "author": {"name": "Bob"}},
+                {"id": 3, "author": {"name": "Alice"}},
+                {"id": 4, "author": {"name": "Carol"}},
+            ]
+        }
+    }
+    assert batch_calls == [("users", [1, 2, 3])]
+
+    # Loaders are created per request
+    await engine.execute("{ posts { id author { name } } }")
+    assert batch_calls == [("users", [1, 2, 3]), ("users", [1, 2, 3])]
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_batch_resolver():
+    batch_calls = []
+    engine = await _engine("test_batch_loader_batch_resolver", batch_calls)
+
+    assert (
+        await engine.execute(
+            """
+        {
+          posts {
+            batchAuthor { name friends { name friends { id } } }
+            title(prefix: "> ")
+          }
+        }
+        """
+        )
+        == {
+            "data": {
+                "posts": [
+                    {
+                        "batchAuthor": {
+                            "name": "Alice",
+                            "friends": [
+                                {"name": "Bob", "friends": [{"id": 1}]},
+                                {
+                                    "name": "Carol",
+                                    "friends": [{"id": 1}, {"id": 2}],
+                                },
+                            ],
+                        },
+                        "title": "> Post#1",
+                    },
+                    {
+                        "batchAuthor": {
+                            "name": "Bob",
+                            "friends": [
+                                {
+                                    "name": "Alice",
+                                    "friends": [{"id": 2}, {"id": 3}],
+                                }
+                            ],
+                        },
+                        "title": "> Post#2",
+                    },
+                    {
+                        "batchAuthor": {
+                            "name": "Alice",
+                            "friends": [
+                                {"name": "Bob", "friends": [{"id": 1}]},
+                                {
+                                    "name": "Carol",
+                                    "friends": [{"id": 1}, {"id": 2}],
+                                },
+                            ],
+                        },
+                        "title": None,
+                    },
+                    {
+                        "batchAuthor": {
+                            "name": "Carol",
+                            "friends": [
+                                {
+                                    "name": "Alice",
+                                    "friends": [{"id": 2}, {"id": 3}],
+                                },
+                                {"name": "Bob", "friends": [{"id": 1}]},
+                            ],
+                        },
+                        "title": "> Post#4",
+                    },
+                ]
+            },
+            "errors": [
+                {
+                    "message": "Boom",
+                    "path": ["posts", 2, "title"],
+                    "locations": [{"line": 5, "column": 13}],
+                }
+            ],
+        }
+    )
+    assert sorted(batch_calls) == [
+        ("batchAuthor", [1, 2, 3, 4]),
+        ("friends", [1, 2, 1, 3]),
+        ("friends", [1, 2, 3, 2, 3, 1, 2]),
+        ("title", [1, 2, 3, 4]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_sequential_lists():
+    batch_calls = []
+    engine = await _engine(
+        "test_batch_loader_sequential_lists",
+        batch_calls,
+        coerce_list_concurrently=False,
+    )
+
+    await engine.execute("{ posts { title } }")
+    assert batch_calls == [
+        ("title", [1]),
+        ("title", [2]),
+        ("title", [3]),
+        ("title", [4]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_loader():
+    batch_calls = []
+
+    async def batch_load(keys):
+        batch_calls.append(keys)
+        return [ValueError(key) if key == "error" else key * 2 for key in keys]
+
+    loader = BatchLoader(batch_load, max_batch_size=2)
+    loader.prime("primed", "value")
+    assert await loader.load_many(["a", "b", "a", "c", "primed"]) == [
+        "aa",
+        "bb",
+        "aa",
+        "cc",
+        "value",
+    ]
+    assert batch_calls == [["a", "b"], ["c"]]
+
+    assert await loader.load("a") == "aa"
+    assert batch_calls == [["a", "b"], ["c"]]
+
+    with pytest.raises(ValueError):
+        await loader.load("error")
+
+    with pytest.raises(ValueError):
+        await loader.load("error")
+    assert batch_calls == [["a", "b"], ["c"], ["error"], ["error"]]
+
+    loader.clear("a")
+    assert await loader.load("a") == "aa"
+    assert batch_calls[-1] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_invalid_batch_load_fn():
+    async def batch_load(keys):
+        return keys[:-1]
+
+    loader = BatchLoader(batch_load)
+    with pytest.raises(TypeError, match="as many values as given keys"):
+        await loader.load_many([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_batch_loader_keeps_dispatch_tasks():
+    released = asyncio.Event()
+
+    async def batch_load(keys):
+        await released.wait()
+        return keys
+
+    loader = BatchLoader(batch_load)
+    future = loader.load(1)
+    while not loader._dispatch_tasks:
+        await asyncio.sleep(0)
+
+    released.set()
+    assert await future == 1
+    await asyncio.sleep(0)
+    assert not loader._dispatch_tasks
@@ -0,0 +1,86 @@
+from functools import lru_cache
+
+import pytest
+
+from tartiflette import (
+    DocumentCache,
+    MemoryPersistedQueryStore,
+    Resolver,
+    create_engine,
+)
+from tartiflette.execution.persisted_queries import get_query_hash
+
+_SDL = """
+type Query {
+  hello(name: String): String
+}
+"""
+
+_QUERY = '{ hello(name: "buffer") }'
+
+
+async def _engine(schema_name, **kwargs):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello " + args.get("name", "world")
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,query",
+    enumerate(
+        [
+            _QUERY.encode("utf-8"),
+            bytearray(_QUERY.encode("utf-8")),
+            memoryview(_QUERY.encode("utf-8")),
+            memoryview(bytearray(_QUERY.encode("utf-8"))),
+            memoryview(f"  {_QUERY}  ".encode("utf-8"))[2:-2],
+        ]
+    ),
+)
+@pytest.mark.parametrize("cache_decorator", ["document_cache", "lru_cache"])
+async def test_buffer_queries(index, query, cache_decorator):
+    document_cache = (
+        DocumentCache() if cache_decorator == "document_cache" else None
+    )
+    engine = await _engine(
+        f"test_buffer_queries_{cache_decorator}_{index}",
+        query_cache_decorator=document_cache or lru_cache(maxsize=16),
+    )
+
+    for _ in range(2):
+        assert await engine.execute(query) == {
+            "data": {"hello": "Hello buffer"}
+        }
+    assert await engine.execute(_QUERY) == {"data": {"hello": "Hello buffer"}}
+
+    if document_cache is not None:
+        # Buffers & strings of a same query share a single entry
+        assert document_cache.cache_info().misses == 1
+        assert document_cache.cache_info().hits == 2
+
+
+@pytest.mark.asyncio
+async def test_buffer_queries_reused_buffer():
+    query_store = MemoryPersistedQueryStore()
+    engine = await _engine(
+        "test_buffer_queries_reused_buffer",
+        query_cache_decorator=lru_cache(maxsize=16),
+        persisted_query_store=query_store,
+    )
+
+    buffer = bytearray(_QUERY.encode("utf-8"))
+    assert await engine.execute(buffer) == {"data": {"hello": "Hello buffer"}}
+    assert await engine.execute(buffer, query_hash=get_query_hash(buffer)) == {
+        "data": {"hello": "Hello buffer"}
+    }
+
+    # The HTTP layer reuses its buffer for the next request
+    buffer[:] = b'{ hello(name: "reused") }'
+    assert await engine.execute(buffer) == {"data": {"hello": "Hello reused"}}
+    assert query_store.get(get_query_hash(_QUERY)) == _QUERY.encode("utf-8")
+    assert await engine.execute(query_hash=get_query_hash(_QUERY)) == {
+        "data": {"hello": "Hello buffer"}
+    }
@@ -0,0 +1,209 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+  nonNullName: String!
+}
+
+type Query {
+  items: [Item]
+  sequentialItems: [Item]
+  limitedItems: [Item]
+}
+"""
+
+
+class _Tracker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.order = []
+
+    async def track(self, value, delay):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(delay)
+        self.order.append(value)
+        self.running -= 1
+        return value
+
+
+async def _engine(schema_name, tracker, **kwargs):
+    @Resolver("Query.items", schema_name=schema_name)
+    @Resolver(
+        "Query.sequentialItems", schema_name=schema_name, concurrently=False
+    )
+    @Resolver(
+        "Query.limitedItems", schema_name=schema_name, list_concurrency_limit=2
+    )
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": index} for index in range(5)]
+
+    @Resolver("Item.name", schema_name=schema_name)
+    async def resolve_item_name(parent, args, ctx, info):
+        return await tracker.track(
+            f"Item#{parent['id']}", 0.01 * (5 - parent["id"])
+        )
+
+    @Resolver("Item.nonNullName", schema_name=schema_name)
+    async def resolve_item_non_null_name(parent, args, ctx, info):
+        if parent["id"] == 3:
+            raise ValueError("Boom")
+        return f"Item#{parent['id']}"
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+_EXPECTED_NAMES = [{"name": f"Item#{index}"} for index in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_coerce_list_concurrently_keeps_ordering():
+    tracker = _Tracker()
+    engine = await _engine(
+        "test_coerce_list_concurrently_keeps_ordering",
+        tracker,
+        coerce_list_concurrently=True,
+    )
+
+    assert await engine.execute("{ items { name } }") == {
+        "data": {"items": _EXPECTED_NAMES}
+    }
+    assert tracker.max_running == 5
+    assert tracker.order == [f"Item#{index}" for index in range(4, -1, -1)]
+
+
+@pytest.mark.asyncio
+async def test_coerce_list_concurrently_disabled_by_default():
+    tracker = _Tracker()
+    engine = await _engine(
+        "test_coerce_list_concurrently_disabled_by_default", tracker
+    )
+
+    assert await engine.execute("{ items { name } }") == {
+        "data": {"items": _EXPECTED_NAMES}
+    }
+    assert tracker.max_running == 1
+    assert tracker.order == [f"Item#{index}" for index in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_coerce_list_concurrently_disabled_on_engine():
+    tracker = _Tracker()
+    engine = await _engine(
+        "test_coerce_list_concurrently_disabled_on_engine",
+        tracker,
+        coerce_list_concurrently=False,
+    )
+
+    assert await engine.execute("{ items { name } }") == {
+        "data": {"items": _EXPECTED_NAMES}
+    }
+    assert tracker.max_running == 1
+    assert tracker.order == [f"Item#{index}" for index in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_coerce_list_concurrently_disabled_on_resolver():
+    tracker = _Tracker()
+    engine = await _engine(
+        "test_coerce_list_concurrently_disabled_on_resolver",
+        tracker,
+        coerce_list_concurrently=True,
+    )
+
+    assert await engine.execute("{ sequentialItems { name } }") == {
+        "data": {"sequentialItems": _EXPECTED_NAMES}
+    }
+    assert tracker.max_running == 1
+
+
+@pytest.mark.asyncio
+async def test_coerce_list_concurrently_list_limit():
+    tracker = _Tracker()
+    engine = await _engine(
+        "test_coerce_list_concurrently_list_limit",
+        tracker,
+        coerce_list_concurrently=True,
+    )
+
+    assert await engine.execute("{ limitedItems { name } }") == {
+        "data": {"limitedItems": _EXPECTED_NAMES}
+    }
+    assert tracker.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_coerce_list_concurrently_request_limit():
+    tracker = _Tracker()
+    engine = await _engine(
+        "test_coerce_list_concurrently_request_limit",
+        tracker,
+        coerce_list_concurrently=True,
+        request_list_concurrency_limit=2,
+    )
+
+    assert await engine.execute("{ items { name } }") == {
+        "data": {"items": _EXPECTED_NAMES}
+    }
+    assert tracker.max_running == 3
+
+
+@pytest.mark.parametrize("coerce_list_concurrently", [True, False])
+@pytest.mark.asyncio
+async def test_coerce_list_concurrently_errors(coerce_list_concurrently):
+    engine = await _engine(
+        f"test_coerce_list_concurrently_errors_{coerce_list_concurrently}",
+        _Tracker(),
+        coerce_list_concurrently=coerce_list_concurrently,
+    )
+
+    assert await engine.execute("{ items { id nonNullName } }") == {
+        "data": {
+            "items": [
+                {"id": 0, "nonNullName": "Item#0"},
+                {"id": 1, "nonNullName": "Item#1"},
+                {"id": 2, "nonNullName": "Item#2"},
+                None,
+                {"id": 4, "nonNullName": "Item#4"},
+            ]
+        },
+        "errors": [
+            {
+                "message": "Boom",
+                "path": ["items", 3, "nonNullName"],
+                "locations": [{"line": 1, "column": 14}],
+            }
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "limit_name", ["list_concurrency_limit", "request_list_concurrency_limit"]
+)
+@pytest.mark.parametrize("limit", [0, -1, "1"])
+@pytest.mark.asyncio
+async def test_coerce_list_concurrently_invalid_limit(limit_name, limit):
+    with pytest.raises(ImproperlyConfigured, match=limit_name):
+        await create_engine(
+            _SDL,
+            schema_name=f"test_coerce_list_concurrently_invalid_limit_{limit_name}_{limit}",
+            **{limit_name: limit},
+        )
+
+
+@pytest.mark.parametrize("limit", [0, -1, "1", True])
+def test_coerce_list_concurrently_invalid_resolver_limit(limit):
+    with pytest.raises(ImproperlyConfigured, match="list_concurrency_limit"):
+        Resolver(
+            "Query.items",
+            schema_name="test_coerce_list_concurrently_invalid_resolver_limit",
+            list_concurrency_limit=limit,
+        )
@@ -0,0 +1,143 @@
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+
+_SDL = """
+directive @hideFor(role: String!) on FIELD
+directive @randomlyHidden on FIELD
+
+type Item {
+  id: Int
+  name: String
+}
+
+type Query {
+  items: [Item]
+}
+"""
+
+
+class _HideForDirective:
+    def __init__(self):
+        self.calls = 0
+
+    async def on_field_collection(
+        self,
+        directive_args: Dict[str, Any],
+        next_directive: Callable,
+        field_node: "FieldNode",
+        ctx: Optional[Any],
+    ) -> "FieldNode":
+        self.calls += 1
+        if ctx["role"] == directive_args["role"]:
+            raise Exception("Hidden")
+        return await next_directive(field_node, ctx)
+
+
+class _RandomlyHiddenDirective:
+    def __init__(self):
+        self.calls = 0
+
+    async def on_field_collection(
+        self,
+        directive_args: Dict[str, Any],
+        next_directive: Callable,
+        field_node: "FieldNode",
+        ctx: Optional[Any],
+    ) -> "FieldNode":
+        self.calls += 1
+        if self.calls % 2:
+            raise Exception("Hidden")
+        return await next_directive(field_node, ctx)
+
+
+_HIDE_FOR = _HideForDirective()
+_RANDOMLY_HIDDEN = _RandomlyHiddenDirective()
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine():
+    @Directive("hideFor", schema_name="test_collection_scopes")
+    class HideForDirective:
+        on_field_collection = _HIDE_FOR.on_field_collection
+
+    @Directive(
+        "randomlyHidden",
+        schema_name="test_collection_scopes",
+        collection_scope="dynamic",
+    )
+    class RandomlyHiddenDirective:
+        on_field_collection = _RANDOMLY_HIDDEN.on_field_collection
+
+    @Resolver("Query.items", schema_name="test_collection_scopes")
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": index, "name": f"Item#{index}"} for index in range(3)]
+
+    return await create_engine(_SDL, schema_name="test_collection_scopes")
+
+
+@pytest.mark.asyncio
+async def test_collection_scopes_request(ttftt_engine):
+    query = """
+    query {
+      items {
+        id
+        name @hideFor(role: "guest")
+      }
+    }
+    """
+
+    _HIDE_FOR.calls = 0
+    assert await ttftt_engine.execute(query, context={"role": "guest"}) == {
+        "data": {"items": [{"id": 0}, {"id": 1}, {"id": 2}]}
+    }
+    assert _HIDE_FOR.calls == 1
+
+    assert await ttftt_engine.execute(query, context={"role": "admin"}) == {
+        "data": {
+            "items": [
+                {"id": 0, "name": "Item#0"},
+                {"id": 1, "name": "Item#1"},
+                {"id": 2, "name": "Item#2"},
+            ]
+        }
+    }
+    assert _HIDE_FOR.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_collection_scopes_dynamic(ttftt_engine):
+    _RANDOMLY_HIDDEN.calls = 0
+    assert await ttftt_engine.execute(
+        "{ items { id name @randomlyHidden } }"
+    ) == {
+        "data": {
+            "items": [
+                {"id": 0},
+                {"id": 1, "name": "Item#1"},
+                {"id": 2},
+            ]
+        }
+    }
+    assert _RANDOMLY_HIDDEN.calls == 3
+
+
+@pytest.mark.parametrize(
+    "query,variables",
+    [
+        ("{ items { id name @include(if: false) } }", None),
+        (
+            "query ($withName: Boolean!) "
+            "{ items { id name @include(if: $withName) } }",
+            {"withName": False},
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_collection_scopes_builtins(ttftt_engine, query, variables):
+    for _ in range(2):
+        assert await ttftt_engine.execute(query, variables=variables) == {
+            "data": {"items": [{"id": 0}, {"id": 1}, {"id": 2}]}
+        }
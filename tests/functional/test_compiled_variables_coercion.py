@@ -0,0 +1,180 @@
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+
+_SDL = """
+directive @upper on INPUT_FIELD_DEFINITION
+
+enum Color {
+  RED
+  GREEN
+}
+
+input ItemInput {
+  name: String!
+  color: Color
+  tags: [String!]
+}
+
+input LabelInput {
+  label: String @upper
+}
+
+input DefaultInput {
+  quantity: Int = 1
+}
+
+type Mutation {
+  addItems(items: [ItemInput!]!): [String]
+  addLabel(label: LabelInput): String
+  addDefault(input: DefaultInput, count: Int): String
+}
+
+type Query {
+  hello: String
+}
+"""
+
+_ADD_ITEMS = """
+mutation ($items: [ItemInput!]!) {
+  addItems(items: $items)
+}
+"""
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine():
+    schema_name = "test_compiled_variables_coercion"
+
+    @Directive("upper", schema_name=schema_name)
+    class UpperDirective:
+        @staticmethod
+        async def on_post_input_coercion(
+            directive_args, next_directive, parent_node, value, ctx
+        ):
+            value = await next_directive(parent_node, value, ctx)
+            return value.upper() if isinstance(value, str) else value
+
+    @Resolver("Mutation.addItems", schema_name=schema_name)
+    async def resolve_mutation_add_items(parent, args, ctx, info):
+        return [
+            f"{item['name']}:{item.get('color')}:{item.get('tags')}"
+            for item in args["items"]
+        ]
+
+    @Resolver("Mutation.addLabel", schema_name=schema_name)
+    async def resolve_mutation_add_label(parent, args, ctx, info):
+        return args["label"]["label"]
+
+    @Resolver("Mutation.addDefault", schema_name=schema_name)
+    async def resolve_mutation_add_default(parent, args, ctx, info):
+        return f"{args['input']}:{args.get('count')}"
+
+    return await create_engine(_SDL, schema_name=schema_name)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,case",
+    enumerate(
+        [
+            (
+                _ADD_ITEMS,
+                {
+                    "items": [
+                        {"name": "a", "color": "RED", "tags": "x"},
+                        {"name": "b", "tags": ["y", "z"]},
+                    ]
+                },
+                {"data": {"addItems": ["a:RED:['x']", "b:None:['y', 'z']"]}},
+            ),
+            (
+                _ADD_ITEMS,
+                {"items": {"name": "a"}},
+                {"data": {"addItems": ["a:None:None"]}},
+            ),
+            (
+                _ADD_ITEMS,
+                {
+                    "items": [
+                        {"name": "a", "color": "BLUE"},
+                        {"tags": [None]},
+                        {"name": "c", "unknown": 1},
+                    ]
+                },
+                {
+                    "data": None,
+                    "errors": [
+                        {
+                            "message": "Variable < $items > got invalid value < [{'name': 'a', 'color': 'BLUE'}, {'tags': [None]}, {'name': 'c', 'unknown': 1}] >; Expected type < Color > at value[0].color.",
+                            "path": None,
+                            "locations": [{"line": 2, "column": 11}],
+                        },
+                        {
+                            "message": "Variable < $items > got invalid value < [{'name': 'a', 'color': 'BLUE'}, {'tags': [None]}, {'name': 'c', 'unknown': 1}] >; Field < value[1].name > of required type < String! > was not provided.",
+                            "path": None,
+                            "locations": [{"line": 2, "column": 11}],
+                        },
+                        {
+                            "message": "Variable < $items > got invalid value < [{'name': 'a', 'color': 'BLUE'}, {'tags': [None]}, {'name': 'c', 'unknown': 1}] >; Expected non-nullable type < String! > not to be null at value[1].tags[0].",
+                            "path": None,
+                            "locations": [{"line": 2, "column": 11}],
+                        },
+                        {
+                            "message": "Variable < $items > got invalid value < [{'name': 'a', 'color': 'BLUE'}, {'tags': [None]}, {'name': 'c', 'unknown': 1}] >; Field < unknown > is not defined by type < ItemInput > at value[2].",
+                            "path": None,
+                            "locations": [{"line": 2, "column": 11}],
+                        },
+                    ],
+                },
+            ),
+            (
+                "mutation ($label: LabelInput) { addLabel(label: $label) }",
+                {"label": {"label": "hello"}},
+                {"data": {"addLabel": "HELLO"}},
+            ),
+            (
+                """
+                mutation ($input: DefaultInput, $count: Int = 3) {
+                  addDefault(input: $input, count: $count)
+                }
+                """,
+                {"input": {}},
+                {"data": {"addDefault": "{'quantity': 1}:3"}},
+            ),
+        ]
+    ),
+)
+async def test_compiled_variables_coercion(ttftt_engine, index, case):
+    query, variables, expected = case
+    assert await ttftt_engine.execute(query, variables=variables) == expected
+
+
+@pytest.mark.asyncio
+async def test_compiled_variables_coercion_cached_per_operation(
+    ttftt_engine,
+):
+    query = """
+    mutation A($items: [ItemInput!]!) { addItems(items: $items) }
+    mutation B($label: LabelInput) { addLabel(label: $label) }
+    """
+
+    assert await ttftt_engine.execute(
+        query,
+        operation_name="A",
+        variables={"items": [{"name": "a"}]},
+    ) == {"data": {"addItems": ["a:None:None"]}}
+    assert await ttftt_engine.execute(
+        query, operation_name="B", variables={"label": {"label": "b"}}
+    ) == {"data": {"addLabel": "B"}}
+
+    document, _ = await ttftt_engine._parse_and_validate_request(query, None)
+    variables_coercers = dict(document.variables_coercers)
+    assert len(variables_coercers) == 2
+
+    assert await ttftt_engine.execute(
+        query,
+        operation_name="A",
+        variables={"items": [{"name": "c"}]},
+    ) == {"data": {"addItems": ["c:None:None"]}}
+    assert document.variables_coercers == variables_coercers
@@ -0,0 +1,315 @@
+import pytest
+
+from tartiflette import ComplexityLimits, Directive, Resolver, create_engine
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+interface Named {
+  name: String
+}
+
+type Item implements Named {
+  id: Int
+  name: String @cost(value: 3)
+  children(first: Int = 5): [Item]
+  related(limit: Int): [Item] @cost(value: 2)
+  tags: [String]
+}
+
+type Query {
+  items(first: Int): [Item]
+  item: Item
+  named: Named
+}
+"""
+
+
+async def _engine(schema_name, **kwargs):
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": 1, "name": "Item #1"}]
+
+    @Resolver("Query.named", schema_name=schema_name)
+    async def resolve_query_named(parent, args, ctx, info):
+        return {"_typename": "Item", "name": "Item #1"}
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+def _too_complex(*messages):
+    return {
+        "data": None,
+        "errors": [
+            {
+                "message": message,
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "QUERY_TOO_COMPLEX"},
+            }
+            for message in messages
+        ],
+    }
+
+
+async def _get_complexity(engine, query, variables=None):
+    from tartiflette.execution.complexity import get_operation_complexity
+    from tartiflette.execution.context import build_execution_context
+
+    document, _ = engine._cached_parse_and_validate_query(
+        query, engine._schema
+    )
+    limits = engine._schema.complexity_limits
+    engine._schema.complexity_limits = None
+    try:
+        execution_context, _ = await build_execution_context(
+            engine._schema, document, None, None, variables, None
+        )
+    finally:
+        engine._schema.complexity_limits = limits
+    return (
+        await get_operation_complexity(
+            execution_context, limits, document.complexities
+        ),
+        document,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,case",
+    enumerate(
+        [
+            ("{ item { id } }", None, (2, 2, 2)),
+            ("{ item { id name __typename } }", None, (2, 3, 5)),
+            # Multipliers from literals, variables & default values
+            ("{ items(first: 10) { id name } }", None, (2, 3, 41)),
+            (
+                "query ($first: Int) { items(first: $first) { id } }",
+                {"first": 7},
+                (2, 2, 8),
+            ),
+            (
+                "query ($first: Int) { items(first: $first) { id } }",
+                None,
+                (2, 2, 2),
+            ),
+            ("{ item { children { id } } }", None, (3, 3, 7)),
+            ("{ item { related(limit: 4) { id } } }", None, (3, 3, 7)),
+            ("{ item { tags } }", None, (2, 2, 2)),
+            (
+                "{ items(first: 2) { children(first: 3) { id } } }",
+                None,
+                (3, 3, 9),
+            ),
+            # Fields merged by response key & fragments expanded once
+            (
+                """
+                {
+                  item { id ...ItemFields ... on Item { id name } }
+                  other: item { id }
+                }
+
+                fragment ItemFields on Item { id name ...ItemFields2 }
+                fragment ItemFields2 on Item { name }
+                """,
+                None,
+                (2, 5, 7),
+            ),
+            (
+                "{ named { name ... on Item { id name } } }",
+                None,
+                (2, 4, 6),
+            ),
+            # Skipped fields aren't taken into account
+            ("{ item { id name @skip(if: true) } }", None, (2, 2, 2)),
+            (
+                "query ($skip: Boolean!) { item { id name @skip(if: $skip) } }",
+                {"skip": False},
+                (2, 3, 5),
+            ),
+        ]
+    ),
+)
+async def test_complexity_analysis(index, case):
+    query, variables, expected = case
+    engine = await _engine(
+        f"test_complexity_analysis_{index}",
+        complexity_limits=ComplexityLimits(),
+    )
+
+    complexity, _ = await _get_complexity(engine, query, variables)
+    assert tuple(complexity) == expected
+
+
+@pytest.mark.asyncio
+async def test_complexity_limits():
+    engine = await _engine(
+        "test_complexity_limits",
+        complexity_limits=ComplexityLimits(
+            max_depth=3, max_field_count=5, max_cost=50
+        ),
+    )
+
+    assert await engine.execute("{ items(first: 10) { id name } }") == {
+        "data": {"items": [{"id": 1, "name": "Item #1"}]}
+    }
+    assert await engine.execute(
+        "{ items(first: 20) { id name } }"
+    ) == _too_complex("Query cost < 81 > exceeds the maximum cost < 50 >.")
+    assert await engine.execute(
+        "{ item { children { children { children { id } } } } }"
+    ) == _too_complex("Query depth < 4 > exceeds the maximum depth < 3 >.")
+    assert await engine.execute(
+        "{ a: item { id } b: item { id } c: item { id } }"
+    ) == _too_complex(
+        "Query field count < 6 > exceeds the maximum field count < 5 >."
+    )
+    assert await engine.execute(
+        "query ($first: Int) { items(first: $first) { id name } }",
+        variables={"first": 100},
+    ) == _too_complex("Query cost < 401 > exceeds the maximum cost < 50 >.")
+
+
+@pytest.mark.asyncio
+async def test_complexity_default_list_multiplier():
+    engine = await _engine(
+        "test_complexity_default_list_multiplier",
+        complexity_limits=ComplexityLimits(
+            max_cost=100, default_list_multiplier=50
+        ),
+    )
+
+    assert await engine.execute("{ items { id } }") == {
+        "data": {"items": [{"id": 1}]}
+    }
+    assert await engine.execute("{ items { id name } }") == _too_complex(
+        "Query cost < 201 > exceeds the maximum cost < 100 >."
+    )
+    assert await engine.execute("{ items(first: 2) { id name } }") == {
+        "data": {"items": [{"id": 1, "name": "Item #1"}]}
+    }
+
+
+@pytest.mark.asyncio
+async def test_complexity_cache():
+    engine = await _engine(
+        "test_complexity_cache", complexity_limits=ComplexityLimits()
+    )
+
+    _, document = await _get_complexity(engine, "{ items(first: 2) { id } }")
+    assert len(document.complexities) == 1
+
+    _, document = await _get_complexity(
+        engine,
+        "query ($first: Int) { items(first: $first) { id } }",
+        {"first": 2},
+    )
+    assert not document.complexities
+
+    _, document = await _get_complexity(
+        engine,
+        "query ($skip: Boolean!) { item { id @skip(if: $skip) } }",
+        {"skip": True},
+    )
+    assert not document.complexities
+
+
+@pytest.mark.asyncio
+async def test_complexity_fragments_spread_several_times():
+    engine = await _engine(
+        "test_complexity_fragments_spread_several_times",
+        complexity_limits=ComplexityLimits(max_cost=10),
+    )
+
+    levels = 40
+    query = "{ item { ...F0 } }" + "".join(
+        f"""
+        fragment F{level} on Item {{
+          a: related(limit: 1) {{ ...F{level + 1} }}
+          b: related(limit: 1) {{ ...F{level + 1} }}
+        }}
+        """
+        for level in range(levels)
+    )
+    query += f"fragment F{levels} on Item {{ id }}"
+
+    cost = 1
+    for _ in range(levels):
+        cost = 2 * (2 + cost)
+    complexity, _ = await _get_complexity(engine, query)
+    assert complexity == (levels + 2, 3 * 2**levels - 1, cost + 1)
+    assert await engine.execute(query) == _too_complex(
+        f"Query cost < {cost + 1} > exceeds the maximum cost < 10 >."
+    )
+
+
+@pytest.mark.asyncio
+async def test_complexity_mutation():
+    schema_name = "test_complexity_mutation"
+
+    @Resolver("Mutation.addItems", schema_name=schema_name)
+    async def resolve_mutation_add_items(parent, args, ctx, info):
+        return [{"id": 1}]
+
+    engine = await create_engine(
+        """
+        type Item { id: Int }
+        type Query { item: Item }
+        type Mutation { addItems(first: Int!): [Item] @cost(value: 10) }
+        """,
+        schema_name=schema_name,
+        complexity_limits=ComplexityLimits(max_cost=20),
+    )
+
+    assert await engine.execute("mutation { addItems(first: 10) { id } }") == {
+        "data": {"addItems": [{"id": 1}]}
+    }
+    assert await engine.execute(
+        "mutation { addItems(first: 11) { id } }"
+    ) == _too_complex("Query cost < 21 > exceeds the maximum cost < 20 >.")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_depth": 0},
+        {"max_field_count": -1},
+        {"max_cost": "10"},
+        {"default_list_multiplier": 0},
+    ],
+)
+def test_complexity_limits_invalid(kwargs):
+    with pytest.raises(ValueError):
+        ComplexityLimits(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_complexity_limits_improperly_configured():
+    with pytest.raises(ImproperlyConfigured):
+        await _engine(
+            "test_complexity_limits_improperly_configured",
+            complexity_limits={"max_depth": 10},
+        )
+
+
+@pytest.mark.asyncio
+async def test_complexity_custom_cost_directive():
+    schema_name = "test_complexity_custom_cost_directive"
+
+    @Directive("cost", schema_name=schema_name)
+    class CostDirective:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            return directive_args["weight"]
+
+    engine = await create_engine(
+        """
+        directive @cost(weight: String!) on FIELD_DEFINITION
+        type Query { item: String @cost(weight: "heavy") }
+        """,
+        schema_name=schema_name,
+    )
+
+    assert await engine.execute("{ item }") == {"data": {"item": "heavy"}}
@@ -0,0 +1,256 @@
+import asyncio
+import os
+
+import pytest
+
+import tartiflette.execution.collect
+
+from tartiflette import DocumentCache, Resolver, create_engine
+from tartiflette.execution.collect import parse_and_validate_query
+from tartiflette.execution.document_cache import estimate_document_size
+
+_SDL = """
+type Query {
+  hello(name: String): String
+}
+"""
+
+
+async def _engine(schema_name, document_cache):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello " + args.get("name", "world")
+
+    return await create_engine(
+        _SDL, schema_name=schema_name, query_cache_decorator=document_cache
+    )
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    parse_to_document = tartiflette.execution.collect.parse_to_document
+
+    def counted_parse_to_document(query, schema):
+        calls.append(query)
+        return parse_to_document(query, schema)
+
+    monkeypatch.setattr(
+        tartiflette.execution.collect,
+        "parse_to_document",
+        counted_parse_to_document,
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_document_cache_counters(parse_calls):
+    document_cache = DocumentCache(max_entries=2)
+    engine = await _engine("test_document_cache_counters", document_cache)
+
+    assert await engine.execute("{ hello }") == {
+        "data": {"hello": "Hello world"}
+    }
+    assert await engine.execute("{ hello }") == {
+        "data": {"hello": "Hello world"}
+    }
+    assert await engine.execute(b'{ hello(name: "bytes") }') == {
+        "data": {"hello": "Hello bytes"}
+    }
+    assert await engine.execute('{ hello(name: "bytes") }') == {
+        "data": {"hello": "Hello bytes"}
+    }
+    assert len(parse_calls) == 2
+
+    cache_info = document_cache.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 2
+    assert cache_info.evictions == 0
+    assert cache_info.entries == 2
+
+    assert await engine.execute('{ hello(name: "third") }') == {
+        "data": {"hello": "Hello third"}
+    }
+    assert await engine.execute("{ hello }") == {
+        "data": {"hello": "Hello world"}
+    }
+    assert len(parse_calls) == 4
+
+    cache_info = document_cache.cache_info()
+    assert cache_info.misses == 4
+    assert cache_info.evictions == 2
+    assert cache_info.entries == 2
+
+
+@pytest.mark.asyncio
+async def test_document_cache_caches_errors(parse_calls):
+    document_cache = DocumentCache()
+    engine = await _engine("test_document_cache_caches_errors", document_cache)
+
+    for _ in range(2):
+        assert await engine.execute("{ unknownField }") == {
+            "data": None,
+            "errors": [
+                {
+                    "message": "Field unknownField doesn't exist on Query",
+                    "path": ["unknownField"],
+                    "locations": [{"line": 1, "column": 3}],
+                    "extensions": {
+                        "spec": "June 2018",
+                        "rule": "5.3.1",
+                        "tag": "field-selections-on-objects-interfaces-and-unions-types",
+                        "details": "https://graphql.github.io/graphql-spec/June2018/#sec-Field-Selections-on-Objects-Interfaces-and-Unions-Types",
+                    },
+                }
+            ],
+        }
+    assert len(parse_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_document_cache_max_size():
+    schema_name = "test_document_cache_max_size"
+    engine = await _engine(schema_name, None)
+    small_document, _ = parse_and_validate_query("{ hello }", engine._schema)
+    large_document, _ = parse_and_validate_query(
+        '{ a: hello(name: "a") b: hello(name: "b") c: hello(name: "c") }',
+        engine._schema,
+    )
+    small_size = estimate_document_size(small_document)
+    large_size = estimate_document_size(large_document)
+    assert small_size < large_size
+
+    document_cache = DocumentCache(
+        max_entries=None, max_size=small_size + large_size
+    )
+    document_cache(parse_and_validate_query)
+
+    document_cache.get("{ hello }", engine._schema)
+    document_cache.get(
+        '{ a: hello(name: "a") b: hello(name: "b") c: hello(name: "c") }',
+        engine._schema,
+    )
+    assert document_cache.cache_info().entries == 2
+    assert document_cache.cache_info().size == small_size + large_size
+
+    document_cache.get("{ hello }", engine._schema)
+    document_cache.get("{ alias: hello }", engine._schema)
+    cache_info = document_cache.cache_info()
+    assert cache_info.evictions == 1
+    assert cache_info.entries == 2
+    assert cache_info.size <= small_size + large_size
+
+    document_cache.get("{ hello }", engine._schema)
+    assert document_cache.cache_info().hits == 2
+
+
+@pytest.mark.parametrize("max_entries", [0, -1, "1"])
+def test_document_cache_invalid_limit(max_entries):
+    with pytest.raises(ValueError, match="max_entries"):
+        DocumentCache(max_entries=max_entries)
+
+
+@pytest.mark.asyncio
+async def test_document_cache_disk_path(tmp_path, parse_calls):
+    schema_name = "test_document_cache_disk_path"
+    disk_path = str(tmp_path)
+
+    document_cache = DocumentCache(disk_path=disk_path)
+    engine = await _engine(schema_name, document_cache)
+    assert await engine.execute("{ hello }") == {
+        "data": {"hello": "Hello world"}
+    }
+    assert await engine.execute("{ unknownField }") != {}
+    await asyncio.gather(*document_cache._pending_writes)
+
+    schema_directory = os.path.join(
+        disk_path, schema_name, engine._schema.sdl_hash
+    )
+    assert os.listdir(schema_directory) == [
+        DocumentCache.get_digest("{ hello }") + ".graphql"
+    ]
+
+    # Simulates a fresh process cooking the same schema
+    warm_schema_name = f"{schema_name}_warm"
+    os.rename(
+        os.path.join(disk_path, schema_name),
+        os.path.join(disk_path, warm_schema_name),
+    )
+
+    del parse_calls[:]
+    warm_document_cache = DocumentCache(disk_path=disk_path)
+    warm_engine = await _engine(warm_schema_name, warm_document_cache)
+    assert parse_calls == [b"{ hello }"]
+    assert warm_document_cache.cache_info().entries == 1
+
+    assert await warm_engine.execute("{ hello }") == {
+        "data": {"hello": "Hello world"}
+    }
+    assert len(parse_calls) == 1
+    assert warm_document_cache.cache_info().hits == 1
+    assert warm_document_cache.cache_info().misses == 0
+
+
+@pytest.mark.asyncio
+async def test_document_cache_disk_path_schema_changed(tmp_path, parse_calls):
+    schema_name = "test_document_cache_disk_path_schema_changed"
+    disk_path = str(tmp_path)
+
+    document_cache = DocumentCache(disk_path=disk_path)
+    engine = await _engine(schema_name, document_cache)
+    await engine.execute("{ hello }")
+    await asyncio.gather(*document_cache._pending_writes)
+
+    # Simulates a fresh process cooking a new version of the schema
+    changed_schema_name = f"{schema_name}_changed"
+    os.rename(
+        os.path.join(disk_path, schema_name),
+        os.path.join(disk_path, changed_schema_name),
+    )
+
+    del parse_calls[:]
+    changed_document_cache = DocumentCache(disk_path=disk_path)
+    changed_engine = await create_engine(
+        "type Query { hello: Int }",
+        schema_name=changed_schema_name,
+        query_cache_decorator=changed_document_cache,
+    )
+    assert changed_engine._schema.sdl_hash != engine._schema.sdl_hash
+    assert parse_calls == []
+    assert changed_document_cache.cache_info().entries == 0
+
+
+@pytest.mark.asyncio
+async def test_document_cache_disk_path_bounded(tmp_path):
+    schema_name = "test_document_cache_disk_path_bounded"
+    disk_path = str(tmp_path)
+
+    document_cache = DocumentCache(max_entries=2, disk_path=disk_path)
+    engine = await _engine(schema_name, document_cache)
+    queries = [f'{{ hello(name: "{index}") }}' for index in range(4)]
+    for query in queries:
+        await engine.execute(query)
+        await asyncio.gather(*document_cache._pending_writes)
+
+    schema_directory = os.path.join(
+        disk_path, schema_name, engine._schema.sdl_hash
+    )
+    assert sorted(os.listdir(schema_directory)) == sorted(
+        DocumentCache.get_digest(query) + ".graphql" for query in queries[2:]
+    )
+
+    # Queries persisted beyond the limits are pruned when warmed
+    for query in queries[:2]:
+        with open(
+            os.path.join(
+                schema_directory,
+                DocumentCache.get_digest(query) + ".graphql",
+            ),
+            "w",
+        ) as query_file:
+            query_file.write(query)
+
+    warm_document_cache = DocumentCache(max_entries=2, disk_path=disk_path)
+    await _engine(f"{schema_name}_warm", warm_document_cache)
+    assert warm_document_cache.warm(engine._schema) == 2
+    assert len(os.listdir(schema_directory)) == 2
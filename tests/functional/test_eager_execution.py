@@ -0,0 +1,228 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Node {
+  id: Int!
+  name: String
+  nonNullFailing: String!
+  failing: String
+  delayed: String
+  children: [Node]
+  loaded: String
+}
+
+type Query {
+  nodes: [Node]
+  node: Node
+}
+"""
+
+_QUERY = """
+{
+  node { id name delayed children { id loaded } }
+  nodes {
+    id
+    name
+    failing
+    delayed
+    loaded
+    children { id name children { id name delayed } }
+  }
+}
+"""
+
+
+def _build_node(identifier, depth):
+    return {
+        "id": identifier,
+        "name": f"Node #{identifier}",
+        "children": [
+            _build_node(identifier * 10 + index, depth - 1)
+            for index in range(3)
+        ]
+        if depth
+        else [],
+    }
+
+
+async def _engine(schema_name, batch_calls, **kwargs):
+    async def load_names(ids):
+        await asyncio.sleep(0)
+        batch_calls.append(ids)
+        return [f"Loaded #{node_id}" for node_id in ids]
+
+    @Resolver("Query.nodes", schema_name=schema_name)
+    async def resolve_query_nodes(parent, args, ctx, info):
+        return [_build_node(identifier, 2) for identifier in range(1, 4)]
+
+    @Resolver("Query.node", schema_name=schema_name)
+    async def resolve_query_node(parent, args, ctx, info):
+        return _build_node(0, 1)
+
+    @Resolver("Node.name", schema_name=schema_name)
+    async def resolve_node_name(parent, args, ctx, info):
+        return parent["name"]
+
+    @Resolver("Node.nonNullFailing", schema_name=schema_name)
+    async def resolve_node_non_null_failing(parent, args, ctx, info):
+        raise ValueError(f"Non null #{parent['id']}")
+
+    @Resolver("Node.failing", schema_name=schema_name)
+    async def resolve_node_failing(parent, args, ctx, info):
+        if parent["id"] % 2:
+            raise ValueError(f"Failing #{parent['id']}")
+        return "ok"
+
+    @Resolver("Node.delayed", schema_name=schema_name)
+    async def resolve_node_delayed(parent, args, ctx, info):
+        await asyncio.sleep(0.001 * (parent["id"] % 3))
+        return f"Delayed #{parent['id']}"
+
+    @Resolver("Node.loaded", schema_name=schema_name)
+    async def resolve_node_loaded(parent, args, ctx, info):
+        return await info.get_loader(load_names).load(parent["id"] % 4)
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,query",
+    enumerate(
+        [
+            _QUERY,
+            "{ nodes { id children { id nonNullFailing } } }",
+            "{ node { id children { nonNullFailing } } }",
+        ]
+    ),
+)
+async def test_eager_execution_same_results(index, query):
+    default_batch_calls = []
+    default_engine = await _engine(
+        f"test_eager_execution_same_results_default_{index}",
+        default_batch_calls,
+    )
+    eager_batch_calls = []
+    eager_engine = await _engine(
+        f"test_eager_execution_same_results_eager_{index}",
+        eager_batch_calls,
+        eager_execution=True,
+    )
+
+    eager_result = await eager_engine.execute(query)
+    assert eager_result == await default_engine.execute(query)
+    assert sorted(map(sorted, eager_batch_calls)) == sorted(
+        map(sorted, default_batch_calls)
+    )
+
+
+@pytest.mark.asyncio
+async def test_eager_execution_errors():
+    engine = await _engine(
+        "test_eager_execution_errors", [], eager_execution=True
+    )
+
+    assert await engine.execute(
+        "{ node { id failing children { id failing } } }"
+    ) == {
+        "data": {
+            "node": {
+                "id": 0,
+                "failing": "ok",
+                "children": [
+                    {"id": 0, "failing": "ok"},
+                    {"id": 1, "failing": None},
+                    {"id": 2, "failing": "ok"},
+                ],
+            }
+        },
+        "errors": [
+            {
+                "message": "Failing #1",
+                "path": ["node", "children", 1, "failing"],
+                "locations": [{"line": 1, "column": 35}],
+            }
+        ],
+    }
+
+    assert await engine.execute("{ node { id nonNullFailing } }") == {
+        "data": {"node": None},
+        "errors": [
+            {
+                "message": "Non null #0",
+                "path": ["node", "nonNullFailing"],
+                "locations": [{"line": 1, "column": 13}],
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not hasattr(asyncio, "timeout"), reason="requires asyncio.timeout"
+)
+async def test_eager_execution_resolver_cancel_scope():
+    schema_name = "test_eager_execution_resolver_cancel_scope"
+
+    @Resolver("Query.node", schema_name=schema_name)
+    async def resolve_query_node(parent, args, ctx, info):
+        try:
+            async with asyncio.timeout(0.01):
+                await asyncio.sleep(10)
+        except TimeoutError:
+            return {"id": 0, "name": "timeout"}
+        return {"id": 0, "name": "node"}
+
+    @Resolver("Query.nodes", schema_name=schema_name)
+    async def resolve_query_nodes(parent, args, ctx, info):
+        await asyncio.sleep(0.05)
+        return [{"id": 1, "name": "slow"}]
+
+    engine = await create_engine(
+        _SDL, schema_name=schema_name, eager_execution=True
+    )
+
+    assert await engine.execute("{ node { name } nodes { name } }") == {
+        "data": {"node": {"name": "timeout"}, "nodes": [{"name": "slow"}]}
+    }
+
+
+@pytest.mark.asyncio
+async def test_eager_execution_shared_futures():
+    batch_calls = []
+    engine = await _engine(
+        "test_eager_execution_shared_futures",
+        batch_calls,
+        eager_execution=True,
+        coerce_list_concurrently=True,
+    )
+
+    assert await engine.execute("{ nodes { id loaded } }") == {
+        "data": {
+            "nodes": [
+                {"id": 1, "loaded": "Loaded #1"},
+                {"id": 2, "loaded": "Loaded #2"},
+                {"id": 3, "loaded": "Loaded #3"},
+            ]
+        }
+    }
+    assert batch_calls == [[1, 2, 3]]
+
+    # Siblings awaiting the same pending future
+    del batch_calls[:]
+    result = await engine.execute("{ nodes { children { id loaded } } }")
+    assert "errors" not in result
+    assert [
+        child["loaded"]
+        for node in result["data"]["nodes"]
+        for child in node["children"]
+    ] == [
+        f"Loaded #{(node_id * 10 + index) % 4}"
+        for node_id in range(1, 4)
+        for index in range(3)
+    ]
+    assert batch_calls == [[2, 3, 0, 1]]
@@ -2,7 +2,7 @@ import os
 
 import pytest
 
-from tartiflette import create_engine
+from tartiflette import Engine, create_engine
 from tartiflette.schema.registry import SchemaRegistry
 
 _curr_path = os.path.dirname(os.path.abspath(__file__))
@@ -182,3 +182,30 @@ async def test_tartiflette_engine_initialization_with_string_schema():
         .find_field("blogs")
         is not None
     )
+
+
+@pytest.mark.asyncio
+async def test_tartiflette_engine_options_overridden_when_cooking():
+    engine = Engine(
+        "type Query { hello: String }",
+        schema_name="test_tartiflette_engine_options_overridden_when_cooking",
+        execution_timeout=1,
+        eager_execution=True,
+    )
+    await engine.cook(execution_timeout=2, eager_execution=None)
+
+    assert engine._schema.execution_timeout == 2
+    assert engine._schema.eager_execution is True
+
+
+@pytest.mark.asyncio
+async def test_tartiflette_engine_unknown_option():
+    with pytest.raises(TypeError):
+        Engine(unknown_option=True)
+
+    with pytest.raises(TypeError):
+        await create_engine(
+            "type Query { hello: String }",
+            schema_name="test_tartiflette_engine_unknown_option",
+            unknown_option=True,
+        )
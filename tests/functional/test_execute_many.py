@@ -0,0 +1,179 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type User {
+  id: Int!
+  name: String
+}
+
+type Query {
+  user(id: Int!): User
+  counter: Int @memoize
+}
+
+type Mutation {
+  rename(id: Int!, name: String!): User
+}
+"""
+
+_USERS = {1: {"id": 1, "name": "Alice"}, 2: {"id": 2, "name": "Bob"}}
+
+_USER_QUERY = "query ($id: Int!) { user(id: $id) { id name } }"
+
+
+async def _engine(schema_name, calls):
+    async def load_users(ids):
+        calls.append(("users", ids))
+        return [_USERS.get(user_id) for user_id in ids]
+
+    @Resolver("Query.user", schema_name=schema_name)
+    async def resolve_query_user(parent, args, ctx, info):
+        return await info.get_loader(load_users).load(args["id"])
+
+    @Resolver("Query.counter", schema_name=schema_name)
+    async def resolve_query_counter(parent, args, ctx, info):
+        calls.append(("counter", ctx["request"]))
+        return sum(call[0] == "counter" for call in calls)
+
+    @Resolver("Mutation.rename", schema_name=schema_name)
+    async def resolve_mutation_rename(parent, args, ctx, info):
+        return {"id": args["id"], "name": args["name"]}
+
+    return await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        modules=["tartiflette.directive.builtins.memoize"],
+    )
+
+
+def _loaded_user_ids(calls):
+    return sorted(
+        user_id for name, ids in calls if name == "users" for user_id in ids
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_many():
+    calls = []
+    engine = await _engine("test_execute_many", calls)
+
+    assert await engine.execute_many(
+        [
+            (_USER_QUERY, {"id": 1}, None),
+            (
+                'mutation { rename(id: 2, name: "Robert") { name } }',
+                None,
+                None,
+            ),
+            (_USER_QUERY.encode("utf-8"), {"id": 2}, None),
+            (bytearray(_USER_QUERY.encode("utf-8")), {"id": 3}, None),
+            ("query A { user(id: 1) { id } } query B { counter }", {}, "A"),
+            ("{ unknown }", None, None),
+        ],
+        context={"request": 1},
+    ) == [
+        {"data": {"user": {"id": 1, "name": "Alice"}}},
+        {"data": {"rename": {"name": "Robert"}}},
+        {"data": {"user": {"id": 2, "name": "Bob"}}},
+        {"data": {"user": None}},
+        {"data": {"user": {"id": 1}}},
+        {
+            "data": None,
+            "errors": [
+                {
+                    "message": "Field unknown doesn't exist on Query",
+                    "path": ["unknown"],
+                    "locations": [{"line": 1, "column": 3}],
+                    "extensions": {
+                        "spec": "June 2018",
+                        "rule": "5.3.1",
+                        "tag": "field-selections-on-objects-interfaces-and-unions-types",
+                        "details": "https://graphql.github.io/graphql-spec/June2018/#sec-Field-Selections-on-Objects-Interfaces-and-Unions-Types",
+                    },
+                }
+            ],
+        },
+    ]
+
+    # Each distinct query is looked up once in the document cache
+    cache_info = engine._cached_parse_and_validate_query.cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 4)
+    # Loaders are scoped to each operation by default
+    assert sorted(calls) == [
+        ("users", [1]),
+        ("users", [1]),
+        ("users", [2]),
+        ("users", [3]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_share_caches():
+    calls = []
+    engine = await _engine("test_execute_many_share_caches", calls)
+
+    requests = [
+        (_USER_QUERY, {"id": 1}, None),
+        (_USER_QUERY, {"id": 2}, None),
+        ("{ user(id: 1) { name } counter }", None, None),
+        ("{ counter }", None, None),
+    ]
+
+    assert await engine.execute_many(
+        requests, context={"request": 1}, share_caches=True
+    ) == [
+        {"data": {"user": {"id": 1, "name": "Alice"}}},
+        {"data": {"user": {"id": 2, "name": "Bob"}}},
+        {"data": {"user": {"name": "Alice"}, "counter": 1}},
+        {"data": {"counter": 1}},
+    ]
+    # Each user is loaded once by the loader shared by the operations
+    assert _loaded_user_ids(calls) == [1, 2]
+    assert calls.count(("counter", 1)) == 1
+
+    # Caches aren't shared across batches
+    assert await engine.execute_many(
+        requests[2:], context={"request": 2}, share_caches=True
+    ) == [
+        {"data": {"user": {"name": "Alice"}, "counter": 2}},
+        {"data": {"counter": 2}},
+    ]
+    assert _loaded_user_ids(calls) == [1, 1, 2]
+    assert calls.count(("counter", 2)) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("share_caches", [False, True])
+async def test_execute_many_batch_resolvers_variables(share_caches):
+    schema_name = f"test_execute_many_batch_resolvers_variables_{share_caches}"
+    calls = []
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [{"id": 1}, {"id": 2}]
+
+    @Resolver("Item.value", schema_name=schema_name, batch=True)
+    async def resolve_item_value(parents, args, ctx, info):
+        calls.append((len(parents), args["mult"]))
+        return [parent["id"] * args["mult"] for parent in parents]
+
+    engine = await create_engine(
+        """
+        type Item { value(mult: Int): Int }
+        type Query { items: [Item] }
+        """,
+        schema_name=schema_name,
+        coerce_list_concurrently=True,
+    )
+
+    query = "query Q($m: Int) { items { value(mult: $m) } }"
+    assert await engine.execute_many(
+        [(query, {"m": 10}, None), (query, {"m": 100}, None)],
+        share_caches=share_caches,
+    ) == [
+        {"data": {"items": [{"value": 10}, {"value": 20}]}},
+        {"data": {"items": [{"value": 100}, {"value": 200}]}},
+    ]
+    assert sorted(calls) == [(2, 10), (2, 100)]
@@ -0,0 +1,199 @@
+import asyncio
+import json
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+
+_SDL = """
+type Item {
+  id: Int!
+  name: String
+  failing: String
+}
+
+type Query {
+  items(count: Int!): [Item]
+  hello: String!
+  failing: String
+  nonNullFailing: String!
+  waiting: String
+}
+
+type Mutation {
+  addItem(name: String!): Item
+}
+"""
+
+
+async def _engine(schema_name, events=None, **kwargs):
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return [
+            {"id": index, "name": f"Ïtem #{index}"}
+            for index in range(args["count"])
+        ]
+
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "world"
+
+    @Resolver("Query.failing", schema_name=schema_name)
+    @Resolver("Item.failing", schema_name=schema_name)
+    async def resolve_failing(parent, args, ctx, info):
+        raise ValueError("Failing")
+
+    @Resolver("Query.nonNullFailing", schema_name=schema_name)
+    async def resolve_query_non_null_failing(parent, args, ctx, info):
+        raise ValueError("Non null failing")
+
+    @Resolver("Query.waiting", schema_name=schema_name)
+    async def resolve_query_waiting(parent, args, ctx, info):
+        await events["first_chunk"].wait()
+        return "done"
+
+    @Resolver("Mutation.addItem", schema_name=schema_name)
+    async def resolve_mutation_add_item(parent, args, ctx, info):
+        return {"id": 1, "name": args["name"]}
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine():
+    return await _engine("test_execute_stream")
+
+
+async def _stream(engine, query, **kwargs):
+    return [chunk async for chunk in engine.execute_stream(query, **kwargs)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query,variables",
+    [
+        ("{ hello items(count: 3) { id name } }", None),
+        ("{ items(count: 1000) { id name failing } hello failing }", None),
+        ("{ items(count: 2) { id } nonNullFailing failing }", None),
+        ("{ hello @skip(if: true) }", None),
+        ("{ unknownField }", None),
+        ("query ($count: Int!) { items(count: $count) { id } }", {}),
+        (
+            "query ($count: Int!) { items(count: $count) { id } }",
+            {"count": 120},
+        ),
+        ('mutation { addItem(name: "New") { id name } }', None),
+    ],
+)
+async def test_execute_stream_same_response(ttftt_engine, query, variables):
+    chunks = await _stream(
+        ttftt_engine, query, variables=variables, chunk_size=256
+    )
+
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert all(len(chunk) >= 256 for chunk in chunks[:-1])
+    assert json.loads(b"".join(chunks).decode("utf-8")) == json.loads(
+        json.dumps(await ttftt_engine.execute(query, variables=variables))
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_chunks(ttftt_engine):
+    query = "{ items(count: 1000) { id name } }"
+
+    chunks = await _stream(ttftt_engine, query, chunk_size=1024)
+    assert len(chunks) > 10
+    assert json.loads(b"".join(chunks)) == await ttftt_engine.execute(query)
+
+    chunks = await _stream(ttftt_engine, query)
+    assert len(chunks) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_incremental():
+    events = {}
+    engine = await _engine("test_execute_stream_incremental", events)
+    events["first_chunk"] = asyncio.Event()
+
+    chunks = []
+    async for chunk in engine.execute_stream(
+        "{ hello items(count: 500) { id } waiting }", chunk_size=1
+    ):
+        chunks.append(chunk)
+        events["first_chunk"].set()
+
+    # The first root fields are yielded before the last one is completed
+    assert chunks[0] == b'{"data":{"hello":'
+    assert json.loads(b"".join(chunks)) == {
+        "data": {
+            "hello": "world",
+            "items": [{"id": index} for index in range(500)],
+            "waiting": "done",
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_schema_execution_directive():
+    schema_name = "test_execute_stream_schema_execution_directive"
+
+    @Directive("addExtensions", schema_name=schema_name)
+    class AddExtensionsDirective:
+        @staticmethod
+        async def on_schema_execution(
+            directive_args, next_directive, schema, document, *args
+        ):
+            results = await next_directive(schema, document, *args)
+            results["extensions"] = {"streamed": False}
+            return results
+
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "world"
+
+    engine = await create_engine(
+        """
+        directive @addExtensions on SCHEMA
+
+        type Query {
+          hello: String
+        }
+
+        schema @addExtensions {
+          query: Query
+        }
+        """,
+        schema_name=schema_name,
+    )
+
+    assert json.loads(b"".join(await _stream(engine, "{ hello }"))) == {
+        "data": {"hello": "world"},
+        "extensions": {"streamed": False},
+    }
+
+
+@pytest.mark.asyncio
+async def test_execute_stream_json_codecs():
+    loaded_types = []
+    encoded_values = []
+
+    def json_loader(value):
+        loaded_types.append(type(value))
+        return json.loads(value)
+
+    def json_encoder(value):
+        encoded_values.append(value)
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+    engine = await _engine(
+        "test_execute_stream_json_codecs",
+        json_loader=json_loader,
+        json_encoder=json_encoder,
+    )
+
+    query = "{ hello items(count: 150) { id name } }"
+    chunks = await _stream(engine, query)
+    assert loaded_types == [bytes]
+    assert encoded_values
+    assert json.loads(b"".join(chunks)) == await engine.execute(query)
+    assert "Ïtem #149".encode("utf-8") in b"".join(chunks)
@@ -0,0 +1,161 @@
+import pytest
+
+import tartiflette.execution.plan
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+interface Named {
+  name: String
+}
+
+type Dog implements Named {
+  name: String
+  barkVolume: Int
+}
+
+type Cat implements Named {
+  name: String
+  meowVolume: Int
+}
+
+type Query {
+  pets: [Named]
+}
+"""
+
+_PETS = [
+    {"_typename": "Dog", "name": "Dog#1", "barkVolume": 1},
+    {"_typename": "Cat", "name": "Cat#1", "meowVolume": 2},
+    {"_typename": "Dog", "name": "Dog#2", "barkVolume": 3},
+    {"_typename": "Cat", "name": "Cat#2", "meowVolume": 4},
+]
+
+
+@pytest.fixture(scope="module")
+async def ttftt_engine():
+    @Resolver("Query.pets", schema_name="test_execution_plans")
+    async def resolve_query_pets(parent, args, ctx, info):
+        return _PETS
+
+    return await create_engine(_SDL, schema_name="test_execution_plans")
+
+
+@pytest.fixture
+def collect_subfields_calls(monkeypatch):
+    calls = []
+    collect_subfields = tartiflette.execution.plan.collect_subfields
+
+    async def counted_collect_subfields(*args, **kwargs):
+        calls.append(args[1].name)
+        return await collect_subfields(*args, **kwargs)
+
+    monkeypatch.setattr(
+        tartiflette.execution.plan,
+        "collect_subfields",
+        counted_collect_subfields,
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_execution_plans_are_cached_per_runtime_type(
+    ttftt_engine, collect_subfields_calls
+):
+    query = """
+    query {
+      pets {
+        name
+        ... on Dog { barkVolume }
+        ...CatFields
+      }
+    }
+
+    fragment CatFields on Cat { meowVolume }
+    """
+
+    expected = {
+        "data": {
+            "pets": [
+                {"name": "Dog#1", "barkVolume": 1},
+                {"name": "Cat#1", "meowVolume": 2},
+                {"name": "Dog#2", "barkVolume": 3},
+                {"name": "Cat#2", "meowVolume": 4},
+            ]
+        }
+    }
+
+    assert await ttftt_engine.execute(query) == expected
+    assert sorted(collect_subfields_calls) == ["Cat", "Dog"]
+
+    assert await ttftt_engine.execute(query) == expected
+    assert sorted(collect_subfields_calls) == ["Cat", "Dog"]
+
+
+@pytest.mark.asyncio
+async def test_execution_plans_with_variable_directives_are_cached_per_request(
+    ttftt_engine, collect_subfields_calls
+):
+    query = """
+    query ($withName: Boolean!) {
+      pets {
+        name @include(if: $withName)
+        __typename
+      }
+    }
+    """
+
+    assert await ttftt_engine.execute(query, variables={"withName": True}) == {
+        "data": {
+            "pets": [
+                {"name": "Dog#1", "__typename": "Dog"},
+                {"name": "Cat#1", "__typename": "Cat"},
+                {"name": "Dog#2", "__typename": "Dog"},
+                {"name": "Cat#2", "__typename": "Cat"},
+            ]
+        }
+    }
+    assert sorted(collect_subfields_calls) == ["Cat", "Dog"]
+
+    assert await ttftt_engine.execute(
+        query, variables={"withName": False}
+    ) == {
+        "data": {
+            "pets": [
+                {"__typename": "Dog"},
+                {"__typename": "Cat"},
+                {"__typename": "Dog"},
+                {"__typename": "Cat"},
+            ]
+        }
+    }
+    assert sorted(collect_subfields_calls) == ["Cat", "Cat", "Dog", "Dog"]
+
+
+@pytest.mark.asyncio
+async def test_execution_plans_with_literal_directives_are_cached(
+    ttftt_engine, collect_subfields_calls
+):
+    query = """
+    query {
+      pets {
+        name @skip(if: true)
+        __typename
+      }
+    }
+    """
+
+    expected = {
+        "data": {
+            "pets": [
+                {"__typename": "Dog"},
+                {"__typename": "Cat"},
+                {"__typename": "Dog"},
+                {"__typename": "Cat"},
+            ]
+        }
+    }
+
+    assert await ttftt_engine.execute(query) == expected
+    assert await ttftt_engine.execute(query) == expected
+    assert sorted(collect_subfields_calls) == ["Cat", "Dog"]
@@ -0,0 +1,216 @@
+import asyncio
+import time
+
+import pytest
+
+from tartiflette import Resolver, create_engine
+from tartiflette.execution.deadline import ExecutionDeadline
+from tartiflette.types.exceptions.tartiflette import (
+    ExecutionDeadlineExceeded,
+    ImproperlyConfigured,
+)
+
+_SDL = """
+type Item {
+  id: Int
+  name: String
+}
+
+type Query {
+  fast: String
+  slow: String
+  slowNonNull: String!
+  blocking: Item
+  items: [Item]
+}
+"""
+
+
+def _deadline_error(path, line, column):
+    return {
+        "message": "Execution deadline exceeded.",
+        "path": path,
+        "locations": [{"line": line, "column": column}],
+        "extensions": {"code": "DEADLINE_EXCEEDED"},
+    }
+
+
+async def _engine(schema_name, calls, **kwargs):
+    @Resolver("Query.fast", schema_name=schema_name)
+    async def resolve_query_fast(parent, args, ctx, info):
+        return "fast"
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    @Resolver("Query.slowNonNull", schema_name=schema_name)
+    async def resolve_query_slow(parent, args, ctx, info):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            calls.append("cancelled")
+            raise
+        return "slow"
+
+    @Resolver("Query.blocking", schema_name=schema_name)
+    async def resolve_query_blocking(parent, args, ctx, info):
+        time.sleep(0.02)
+        return {"id": 1}
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        time.sleep(0.02)
+        return [{"id": index} for index in range(3)]
+
+    @Resolver("Item.name", schema_name=schema_name)
+    async def resolve_item_name(parent, args, ctx, info):
+        calls.append("name")
+        return f"Item #{parent['id']}"
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("eager_execution", [False, True])
+async def test_execution_timeout_cancels_resolvers(eager_execution):
+    calls = []
+    engine = await _engine(
+        f"test_execution_timeout_cancels_resolvers_{eager_execution}",
+        calls,
+        execution_timeout=0.05,
+        eager_execution=eager_execution,
+    )
+
+    started_at = time.monotonic()
+    assert await engine.execute("{ fast slow }") == {
+        "data": {"fast": "fast", "slow": None},
+        "errors": [_deadline_error(["slow"], 1, 8)],
+    }
+    assert time.monotonic() - started_at < 1
+    assert calls == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_execution_timeout_non_null_field():
+    calls = []
+    engine = await _engine(
+        "test_execution_timeout_non_null_field",
+        calls,
+        execution_timeout=0.05,
+    )
+
+    assert await engine.execute("{ fast slowNonNull }") == {
+        "data": None,
+        "errors": [_deadline_error(["slowNonNull"], 1, 8)],
+    }
+    assert calls == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_execution_timeout_stops_scheduling_resolvers():
+    calls = []
+    engine = await _engine(
+        "test_execution_timeout_stops_scheduling_resolvers",
+        calls,
+        execution_timeout=0.01,
+    )
+
+    assert await engine.execute("{ blocking { id name } }") == {
+        "data": {"blocking": {"id": 1, "name": None}},
+        "errors": [_deadline_error(["blocking", "name"], 1, 17)],
+    }
+    assert await engine.execute("{ items { id name } }") == {
+        "data": {"items": None},
+        "errors": [_deadline_error(["items"], 1, 3)],
+    }
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_execution_timeout_not_exceeded():
+    calls = []
+    engine = await _engine(
+        "test_execution_timeout_not_exceeded", calls, execution_timeout=1
+    )
+
+    assert await engine.execute("{ fast items { id name } }") == {
+        "data": {
+            "fast": "fast",
+            "items": [
+                {"id": 0, "name": "Item #0"},
+                {"id": 1, "name": "Item #1"},
+                {"id": 2, "name": "Item #2"},
+            ],
+        }
+    }
+    assert calls == ["name"] * 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execution_timeout", [0, -1, "1", True])
+async def test_execution_timeout_improperly_configured(execution_timeout):
+    with pytest.raises(ImproperlyConfigured):
+        await _engine(
+            f"test_execution_timeout_improperly_configured_{execution_timeout}",
+            [],
+            execution_timeout=execution_timeout,
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not hasattr(asyncio, "timeout"), reason="requires asyncio.timeout"
+)
+async def test_execution_timeout_resolver_cancel_scope():
+    schema_name = "test_execution_timeout_resolver_cancel_scope"
+
+    @Resolver("Query.fast", schema_name=schema_name)
+    async def resolve_query_fast(parent, args, ctx, info):
+        try:
+            async with asyncio.timeout(0.01):
+                await asyncio.sleep(10)
+        except TimeoutError:
+            return "timeout"
+        return "fast"
+
+    @Resolver("Query.slow", schema_name=schema_name)
+    async def resolve_query_slow(parent, args, ctx, info):
+        await asyncio.sleep(0.05)
+        return "slow"
+
+    engine = await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        execution_timeout=5.0,
+    )
+
+    assert await engine.execute("{ fast slow }") == {
+        "data": {"fast": "timeout", "slow": "slow"}
+    }
+
+
+@pytest.mark.asyncio
+async def test_execution_timeout_external_cancellation():
+    calls = []
+    engine = await _engine(
+        "test_execution_timeout_external_cancellation",
+        calls,
+        execution_timeout=5.0,
+    )
+
+    task = asyncio.ensure_future(engine.execute("{ slow }"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert calls == ["cancelled"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not hasattr(asyncio.Task, "cancelling"),
+    reason="requires Task.cancelling",
+)
+async def test_execution_timeout_withdraws_cancellations():
+    deadline = ExecutionDeadline(0.01)
+    with pytest.raises(ExecutionDeadlineExceeded):
+        await deadline.run(asyncio.sleep(1))
+    assert asyncio.current_task().cancelling() == 0
@@ -0,0 +1,180 @@
+import json
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+from tartiflette.execution.introspection import INTROSPECTION_QUERY
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+directive @hiddenFor(role: String!) on FIELD_DEFINITION
+
+type Query {
+  hello: String
+  secret: String @hiddenFor(role: "guest")
+}
+"""
+
+_TYPE_QUERY = """
+query ($name: String!) {
+  __type(name: $name) {
+    name
+    fields { name }
+  }
+}
+"""
+
+
+async def _engine(schema_name, context_independent=False, **kwargs):
+    @Directive(
+        "hiddenFor",
+        schema_name=schema_name,
+        context_independent_introspection=context_independent,
+    )
+    class HiddenForDirective:
+        async def on_introspection(
+            self,
+            directive_args,
+            next_directive,
+            introspected_element,
+            ctx,
+            info,
+        ):
+            if ctx and ctx.get("role") == directive_args["role"]:
+                return None
+            return await next_directive(introspected_element, ctx, info)
+
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "world"
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache():
+    engine = await _engine(
+        "test_introspection_cache",
+        context_independent=True,
+        introspection_cache=True,
+    )
+    uncached_engine = await _engine("test_introspection_cache_uncached")
+
+    response = await engine.execute(INTROSPECTION_QUERY)
+    assert response == await uncached_engine.execute(INTROSPECTION_QUERY)
+    assert await engine.execute(INTROSPECTION_QUERY) == response
+
+    for name, fields in (
+        ("Query", [{"name": "hello"}, {"name": "secret"}]),
+        ("String", None),
+    ):
+        expected = {"data": {"__type": {"name": name, "fields": fields}}}
+        for _ in range(2):
+            assert (
+                await engine.execute(_TYPE_QUERY, variables={"name": name})
+                == expected
+            )
+
+    document, _ = engine._cached_parse_and_validate_query(
+        _TYPE_QUERY, engine._schema
+    )
+    (cached_responses,) = document.introspection_responses.values()
+    assert len(cached_responses) == 2
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache_responses_copied():
+    engine = await _engine(
+        "test_introspection_cache_responses_copied",
+        context_independent=True,
+        introspection_cache=True,
+    )
+
+    query = '{ __type(name: "Query") { name } }'
+    expected = {"data": {"__type": {"name": "Query"}}}
+    for _ in range(3):
+        response = await engine.execute(query)
+        assert response == expected
+        response["data"]["__type"]["name"] = "Mutated"
+        response["extensions"] = {"mutated": True}
+
+    chunks = [chunk async for chunk in engine.execute_stream(query)]
+    assert json.loads(b"".join(chunks)) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,query",
+    enumerate(
+        [
+            "{ __typename hello }",
+            "{ ... on Query { __typename hello } }",
+            "{ __schema { queryType { name } } hello }",
+        ]
+    ),
+)
+async def test_introspection_cache_non_introspection_queries(index, query):
+    engine = await _engine(
+        f"test_introspection_cache_non_introspection_queries_{index}",
+        context_independent=True,
+        introspection_cache=True,
+    )
+
+    first_response = await engine.execute(query)
+    assert first_response["data"]["hello"] == "world"
+    assert await engine.execute(query) is not first_response
+
+    document, _ = engine._cached_parse_and_validate_query(
+        query, engine._schema
+    )
+    assert list(document.introspection_responses.values()) == [None]
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache_context_dependent_directives():
+    engine = await _engine(
+        "test_introspection_cache_context_dependent_directives",
+        introspection_cache=True,
+    )
+
+    query = '{ __type(name: "Query") { fields { name } } }'
+    assert await engine.execute(query, context={"role": "guest"}) == {
+        "data": {"__type": {"fields": [{"name": "hello"}]}}
+    }
+    assert await engine.execute(query, context={"role": "admin"}) == {
+        "data": {"__type": {"fields": [{"name": "hello"}, {"name": "secret"}]}}
+    }
+
+    with pytest.raises(ImproperlyConfigured):
+        await _engine(
+            "test_introspection_cache_context_dependent_directives_prerender",
+            prerender_introspection=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_introspection_cache_prerender():
+    engine = await _engine(
+        "test_introspection_cache_prerender",
+        context_independent=True,
+        prerender_introspection=True,
+    )
+    uncached_engine = await _engine("test_introspection_cache_prerender_2")
+
+    expected = await uncached_engine.execute(INTROSPECTION_QUERY)
+    response = await engine.execute(INTROSPECTION_QUERY)
+    assert response == expected
+    assert await engine.execute(INTROSPECTION_QUERY) == expected
+
+    chunks = [
+        chunk async for chunk in engine.execute_stream(INTROSPECTION_QUERY)
+    ]
+    assert json.loads(b"".join(chunks)) == expected
+
+    document, _ = await engine._parse_and_validate_request(
+        INTROSPECTION_QUERY.encode("utf-8"), None
+    )
+    (cached_responses,) = document.introspection_responses.values()
+    (cached_response,) = cached_responses.values()
+    assert json.loads(cached_response.encoded) == expected
+    assert engine._cached_parse_and_validate_query.cache_info().hits > 0
@@ -0,0 +1,291 @@
+import asyncio
+import json
+
+import pytest
+
+import tartiflette.engine
+import tartiflette.execution.persisted_queries
+
+from tartiflette import (
+    MemoryPersistedQueryStore,
+    PersistedQueryStore,
+    Resolver,
+    Subscription,
+    create_engine,
+)
+from tartiflette.execution.persisted_queries import get_query_hash
+from tartiflette.types.exceptions.tartiflette import ImproperlyConfigured
+
+_SDL = """
+type Query {
+  hello(name: String): String
+}
+
+type Subscription {
+  countdown(from: Int!): Int
+}
+"""
+
+_QUERY = '{ hello(name: "persisted") }'
+_QUERY_HASH = get_query_hash(_QUERY)
+
+
+async def _engine(schema_name, **kwargs):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello " + args.get("name", "world")
+
+    @Subscription("Subscription.countdown", schema_name=schema_name)
+    async def subscribe_subscription_countdown(parent, args, ctx, info):
+        for value in range(args["from"], 0, -1):
+            yield {"countdown": value}
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    parse_and_validate_query = tartiflette.engine.parse_and_validate_query
+
+    def counted_parse_and_validate_query(query, schema, **kwargs):
+        calls.append(query)
+        return parse_and_validate_query(query, schema, **kwargs)
+
+    for module in (
+        tartiflette.engine,
+        tartiflette.execution.persisted_queries,
+    ):
+        monkeypatch.setattr(
+            module,
+            "parse_and_validate_query",
+            counted_parse_and_validate_query,
+        )
+    return calls
+
+
+class _AsyncStore(PersistedQueryStore):
+    def __init__(self):
+        self.queries = {}
+
+    async def get(self, query_hash):
+        await asyncio.sleep(0)
+        return self.queries.get(query_hash)
+
+    async def set(self, query_hash, query):
+        await asyncio.sleep(0)
+        self.queries[query_hash] = query
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_automatic_registration(parse_calls):
+    engine = await _engine(
+        "test_persisted_queries_automatic_registration",
+        persisted_query_store=MemoryPersistedQueryStore(),
+    )
+
+    assert await engine.execute(query_hash=_QUERY_HASH) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "PersistedQueryNotFound",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+            }
+        ],
+    }
+
+    assert await engine.execute(_QUERY, query_hash=_QUERY_HASH) == {
+        "data": {"hello": "Hello persisted"}
+    }
+    assert await engine.execute(query_hash=_QUERY_HASH) == {
+        "data": {"hello": "Hello persisted"}
+    }
+    assert await engine.execute(query_hash=_QUERY_HASH) == {
+        "data": {"hello": "Hello persisted"}
+    }
+    assert parse_calls == [_QUERY]
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_hash_mismatch():
+    engine = await _engine(
+        "test_persisted_queries_hash_mismatch",
+        persisted_query_store=MemoryPersistedQueryStore(),
+    )
+
+    assert await engine.execute("{ hello }", query_hash=_QUERY_HASH) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Provided hash does not match query",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+            }
+        ],
+    }
+    assert await engine.execute(query_hash=_QUERY_HASH) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "PersistedQueryNotFound",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_invalid_query_not_persisted():
+    store = MemoryPersistedQueryStore()
+    engine = await _engine(
+        "test_persisted_queries_invalid_query_not_persisted",
+        persisted_query_store=store,
+    )
+
+    query = "{ unknownField }"
+    result = await engine.execute(query, query_hash=get_query_hash(query))
+    assert result["data"] is None
+    assert result["errors"][0]["message"] == (
+        "Field unknownField doesn't exist on Query"
+    )
+    assert len(store) == 0
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_disabled():
+    engine = await _engine("test_persisted_queries_disabled")
+
+    assert await engine.execute(_QUERY, query_hash=_QUERY_HASH) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "PersistedQueryNotSupported",
+                "path": None,
+                "locations": [],
+                "extensions": {"code": "PERSISTED_QUERY_NOT_SUPPORTED"},
+            }
+        ],
+    }
+    assert await engine.execute(_QUERY) == {
+        "data": {"hello": "Hello persisted"}
+    }
+
+    # Queries of a manifest can still be executed through their hash
+    await engine.register_persisted_queries({_QUERY_HASH: _QUERY})
+    assert await engine.execute(query_hash=_QUERY_HASH) == {
+        "data": {"hello": "Hello persisted"}
+    }
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_custom_store(parse_calls):
+    store = _AsyncStore()
+    store.queries[_QUERY_HASH] = _QUERY
+    engine = await _engine(
+        "test_persisted_queries_custom_store", persisted_query_store=store
+    )
+
+    assert await engine.execute(query_hash=_QUERY_HASH) == {
+        "data": {"hello": "Hello persisted"}
+    }
+
+    query = "{ hello }"
+    query_hash = get_query_hash(query)
+    assert await engine.execute(query, query_hash=query_hash) == {
+        "data": {"hello": "Hello world"}
+    }
+    assert store.queries[query_hash] == query
+    assert parse_calls == [_QUERY, query]
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_manifest(tmp_path, parse_calls):
+    manifest = {
+        "helloWorld": "{ hello }",
+        "countdown": "subscription { countdown(from: 2) }",
+    }
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(manifest))
+
+    engine = await _engine(
+        "test_persisted_queries_manifest",
+        persisted_queries_manifest=str(manifest_path),
+    )
+    assert sorted(parse_calls) == sorted(manifest.values())
+
+    assert await engine.execute(query_hash="helloWorld") == {
+        "data": {"hello": "Hello world"}
+    }
+    assert [
+        payload async for payload in engine.subscribe(query_hash="countdown")
+    ] == [{"data": {"countdown": 2}}, {"data": {"countdown": 1}}]
+    assert len(parse_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_invalid_manifest():
+    with pytest.raises(ImproperlyConfigured, match="invalidQuery"):
+        await _engine(
+            "test_persisted_queries_invalid_manifest",
+            persisted_queries_manifest={"invalidQuery": "{ unknownField }"},
+        )
+
+
+@pytest.mark.asyncio
+async def test_persisted_queries_bounded(monkeypatch, parse_calls):
+    monkeypatch.setattr(
+        tartiflette.execution.persisted_queries,
+        "_PERSISTED_DOCUMENTS_MAX_ENTRIES",
+        2,
+    )
+    store = MemoryPersistedQueryStore(max_entries=3)
+    engine = await _engine(
+        "test_persisted_queries_bounded",
+        persisted_query_store=store,
+        persisted_queries_manifest={"manifest": _QUERY},
+    )
+
+    queries = [f'{{ hello(name: "{index}") }}' for index in range(4)]
+    for index, query in enumerate(queries):
+        assert await engine.execute(
+            query, query_hash=get_query_hash(query)
+        ) == {"data": {"hello": f"Hello {index}"}}
+
+    # The least recently used queries are evicted from the store, manifest
+    # queries are only evicted from the store
+    assert len(store) == 3
+    assert store.get("manifest") is None
+    assert store.get(get_query_hash(queries[0])) is None
+    assert await engine.execute(query_hash="manifest") == {
+        "data": {"hello": "Hello persisted"}
+    }
+
+    # Evicted documents are parsed again from the store
+    del parse_calls[:]
+    for index in (3, 2, 1):
+        assert await engine.execute(
+            query_hash=get_query_hash(queries[index])
+        ) == {"data": {"hello": f"Hello {index}"}}
+    assert parse_calls == [queries[1]]
+
+
+@pytest.mark.parametrize("max_entries", [0, -1, "1"])
+def test_persisted_queries_memory_store_invalid_max_entries(max_entries):
+    with pytest.raises(ValueError):
+        MemoryPersistedQueryStore(max_entries=max_entries)
+
+
+def test_persisted_queries_store_is_abstract():
+    class _IncompleteStore(PersistedQueryStore):
+        def get(self, query_hash):
+            return None
+
+    with pytest.raises(TypeError):
+        PersistedQueryStore()
+    with pytest.raises(TypeError):
+        _IncompleteStore()
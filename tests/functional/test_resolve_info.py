@@ -0,0 +1,85 @@
+import pytest
+
+from tartiflette import Resolver, create_engine
+
+_SDL = """
+type Item {
+  name: String
+  info: String
+}
+
+type Query {
+  items(prefix: String): [Item]
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_resolve_info_attributes():
+    schema_name = "test_resolve_info_attributes"
+    infos = []
+
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        infos.append(info)
+        return [{"name": "first"}, {"name": "second"}]
+
+    @Resolver("Item.info", schema_name=schema_name)
+    def resolve_item_info(parent, args, ctx, info):
+        infos.append(info)
+        return (
+            f"{info.parent_type.name}.{info.field_name}@{info.path.as_list()}"
+        )
+
+    engine = await create_engine(_SDL, schema_name=schema_name)
+
+    assert (
+        await engine.execute(
+            """
+        query Items($prefix: String) {
+          items(prefix: $prefix) { ...ItemFields }
+        }
+
+        fragment ItemFields on Item { name info }
+        """,
+            variables={"prefix": "item"},
+            initial_value={"root": True},
+        )
+        == {
+            "data": {
+                "items": [
+                    {
+                        "name": "first",
+                        "info": "Item.info@['items', 0, 'info']",
+                    },
+                    {
+                        "name": "second",
+                        "info": "Item.info@['items', 1, 'info']",
+                    },
+                ]
+            }
+        }
+    )
+
+    items_info, first_item_info, second_item_info = infos
+    assert items_info.field_name == "items"
+    assert str(items_info.return_type) == "[Item]"
+    assert items_info.parent_type is engine._schema.find_type("Query")
+    assert items_info.path.as_list() == ["items"]
+    assert items_info.schema is engine._schema
+    assert list(items_info.fragments) == ["ItemFields"]
+    assert items_info.root_value == {"root": True}
+    assert items_info.operation.name.value == "Items"
+    assert items_info.variable_values == {"prefix": "item"}
+    assert items_info.is_introspection is False
+    assert [node.name.value for node in items_info.field_nodes] == ["items"]
+
+    assert first_item_info.field_name == "info"
+    assert str(first_item_info.return_type) == "String"
+    assert first_item_info.path.as_list() == ["items", 0, "info"]
+    assert second_item_info.path.as_list() == ["items", 1, "info"]
+    assert (
+        first_item_info.execution_context
+        is second_item_info.execution_context
+        is items_info.execution_context
+    )
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Directive, Resolver, create_engine
+
+_SDL = """
+type User {
+  id: Int!
+  name: String
+  score(factor: Int, filters: [String]): Int @memoize
+  rank: Int
+}
+
+type Query {
+  users: [User]
+  user(id: Int!): User
+  failing: String @memoize
+}
+"""
+
+_USERS = [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+
+
+async def _engine(schema_name, calls):
+    @Resolver("Query.users", schema_name=schema_name)
+    async def resolve_query_users(parent, args, ctx, info):
+        return _USERS
+
+    @Resolver("Query.user", schema_name=schema_name, memoize=True)
+    async def resolve_query_user(parent, args, ctx, info):
+        calls.append(("user", args["id"]))
+        await asyncio.sleep(0)
+        return _USERS[args["id"] - 1]
+
+    @Resolver("Query.failing", schema_name=schema_name)
+    async def resolve_query_failing(parent, args, ctx, info):
+        calls.append(("failing", None))
+        raise ValueError("Boom")
+
+    @Resolver("User.score", schema_name=schema_name)
+    async def resolve_user_score(parent, args, ctx, info):
+        calls.append(("score", parent["id"], args.get("factor")))
+        return parent["id"] * (args.get("factor") or 1)
+
+    @Resolver("User.rank", schema_name=schema_name)
+    async def resolve_user_rank(parent, args, ctx, info):
+        calls.append(("rank", parent["id"]))
+        return parent["id"]
+
+    return await create_engine(
+        _SDL,
+        schema_name=schema_name,
+        modules=["tartiflette.directive.builtins.memoize"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_resolver_memoization_aliases_and_fragments():
+    calls = []
+    engine = await _engine(
+        "test_resolver_memoization_aliases_and_fragments", calls
+    )
+
+    assert (
+        await engine.execute(
+            """
+        fragment UserScore on User {
+          score(factor: 2, filters: ["a"])
+          rank
+        }
+
+        {
+          users {
+            score(factor: 2, filters: ["a"])
+            double: score(factor: 2, filters: ["a"])
+            triple: score(factor: 3)
+            rank
+            ... UserScore
+          }
+          first: user(id: 1) { name }
+          alsoFirst: user(id: 1) { ... UserScore }
+          second: user(id: 2) { name }
+        }
+        """
+        )
+        == {
+            "data": {
+                "users": [
+                    {"score": 2, "double": 2, "triple": 3, "rank": 1},
+                    {"score": 4, "double": 4, "triple": 6, "rank": 2},
+                ],
+                "first": {"name": "Alice"},
+                "alsoFirst": {"score": 2, "rank": 1},
+                "second": {"name": "Bob"},
+            }
+        }
+    )
+    assert sorted(calls, key=str) == [
+        ("rank", 1),
+        ("rank", 1),
+        ("rank", 2),
+        ("score", 1, 2),
+        ("score", 1, 3),
+        ("score", 2, 2),
+        ("score", 2, 3),
+        ("user", 1),
+        ("user", 2),
+    ]
+    # `alsoFirst` shares its parent with the first item of `users`
+    assert engine.resolver_memoization_info() == (4, 6)
+
+    # Memoized values don't outlive the request
+    await engine.execute("{ first: user(id: 1) { name } }")
+    assert calls[-1] == ("user", 1)
+    assert engine.resolver_memoization_info() == (4, 7)
+
+
+@pytest.mark.asyncio
+async def test_resolver_memoization_errors_not_memoized():
+    calls = []
+    engine = await _engine(
+        "test_resolver_memoization_errors_not_memoized", calls
+    )
+
+    assert await engine.execute("{ failing other: failing }") == {
+        "data": {"failing": None, "other": None},
+        "errors": [
+            {
+                "message": "Boom",
+                "path": ["failing"],
+                "locations": [{"line": 1, "column": 3}],
+            },
+            {
+                "message": "Boom",
+                "path": ["other"],
+                "locations": [{"line": 1, "column": 11}],
+            },
+        ],
+    }
+    assert calls == [("failing", None), ("failing", None)]
+    assert engine.resolver_memoization_info() == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_resolver_memoization_query_directives():
+    calls = []
+    engine = await _engine("test_resolver_memoization_query_directives", calls)
+
+    await engine.execute("{ users { score other: score @include(if: true) } }")
+    assert len(calls) == 4
+    assert engine.resolver_memoization_info() == (0, 2)
+
+
+@pytest.mark.asyncio
+async def test_resolver_memoization_custom_memoize_directive():
+    schema_name = "test_resolver_memoization_custom_memoize_directive"
+
+    @Directive("memoize", schema_name=schema_name)
+    class MemoizeDirective:
+        @staticmethod
+        async def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            return "custom"
+
+    engine = await create_engine(
+        """
+        directive @memoize on FIELD_DEFINITION
+        type Query { item: String @memoize }
+        """,
+        schema_name=schema_name,
+    )
+
+    assert await engine.execute("{ item }") == {"data": {"item": "custom"}}
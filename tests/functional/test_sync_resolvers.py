@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from tartiflette import Directive, Resolver, TypeResolver, create_engine
+
+_SDL = """
+directive @upper on FIELD_DEFINITION
+
+interface Named {
+  name: String
+}
+
+type Dog implements Named {
+  name: String
+  barkVolume: Int
+}
+
+type Cat implements Named {
+  name: String
+  meowVolume: Int
+}
+
+type Query {
+  dogName: String
+  shout: String @upper
+  count: Int!
+  failing: String
+  nullable: Int!
+  awaitable: String
+  pets: [Named]
+  pet: Named
+  greet(name: String): String
+}
+"""
+
+_PETS = [{"name": "Rex", "barkVolume": 10}, {"name": "Tom", "meowVolume": 5}]
+
+
+async def _engine(schema_name):
+    @Resolver("Query.dogName", schema_name=schema_name)
+    def resolve_query_dog_name(parent, args, ctx, info):
+        return "Rex"
+
+    @Resolver("Query.shout", schema_name=schema_name)
+    def resolve_query_shout(parent, args, ctx, info):
+        return "hey"
+
+    @Resolver("Query.count", schema_name=schema_name)
+    def resolve_query_count(parent, args, ctx, info):
+        return 3
+
+    @Resolver("Query.failing", schema_name=schema_name)
+    def resolve_query_failing(parent, args, ctx, info):
+        raise ValueError("Boom")
+
+    @Resolver("Query.nullable", schema_name=schema_name)
+    def resolve_query_nullable(parent, args, ctx, info):
+        return None
+
+    @Resolver("Query.awaitable", schema_name=schema_name)
+    def resolve_query_awaitable(parent, args, ctx, info):
+        async def later():
+            await asyncio.sleep(0)
+            return "later"
+
+        return later()
+
+    @Resolver("Query.pets", schema_name=schema_name)
+    def resolve_query_pets(parent, args, ctx, info):
+        return _PETS
+
+    @Resolver("Query.pet", schema_name=schema_name)
+    def resolve_query_pet(parent, args, ctx, info):
+        return _PETS[0]
+
+    @Resolver("Query.greet", schema_name=schema_name)
+    def resolve_query_greet(parent, args, ctx, info):
+        return "Hello " + args.get("name", "world")
+
+    @TypeResolver("Named", schema_name=schema_name)
+    async def resolve_named_type(result, ctx, info, abstract_type):
+        await asyncio.sleep(0)
+        return "Dog" if "barkVolume" in result else "Cat"
+
+    @Directive("upper", schema_name=schema_name)
+    class UpperDirective:
+        @staticmethod
+        def on_field_execution(
+            directive_args, next_resolver, parent, args, ctx, info
+        ):
+            async def upper():
+                return (await next_resolver(parent, args, ctx, info)).upper()
+
+            return upper()
+
+    return await create_engine(_SDL, schema_name=schema_name)
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers():
+    engine = await _engine("test_sync_resolvers")
+    # pylint: disable=protected-access
+    query_type = engine._schema.find_type("Query")
+    assert query_type.find_field("dogName").sync_resolver is not None
+    assert query_type.find_field("pets").sync_resolver is not None
+    assert query_type.find_field("shout").sync_resolver is None
+    assert query_type.find_field("greet").sync_resolver is None
+
+    assert (
+        await engine.execute(
+            """
+        {
+          dogName
+          shout
+          count
+          awaitable
+          greet(name: "sync")
+          pets {
+            name
+            ... on Dog { barkVolume }
+            ... on Cat { meowVolume }
+          }
+          pet { name }
+        }
+        """
+        )
+        == {
+            "data": {
+                "dogName": "Rex",
+                "shout": "HEY",
+                "count": 3,
+                "awaitable": "later",
+                "greet": "Hello sync",
+                "pets": [
+                    {"name": "Rex", "barkVolume": 10},
+                    {"name": "Tom", "meowVolume": 5},
+                ],
+                "pet": {"name": "Rex"},
+            }
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_resolvers_errors():
+    engine = await _engine("test_sync_resolvers_errors")
+
+    assert await engine.execute("{ dogName failing }") == {
+        "data": {"dogName": "Rex", "failing": None},
+        "errors": [
+            {
+                "message": "Boom",
+                "path": ["failing"],
+                "locations": [{"line": 1, "column": 11}],
+            }
+        ],
+    }
+    assert await engine.execute("{ dogName nullable }") == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Cannot return null for non-nullable field Query.nullable.",
+                "path": ["nullable"],
+                "locations": [{"line": 1, "column": 11}],
+            }
+        ],
+    }
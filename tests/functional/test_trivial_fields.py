@@ -0,0 +1,153 @@
+import pytest
+
+from tartiflette import Resolver, Scalar, create_engine
+
+_SDL = """
+scalar Upper
+
+type Item {
+  id: Int!
+  name: String
+  upper: Upper
+  price: Float @deprecated
+  label(prefix: String): String
+  resolved: String
+  required: String!
+}
+
+type Query {
+  items: [Item]
+}
+"""
+
+
+class _Item:
+    def __init__(self, id, name, required=None):
+        # pylint: disable=redefined-builtin
+        self.id = id
+        self.name = name
+        self.required = required
+
+
+_ITEMS = [
+    {"id": 1, "name": "one", "upper": "a", "price": 1.5, "required": "r"},
+    _Item(2, "two", required="r"),
+    {"id": "invalid", "name": "three", "upper": "c", "price": 3.5},
+]
+
+
+async def _engine(schema_name):
+    @Resolver("Query.items", schema_name=schema_name)
+    async def resolve_query_items(parent, args, ctx, info):
+        return _ITEMS
+
+    @Resolver("Item.resolved", schema_name=schema_name)
+    async def resolve_item_resolved(parent, args, ctx, info):
+        return "resolved"
+
+    @Scalar("Upper", schema_name=schema_name)
+    class UpperScalar:
+        @staticmethod
+        def coerce_output(value):
+            return value.upper()
+
+        @staticmethod
+        def coerce_input(value):
+            return value
+
+        @staticmethod
+        def parse_literal(ast):
+            return ast.value
+
+    return await create_engine(_SDL, schema_name=schema_name)
+
+
+@pytest.mark.asyncio
+async def test_trivial_fields_detection():
+    engine = await _engine("test_trivial_fields_detection")
+    # pylint: disable=protected-access
+    item_type = engine._schema.find_type("Item")
+
+    assert item_type.find_field("id").sync_resolver is not None
+    assert item_type.find_field("name").sync_resolver is not None
+    assert item_type.find_field("upper").sync_resolver is not None
+    assert item_type.find_field("required").sync_resolver is not None
+    assert item_type.find_field("price").sync_resolver is None
+    assert item_type.find_field("label").sync_resolver is None
+    assert item_type.find_field("resolved").sync_resolver is None
+
+
+@pytest.mark.asyncio
+async def test_trivial_fields_execution():
+    engine = await _engine("test_trivial_fields_execution")
+
+    assert (
+        await engine.execute(
+            """
+        {
+          items {
+            name
+            upper
+            resolved
+            aliased: name
+            price
+            skipped: name @skip(if: true)
+          }
+        }
+        """
+        )
+        == {
+            "data": {
+                "items": [
+                    {
+                        "name": "one",
+                        "upper": "A",
+                        "resolved": "resolved",
+                        "aliased": "one",
+                        "price": 1.5,
+                    },
+                    {
+                        "name": "two",
+                        "upper": None,
+                        "resolved": "resolved",
+                        "aliased": "two",
+                        "price": None,
+                    },
+                    {
+                        "name": "three",
+                        "upper": "C",
+                        "resolved": "resolved",
+                        "aliased": "three",
+                        "price": 3.5,
+                    },
+                ]
+            }
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_trivial_fields_errors():
+    engine = await _engine("test_trivial_fields_errors")
+
+    assert await engine.execute("{ items { name id required } }") == {
+        "data": {
+            "items": [
+                {"name": "one", "id": 1, "required": "r"},
+                {"name": "two", "id": 2, "required": "r"},
+                None,
+            ]
+        },
+        "errors": [
+            {
+                "message": "Int cannot represent non-integer value: < invalid >.",
+                "path": ["items", 2, "id"],
+                "locations": [{"line": 1, "column": 16}],
+            },
+            {
+                "message": "Cannot return null for non-nullable field Item.required.",
+                "path": ["items", 2, "required"],
+                "locations": [{"line": 1, "column": 19}],
+            },
+        ],
+    }
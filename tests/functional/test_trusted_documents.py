@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from tartiflette import MemoryPersistedQueryStore, Resolver, create_engine
+from tartiflette.execution.collect import DocumentParsingInfo
+from tartiflette.execution.persisted_queries import get_query_hash
+from tartiflette.types.exceptions.tartiflette import (
+    ImproperlyConfigured,
+    NonCallable,
+)
+
+_SDL = """
+type Query {
+  hello(name: String): String
+}
+"""
+
+_QUERY = '{ hello(name: "trusted") }'
+_QUERY_HASH = get_query_hash(_QUERY)
+
+# Parsed but invalid against the schema
+_INVALID_QUERY = "{ unknownField }"
+
+
+async def _engine(schema_name, **kwargs):
+    @Resolver("Query.hello", schema_name=schema_name)
+    async def resolve_query_hello(parent, args, ctx, info):
+        return "Hello " + args.get("name", "world")
+
+    return await create_engine(_SDL, schema_name=schema_name, **kwargs)
+
+
+def _verify_signature(query_hash, query, context):
+    return (context or {}).get("signature") == f"signed:{query_hash}"
+
+
+async def _async_verify_signature(query_hash, query, context):
+    await asyncio.sleep(0)
+    return _verify_signature(query_hash, query, context)
+
+
+@pytest.mark.asyncio
+async def test_trusted_documents_manifest():
+    engine = await _engine(
+        "test_trusted_documents_manifest",
+        trusted_documents=True,
+        persisted_queries_manifest={
+            "hello": _QUERY,
+            "invalid": _INVALID_QUERY,
+        },
+    )
+
+    assert engine.document_parsing_info() == DocumentParsingInfo(
+        trusted=2, validated=0
+    )
+    assert await engine.execute(query_hash="hello") == {
+        "data": {"hello": "Hello trusted"}
+    }
+    assert await engine.execute(_QUERY) == {"data": {"hello": "Hello trusted"}}
+    assert engine.document_parsing_info() == DocumentParsingInfo(
+        trusted=2, validated=1
+    )
+
+    with pytest.raises(ImproperlyConfigured):
+        await _engine(
+            "test_trusted_documents_manifest_untrusted",
+            persisted_queries_manifest={"invalid": _INVALID_QUERY},
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("trusted_documents", [False, True])
+async def test_trusted_documents_store(trusted_documents):
+    store = MemoryPersistedQueryStore()
+    store.set(_QUERY_HASH, _QUERY)
+    engine = await _engine(
+        f"test_trusted_documents_store_{trusted_documents}",
+        persisted_query_store=store,
+        trusted_documents=trusted_documents,
+    )
+
+    assert await engine.execute(query_hash=_QUERY_HASH) == {
+        "data": {"hello": "Hello trusted"}
+    }
+    # Queries of the store are validated even when documents are trusted
+    assert engine.document_parsing_info() == DocumentParsingInfo(
+        trusted=0, validated=1
+    )
+
+    for index, (query, message) in enumerate(
+        [
+            ("{ ...F }", "Unknown Fragment for Spread < F >."),
+            ("{ nope }", "Field nope doesn't exist on Query"),
+        ]
+    ):
+        query_hash = get_query_hash(query)
+        store.set(query_hash, query)
+        response = await engine.execute(query_hash=query_hash)
+        assert response["data"] is None
+        assert response["errors"][0]["message"] == message
+        assert engine.document_parsing_info() == DocumentParsingInfo(
+            trusted=0, validated=index + 2
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,verifier",
+    enumerate([_verify_signature, _async_verify_signature]),
+)
+async def test_trusted_documents_verifier(index, verifier):
+    engine = await _engine(
+        f"test_trusted_documents_verifier_{index}",
+        persisted_query_store=MemoryPersistedQueryStore(),
+        trusted_document_verifier=verifier,
+    )
+
+    invalid_query_hash = get_query_hash(_INVALID_QUERY)
+    response = await engine.execute(
+        _INVALID_QUERY,
+        query_hash=invalid_query_hash,
+        context={"signature": "forged"},
+    )
+    assert response["data"] is None
+    assert response["errors"][0]["message"] == (
+        "Field unknownField doesn't exist on Query"
+    )
+    assert engine.document_parsing_info() == DocumentParsingInfo(
+        trusted=0, validated=1
+    )
+
+    assert await engine.execute(
+        _QUERY,
+        query_hash=_QUERY_HASH,
+        context={"signature": f"signed:{_QUERY_HASH}"},
+    ) == {"data": {"hello": "Hello trusted"}}
+    assert await engine.execute(query_hash=_QUERY_HASH) == {
+        "data": {"hello": "Hello trusted"}
+    }
+    assert engine.document_parsing_info() == DocumentParsingInfo(
+        trusted=1, validated=1
+    )
+
+
+@pytest.mark.asyncio
+async def test_trusted_documents_verifier_not_callable():
+    with pytest.raises(NonCallable):
+        await _engine(
+            "test_trusted_documents_verifier_not_callable",
+            trusted_document_verifier="not callable",
+        )
@@ -1,5 +1,7 @@
 import pytest
 
+from tartiflette import create_engine
+
 
 @pytest.mark.asyncio
 @pytest.mark.ttftt_engine()
@@ -265,3 +267,68 @@ async def test_validators_fragment_spreads_must_not_form_cycles(
     query, expected, engine
 ):
     assert await engine.execute(query) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,case",
+    enumerate(
+        [
+            (
+                "query A($x: Int) { t { ...F } } "
+                "fragment F on T { t { ...G } v(x: $x) } "
+                "fragment G on T { ...F }",
+                [{"line": 1, "column": 33}, {"line": 1, "column": 73}],
+            ),
+            (
+                "query A { t { ...F } } "
+                "fragment F on T { t { ...G } } "
+                "fragment G on T { t { ... on T { ...F } } }",
+                [{"line": 1, "column": 24}, {"line": 1, "column": 55}],
+            ),
+        ]
+    ),
+)
+async def test_validators_fragment_spreads_must_not_form_cycles_nested(
+    index, case
+):
+    query, locations = case
+    engine = await create_engine(
+        "type T { t: T v(x: Int): Int } type Query { t: T }",
+        schema_name=(
+            "test_validators_fragment_spreads_must_not_form_cycles_nested_"
+            f"{index}"
+        ),
+    )
+
+    assert await engine.execute(query) == {
+        "data": None,
+        "errors": [
+            {
+                "message": "Fragment Cylcle Detected",
+                "path": None,
+                "locations": locations,
+                "extensions": {
+                    "rule": "5.5.2.2",
+                    "spec": "June 2018",
+                    "details": "https://graphql.github.io/graphql-spec/June2018/#sec-Fragment-spreads-must-not-form-cycles",
+                    "tag": "fragment-spreads-must-not-form-cycles",
+                },
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_validators_fragment_spreads_must_not_form_cycles_siblings():
+    engine = await create_engine(
+        "type T { t: T v: Int } type Query { t: T }",
+        schema_name=(
+            "test_validators_fragment_spreads_must_not_form_cycles_siblings"
+        ),
+    )
+
+    assert await engine.execute(
+        "{ t { ...F } } fragment F on T { a: t { ...G } b: t { ...G } } "
+        "fragment G on T { v }"
+    ) == {"data": {"t": None}}
@@ -0,0 +1,70 @@
+import pytest
+
+from tartiflette import create_engine
+from tartiflette.language.parsers.libgraphqlparser import parse_to_document
+from tartiflette.language.validators import validate_document
+from tartiflette.language.validators.query.rule import ValidationRule
+from tartiflette.utils.errors import graphql_error_from_nodes
+
+_SDL = """
+type Item {
+  id: Int
+  name: String
+}
+
+type Query {
+  item(id: Int): Item
+}
+"""
+
+
+class _NoAliasRule(ValidationRule):
+    RULE_NAME = "no-alias"
+    RULE_LINK = "https://example.com/no-alias"
+    RULE_NUMBER = "0"
+
+    def leave_field(self, node, context):
+        # pylint: disable=no-self-use
+        if node.alias is None:
+            return []
+        return [
+            graphql_error_from_nodes(
+                message=(
+                    f"Alias < {node.alias.value} > on "
+                    f"< {context.field_name} > isn't allowed."
+                ),
+                nodes=node,
+                extensions=self._extensions,
+            )
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "index,case",
+    enumerate(
+        [
+            ("{ item(id: 1) { id name } }", []),
+            (
+                "{ first: item(id: 1) { identifier: id name } }",
+                [
+                    "Alias < identifier > on < Item.id > isn't allowed.",
+                    "Alias < first > on < Query.item > isn't allowed.",
+                ],
+            ),
+        ]
+    ),
+)
+async def test_validators_validate_document_custom_rules(index, case):
+    query, expected = case
+    engine = await create_engine(
+        _SDL, schema_name=f"test_validators_validate_document_{index}"
+    )
+    schema = engine._schema  # pylint: disable=protected-access
+    document = parse_to_document(query, schema)
+
+    assert [
+        error.message
+        for error in validate_document(schema, document, [_NoAliasRule()])
+    ] == expected
+    assert validate_document(schema, document) == []
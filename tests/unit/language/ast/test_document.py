@@ -70,3 +70,13 @@ def test_documentnode__eq__(document_node, other, expected):
 )
 def test_documentnode__repr__(document_node, expected):
     assert document_node.__repr__() == expected
+
+
+def test_documentnode__init__deprecated_validators():
+    with pytest.deprecated_call():
+        document_node = DocumentNode(
+            "documentDefinitions", object(), "documentLocation", 42
+        )
+    assert document_node.definitions == "documentDefinitions"
+    assert document_node.location == "documentLocation"
+    assert hash(document_node) == 42
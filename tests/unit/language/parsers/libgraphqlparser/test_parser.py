@@ -1,3 +1,5 @@
+import json
+
 from unittest.mock import Mock
 
 import pytest
@@ -31,9 +33,11 @@ from tartiflette.language.ast import (
 )
 from tartiflette.language.parsers.libgraphqlparser import parse_to_document
 from tartiflette.language.parsers.libgraphqlparser.parser import (
+    _FFI,
     ParsedData,
     _parse_context_manager,
     _parse_to_json_ast,
+    _to_c_string,
 )
 from tartiflette.types.exceptions.tartiflette import GraphQLSyntaxError
 
@@ -52,12 +56,54 @@ def test_parseddata__enter__():
     destroy_cb_mock.assert_called_once_with(c_parsed_mock)
 
 
-@pytest.mark.parametrize("query", [b"{ a }", "{ a }"])
+@pytest.mark.parametrize(
+    "query",
+    [
+        b"{ a }",
+        "{ a }",
+        bytearray(b"{ a }"),
+        memoryview(b"{ a }"),
+        memoryview(bytearray(b"{ a }")),
+    ],
+)
 def test_parse_context_manager(query):
     result = _parse_context_manager(query)
     assert isinstance(result, ParsedData)
 
 
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ a { a1 a2 } }",
+        b"{ a { a1 a2 } }",
+        bytearray(b"{ a { a1 a2 } }"),
+        memoryview(b"{ a { a1 a2 } }"),
+        memoryview(bytearray(b"{ a { a1 a2 } }")),
+        # Views which aren't NUL terminated
+        memoryview(b"{ a { a1 a2 } } { b }")[:15],
+        memoryview(bytearray(b" { a { a1 a2 } } "))[1:16],
+        memoryview(b"{ a { a1 a2 } }").cast("B", shape=[3, 5]),
+    ],
+)
+def test_to_c_string(query):
+    c_string = _to_c_string(query)
+    assert _FFI.string(c_string) == b"{ a { a1 a2 } }"
+    assert _parse_to_json_ast(query) == _parse_to_json_ast("{ a { a1 a2 } }")
+
+
+def test_to_c_string_non_contiguous():
+    query = memoryview(b"".join(bytes([char, 0]) for char in b"{ a }"))[::2]
+    assert not query.c_contiguous
+    assert _FFI.string(_to_c_string(query)) == b"{ a }"
+
+
+def test_to_c_string_zero_copy():
+    query = bytearray(b"{ a }")
+    c_string = _to_c_string(query)
+    query[2] = ord("b")
+    assert _FFI.string(c_string) == b"{ b }"
+
+
 def test_parse_context_manager_error():
     with pytest.raises(GraphQLSyntaxError):
         _parse_context_manager("{ a { }")
@@ -80,11 +126,6 @@ def test_parse_to_json_ast(query, expected):
     assert _parse_to_json_ast(query) == expected
 
 
-@pytest.mark.skip(
-    reason="Should be unskipped when a better validation "
-    "system which doesn't alter the DocumentNode will "
-    "be implemented."
-)
 @pytest.mark.parametrize(
     "sdl,expected",
     [
@@ -1027,7 +1068,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=FloatValueNode(
-                                                value=0.0,
+                                                value="0.0",
                                                 location=Location(
                                                     line=5,
                                                     column=35,
@@ -1053,7 +1094,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=FloatValueNode(
-                                                value=10.20,
+                                                value="10.20",
                                                 location=Location(
                                                     line=5,
                                                     column=46,
@@ -1079,7 +1120,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=FloatValueNode(
-                                                value=1000.0,
+                                                value="1e3",
                                                 location=Location(
                                                     line=5,
                                                     column=59,
@@ -1105,7 +1146,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=FloatValueNode(
-                                                value=123.4,
+                                                value="1.234e2",
                                                 location=Location(
                                                     line=6,
                                                     column=21,
@@ -1131,7 +1172,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=FloatValueNode(
-                                                value=-123.4,
+                                                value="-1.234e2",
                                                 location=Location(
                                                     line=6,
                                                     column=36,
@@ -1179,7 +1220,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=IntValueNode(
-                                                value=0,
+                                                value="0",
                                                 location=Location(
                                                     line=7,
                                                     column=33,
@@ -1205,7 +1246,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=IntValueNode(
-                                                value=10,
+                                                value="10",
                                                 location=Location(
                                                     line=7,
                                                     column=42,
@@ -1231,7 +1272,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=IntValueNode(
-                                                value=-10,
+                                                value="-10",
                                                 location=Location(
                                                     line=7,
                                                     column=52,
@@ -1446,7 +1487,7 @@ def test_parse_to_json_ast(query, expected):
                                                         ),
                                                     ),
                                                     FloatValueNode(
-                                                        value=-123.4,
+                                                        value="-1.234e2",
                                                         location=Location(
                                                             line=10,
                                                             column=63,
@@ -1455,7 +1496,7 @@ def test_parse_to_json_ast(query, expected):
                                                         ),
                                                     ),
                                                     IntValueNode(
-                                                        value=-10,
+                                                        value="-10",
                                                         location=Location(
                                                             line=10,
                                                             column=73,
@@ -1618,7 +1659,7 @@ def test_parse_to_json_ast(query, expected):
                                                             ),
                                                         ),
                                                         value=FloatValueNode(
-                                                            value=-123.4,
+                                                            value="-1.234e2",
                                                             location=Location(
                                                                 line=15,
                                                                 column=24,
@@ -1644,7 +1685,7 @@ def test_parse_to_json_ast(query, expected):
                                                             ),
                                                         ),
                                                         value=IntValueNode(
-                                                            value=-10,
+                                                            value="-10",
                                                             location=Location(
                                                                 line=16,
                                                                 column=22,
@@ -2466,7 +2507,7 @@ def test_parse_to_json_ast(query, expected):
                                             value=ListValueNode(
                                                 values=[
                                                     IntValueNode(
-                                                        value=123,
+                                                        value="123",
                                                         location=Location(
                                                             line=3,
                                                             column=39,
@@ -2475,7 +2516,7 @@ def test_parse_to_json_ast(query, expected):
                                                         ),
                                                     ),
                                                     IntValueNode(
-                                                        value=456,
+                                                        value="456",
                                                         location=Location(
                                                             line=3,
                                                             column=44,
@@ -2630,7 +2671,7 @@ def test_parse_to_json_ast(query, expected):
                                                                                     ),
                                                                                 ),
                                                                                 value=IntValueNode(
-                                                                                    value=10,
+                                                                                    value="10",
                                                                                     location=Location(
                                                                                         line=8,
                                                                                         column=41,
@@ -3054,7 +3095,7 @@ def test_parse_to_json_ast(query, expected):
                                                 ),
                                             ),
                                             value=IntValueNode(
-                                                value=123,
+                                                value="123",
                                                 location=Location(
                                                     line=24,
                                                     column=27,
@@ -3844,4 +3885,5 @@ def test_parse_to_json_ast(query, expected):
     ],
 )
 def test_parse_to_document(sdl, expected):
-    assert parse_to_document(sdl) == expected
+    schema = Mock(json_loader=json.loads)
+    assert parse_to_document(sdl, schema) == expected
@@ -3,16 +3,15 @@ import pytest
 
 @pytest.mark.asyncio
 async def test_create_engine_no_loader():
-    import json
-
     from tartiflette import create_engine
+    from tartiflette.utils.json_codecs import default_json_loader
 
     e = await create_engine(
         sdl="""type A{ B:String } type Query { a:A }""",
         schema_name="test_issue362_test_create_engine_no_loader",
     )
 
-    assert e._schema.json_loader == json.loads
+    assert e._schema.json_loader == default_json_loader
 
 
 @pytest.mark.asyncio
@@ -33,9 +32,8 @@ async def test_create_engine_loader():
 
 @pytest.mark.asyncio
 async def test_engine_init_no_loader():
-    import json
-
     from tartiflette import Engine
+    from tartiflette.utils.json_codecs import default_json_loader
 
     e = Engine(
         sdl="""type A{ B:String } type Query { a:A }""",
@@ -43,7 +41,7 @@ async def test_engine_init_no_loader():
     )
     await e.cook()
 
-    assert e._schema.json_loader == json.loads
+    assert e._schema.json_loader == default_json_loader
 
 
 @pytest.mark.asyncio
@@ -285,8 +285,10 @@ def boby():
     [
         (bob, "ok", "engine"),
         (bob, "ok", "cook"),
-        (boby, Exception(), "engine"),
-        (boby, Exception(), "cook"),
+        (boby, "ok", "engine"),
+        (boby, "ok", "cook"),
+        ("boby", Exception(), "engine"),
+        ("boby", Exception(), "cook"),
     ],
 )
 async def test_engine_api_cdr(cdr, expected, pass_to, clean_registry):
@@ -0,0 +1,45 @@
+import pytest
+
+from tartiflette.coercers.common import Path
+
+
+def test_path_as_list():
+    root = Path(None, "items")
+    item = Path(root, 3)
+    field = Path(item, "name")
+
+    assert field.as_list() == ["items", 3, "name"]
+    assert item.as_list() == ["items", 3]
+    assert root.as_list() == ["items"]
+
+    # Materialized paths of the previous values are reused
+    assert Path(item, "id").as_list() == ["items", 3, "id"]
+
+    # Returned lists can be mutated without altering the path
+    field.as_list().append("mutated")
+    assert field.as_list() == ["items", 3, "name"]
+
+
+@pytest.mark.parametrize(
+    "keys,expected",
+    [
+        (["items"], "value.items"),
+        (["items", 3, "name"], "value.items[3].name"),
+        ([0, 1], "value[0][1]"),
+    ],
+)
+def test_path_str(keys, expected):
+    path = None
+    for key in keys:
+        path = Path(path, key)
+
+    assert str(path) == expected
+    assert str(path) == expected
+
+
+def test_path_deep():
+    path = None
+    for index in range(5000):
+        path = Path(path, index)
+
+    assert path.as_list() == list(range(5000))
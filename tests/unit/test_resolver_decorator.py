@@ -4,7 +4,7 @@ import pytest
 
 from tartiflette import Resolver
 from tartiflette.schema.bakery import SchemaBakery
-from tartiflette.types.exceptions.tartiflette import NonAwaitableResolver
+from tartiflette.types.exceptions.tartiflette import NonCallable
 
 
 @pytest.mark.asyncio
@@ -84,11 +84,8 @@ async def test_resolver_decorator(clean_registry):
         mock_two()
         return
 
-    with pytest.raises(NonAwaitableResolver):
-
-        @Resolver("Test.simpleField")
-        def func_default_resolver(*args, **kwargs):
-            pass
+    with pytest.raises(NonCallable):
+        Resolver("Test.simpleField")("not a callable")
 
     generated_schema = await SchemaBakery.bake("default")
 
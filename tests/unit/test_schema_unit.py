@@ -1,9 +1,13 @@
+import os
+import stat
+
 import pytest
 
 from tartiflette import Directive, Resolver, Scalar
 from tartiflette.engine import _import_builtins
 from tartiflette.schema.bakery import SchemaBakery
 from tartiflette.schema.registry import SchemaRegistry
+from tartiflette.schema.snapshot import get_schema_snapshot_file
 from tartiflette.types.exceptions.tartiflette import (
     GraphQLSchemaError,
     ImproperlyConfigured,
@@ -581,6 +585,164 @@ async def test_schema_has_type(clean_registry, type_name, expected):
     assert schema.has_type(type_name) is expected
 
 
+@pytest.mark.asyncio
+async def test_schema_bake_from_snapshot(
+    clean_registry, tmp_path, monkeypatch
+):
+    _, full_sdl = await _import_builtins(
+        [],
+        """
+        type User {
+            name: String
+        }
+
+        type Query {
+            viewer: User
+        }
+        """,
+        "a",
+    )
+    clean_registry.register_sdl("a", full_sdl)
+    schema = await SchemaBakery.bake("a", schema_snapshot_path=str(tmp_path))
+    assert not schema.is_snapshot
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def unexpected_schema_from_sdl(*_args, **_kwargs):
+        raise AssertionError("SDL shouldn't be parsed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            "tartiflette.schema.bakery.schema_from_sdl",
+            unexpected_schema_from_sdl,
+        )
+        snapshot_schema = await SchemaBakery.bake(
+            "a", schema_snapshot_path=str(tmp_path)
+        )
+
+    assert snapshot_schema is not schema
+    assert snapshot_schema.is_snapshot
+    assert snapshot_schema.find_type("Query").find_field(
+        "viewer"
+    ).graphql_type is snapshot_schema.find_type("User")
+    assert clean_registry.find_schema("a") is snapshot_schema
+
+    clean_registry.register_sdl("a", full_sdl + "\ntype Other { id: Int }")
+    schema = await SchemaBakery.bake("a", schema_snapshot_path=str(tmp_path))
+    assert not schema.is_snapshot
+    assert schema.has_type("Other")
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+@pytest.mark.asyncio
+async def test_schema_bake_snapshot_of_another_sdl(clean_registry, tmp_path):
+    _, full_sdl = await _import_builtins(
+        [],
+        """
+        type Query {
+            viewer: String
+        }
+        """,
+        "a",
+    )
+    other_sdl = full_sdl + "\ntype Other { id: Int }"
+    clean_registry.register_sdl("a", full_sdl)
+    await SchemaBakery.bake("a", schema_snapshot_path=str(tmp_path))
+
+    # The snapshot of the first SDL is placed where the one of the other SDL
+    # is expected
+    os.replace(
+        get_schema_snapshot_file(str(tmp_path), "a", full_sdl),
+        get_schema_snapshot_file(str(tmp_path), "a", other_sdl),
+    )
+
+    clean_registry.register_sdl("a", other_sdl)
+    schema = await SchemaBakery.bake("a", schema_snapshot_path=str(tmp_path))
+    assert not schema.is_snapshot
+    assert schema.has_type("Other")
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "getuid"), reason="POSIX file permissions only"
+)
+@pytest.mark.asyncio
+async def test_schema_bake_untrusted_snapshot(clean_registry, tmp_path):
+    _, full_sdl = await _import_builtins(
+        [],
+        """
+        type Query {
+            viewer: String
+        }
+        """,
+        "a",
+    )
+    clean_registry.register_sdl("a", full_sdl)
+    await SchemaBakery.bake("a", schema_snapshot_path=str(tmp_path))
+    snapshot_file = get_schema_snapshot_file(str(tmp_path), "a", full_sdl)
+    assert stat.S_IMODE(os.stat(snapshot_file).st_mode) == 0o644
+
+    os.chmod(snapshot_file, 0o666)
+    schema = await SchemaBakery.bake("a", schema_snapshot_path=str(tmp_path))
+    assert not schema.is_snapshot
+
+
+@pytest.mark.asyncio
+async def test_schema_bake_invalid_schema_snapshot(clean_registry, tmp_path):
+    _, full_sdl = await _import_builtins(
+        [],
+        """
+        type Query {
+            viewer: Unknown
+        }
+        """,
+        "a",
+    )
+    clean_registry.register_sdl("a", full_sdl)
+    with pytest.raises(GraphQLSchemaError):
+        await SchemaBakery.bake("a", schema_snapshot_path=str(tmp_path))
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "type_name,field_name,is_found",
+    [
+        ("Query", "viewer", True),
+        ("Query", "__typename", True),
+        ("Query", "__schema", True),
+        ("Query", "__type", True),
+        ("User", "name", True),
+        ("User", "__typename", True),
+        ("User", "__schema", False),
+        ("User", "unknownField", False),
+    ],
+)
+@pytest.mark.asyncio
+async def test_schema_find_field_definition(
+    clean_registry, type_name, field_name, is_found
+):
+    _, full_sdl = await _import_builtins(
+        [],
+        """
+        type User {
+            name: String
+        }
+
+        type Query {
+            viewer: User
+        }
+        """,
+        "a",
+    )
+    clean_registry.register_sdl("a", full_sdl)
+    schema = await SchemaBakery.bake("a")
+    field = schema.find_field_definition(
+        schema.find_type(type_name), field_name
+    )
+    if is_found:
+        assert field is schema.find_type(type_name).find_field(field_name)
+    else:
+        assert field is None
+
+
 @pytest.mark.parametrize(
     "schema_name,where,obj",
     [